@@ -0,0 +1,97 @@
+# ============================================================
+# ARC CORE — AUDIT LOG BENCHMARK
+# Loop 1.21: recording cost and indexed "why" queries
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_audit.py [--records 200000] [--exchanges 2000]
+#
+# 1. record() cost: in-memory, and to disk with group commit
+#    (the caller only appends; the writer thread fsyncs).
+# 2. Ingest latency with the Guardian audit OFF, at the default
+#    ALL_DENY (nothing recorded on the happy path) and at FULL
+#    with a disk sink (every gate decision recorded).
+# 3. why(action, cycle), cold and with cached indexes, against
+#    a full scan of the segments.
+#
+# ============================================================
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from synthetic import AI_LINES, USER_LINES
+from ac_audit import AuditLog  # noqa: E402
+from arc_prime import ArcMemorySystem  # noqa: E402
+
+
+def record_us(log: AuditLog, records: int) -> float:
+    start = time.perf_counter()
+    for k in range(records):
+        log.record("WRITE", k % 100 != 0, "OK", action=f"gate:{('user', 'ai')[k % 2]}",
+                   target_node_id=f"n{k}", cycle_context=k % 1000)
+    elapsed = time.perf_counter() - start
+    log.flush()
+    return elapsed / records * 1e6
+
+
+def ingest_us(log: AuditLog, exchanges: int) -> float:
+    mem = ArcMemorySystem()
+    mem.guardian.audit = log
+    start = time.perf_counter()
+    for n in range(exchanges):
+        mem.prepare_interaction(USER_LINES[n % len(USER_LINES)], AI_LINES[n % len(AI_LINES)], 2 + n % 50)
+    log.flush()
+    return (time.perf_counter() - start) / exchanges * 1e6
+
+
+def scan(directory: str, action: str, cycle: int):
+    hits = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".log"):
+            with open(os.path.join(directory, name), "rb") as f:
+                for line in f:
+                    r = json.loads(line)
+                    if r[7] == action and r[9] == cycle and not r[3]:
+                        hits.append(r)
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--exchanges", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        memory_cost = record_us(AuditLog(level="FULL"), args.records)
+        disk = AuditLog(workdir, level="FULL", max_segments=1000)
+        disk_cost = record_us(disk, args.records)
+        print(f"record(): memory {memory_cost:.2f} µs, disk {disk_cost:.2f} µs "
+              f"({disk.groups} group commits for {disk.written:,} records)")
+
+        for label, log in (("OFF", AuditLog(level="OFF")),
+                           ("ALL_DENY", AuditLog(level="ALL_DENY")),
+                           ("FULL+disk", AuditLog(os.path.join(workdir, "ingest"), level="FULL"))):
+            print(f"prepare_interaction, audit {label:<9}: {ingest_us(log, args.exchanges):.1f} µs")
+            log.close()
+
+        timings = []
+        for _ in range(2):  # cold: parses the index files; warm: cached
+            start = time.perf_counter()
+            indexed = disk.why(action="gate:user", cycle=500, limit=args.records)
+            timings.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        scanned = scan(workdir, "gate:user", 500)
+        scan_ms = (time.perf_counter() - start) * 1000
+        assert len(indexed) == len(scanned)
+        print(f"why(action, cycle): {timings[0]:.1f} ms cold / {timings[1]:.2f} ms warm "
+              f"vs {scan_ms:.1f} ms full scan "
+              f"({len(indexed)} hits)")
+        disk.close()
+
+
+if __name__ == "__main__":
+    main()
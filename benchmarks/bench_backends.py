@@ -0,0 +1,80 @@
+# ============================================================
+# ARC CORE — STORAGE BACKEND BENCHMARK
+# Loop 1.8: in-memory tree vs SQLite
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_backends.py [--sizes 500,2000] [--batch 500]
+#
+# Sizes are interaction counts (two nodes each). The in-memory
+# backend re-hashes the tree on every ingest, so its ingest cost
+# grows with tree size; SQLite defers hashing to save time.
+#
+# ============================================================
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from synthetic import AI_LINES, USER_LINES
+from arc_prime import ArcMemorySystem  # noqa: E402
+from ac_storage import SQLiteBackend  # noqa: E402
+
+
+def run(mem: ArcMemorySystem, interactions: int):
+    rng = random.Random(0)
+    timings = {}
+
+    start = time.perf_counter()
+    for n in range(interactions):
+        mem.ingest_interaction(rng.choice(USER_LINES), rng.choice(AI_LINES), rng.randint(1, 50))
+    mem.backend.flush()
+    timings["ingest_per_s"] = interactions / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for cycle in range(1, 51):
+        mem.thread_nodes(cycle)
+    timings["thread_ms"] = (time.perf_counter() - start) / 50 * 1000
+
+    start = time.perf_counter()
+    mem.sigil_nodes(3)
+    timings["sigil_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        mem.save_memory(os.path.join(tempfile.gettempdir(), "bench_backend.json"))
+    timings["save_ms"] = (time.perf_counter() - start) * 1000
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="500,2000")
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'interactions':>12} {'backend':<8} {'ingest/s':>10} {'thread ms':>10} "
+          f"{'sigil ms':>9} {'save ms':>9}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in (int(s) for s in args.sizes.split(",") if s):
+            backends = [
+                ("memory", lambda: None),
+                ("sqlite", lambda: SQLiteBackend(
+                    os.path.join(workdir, f"bench_{size}.db"), batch_size=args.batch)),
+            ]
+            for label, factory in backends:
+                mem = ArcMemorySystem(backend=factory())
+                t = run(mem, size)
+                mem.backend.close()
+                print(f"{size:>12} {label:<8} {t['ingest_per_s']:>10.0f} {t['thread_ms']:>10.3f} "
+                      f"{t['sigil_ms']:>9.3f} {t['save_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# ============================================================
+# ARC CORE — ECHO PULSE MICROBENCHMARK
+# Loop 1.17: cost per pulse, reflect and export
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_echo.py [--pulses 200000] [--capacity 4096]
+#
+# Compares the legacy echo log (list of dicts, sha256 id per
+# pulse) with the ring: in memory only, and spilling NDJSON
+# segments to a temp directory. Reports ns per pulse, reflect(5)
+# cost and export throughput, plus peak traced memory (measured
+# in a second, untimed pass).
+#
+# ============================================================
+
+import argparse
+import hashlib
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from synthetic import USER_LINES
+from ac_echo import ArcEcho  # noqa: E402
+
+
+class LegacyEcho:
+    """The pre-ring ArcEcho.pulse, for comparison."""
+
+    def __init__(self):
+        self.echo_log = []
+
+    def pulse(self, signal, source="manual", intensity=1):
+        timestamp = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+        echo_id = hashlib.sha256(f"{signal}{timestamp}".encode()).hexdigest()[:12]
+        entry = {"id": echo_id, "signal": signal, "source": source,
+                 "intensity": intensity, "timestamp": timestamp}
+        self.echo_log.append(entry)
+        return entry
+
+    def reflect(self, count=5):
+        return self.echo_log[-count:]
+
+    def export(self):
+        return iter(self.echo_log)
+
+
+def feed(echo, pulses: int):
+    signals = USER_LINES
+    for n in range(pulses):
+        echo.pulse(signals[n % len(signals)], intensity=n % 3)
+
+
+def measure(label: str, make, pulses: int):
+    echo = make()
+    start = time.perf_counter()
+    feed(echo, pulses)
+    pulse_ns = (time.perf_counter() - start) / pulses * 1e9
+
+    # Retained memory, on a separate instance (tracing skews timings)
+    tracemalloc.start()
+    feed(make(), pulses)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        echo.reflect(5)
+    reflect_us = (time.perf_counter() - start) / 1000 * 1e6
+
+    start = time.perf_counter()
+    exported = sum(1 for _ in echo.export())
+    export_s = time.perf_counter() - start
+    rate = exported / export_s if export_s else 0.0
+
+    print(f"{label:<18} {pulse_ns:>10,.0f} {reflect_us:>12.2f} {exported:>10,} "
+          f"{rate:>12,.0f} {peak / 1024 / 1024:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pulses", type=int, default=200000)
+    parser.add_argument("--capacity", type=int, default=4096)
+    args = parser.parse_args()
+
+    print(f"pulses={args.pulses:,} capacity={args.capacity:,}")
+    print(f"{'':<18} {'ns/pulse':>10} {'reflect(5) µs':>12} {'exported':>10} "
+          f"{'export/s':>12} {'peak MiB':>10}")
+
+    measure("legacy list", LegacyEcho, args.pulses)
+    measure("ring (drop)", lambda: ArcEcho(capacity=args.capacity), args.pulses)
+
+    spill = tempfile.mkdtemp(prefix="arc_echo_bench_")
+    try:
+        # Each instance gets its own subdirectory, so the export only sees its own segments
+        dirs = iter(range(1 << 30))
+        measure("ring + spill",
+                lambda: ArcEcho(capacity=args.capacity, max_segments=1 << 20,
+                                spill_dir=f"{spill}/{next(dirs)}"),
+                args.pulses)
+    finally:
+        shutil.rmtree(spill, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# ============================================================
+# ARC CORE — MEMORY FORMAT BENCHMARK
+# Loop 1.6: JSON vs ACMB save/load
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_memory_format.py [--sizes 10000,100000,1000000]
+#                                            [--json results.json]
+#
+# ============================================================
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+from synthetic import build_memory
+
+
+VARIANTS = [
+    ("json", "json", None),
+    ("bin", "bin", None),
+    ("bin+zlib", "bin", "zlib"),
+    ("bin+lzma", "bin", "lzma"),
+]
+
+
+def bench_size(node_count: int, workdir: str):
+    mem = build_memory(node_count)
+    rows = []
+
+    for label, fmt, compression in VARIANTS:
+        path = os.path.join(workdir, f"bench_{node_count}.{label}")
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            mem.save_memory(path, format=fmt, compression=compression)
+        save_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mem.read_memory(path)
+        load_s = time.perf_counter() - start
+
+        rows.append({
+            "nodes": node_count,
+            "variant": label,
+            "save_s": round(save_s, 4),
+            "load_s": round(load_s, 4),
+            "bytes": os.path.getsize(path),
+        })
+        os.remove(path)
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--json", dest="json_out")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = []
+
+    print(f"{'nodes':>9} {'variant':<9} {'save s':>8} {'load s':>8} {'bytes':>12}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            for row in bench_size(size, workdir):
+                results.append(row)
+                print(f"{row['nodes']:>9} {row['variant']:<9} {row['save_s']:>8.3f} "
+                      f"{row['load_s']:>8.3f} {row['bytes']:>12}")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
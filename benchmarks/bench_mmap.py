@@ -0,0 +1,78 @@
+# ============================================================
+# ARC CORE — MAPPED MEMORY BENCHMARK
+# Loop 1.7: open + point lookups vs full load
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_mmap.py [--sizes 100000,1000000] [--lookups 1000]
+#
+# ============================================================
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from synthetic import build_memory
+from ac_mmap import MappedMemory  # noqa: E402  (path set by synthetic)
+
+
+def bench_size(node_count: int, lookups: int, workdir: str):
+    mem = build_memory(node_count, hash_tree=False)
+    ids = [c.id for c in mem.root.children]
+    path = os.path.join(workdir, f"bench_{node_count}.bin")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        mem.save_memory(path, format="bin")
+    del mem
+
+    start = time.perf_counter()
+    mem_full = build_memory(0, hash_tree=False)
+    mem_full.read_memory(path)
+    full_load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mapped = MappedMemory(path)
+    open_s = time.perf_counter() - start
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for node_id in rng.sample(ids, min(lookups, len(ids))):
+        mapped.find(node_id).seed
+    find_s = (time.perf_counter() - start) / max(1, min(lookups, len(ids)))
+
+    start = time.perf_counter()
+    lines = mapped.thread(17)
+    thread_s = time.perf_counter() - start
+
+    mapped.close()
+    return {
+        "nodes": node_count,
+        "bytes": os.path.getsize(path),
+        "full_load_s": full_load_s,
+        "open_ms": open_s * 1000,
+        "find_us": find_s * 1e6,
+        "thread_ms": thread_s * 1000,
+        "thread_lines": len(lines),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>9} {'bytes':>12} {'load s':>8} {'open ms':>8} {'find us':>8} {'thread ms':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in (int(s) for s in args.sizes.split(",") if s):
+            r = bench_size(size, args.lookups, workdir)
+            print(f"{r['nodes']:>9} {r['bytes']:>12} {r['full_load_s']:>8.3f} "
+                  f"{r['open_ms']:>8.3f} {r['find_us']:>8.1f} {r['thread_ms']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
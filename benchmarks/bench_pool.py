@@ -0,0 +1,86 @@
+# ============================================================
+# ARC CORE — MEMORY POOL BENCHMARK
+# Loop 1.29: tenant hit rate and load latency vs byte budget
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_pool.py [--tenants 500] [--exchanges 50]
+#                                   [--requests 5000] [--budgets 5,20,50]
+#                                   [--format json|bin]
+#
+# Writes --tenants memory files, then serves --requests
+# Zipf-distributed tenant accesses (one read and one ingest each)
+# through a MemoryPool whose budget is the given percentage of
+# the total tenant bytes. Reports hit rate, evictions, saves and
+# load latency percentiles per budget. Evictions and misses cost
+# a save_memory / restore, so --format bin shows the pool with
+# the faster ACMB files.
+#
+# ============================================================
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from synthetic import AI_LINES, USER_LINES
+from ac_pool import MemoryPool  # noqa: E402
+
+
+def populate(directory: str, tenants: int, exchanges: int, fmt: str) -> int:
+    with MemoryPool(directory, budget=None, max_tenants=1, format=fmt) as pool:
+        total = 0
+        for t in range(tenants):
+            with pool.lease(f"tenant-{t}") as memory:
+                memory.hash_on_write = False
+                for n in range(exchanges):
+                    memory.ingest_interaction(f"{USER_LINES[n % len(USER_LINES)]} #{t}-{n}",
+                                              AI_LINES[n % len(AI_LINES)], 2 + n % 7)
+            total += pool.resident_bytes
+    return total
+
+
+def serve(directory: str, budget: int, tenants: int, requests: int, fmt: str):
+    rng = random.Random(7)
+    weights = [1 / (rank + 1) for rank in range(tenants)]
+    picks = rng.choices(range(tenants), weights, k=requests)
+    pool = MemoryPool(directory, budget=budget, format=fmt)
+    start = time.perf_counter()
+    for k, t in enumerate(picks):
+        with pool.lease(f"tenant-{t}") as memory:
+            memory.thread_nodes(2 + k % 7)
+            memory.ingest_interaction(f"Request {k}", "Served", 2 + k % 7)
+    pool.close()
+    return time.perf_counter() - start, pool.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=500)
+    parser.add_argument("--exchanges", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--budgets", default="5,20,50", help="percent of total tenant bytes")
+    parser.add_argument("--format", default="json", choices=("json", "bin"))
+    args = parser.parse_args()
+
+    for percent in [float(x) for x in args.budgets.split(",")]:
+        workdir = tempfile.mkdtemp()
+        try:
+            total = populate(workdir, args.tenants, args.exchanges, args.format)
+            if percent == float(args.budgets.split(",")[0]):
+                print(f"tenants={args.tenants:,} exchanges={args.exchanges} "
+                      f"total={total / 2**20:.1f} MiB requests={args.requests:,} format={args.format}")
+                print(f"{'budget':>7} {'seconds':>8} {'req/s':>8} {'hit rate':>9} {'evicted':>8} "
+                      f"{'saves':>6} {'load p50':>9} {'load p99':>9}")
+            seconds, s = serve(workdir, int(total * percent / 100), args.tenants, args.requests,
+                               args.format)
+            print(f"{percent:>6.0f}% {seconds:>8.2f} {args.requests / seconds:>8,.0f} "
+                  f"{s['hit_rate']:>8.1%} {s['evictions']:>8} {s['saves']:>6} "
+                  f"{s['load']['p50_ms']:>7.2f}ms {s['load']['p99_ms']:>7.2f}ms")
+        finally:
+            shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
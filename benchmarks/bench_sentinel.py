@@ -0,0 +1,76 @@
+# ============================================================
+# ARC CORE — SENTINEL BENCHMARK
+# Loop 1.22: compiled judgment table vs judging per call
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_sentinel.py [--calls 500000] [--reloads 1000]
+#
+# Per-judgment cost of Sentinel.judge() (table lookup, audit at
+# the default ALL_DENY level) against deciding from the policy
+# on every call, plus the cost of a policy reload (compile and
+# swap) and of judgments made while another thread reloads.
+#
+# ============================================================
+
+import argparse
+import threading
+import time
+
+import synthetic  # noqa: F401  (puts src/ on the path)
+from ac_audit import AuditLog  # noqa: E402
+from ac_sentinel import Sentinel, SentinelPolicy, decide  # noqa: E402
+
+VERBS = ("walk", "inject", "thread", "collapse", "summary", "sync")
+
+
+def per_call_ns(fn, calls: int) -> float:
+    verbs = VERBS * (calls // len(VERBS))
+    start = time.perf_counter()
+    for verb in verbs:
+        fn(verb, 1)
+    return (time.perf_counter() - start) / len(verbs) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500000)
+    parser.add_argument("--reloads", type=int, default=1000)
+    args = parser.parse_args()
+
+    policy = SentinelPolicy()
+
+    def per_call(verb, actor):
+        operation = policy.commands.get(verb)
+        return decide(operation, policy.required_for(verb), actor)
+
+    sentinel = Sentinel(policy)
+    audited = Sentinel(policy, audit=AuditLog())
+    print(f"judge per call (decide):     {per_call_ns(per_call, args.calls):7.0f} ns")
+    print(f"judge compiled:              {per_call_ns(sentinel.judge, args.calls):7.0f} ns")
+    print(f"judge compiled + audit:      {per_call_ns(audited.judge, args.calls):7.0f} ns  (collapse denials recorded)")
+
+    start = time.perf_counter()
+    for _ in range(args.reloads):
+        sentinel.reload(policy)
+    print(f"reload (compile + swap):     {(time.perf_counter() - start) / args.reloads * 1e6:7.1f} µs")
+
+    stop = threading.Event()
+
+    def reloader():
+        while not stop.is_set():
+            sentinel.reload(policy)
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=reloader)
+    thread.start()
+    try:
+        busy = per_call_ns(sentinel.judge, args.calls)
+    finally:
+        stop.set()
+        thread.join()
+    print(f"judge during reloads:        {busy:7.0f} ns  ({sentinel.reloads} reloads)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# ============================================================
+# ARC CORE — ASYNC SERVICE LOAD TEST
+# Loop 1.13: concurrent sessions against the ingest queue
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_service.py [--sessions 3000] [--turns 4]
+#                                      [--capacity 1024] [--batch 256]
+#
+# Each simulated session ingests `turns` exchanges with a short
+# random think time and reads its own cycle's thread after every
+# exchange. Reports throughput, batching and p50/p99 latencies;
+# a sequential ingest_interaction() baseline is run for
+# comparison on a smaller count (it re-hashes per exchange).
+#
+# ============================================================
+
+import argparse
+import asyncio
+import random
+import time
+
+from synthetic import AI_LINES, USER_LINES
+from ac_service import ArcService  # noqa: E402
+from arc_prime import ArcMemorySystem  # noqa: E402
+
+
+async def session(service: ArcService, n: int, turns: int, rng: random.Random):
+    cycle = 2 + n % 97  # cycle 1 is the root's: its thread is the whole tree
+    for t in range(turns):
+        await asyncio.sleep(rng.random() * 0.005)
+        await service.ingest(USER_LINES[(n + t) % len(USER_LINES)],
+                             AI_LINES[(n * 7 + t) % len(AI_LINES)], cycle)
+        await service.thread(cycle)
+
+
+async def load(sessions: int, turns: int, capacity: int, batch: int):
+    service = ArcService(ArcMemorySystem(), capacity=capacity, batch_size=batch)
+    rng = random.Random(0)
+    async with service:
+        start = time.perf_counter()
+        await asyncio.gather(*(session(service, n, turns, rng) for n in range(sessions)))
+        elapsed = time.perf_counter() - start
+    return elapsed, service.metrics()
+
+
+def sequential(count: int) -> float:
+    memory = ArcMemorySystem()
+    start = time.perf_counter()
+    for n in range(count):
+        memory.ingest_interaction(USER_LINES[n % len(USER_LINES)],
+                                  AI_LINES[n % len(AI_LINES)], n % 97)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=3000)
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=1024)
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args()
+
+    elapsed, metrics = asyncio.run(load(args.sessions, args.turns, args.capacity, args.batch))
+    total = metrics["applied"]
+
+    print(f"sessions={args.sessions} turns={args.turns} "
+          f"capacity={args.capacity} batch={args.batch}")
+    print(f"  ingested      {total} exchanges in {elapsed:.2f} s "
+          f"({total / elapsed:,.0f}/s)")
+    print(f"  batches       {metrics['batches']} (mean {metrics['mean_batch']})")
+    for kind in ("ingest", "query"):
+        m = metrics[kind]
+        print(f"  {kind:<7} p50 {m['p50_ms']:8.3f} ms   p99 {m['p99_ms']:8.3f} ms   "
+              f"max {m['max_ms']:8.3f} ms")
+
+    base_count = min(total, 2000)
+    base = sequential(base_count)
+    print(f"\nsequential ingest_interaction: {base_count} exchanges in {base:.2f} s "
+          f"({base_count / base:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
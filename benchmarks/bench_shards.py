@@ -0,0 +1,66 @@
+# ============================================================
+# ARC CORE — SHARD SCALING BENCHMARK
+# Loop 1.16: ingest throughput vs worker process count
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_shards.py [--exchanges 20000] [--workers 1,2,4,8]
+#                                     [--batch 256] [--cycles 997]
+#
+# Feeds the same exchanges (spread over `--cycles` cycles) into a
+# ShardedMemory with each worker count and reports exchanges/s,
+# speedup over one worker, and the merged thread/search latency.
+# Scaling is bounded by the cores available (os.cpu_count() is
+# printed); the coordinator only routes and pickles strings.
+#
+# ============================================================
+
+import argparse
+import os
+import time
+
+from synthetic import AI_LINES, USER_LINES
+from ac_shard import ShardedMemory  # noqa: E402
+
+
+def run(exchanges: int, workers: int, batch: int, cycles: int):
+    with ShardedMemory(shards=workers, batch_size=batch) as sharded:
+        start = time.perf_counter()
+        for n in range(exchanges):
+            sharded.ingest_interaction(f"{USER_LINES[n % len(USER_LINES)]} #{n}",
+                                       AI_LINES[n % len(AI_LINES)], 2 + n % cycles)
+        sharded.flush()
+        ingest = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sharded.thread_nodes(7)
+        thread_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        sharded.search("export format", limit=50)
+        search_ms = (time.perf_counter() - start) * 1000
+    return ingest, thread_ms, search_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--exchanges", type=int, default=20000)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--cycles", type=int, default=997)
+    args = parser.parse_args()
+
+    print(f"exchanges={args.exchanges:,} batch={args.batch} cpus={os.cpu_count()}")
+    print(f"{'workers':>7} {'seconds':>9} {'exch/s':>10} {'speedup':>8} "
+          f"{'thread ms':>10} {'search ms':>10}")
+
+    baseline = None
+    for count in [int(x) for x in args.workers.split(",")]:
+        seconds, thread_ms, search_ms = run(args.exchanges, count, args.batch, args.cycles)
+        baseline = baseline or seconds
+        print(f"{count:>7} {seconds:>9.2f} {args.exchanges / seconds:>10,.0f} "
+              f"{baseline / seconds:>7.2f}x {thread_ms:>10.2f} {search_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
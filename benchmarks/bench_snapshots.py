@@ -0,0 +1,62 @@
+# ============================================================
+# ARC CORE — SNAPSHOT BENCHMARK
+# Loop 1.15: persistent snapshots vs to_dict() copies
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_snapshots.py [--sizes 10000,100000,400000] [--appends 100]
+#
+# For each tree size: a full to_dict() copy, the first snapshot
+# (freezes everything once), a repeat snapshot with no writes,
+# a snapshot after `--appends` new exchanges, and the diff
+# between the two snapshots (cached digests; only new subtrees
+# are hashed).
+#
+# ============================================================
+
+import argparse
+import time
+
+from synthetic import AI_LINES, USER_LINES, build_memory
+import ac_sync  # noqa: E402
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def bench_size(node_count: int, appends: int):
+    mem = build_memory(node_count, hash_tree=False)
+    copy_ms, _ = timed(mem.root.to_dict)
+    first_ms, first = timed(mem.snapshot)
+    first.root.digest()
+    repeat_ms, _ = timed(mem.snapshot)
+
+    prepared = [mem.prepare_interaction(USER_LINES[n % len(USER_LINES)],
+                                        AI_LINES[n % len(AI_LINES)], 2 + n % 50)
+                for n in range(appends)]
+    mem.ingest_prepared(prepared)
+
+    after_ms, second = timed(mem.snapshot)
+    diff_ms, patch = timed(lambda: ac_sync.diff(first, second))
+    assert len(patch["added"]) == appends
+    return copy_ms, first_ms, repeat_ms, after_ms, diff_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,400000")
+    parser.add_argument("--appends", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>9} {'to_dict':>10} {'1st snap':>10} {'repeat':>10} "
+          f"{'+' + str(args.appends) + ' snap':>10} {'snap diff':>10}   (ms)")
+    for size in [int(x) for x in args.sizes.split(",")]:
+        row = bench_size(size, args.appends)
+        print(f"{size:>9,} " + " ".join(f"{v:>10.3f}" for v in row))
+
+
+if __name__ == "__main__":
+    main()
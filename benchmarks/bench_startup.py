@@ -0,0 +1,110 @@
+# ============================================================
+# ARC CORE — STARTUP BENCHMARK
+# Loop 1.11: import time + cold start of scripted invocations
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_startup.py [--runs 15] [--budget-ms 60]
+#
+# Every figure comes from a fresh interpreter. Bytecode caches
+# are written to a private prefix so the numbers reflect a warm
+# install, not recompiling src/ on every run. "overhead" is the
+# time above a bare `python -c pass`; the script exits non-zero
+# when the median overhead exceeds the budget.
+#
+# ============================================================
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+SCRIPTED = (
+    "from ac_interpreter import ArcInterpreter\n"
+    "ArcInterpreter().execute('summary')\n"
+)
+
+
+def _env(workdir: str, cache_dir: str) -> dict:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = os.path.join(workdir, "pycache")
+    env["PYTHONPATH"] = os.path.abspath(SRC)
+    env["ARCCORE_CACHE_DIR"] = cache_dir
+    return env
+
+
+def _run(code: str, env: dict, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *flags, "-c", code], env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def wall_ms(code: str, env: dict, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(code, env)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def import_profile(env: dict, top: int = 8):
+    """(total_us, [(cumulative_us, module)]) from -X importtime."""
+    stderr = _run("import ac_shell", env, "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:  # the header row fails int() and is skipped
+            _self, cumulative, name = line[len("import time:"):].split("|")
+            rows.append((int(cumulative), name.strip()))
+        except ValueError:
+            continue
+    total = next(us for us, name in reversed(rows) if name == "ac_shell")
+    ours = sorted((r for r in rows if r[1].startswith(("ac_", "arc_"))), reverse=True)
+    return total, ours[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=60.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        cache_dir = os.path.join(workdir, "kernel-cache")
+        env = _env(workdir, cache_dir)
+
+        # Populate bytecode caches and the kernel hash cache
+        _run(SCRIPTED, env)
+
+        total_us, modules = import_profile(env)
+        print(f"import ac_shell: {total_us / 1000:.1f} ms (-X importtime, cumulative)")
+        for us, name in modules:
+            print(f"  {name:<18} {us / 1000:7.1f} ms")
+
+        bare = wall_ms("pass", env, args.runs)
+        scripted = wall_ms(SCRIPTED, env, args.runs)
+
+        cold_env = dict(env, ARCCORE_CACHE_DIR=os.path.join(workdir, "empty"))
+        cold = wall_ms(SCRIPTED, cold_env, 1)
+
+        overhead = scripted - bare
+        print(f"\nbare interpreter:          {bare:7.1f} ms")
+        print(f"scripted invocation:       {scripted:7.1f} ms  (median of {args.runs})")
+        print(f"  first run, empty cache:  {cold:7.1f} ms")
+        print(f"overhead:                  {overhead:7.1f} ms  (budget {args.budget_ms:.0f} ms)")
+
+    if overhead > args.budget_ms:
+        print("[FAIL] startup overhead over budget")
+        sys.exit(1)
+    print("[OK] within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# ============================================================
+# ARC CORE — BENCHMARK SUITE
+# Loop 1.20: kernel hot paths on shaped trees, with baselines
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_suite.py [--sizes 10000,100000] [--shapes wide,deep,sigil,long]
+#                                    [--ops ingest,collapse,reconstruct,save,load,hash]
+#                                    [--repeat 3] [--seed 0] [--json results.json]
+#                                    [--baseline base.json] [--threshold 0.25]
+#                                    [--save-baseline base.json]
+#
+# For every shape × size a seeded tree is generated (synthetic.py)
+# and each operation is timed, keeping the best of `--repeat` runs:
+#
+#   ingest       ingest_interaction() into the tree (per call; it
+#                re-hashes the whole tree, so it grows with size)
+#   collapse     ACCollapseEngine.collapse_state(tree)
+#   reconstruct  ArcReconstruct.reconstruct_full(tree)
+#   save         save_memory() to JSON
+#   load         load_and_inject() of that file
+#   hash         ArcGuardian.compute_memory_tree_hash(tree)
+#
+# Results are printed and, with --json, written as
+#   {"meta": {...}, "results": {"<shape>/<size>/<op>": {"seconds", "nodes"}}}
+# --baseline compares against such a file and exits 1 if any
+# operation is slower than baseline × (1 + threshold). Baselines
+# are machine-specific: record one with --save-baseline on the
+# machine that will run the comparison. 1M-node runs work but
+# take minutes per shape (collapse deep-copies the tree).
+#
+# ============================================================
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from synthetic import AI_LINES, SHAPES, USER_LINES, generate
+from ac_reconstruct import ArcReconstruct  # noqa: E402
+
+OPS = ("ingest", "collapse", "reconstruct", "save", "load", "hash")
+INGEST_CALLS = 10
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_shape(shape: str, size: int, ops, repeat: int, seed: int, workdir: str):
+    mem = generate(shape, size, seed=seed)
+    tree = mem.tree()
+    nodes = _count(tree)
+    path = os.path.join(workdir, f"{shape}_{size}.json")
+    results = {}
+
+    def ingest():
+        for n in range(INGEST_CALLS):
+            mem.ingest_interaction(USER_LINES[n % len(USER_LINES)], AI_LINES[n % len(AI_LINES)], 2 + n)
+
+    def save():
+        with contextlib.redirect_stdout(io.StringIO()):
+            mem.save_memory(path)
+
+    timers = {
+        "collapse": lambda: mem.collapse.collapse_state(tree),
+        "reconstruct": lambda: ArcReconstruct().reconstruct_full(tree),
+        "save": save,
+        "load": lambda: mem.load_and_inject(path),
+        "hash": lambda: mem.guardian.compute_memory_tree_hash(tree),
+    }
+    for op in ops:
+        if op == "ingest":
+            continue
+        if op == "load" and not os.path.exists(path):
+            save()
+        results[op] = best_of(repeat, timers[op])
+
+    # Last: it grows the tree
+    if "ingest" in ops:
+        results["ingest"] = best_of(repeat, ingest) / INGEST_CALLS
+
+    if os.path.exists(path):
+        os.remove(path)
+    return nodes, results
+
+
+def _count(tree) -> int:
+    total, stack = 0, [tree]
+    while stack:
+        node = stack.pop()
+        total += 1
+        stack.extend(node.get("children", []))
+    return total
+
+
+def compare(results, baseline, threshold: float):
+    """Returns [(key, seconds, baseline seconds, ratio)] for regressions."""
+    flagged = []
+    for key, entry in results.items():
+        base = baseline.get("results", {}).get(key)
+        if not base or not base.get("seconds"):
+            continue
+        ratio = entry["seconds"] / base["seconds"]
+        if ratio > 1 + threshold:
+            flagged.append((key, entry["seconds"], base["seconds"], ratio))
+    return flagged
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument("--ops", default=",".join(OPS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_out")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--save-baseline")
+    args = parser.parse_args()
+
+    ops = [op for op in args.ops.split(",") if op]
+    for op in ops:
+        if op not in OPS:
+            parser.error(f"unknown op {op!r}; choose from {', '.join(OPS)}")
+    shapes = [s for s in args.shapes.split(",") if s]
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+
+    document = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes, "shapes": shapes, "ops": ops,
+            "repeat": args.repeat, "seed": args.seed,
+        },
+        "results": {},
+    }
+
+    print(f"{'shape':<6} {'size':>9} {'nodes':>9} " + " ".join(f"{op + ' ms':>14}" for op in ops))
+    with tempfile.TemporaryDirectory() as workdir:
+        for shape in shapes:
+            for size in sizes:
+                nodes, timings = run_shape(shape, size, ops, args.repeat, args.seed, workdir)
+                for op, seconds in timings.items():
+                    document["results"][f"{shape}/{size}/{op}"] = {"seconds": seconds, "nodes": nodes}
+                print(f"{shape:<6} {size:>9,} {nodes:>9,} "
+                      + " ".join(f"{timings[op] * 1000:>14.3f}" for op in ops), flush=True)
+
+    for target in (args.json_out, args.save_baseline):
+        if target:
+            with open(target, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+            print(f"Results → {target}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        flagged = compare(document["results"], baseline, args.threshold)
+        if flagged:
+            print(f"\n{len(flagged)} regression(s) over {args.threshold:.0%}:")
+            for key, seconds, base, ratio in flagged:
+                print(f"  {key:<28} {seconds * 1000:>10.3f} ms vs {base * 1000:>10.3f} ms  ({ratio:.2f}x)")
+            sys.exit(1)
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
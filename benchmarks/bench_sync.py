@@ -0,0 +1,59 @@
+# ============================================================
+# ARC CORE — SYNC BENCHMARK
+# Loop 1.9: diff cost vs tree size for a fixed set of edits
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_sync.py [--sizes 100000,1000000] [--edits 10]
+#
+# Two ACMB files differ by a handful of edits; with stored
+# digests the mapped diff should stay flat as the tree grows.
+#
+# ============================================================
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from synthetic import build_memory
+from ac_mmap import MappedMemory  # noqa: E402
+from ac_storage import write_file  # noqa: E402
+import ac_sync  # noqa: E402
+
+
+def bench_size(node_count: int, edits: int, workdir: str):
+    tree = build_memory(node_count, hash_tree=False).tree()
+    path_a = os.path.join(workdir, "a.bin")
+    write_file(path_a, {}, tree, format="bin")
+
+    rng = random.Random(1)
+    for k in rng.sample(range(len(tree["children"])), edits):
+        tree["children"][k]["children"][0]["content"] = f"edited {k}"
+    path_b = os.path.join(workdir, "b.bin")
+    write_file(path_b, {}, tree, format="bin")
+
+    with MappedMemory(path_a) as a, MappedMemory(path_b) as b:
+        start = time.perf_counter()
+        patch = ac_sync.diff(a, b)
+        elapsed = time.perf_counter() - start
+
+    return elapsed, patch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--edits", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>9} {'diff ms':>9}  patch")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in (int(s) for s in args.sizes.split(",") if s):
+            elapsed, patch = bench_size(size, args.edits, workdir)
+            print(f"{size:>9} {elapsed * 1000:>9.2f}  {ac_sync.summarize(patch)}")
+
+
+if __name__ == "__main__":
+    main()
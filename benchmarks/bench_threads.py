@@ -0,0 +1,89 @@
+# ============================================================
+# ARC CORE — THREAD SCALING BENCHMARK
+# Loop 1.14: mixed read/ingest throughput for 1–16 threads
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_threads.py [--nodes 5000] [--threads 1,2,4,8,16]
+#                                      [--writes 0.05] [--seconds 2]
+#
+# Every thread runs the same mix against one shared memory: a
+# `--writes` fraction of ingest_interaction calls, the rest
+# split between thread_nodes(cycle) and sigil_nodes(3). Reports
+# total ops/s and per-kind p50/p99 latency. CPython's GIL caps
+# CPU-bound scaling; the point is that throughput holds and
+# reads keep flowing while writers are active.
+#
+# ============================================================
+
+import argparse
+import random
+import threading
+import time
+
+from synthetic import AI_LINES, USER_LINES, build_memory
+from ac_service import LatencyStats  # noqa: E402
+
+
+def run(node_count: int, threads: int, write_ratio: float, seconds: float):
+    mem = build_memory(node_count)
+    stats = {"ingest": LatencyStats(), "thread": LatencyStats(), "sigil": LatencyStats()}
+    guard = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def worker(n):
+        rng = random.Random(n)
+        local = {kind: [] for kind in stats}
+        while time.perf_counter() < deadline:
+            roll = rng.random()
+            start = time.perf_counter()
+            if roll < write_ratio:
+                kind = "ingest"
+                mem.ingest_interaction(rng.choice(USER_LINES), rng.choice(AI_LINES),
+                                       rng.randint(2, 999))
+            elif roll < (1 + write_ratio) / 2:
+                kind = "thread"
+                mem.thread_nodes(rng.randint(2, 999))
+            else:
+                kind = "sigil"
+                mem.sigil_nodes(3)
+            local[kind].append(time.perf_counter() - start)
+        with guard:
+            for kind, samples in local.items():
+                for s in samples:
+                    stats[kind].record(s)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--threads", default="1,2,4,8,16")
+    parser.add_argument("--writes", type=float, default=0.05)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"nodes={args.nodes} writes={args.writes:.0%} seconds={args.seconds}")
+    print(f"{'threads':>7} {'ops/s':>9} {'ingest p50/p99 ms':>20} "
+          f"{'thread p50/p99 ms':>20} {'sigil p50/p99 ms':>20}")
+
+    for count in [int(x) for x in args.threads.split(",")]:
+        elapsed, stats = run(args.nodes, count, args.writes, args.seconds)
+        ops = sum(s.count for s in stats.values())
+        cells = []
+        for kind in ("ingest", "thread", "sigil"):
+            m = stats[kind].summary()
+            cells.append(f"{m['p50_ms']:8.2f} / {m['p99_ms']:8.2f}")
+        print(f"{count:>7} {ops / elapsed:>9,.0f} " + " ".join(f"{c:>20}" for c in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# ============================================================
+# ARC CORE — TRACING OVERHEAD BENCHMARK
+# Loop 1.18: cost of ArcEcho spans, disabled and enabled
+# ============================================================
+#
+# Usage:
+#   python benchmarks/bench_tracing.py [--calls 500000] [--exchanges 2000]
+#
+# Measures the per-call cost of a @traced no-op method and an
+# ECHO.span() block against a plain method, with tracing off
+# and on, then the end-to-end cost of prepare_interaction (purify,
+# sigil, gate, prune: the most densely traced path) both ways.
+#
+# ============================================================
+
+import argparse
+import time
+
+from synthetic import AI_LINES, USER_LINES
+from ac_echo import ECHO, traced  # noqa: E402
+from arc_prime import ArcMemorySystem  # noqa: E402
+
+
+class Probe:
+    def plain(self):
+        return None
+
+    @traced("bench.noop")
+    def decorated(self):
+        return None
+
+    def with_span(self):
+        with ECHO.span("bench.span"):
+            return None
+
+
+PROBE = Probe()
+
+
+def per_call_ns(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def prepare_us(exchanges: int) -> float:
+    mem = ArcMemorySystem()
+    start = time.perf_counter()
+    for n in range(exchanges):
+        mem.prepare_interaction(USER_LINES[n % len(USER_LINES)], AI_LINES[n % len(AI_LINES)], 2 + n % 50)
+    return (time.perf_counter() - start) / exchanges * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500000)
+    parser.add_argument("--exchanges", type=int, default=2000)
+    args = parser.parse_args()
+
+    base = per_call_ns(PROBE.plain, args.calls)
+    print(f"plain method call: {base:,.0f} ns")
+    print(f"{'tracing':>8} {'@traced +ns':>12} {'span +ns':>10} {'prepare µs':>11}")
+    for enabled in (False, True):
+        ECHO.enabled = enabled
+        ECHO.reset_stats()
+        traced_ns = per_call_ns(PROBE.decorated, args.calls) - base
+        span_ns = per_call_ns(PROBE.with_span, args.calls) - base
+        prep = prepare_us(args.exchanges)
+        print(f"{'on' if enabled else 'off':>8} {traced_ns:>12,.0f} {span_ns:>10,.0f} {prep:>11.1f}")
+    ECHO.enabled = False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# ============================================================
+# ARC CORE — SYNTHETIC MEMORY BUILDER
+# Benchmark support: large trees without the ingest loop
+# ============================================================
+#
+# ingest_interaction re-hashes the whole tree on every call,
+# so building 1M nodes through it is quadratic. These helpers
+# assemble user/ai pairs directly, run them through the same
+# sigil + prune + content-table steps, and hash once at the end.
+#
+# Loop 1.20 — shaped generators for the benchmark suite, all
+# seeded and deterministic:
+#   wide   exchanges directly under the root (build_memory)
+#   deep   user/ai chains nested up to the Guardian depth limit
+#   sigil  every user line carries several sigils (priority 3+)
+#   long   multi-kilobyte contents
+#
+# ============================================================
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from arc_prime import ArcMemorySystem, HarmonicNode  # noqa: E402
+
+
+USER_LINES = [
+    "How do I stabilize the current cycle?",
+    "Summarize what we decided about the export format.",
+    "💠 This decision matters: keep seeds under eighty characters.",
+    "Can you reconstruct the sigiled decision about compression?",
+    "✨ Note for later: the guardian gate must run before ingest.",
+]
+
+AI_LINES = [
+    "Acknowledged.",
+    "Stability is found through structured descent. Cycle alignment applies here.",
+    "The export format keeps a string table so repeated content is stored once.",
+    "Reconstruction is meaning-first: seeds recover what was decided, not how.",
+]
+
+
+def build_memory(node_count: int, seed: int = 0, hash_tree: bool = True) -> ArcMemorySystem:
+    """Returns an ArcMemorySystem holding roughly node_count nodes."""
+    rng = random.Random(seed)
+    mem = ArcMemorySystem()
+
+    for n in range(max(0, node_count - 1) // 2):
+        cycle = rng.randint(1, 999)
+        user = HarmonicNode("user", f"{rng.choice(USER_LINES)} #{n % 97}", cycle)
+        ai = HarmonicNode("ai", rng.choice(AI_LINES), cycle)
+
+        for node in (user, ai):
+            node.apply_sigil_priority(mem.sigil)
+            node.prune_to_seed()
+            mem.content.share(node)
+
+        user.children.append(ai)
+        mem.root.children.append(user)
+
+    if hash_tree:
+        mem.memory_hash = mem.guardian.compute_memory_tree_hash(mem.root.to_dict())
+    return mem
+
+
+# ------------------------------------------------------------
+# Shaped generators (Loop 1.20)
+# ------------------------------------------------------------
+
+MAX_DEPTH = 128  # ArcGuardian.gate rejects deeper nodes
+SIGILS = ("💠", "✨", "•")
+FILLER = (
+    "Seeds keep what was decided and drop how it was phrased. "
+    "Reconstruction walks the structural path and expands each seed. "
+    "The guardian gates every node before it reaches the tree. "
+    "Compression downgrades are explicit and never silent. "
+)
+
+
+def _node(mem: ArcMemorySystem, role: str, text: str, cycle: int) -> HarmonicNode:
+    node = HarmonicNode(role, text, cycle)
+    node.apply_sigil_priority(mem.sigil)
+    node.prune_to_seed()
+    mem.content.share(node)
+    return node
+
+
+def _finish(mem: ArcMemorySystem, hash_tree: bool) -> ArcMemorySystem:
+    if hash_tree:
+        mem.memory_hash = mem.guardian.compute_memory_tree_hash(mem.root.to_dict())
+    return mem
+
+
+def build_deep(node_count: int, seed: int = 0, depth: int = MAX_DEPTH,
+               hash_tree: bool = True) -> ArcMemorySystem:
+    """Chains of alternating user/ai nodes, each `depth` nodes deep."""
+    rng = random.Random(seed)
+    mem = ArcMemorySystem()
+    depth = max(1, min(depth, MAX_DEPTH))
+    remaining = max(0, node_count - 1)
+
+    while remaining > 0:
+        cycle = rng.randint(2, 999)
+        parent = mem.root
+        for level in range(min(depth, remaining)):
+            role = "user" if level % 2 == 0 else "ai"
+            lines = USER_LINES if role == "user" else AI_LINES
+            node = _node(mem, role, f"{rng.choice(lines)} (depth {level + 1})", cycle)
+            parent.children.append(node)
+            parent = node
+            remaining -= 1
+    return _finish(mem, hash_tree)
+
+
+def build_sigil_heavy(node_count: int, seed: int = 0, hash_tree: bool = True) -> ArcMemorySystem:
+    """Wide tree where every user line carries 2–5 sigils."""
+    rng = random.Random(seed)
+    mem = ArcMemorySystem()
+
+    for n in range(max(0, node_count - 1) // 2):
+        cycle = rng.randint(2, 999)
+        marks = " ".join(rng.choice(SIGILS) for _ in range(rng.randint(2, 5)))
+        user = _node(mem, "user", f"{marks} {rng.choice(USER_LINES)} #{n % 97}", cycle)
+        ai = _node(mem, "ai", f"{rng.choice(SIGILS)} {rng.choice(AI_LINES)}", cycle)
+        user.children.append(ai)
+        mem.root.children.append(user)
+    return _finish(mem, hash_tree)
+
+
+def build_long_content(node_count: int, seed: int = 0, length: int = 4096,
+                       hash_tree: bool = True) -> ArcMemorySystem:
+    """Wide tree of unique contents around `length` characters each."""
+    rng = random.Random(seed)
+    mem = ArcMemorySystem()
+    repeats = max(1, length // len(FILLER))
+
+    for n in range(max(0, node_count - 1) // 2):
+        cycle = rng.randint(2, 999)
+        body = FILLER * rng.randint(max(1, repeats // 2), repeats * 3 // 2)
+        user = _node(mem, "user", f"#{n} {rng.choice(USER_LINES)} {body}", cycle)
+        ai = _node(mem, "ai", f"#{n} {rng.choice(AI_LINES)} {body[::-1]}", cycle)
+        user.children.append(ai)
+        mem.root.children.append(user)
+    return _finish(mem, hash_tree)
+
+
+SHAPES = {
+    "wide": build_memory,
+    "deep": build_deep,
+    "sigil": build_sigil_heavy,
+    "long": build_long_content,
+}
+
+
+def generate(shape: str, node_count: int, seed: int = 0, hash_tree: bool = True) -> ArcMemorySystem:
+    """One of SHAPES, roughly node_count nodes."""
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape {shape!r}; choose from {', '.join(SHAPES)}")
+    return SHAPES[shape](node_count, seed=seed, hash_tree=hash_tree)
@@ -0,0 +1,442 @@
+# ============================================================
+# AC AUDIT — ArcCore-Prime V1.1
+# Loop 1.21: Append-Only Audit Log for Guardian Decisions
+# Guardian Layer: Arien
+# Audit guarantees are defined in docs/audit_model.md
+# ============================================================
+#
+# Purpose:
+#   docs/audit_model.md: "no significant action is silent".
+#   Guardian gate / gate_text decisions and Sentinel judgments
+#   are recorded here as audit records with the canonical fields
+#   (timestamp, operation, allowed, reason, actor/required
+#   authority, target node, cycle) plus the action judged. No
+#   content is recorded, only verbs, roles and ids.
+#
+#   Recording is a level check and a list append; a background
+#   writer appends batches to the current segment and fsyncs
+#   once per batch (group commit), so ingest never waits on
+#   disk. Denials are the exception: they are written before
+#   record() returns, so a short-lived process cannot lose one.
+#   Pending records are also written at interpreter exit.
+#   Segments rotate at segment_bytes; the oldest are deleted
+#   beyond max_segments.
+#
+#   Several writers may share a directory (shard workers, other
+#   processes). Each group is appended under an flock on the
+#   segment, at the file's size at that moment, so every writer
+#   indexes the records where they actually landed. Within one
+#   process from_env() hands out a single log per directory.
+#
+#   Each segment has a sidecar index (key → byte offsets) for
+#   cycle, action, target node and denials, so "why was X
+#   denied in cycle N" reads only the matching records.
+#
+#   Without a directory the log keeps the most recent records
+#   in memory only.
+#
+# ============================================================
+
+import atexit
+import fcntl
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from ac_authority_defaults import DEFAULT_ACTOR_AUTHORITY, REQUIRED_AUTHORITY
+
+AUDIT_DIR_ENV = "ARCCORE_AUDIT_DIR"
+AUDIT_LEVEL_ENV = "ARCCORE_AUDIT_LEVEL"
+
+OPERATIONS = ("READ", "WRITE", "MARK", "GOVERN")
+LEVELS = ("OFF", "GOVERN", "MARK+", "ALL_DENY", "FULL")
+DEFAULT_LEVEL = "ALL_DENY"
+
+FIELDS = ("timestamp", "seq", "operation", "allowed", "reason", "actor_authority",
+          "required_authority", "action", "target_node_id", "cycle_context")
+
+SEGMENT_PREFIX = "audit-"
+LOG_SUFFIX = ".log"
+INDEX_SUFFIX = ".idx"
+
+_shared: Dict[str, "AuditLog"] = {}
+_shared_lock = threading.Lock()
+
+
+def wanted_pairs(level: str) -> frozenset:
+    """(operation, allowed) pairs recorded at an audit level."""
+    if level not in LEVELS:
+        raise ValueError(f"Unknown audit level {level!r}; choose from {', '.join(LEVELS)}")
+    pairs = set()
+    if level == "OFF":
+        return frozenset()
+    ops = {"GOVERN"} if level == "GOVERN" else {"MARK", "GOVERN"}
+    if level == "FULL":
+        ops |= {"WRITE"}
+    for op in ops:
+        pairs |= {(op, True), (op, False)}
+    if level in ("ALL_DENY", "FULL"):
+        pairs |= {(op, False) for op in OPERATIONS + ("UNCLASSIFIED",)}
+    return frozenset(pairs)
+
+
+def to_dict(record: Sequence) -> Dict[str, Any]:
+    data = dict(zip(FIELDS, record))
+    data["time"] = datetime.fromtimestamp(data["timestamp"] / 1e9).isoformat()
+    return data
+
+
+def _index_keys(record: Sequence) -> List[str]:
+    keys = []
+    if not record[3]:
+        keys.append("x:deny")
+    if record[7] is not None:
+        keys.append(f"a:{record[7]}")
+    if record[8] is not None:
+        keys.append(f"n:{record[8]}")
+    if record[9] is not None:
+        keys.append(f"c:{record[9]}")
+    return keys
+
+
+# ============================================================
+#  AUDIT LOG
+# ============================================================
+
+class AuditLog:
+    """
+    Batched, rotating, indexed audit sink.
+    record() is safe to call from any thread.
+    """
+
+    def __init__(self, directory: Optional[str] = None, level: str = DEFAULT_LEVEL,
+                 batch_size: int = 256, flush_interval: float = 0.05, fsync: bool = True,
+                 segment_bytes: int = 4 << 20, max_segments: int = 16, keep_recent: int = 1024):
+        self.directory = directory
+        self.level = level
+        self.wanted = wanted_pairs(level)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.recent = deque(maxlen=keep_recent)
+
+        self.written = 0
+        self.groups = 0          # fsync groups committed
+        self._seq = 0
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()        # guards _pending / _seq
+        self._io = threading.Lock()          # one writer / reader of segment files
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = None
+        self._segments: List[int] = []
+        self._number = None                  # segment being appended to
+        self._log = self._idx = None
+        self._index_cache: Dict[int, tuple] = {}
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._segments = sorted(self._existing_segments())
+            atexit.register(self.close)
+
+    @classmethod
+    def from_env(cls) -> "AuditLog":
+        """The process's log for ARCCORE_AUDIT_DIR (in memory only if unset)."""
+        level = os.environ.get(AUDIT_LEVEL_ENV, DEFAULT_LEVEL).upper()
+        if level not in LEVELS:
+            level = DEFAULT_LEVEL
+        directory = os.environ.get(AUDIT_DIR_ENV) or None
+        if directory is None:
+            return cls(None, level)
+        key = os.path.realpath(directory)
+        with _shared_lock:
+            log = _shared.get(key)
+            if log is None or log._closed:
+                log = _shared[key] = cls(directory, level)
+        return log
+
+    def set_level(self, level: str):
+        self.wanted = wanted_pairs(level)
+        self.level = level
+
+    # ------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------
+
+    def record(self, operation: str, allowed: bool, reason: str,
+               actor_authority: Optional[int] = None, required_authority: Optional[int] = None,
+               action: Optional[str] = None, target_node_id: Optional[str] = None,
+               cycle_context: Optional[int] = None) -> bool:
+        """Records one judgment if the level asks for it; returns whether it did."""
+        if (operation, allowed) not in self.wanted:
+            return False
+        if actor_authority is None:
+            actor_authority = DEFAULT_ACTOR_AUTHORITY
+        if required_authority is None:
+            required_authority = REQUIRED_AUTHORITY.get(operation)
+
+        with self._lock:
+            self._seq += 1
+            record = (time.time_ns(), self._seq, operation, bool(allowed), reason,
+                      actor_authority, required_authority, action, target_node_id, cycle_context)
+            self.recent.append(record)
+            if not self.directory:
+                return True
+            self._pending.append(record)
+            if self._writer is None:
+                self._start_writer()
+            if allowed and len(self._pending) >= self.batch_size:
+                self._wake.set()
+        if not allowed:
+            self.flush()  # with any records queued before it
+        return True
+
+    def _start_writer(self):
+        self._writer = threading.Thread(target=self._write_loop, name="arccore-audit", daemon=True)
+        self._writer.start()
+
+    def _write_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    # ------------------------------------------------------------
+    # Group commit
+    # ------------------------------------------------------------
+
+    def flush(self):
+        """Writes pending records as one group (one fsync per file)."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch or not self.directory:
+            return
+        with self._io:
+            lines, keys, size = [], [], 0
+            for record in batch:
+                line = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+                lines.append(line)
+                keys.append(_index_keys(record))
+                size += len(line)
+                if size >= self.segment_bytes:
+                    self._commit(lines, keys)
+                    lines, keys, size = [], [], 0
+            if lines:
+                self._commit(lines, keys)
+            self.written += len(batch)
+            self.groups += 1
+
+    def _commit(self, lines: List[bytes], keys: List[List[str]]):
+        """Appends lines to the newest segment with room, indexed at their real offsets."""
+        while True:
+            if self._log is None:
+                self._open_segment(self._newest())
+            fd = self._log.fileno()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                offset = os.fstat(fd).st_size
+                if offset < self.segment_bytes and not os.path.exists(
+                        self._path(self._number + 1, LOG_SUFFIX)):
+                    index = []
+                    for line, line_keys in zip(lines, keys):
+                        index.extend(f"{key}\t{offset}\n" for key in line_keys)
+                        offset += len(line)
+                    self._log.write(b"".join(lines))
+                    self._idx.write("".join(index).encode())
+                    self._log.flush()
+                    self._idx.flush()
+                    if self.fsync:
+                        os.fsync(fd)
+                        os.fsync(self._idx.fileno())
+                    return
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self._rotate()  # full, or another writer has moved on
+
+    def _path(self, number: int, suffix: str) -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{number:08d}{suffix}")
+
+    def _existing_segments(self) -> List[int]:
+        found = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(LOG_SUFFIX):
+                number = name[len(SEGMENT_PREFIX):-len(LOG_SUFFIX)]
+                if number.isdigit():
+                    found.append(int(number))
+        return found
+
+    def _refresh_segments(self):
+        """Segments on disk, including those other writers created or pruned."""
+        self._segments = sorted(self._existing_segments())
+        for number in list(self._index_cache):
+            if number not in self._segments:
+                del self._index_cache[number]
+
+    def _newest(self) -> int:
+        self._refresh_segments()
+        return self._segments[-1] if self._segments else 1
+
+    def _open_segment(self, number: int):
+        self._log = open(self._path(number, LOG_SUFFIX), "ab")
+        self._idx = open(self._path(number, INDEX_SUFFIX), "ab")
+        self._number = number
+        if number not in self._segments:
+            self._segments.append(number)
+
+    def _rotate(self):
+        self._log.close()
+        self._idx.close()
+        self._open_segment(self._number + 1)
+        self._refresh_segments()
+        while len(self._segments) > self.max_segments:
+            old = self._segments.pop(0)
+            self._index_cache.pop(old, None)
+            for suffix in (LOG_SUFFIX, INDEX_SUFFIX):
+                try:
+                    os.remove(self._path(old, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
+        self.flush()
+        with self._io:
+            if self._log is not None:
+                self._log.close()
+                self._idx.close()
+                self._log = self._idx = None
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+
+    def tail(self, count: int = 10) -> List[Dict[str, Any]]:
+        """Most recent records held in memory, newest last."""
+        return [to_dict(r) for r in list(self.recent)[-count:]]
+
+    def why(self, action: Optional[str] = None, cycle: Optional[int] = None,
+            node: Optional[str] = None, allowed: Optional[bool] = False,
+            limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Matching records, newest first. allowed=False (default) asks
+        "why was this denied"; None matches both outcomes. On disk,
+        only index entries and the matching records are read.
+        """
+        def match(r) -> bool:
+            return ((action is None or r[7] == action) and (cycle is None or r[9] == cycle)
+                    and (node is None or r[8] == node) and (allowed is None or r[3] == allowed))
+
+        if not self.directory:
+            return [to_dict(r) for r in reversed(self.recent) if match(r)][:limit]
+
+        self.flush()
+        keys = []
+        if node is not None:
+            keys.append(f"n:{node}")
+        if action is not None:
+            keys.append(f"a:{action}")
+        if cycle is not None:
+            keys.append(f"c:{cycle}")
+        if allowed is False:
+            keys.append("x:deny")
+
+        found = []
+        with self._io:
+            self._refresh_segments()
+            for number in reversed(self._segments):
+                offsets = self._lookup(number, keys)
+                if offsets is None:
+                    continue
+                with open(self._path(number, LOG_SUFFIX), "rb") as f:
+                    for offset in sorted(offsets, reverse=True):
+                        f.seek(offset)
+                        record = json.loads(f.readline())
+                        if match(record):
+                            found.append(to_dict(record))
+                            if len(found) >= limit:
+                                return found
+        return found
+
+    def _lookup(self, number: int, keys: List[str]):
+        """Offsets in one segment carrying every key (all records if no keys)."""
+        index = self._load_index(number)
+        if not keys:
+            return sorted({o for offsets in index.values() for o in offsets})
+        sets = [index.get(key) for key in keys]
+        if any(s is None for s in sets):
+            return None
+        sets.sort(key=len)
+        result = set(sets[0])
+        for other in sets[1:]:
+            result.intersection_update(other)
+        return result
+
+    def _load_index(self, number: int) -> Dict[str, List[int]]:
+        """Segment index, read incrementally as the active segment grows."""
+        path = self._path(number, INDEX_SUFFIX)
+        read, index = self._index_cache.get(number, (0, {}))
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return {}
+        if size > read:
+            with open(path, "rb") as f:
+                f.seek(read)
+                chunk = f.read(size - read)
+            end = chunk.rfind(b"\n") + 1
+            for line in chunk[:end].decode().splitlines():
+                key, offset = line.rsplit("\t", 1)
+                index.setdefault(key, []).append(int(offset))
+            self._index_cache[number] = (read + end, index)
+        return index
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "level": self.level,
+            "directory": self.directory,
+            "recorded": self._seq,
+            "written": self.written,
+            "groups": self.groups,
+            "pending": len(self._pending),
+            "segments": len(self._segments),
+        }
+
+
+# ============================================================
+#  CLI — python ac_audit.py --dir <audit dir> why ...
+# ============================================================
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query an ArcCore audit log.")
+    parser.add_argument("--dir", default=os.environ.get(AUDIT_DIR_ENV), required=False)
+    sub = parser.add_subparsers(dest="command", required=True)
+    why = sub.add_parser("why", help="why was an action denied (or allowed)")
+    why.add_argument("--action")
+    why.add_argument("--cycle", type=int)
+    why.add_argument("--node")
+    why.add_argument("--allowed", action="store_true", help="match allowed records instead")
+    why.add_argument("--any", action="store_true", help="match both outcomes")
+    why.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if not args.dir:
+        parser.error(f"--dir or {AUDIT_DIR_ENV} is required")
+    log = AuditLog(args.dir)
+    outcome = None if args.any else bool(args.allowed)
+    for record in log.why(args.action, args.cycle, args.node, outcome, args.limit):
+        print(json.dumps(record, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# ============================================================
+# AC AUTHORITY DEFAULTS — ArcCore-Prime V1.1
+# Mirror of docs/authority_defaults.md
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   The default authority scale, kept out of the Sentinel so
+#   authority stays policy rather than mechanism. These are
+#   defaults, not law: a SentinelPolicy may override any of
+#   them.
+#
+# ============================================================
+
+# Authority scale (monotonic, sparse)
+PASSIVE = 0        # Passive / read-only
+INTERACTION = 1    # Normal interaction (default user & LLM)
+MARKING = 3        # Marking intent (sigils, priority)
+RESHAPING = 5      # Semantic reshaping (compression changes)
+STRUCTURAL = 7     # Structural mutation (collapse, prune)
+RECOVERY = 9       # System governance / recovery
+
+MAX_AUTHORITY = RECOVERY
+
+# Default actor authority
+DEFAULT_ACTOR_AUTHORITY = INTERACTION
+ACTOR_AUTHORITY = {
+    "user": INTERACTION,
+    "ai": INTERACTION,
+    "system": MARKING,
+    "recovery": RECOVERY,
+}
+
+# Minimum authority per OperationType
+REQUIRED_AUTHORITY = {
+    "READ": PASSIVE,
+    "WRITE": INTERACTION,
+    "MARK": MARKING,
+    "GOVERN": STRUCTURAL,
+}
+
+# Default node authority by compression level name
+NODE_AUTHORITY = {
+    "RAW": 0,
+    "SUMMARY": 1,
+    "SEED": 3,
+    "SIGIL_ONLY": 5,
+}
+
+
+def cycle_authority(cycle_id: int) -> int:
+    return min(cycle_id, 5)
+
+
+def sigil_authority(sigil_count: int) -> int:
+    return min(2 * sigil_count, 5)
@@ -0,0 +1,212 @@
+# ============================================================
+# AC BATCH — ArcCore-Prime V1.1
+# Loop 1.23: Headless Script Runner
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Runs a file or stdin stream of shell commands through one
+#   warm ArcInterpreter (or an ac_daemon client) for cron jobs
+#   and pipelines: no boot banner, no typing effect, no sleeps.
+#
+#   Each line gets the same treatment as in ArcConsole: blank
+#   lines are skipped, input is purified, "cycle N" shifts the
+#   context and exit/quit/shutdown ends the run. Lines starting
+#   with "#" are comments.
+#
+#   Output is written in blocks. With json_lines=True every
+#   command becomes one JSON object:
+#     {"n", "line", "command", "status", "ms", "output"}
+#   where status is "ok", "error" or "denied", as reported by the
+#   interpreter's execute_status() rather than read from the
+#   reply. stop_on_error ends the run at the first command that
+#   is not "ok".
+#
+#   Against a local memory system the per-write tree hash is
+#   deferred and computed once when the run ends.
+#
+# Usage:
+#   python ac_batch.py [script ... | -] [--json] [--stop-on-error]
+#                      [--authority N] [--connect [socket]] [--quiet]
+#
+# ============================================================
+
+import json
+import re
+import sys
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from arc_guardian import ArcGuardian
+
+EXIT_WORDS = ("exit", "quit", "shutdown")
+DENIED_PREFIXES = ("[Guardian] ⛔", "[Sentinel] ⛔")
+ERROR_TAG = re.compile(r"\[[^\]\n]*\] Error:")  # "[walk] Error: ..." — the reply's own tag
+
+
+def classify(output: str) -> str:
+    """
+    ok / error / denied read from a reply's text, for interpreters
+    without execute_status() (ArcInterpreter and ArcClient have it).
+    """
+    if output.startswith(DENIED_PREFIXES):
+        return "denied"
+    if output.startswith(("[Error]", "[CRITICAL]")) or ERROR_TAG.match(output):
+        return "error"
+    return "ok"
+
+
+class BatchRunner:
+    """
+    Executes commands against one interpreter, any object with
+    execute(command) -> str.
+    """
+
+    def __init__(self, interpreter=None, stop_on_error: bool = False, json_lines: bool = False,
+                 out=None, flush_every: int = 256):
+        if interpreter is None:
+            from ac_interpreter import ArcInterpreter
+            interpreter = ArcInterpreter()
+        self.interpreter = interpreter
+        self.guardian = getattr(interpreter, "guardian", None) or ArcGuardian()
+        self.stop_on_error = stop_on_error
+        self.json_lines = json_lines
+        self.out = out if out is not None else sys.stdout
+        self.flush_every = flush_every
+        self.cycle = 1
+        self._buffer = []
+
+    # ------------------------------------------------------------
+    # One command
+    # ------------------------------------------------------------
+
+    def execute_line(self, raw: str) -> Optional[Tuple[str, str]]:
+        """(status, reply) for one line; None for blanks and comments."""
+        text = raw.strip()
+        if not text or text.startswith("#"):
+            return None
+        cleaned = self.guardian.purify(text)
+        if cleaned.startswith("cycle "):
+            try:
+                self.cycle = int(cleaned.split(" ")[1])
+                return "ok", f"[SYSTEM] Context shifted to Cycle {self.cycle}"
+            except ValueError:
+                return "error", "[Error] Invalid cycle format."
+        try:
+            execute_status = getattr(self.interpreter, "execute_status", None)
+            if execute_status is not None:
+                return execute_status(cleaned)
+            output = self.interpreter.execute(cleaned) or ""
+            return classify(output), output
+        except Exception as e:
+            return "error", f"[CRITICAL] Kernel Panic: {e}"
+
+    # ------------------------------------------------------------
+    # A whole stream
+    # ------------------------------------------------------------
+
+    def run(self, lines: Iterable[str]) -> Dict[str, Any]:
+        """Runs every line; returns counts by status, seconds, and whether it stopped or exited."""
+        summary = {"commands": 0, "ok": 0, "error": 0, "denied": 0, "seconds": 0.0,
+                   "stopped": False, "exited": False}
+        memory = getattr(self.interpreter, "memory", None)
+        hash_on_write = getattr(memory, "hash_on_write", None)
+        if hash_on_write:
+            memory.hash_on_write = False
+
+        start = time.perf_counter()
+        try:
+            for number, raw in enumerate(lines, 1):
+                if raw.strip().lower() in EXIT_WORDS:
+                    summary["exited"] = True
+                    break
+                began = time.perf_counter()
+                result = self.execute_line(raw)
+                if result is None:
+                    continue
+                elapsed_ms = (time.perf_counter() - began) * 1000
+                status, output = result
+                summary["commands"] += 1
+                summary[status] += 1
+                self._emit(summary["commands"], number, raw.strip(), status, elapsed_ms, output)
+                if status != "ok" and self.stop_on_error:
+                    summary["stopped"] = True
+                    break
+        finally:
+            self.flush()
+            if hash_on_write:
+                memory.hash_on_write = True
+                memory.refresh_hash()
+            summary["seconds"] = time.perf_counter() - start
+        return summary
+
+    def _emit(self, n: int, line: int, command: str, status: str, ms: float, output: str):
+        if self.json_lines:
+            self._buffer.append(json.dumps({"n": n, "line": line, "command": command, "status": status,
+                                            "ms": round(ms, 3), "output": output}, ensure_ascii=False))
+        elif output:
+            self._buffer.append(output)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self.out.write("\n".join(self._buffer) + "\n")
+            self._buffer = []
+        self.out.flush()
+
+
+# ============================================================
+#  CLI
+# ============================================================
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run ArcCore shell commands headlessly.")
+    parser.add_argument("scripts", nargs="*", default=["-"], help="command files; '-' reads stdin")
+    parser.add_argument("--json", action="store_true", help="one JSON object per command")
+    parser.add_argument("--stop-on-error", action="store_true")
+    parser.add_argument("--authority", type=int, help="actor authority for the Sentinel")
+    parser.add_argument("--connect", nargs="?", const="", metavar="SOCKET",
+                        help="run against a running ac_daemon")
+    parser.add_argument("--quiet", action="store_true", help="no summary on stderr")
+    args = parser.parse_args(argv)
+
+    if args.connect is not None:
+        from ac_daemon import ArcClient
+        interpreter = ArcClient(args.connect or None)
+    else:
+        from ac_interpreter import ArcInterpreter
+        interpreter = ArcInterpreter() if args.authority is None else ArcInterpreter(authority=args.authority)
+
+    runner = BatchRunner(interpreter, stop_on_error=args.stop_on_error, json_lines=args.json)
+    totals = {"commands": 0, "ok": 0, "error": 0, "denied": 0, "seconds": 0.0, "stopped": False}
+    try:
+        for script in args.scripts:
+            if script == "-":
+                summary = runner.run(sys.stdin)
+            else:
+                with open(script, "r", encoding="utf-8") as f:
+                    summary = runner.run(f)
+            for key in ("commands", "ok", "error", "denied", "seconds"):
+                totals[key] += summary[key]
+            if summary["stopped"]:
+                totals["stopped"] = True
+            if summary["stopped"] or summary["exited"]:
+                break
+    finally:
+        if args.connect is None:
+            interpreter.guardian.audit.close()  # the daemon owns its own log
+
+    if not args.quiet:
+        per = totals["seconds"] / totals["commands"] * 1000 if totals["commands"] else 0.0
+        stopped = " (stopped on error)" if totals["stopped"] else ""
+        print(f"[batch] {totals['commands']} commands: {totals['ok']} ok, {totals['error']} errors, "
+              f"{totals['denied']} denied in {totals['seconds']:.2f}s ({per:.3f} ms/command){stopped}",
+              file=sys.stderr)
+    return 0 if totals["error"] == 0 and totals["denied"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,644 @@
+# ============================================================
+# AC BINARY MEMORY FORMAT — ArcCore-Prime V1.1
+# Loop 1.6: Compact Persisted Memory (ACMB)
+# Guardian Layer: Arien
+# ============================================================
+#
+# Layout (all integers little-endian):
+#
+#   HEADER     magic "ACMB" | version u16 | flags u16
+#              | section_count u32 | reserved u32
+#   DIRECTORY  section_count × (kind u32 | codec u8 | pad 3
+#              | offset u64 | stored_len u64 | raw_len u64)
+#   SECTIONS   META     integrity block (UTF-8 JSON)
+#              STRINGS  count u64 | (count + 1) × u64 offsets | blob
+#              NODES    count u64 | count × NODE_RECORD
+#              ID_INDEX     count u64 | sorted (id_key u64, node u32)
+#              CYCLE_INDEX  count u64 | sorted (cycle i32, node u32)
+#              SIGIL_INDEX  count u64 | (priority i32, node u32),
+#                           highest priority first
+#              DIGESTS      count × 16-byte subtree digest, record order
+#              CHECKSUMS    segment_size u32 | pad u32 | count u64
+#                           | count × (kind u32 | segment u32 | sha256)
+#
+# Node records are fixed-width and stored breadth-first, so the
+# children of a node are the contiguous run
+#   records[first_child : first_child + child_count].
+#
+# Every id, role, content and seed lives once in the string
+# table (Loop 1.5). Sections may be compressed independently
+# (zlib / lzma). Readers skip section kinds they do not know.
+#
+# Loop 1.7: index sections are never compressed, so a file can
+# be opened with mmap (ac_mmap.MappedMemory) and queried by id,
+# cycle or sigil priority without decoding the whole tree.
+# Cycle and sigil entries are ordered by depth-first rank, so
+# index order matches a recursive tree walk.
+#
+# Loop 1.9: DIGESTS holds each node's subtree digest (ac_sync).
+# Because children are contiguous records, a node's child
+# digests are one contiguous slice, which the diff engine
+# compares block-wise straight from the mapped file.
+#
+# Loop 1.10: CHECKSUMS is written first, right after the
+# directory. It holds a sha256 per SEGMENT_SIZE slice of every
+# other section (kind 0 = header + directory), so load() can
+# verify while streaming and keep every intact segment when
+# part of the file is damaged (see ac_verify).
+#
+# ============================================================
+
+import hashlib
+import json
+import lzma
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+MAGIC = b"ACMB"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")
+SECTION = struct.Struct("<IB3xQQQ")
+COUNT = struct.Struct("<Q")
+
+# id, role, parent, cycle, content, seed, priority,
+# first_child, child_count, flags, compression_level
+NODE_RECORD = struct.Struct("<IIIiIIiIIBB2x")
+
+CHECKSUM_HEAD = struct.Struct("<I4xQ")
+CHECKSUM_ENTRY = struct.Struct("<II32s")
+
+ID_ENTRY = struct.Struct("<QI")
+KEYED_ENTRY = struct.Struct("<iI")
+
+NONE = 0xFFFFFFFF
+NO_LEVEL = 0xFF
+FLAG_COLLAPSED = 0x01
+
+SECTION_META = 1
+SECTION_STRINGS = 2
+SECTION_NODES = 3
+SECTION_ID_INDEX = 4
+SECTION_CYCLE_INDEX = 5
+SECTION_SIGIL_INDEX = 6
+SECTION_DIGESTS = 7
+SECTION_CHECKSUMS = 8
+SECTION_HEADER = 0  # checksum-only pseudo section: header + directory
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_LZMA = 2
+
+CODECS = {
+    None: CODEC_NONE,
+    "none": CODEC_NONE,
+    "zlib": CODEC_ZLIB,
+    "lzma": CODEC_LZMA,
+}
+
+
+class FormatError(ValueError):
+    """Raised when a file is not a readable ACMB memory."""
+
+
+# ============================================================
+#  CODECS
+# ============================================================
+
+def _compress(codec: int, data: bytes) -> bytes:
+    if codec == CODEC_ZLIB:
+        return zlib.compress(data, 6)
+    if codec == CODEC_LZMA:
+        return lzma.compress(data)
+    return data
+
+
+def _decompress(codec: int, data: bytes) -> bytes:
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_LZMA:
+        return lzma.decompress(data)
+    if codec == CODEC_NONE:
+        return data
+    raise FormatError(f"Unknown section codec {codec}")
+
+
+# ============================================================
+#  STRING TABLE
+# ============================================================
+
+class _StringTable:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.items: List[str] = []
+
+    def ref(self, text: Optional[str]) -> int:
+        if text is None:
+            return NONE
+        sid = self.ids.get(text)
+        if sid is None:
+            sid = len(self.items)
+            self.ids[text] = sid
+            self.items.append(text)
+        return sid
+
+    def encode(self) -> bytes:
+        encoded = [s.encode("utf-8") for s in self.items]
+        offsets = [0]
+        for chunk in encoded:
+            offsets.append(offsets[-1] + len(chunk))
+        return b"".join([
+            COUNT.pack(len(encoded)),
+            struct.pack(f"<{len(offsets)}Q", *offsets),
+            *encoded,
+        ])
+
+
+def decode_strings(data: bytes) -> List[str]:
+    (count,) = COUNT.unpack_from(data, 0)
+    offsets = struct.unpack_from(f"<{count + 1}Q", data, COUNT.size)
+    base = COUNT.size + 8 * (count + 1)
+    blob = data[base:]
+    return [
+        blob[offsets[i]:offsets[i + 1]].decode("utf-8")
+        for i in range(count)
+    ]
+
+
+# ============================================================
+#  ENCODE
+# ============================================================
+
+def id_key(node_id: str) -> int:
+    """64-bit index key for a node id."""
+    digest = hashlib.blake2b(node_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def encode(payload: Dict[str, Any], compression: Optional[str] = None,
+           index: bool = True, segment_size: Optional[int] = None) -> bytes:
+    """
+    Encodes {"integrity": ..., "tree": ...} into ACMB bytes.
+    index=True also writes the id / cycle / sigil index sections.
+    segment_size overrides the checksum granularity (ac_verify).
+    """
+    if compression not in CODECS:
+        raise ValueError(f"Unknown compression '{compression}' (use zlib or lzma)")
+    codec = CODECS[compression]
+
+    tree = payload.get("tree", {})
+    strings = _StringTable()
+    records = bytearray()
+
+    order = [tree]
+    parents = [NONE]
+    spans = []
+    i = 0
+
+    while i < len(order):
+        node = order[i]
+        children = node.get("children", [])
+        first_child = len(order)
+        order.extend(children)
+        parents.extend([i] * len(children))
+
+        level = node.get("compression_level")
+        flags = FLAG_COLLAPSED if node.get("collapsed") else 0
+
+        records += NODE_RECORD.pack(
+            strings.ref(node.get("id")),
+            strings.ref(node.get("role", "")),
+            parents[i],
+            int(node.get("cycle") or 0),
+            strings.ref(node.get("content")),
+            strings.ref(node.get("seed")),
+            int(node.get("priority") or 0),
+            first_child if children else NONE,
+            len(children),
+            flags,
+            NO_LEVEL if level is None else int(level),
+        )
+        spans.append((first_child, len(children)))
+        i += 1
+
+    meta = json.dumps(payload.get("integrity", {})).encode("utf-8")
+    sections = [
+        (SECTION_META, CODEC_NONE, meta),
+        (SECTION_STRINGS, codec, strings.encode()),
+        (SECTION_NODES, codec, COUNT.pack(len(order)) + bytes(records)),
+    ]
+
+    if index:
+        sections.extend(_build_indexes(order, spans))
+
+    return _assemble(sections, segment_size)
+
+
+def _depth_first_ranks(spans) -> List[int]:
+    ranks = [0] * len(spans)
+    stack = [0] if spans else []
+    rank = 0
+    while stack:
+        i = stack.pop()
+        ranks[i] = rank
+        rank += 1
+        first, n = spans[i]
+        stack.extend(range(first + n - 1, first - 1, -1))
+    return ranks
+
+
+def _subtree_digests(order, spans) -> bytes:
+    from ac_sync import combine, node_fields
+
+    digests = [b""] * len(order)
+    for i in range(len(order) - 1, -1, -1):
+        first, n = spans[i]
+        block = b"".join(digests[first:first + n]) if n else b""
+        digests[i] = combine(node_fields(order[i]), block)
+    return b"".join(digests)
+
+
+def _pack_entries(entry: struct.Struct, rows) -> bytes:
+    out = bytearray(COUNT.pack(len(rows)))
+    for row in rows:
+        out += entry.pack(*row)
+    return bytes(out)
+
+
+def _build_indexes(order, spans):
+    ranks = _depth_first_ranks(spans)
+
+    ids = sorted(
+        (id_key(node["id"]), i)
+        for i, node in enumerate(order)
+        if node.get("id") is not None
+    )
+
+    cycles = sorted(
+        (int(node.get("cycle") or 0), ranks[i], i)
+        for i, node in enumerate(order)
+    )
+
+    sigils = sorted(
+        (-int(node.get("priority") or 0), ranks[i], i)
+        for i, node in enumerate(order)
+        if (node.get("priority") or 0) > 0
+    )
+
+    return [
+        (SECTION_DIGESTS, CODEC_NONE, _subtree_digests(order, spans)),
+        (SECTION_ID_INDEX, CODEC_NONE, _pack_entries(ID_ENTRY, ids)),
+        (SECTION_CYCLE_INDEX, CODEC_NONE,
+         _pack_entries(KEYED_ENTRY, [(c, i) for c, _, i in cycles])),
+        (SECTION_SIGIL_INDEX, CODEC_NONE,
+         _pack_entries(KEYED_ENTRY, [(-p, i) for p, _, i in sigils])),
+    ]
+
+
+def _assemble(sections, segment_size: Optional[int] = None) -> bytes:
+    from ac_verify import SEGMENT_SIZE, segment_checksums
+    segment_size = segment_size or SEGMENT_SIZE
+
+    stored = [(kind, codec, _compress(codec, raw), len(raw)) for kind, codec, raw in sections]
+
+    # Checksum entries: one per segment of every section, plus header
+    entries = [(kind, n, digest)
+               for kind, _, body, _ in stored
+               for n, digest in enumerate(segment_checksums(body, segment_size))]
+    count = len(stored) + 1
+    checksum_len = CHECKSUM_HEAD.size + CHECKSUM_ENTRY.size * (len(entries) + 1)
+
+    offset = HEADER.size + SECTION.size * count
+    directory = bytearray(SECTION.pack(SECTION_CHECKSUMS, CODEC_NONE, offset,
+                                       checksum_len, checksum_len))
+    offset += checksum_len
+    for kind, codec, body, raw_len in stored:
+        directory += SECTION.pack(kind, codec, offset, len(body), raw_len)
+        offset += len(body)
+
+    head = HEADER.pack(MAGIC, VERSION, 0, count, 0) + bytes(directory)
+    checksums = bytearray(CHECKSUM_HEAD.pack(segment_size, len(entries) + 1))
+    checksums += CHECKSUM_ENTRY.pack(SECTION_HEADER, 0, segment_checksums(head, len(head))[0])
+    for entry in entries:
+        checksums += CHECKSUM_ENTRY.pack(*entry)
+
+    return b"".join([head, bytes(checksums), *(body for _, _, body, _ in stored)])
+
+
+# ============================================================
+#  DECODE
+# ============================================================
+
+def read_directory(data) -> Dict[int, tuple]:
+    """Returns {kind: (codec, offset, stored_len, raw_len)}."""
+    if len(data) < HEADER.size:
+        raise FormatError("File too short for ACMB header")
+
+    magic, version, _flags, count, _ = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise FormatError("Not an ACMB memory file")
+    if version > VERSION:
+        raise FormatError(f"Unsupported ACMB version {version}")
+
+    directory = {}
+    for n in range(count):
+        kind, codec, offset, stored, raw = SECTION.unpack_from(
+            data, HEADER.size + n * SECTION.size
+        )
+        directory[kind] = (codec, offset, stored, raw)
+    return directory
+
+
+def read_section(data, directory, kind: int) -> bytes:
+    if kind not in directory:
+        raise FormatError(f"Missing section {kind}")
+    codec, offset, stored, _raw = directory[kind]
+    return _decompress(codec, bytes(data[offset:offset + stored]))
+
+
+def decode_node(fields, strings: List[str]) -> Dict[str, Any]:
+    """Builds a to_dict()-shaped node (children left empty)."""
+    (id_ref, role_ref, _parent, cycle, content_ref, seed_ref,
+     priority, _first, _count, flags, level) = fields
+
+    node = {
+        "id": None if id_ref == NONE else strings[id_ref],
+        "role": strings[role_ref],
+        "cycle": cycle,
+        "content": None if content_ref == NONE else strings[content_ref],
+        "seed": None if seed_ref == NONE else strings[seed_ref],
+        "collapsed": bool(flags & FLAG_COLLAPSED),
+        "priority": priority,
+    }
+    if level != NO_LEVEL:
+        node["compression_level"] = level
+    node["children"] = []
+    return node
+
+
+def read_checksums(data, directory) -> Tuple[int, Dict[Tuple[int, int], tuple]]:
+    """
+    Returns (segment_size, expected) where expected maps
+    (kind, segment) to (file_offset, length, sha256).
+    Files written before Loop 1.10 return (0, {}).
+    """
+    entry = directory.get(SECTION_CHECKSUMS)
+    if entry is None:
+        return 0, {}
+
+    offset = entry[1]
+    segment_size, count = CHECKSUM_HEAD.unpack_from(data, offset)
+    head_len = HEADER.size + SECTION.size * len(directory)
+    expected = {}
+
+    for n in range(count):
+        kind, seg, digest = CHECKSUM_ENTRY.unpack_from(
+            data, offset + CHECKSUM_HEAD.size + n * CHECKSUM_ENTRY.size
+        )
+        if kind == SECTION_HEADER:
+            expected[(kind, seg)] = (0, head_len, digest)
+        elif kind in directory:
+            start = directory[kind][1] + seg * segment_size
+            length = min(segment_size, directory[kind][2] - seg * segment_size)
+            expected[(kind, seg)] = (start, length, digest)
+
+    return segment_size, expected
+
+
+def _damaged_items(bad_segments: Set[int], segment_size: int, start: int,
+                   item_size: int, count: int) -> Set[int]:
+    """Indexes of fixed-size items (at section offset start) overlapping bad segments."""
+    damaged = set()
+    for seg in bad_segments:
+        lo = max(0, (seg * segment_size - start) // item_size)
+        hi = min(count, ((seg + 1) * segment_size - start + item_size - 1) // item_size)
+        damaged.update(range(lo, hi))
+    return damaged
+
+
+def _checked_strings(raw: bytes, bad_segments: Set[int], segment_size: int) -> List[str]:
+    """decode_strings, with strings touching a bad segment replaced."""
+    from ac_verify import CORRUPT_TEXT
+
+    (count,) = COUNT.unpack_from(raw, 0)
+    base = COUNT.size + 8 * (count + 1)
+    damaged = _damaged_items(bad_segments, segment_size, COUNT.size, 8, count + 1)
+    offsets = struct.unpack_from(f"<{count + 1}Q", raw, COUNT.size)
+    bad_bytes = [(seg * segment_size, (seg + 1) * segment_size) for seg in bad_segments]
+
+    strings = []
+    for i in range(count):
+        start, end = base + offsets[i], base + offsets[i + 1]
+        if (i in damaged or i + 1 in damaged or end < start or end > len(raw)
+                or any(lo < end and start < hi for lo, hi in bad_bytes)):
+            strings.append(CORRUPT_TEXT)
+        else:
+            strings.append(raw[start:end].decode("utf-8", errors="replace"))
+    return strings
+
+
+def decode(data, bad: Optional[Set[Tuple[int, int]]] = None,
+           segment_size: int = 0, report=None) -> Dict[str, Any]:
+    """
+    Decodes ACMB bytes into {"integrity": ..., "tree": ...}.
+
+    bad lists (kind, segment) pairs that failed verification;
+    damage is confined to the records and strings they cover.
+    """
+    directory = read_directory(data)
+    bad = bad or set()
+
+    def bad_in(kind) -> Set[int]:
+        return {seg for k, seg in bad if k == kind}
+
+    def lost_section(kind) -> bool:
+        return bool(bad_in(kind)) and directory[kind][0] != CODEC_NONE
+
+    for kind, seg in sorted(bad):
+        if report is not None:
+            report.add(SECTION_NAMES.get(kind, f"section {kind}"), f"segment {seg}")
+
+    # META
+    if bad_in(SECTION_META):
+        integrity = {}
+    else:
+        integrity = json.loads(read_section(data, directory, SECTION_META) or b"{}")
+
+    # STRINGS
+    if lost_section(SECTION_STRINGS):
+        strings = None
+    else:
+        raw = read_section(data, directory, SECTION_STRINGS)
+        if bad_in(SECTION_STRINGS):
+            strings = _checked_strings(raw, bad_in(SECTION_STRINGS), segment_size)
+        else:
+            strings = decode_strings(raw)
+
+    # NODES
+    raw_len = directory[SECTION_NODES][3]
+    count = max(0, (raw_len - COUNT.size) // NODE_RECORD.size)
+
+    if lost_section(SECTION_NODES):
+        from ac_verify import placeholder
+        if report is not None:
+            report.lost += count
+        return {"integrity": integrity, "tree": placeholder()}
+
+    nodes_raw = read_section(data, directory, SECTION_NODES)
+    view = memoryview(nodes_raw)[COUNT.size:COUNT.size + count * NODE_RECORD.size]
+    records = list(NODE_RECORD.iter_unpack(view))
+
+    if strings is None:
+        from ac_verify import CORRUPT_TEXT
+        strings = _CorruptStrings(CORRUPT_TEXT)
+
+    damaged = _damaged_items(bad_in(SECTION_NODES), segment_size,
+                             COUNT.size, NODE_RECORD.size, count)
+
+    if not damaged:
+        nodes = [decode_node(r, strings) for r in records]
+        for node, record in zip(nodes, records):
+            first, n = record[7], record[8]
+            if n:
+                node["children"] = nodes[first:first + n]
+    else:
+        nodes = _decode_damaged(records, strings, damaged)
+        if report is not None:
+            report.lost += len(damaged)
+
+    if bad_in(SECTION_STRINGS):
+        # An unreadable id must not alias other unreadable ids
+        from ac_verify import CORRUPT_TEXT
+        for node in nodes:
+            if node["id"] == CORRUPT_TEXT:
+                node["id"] = None
+
+    return {
+        "integrity": integrity,
+        "tree": nodes[0] if nodes else {},
+    }
+
+
+class _CorruptStrings:
+    """Stands in for a string table whose section could not be read."""
+
+    def __init__(self, text):
+        self.text = text
+
+    def __getitem__(self, _):
+        return self.text
+
+
+def _decode_damaged(records, strings, damaged: Set[int]) -> List[Dict[str, Any]]:
+    """
+    Rebuilds the tree around damaged records. Intact records keep
+    their parent links; a damaged record is re-homed under the
+    intact node whose child span covers it and becomes a
+    SIGIL_ONLY placeholder. Orphans are attached to the root.
+    """
+    from ac_verify import placeholder
+
+    count = len(records)
+    nodes = []
+    parent_of: List[Optional[int]] = [None] * count
+
+    for i, record in enumerate(records):
+        if i in damaged:
+            nodes.append(placeholder())
+            continue
+        nodes.append(decode_node(record, strings))
+        parent = record[2]
+        parent_of[i] = parent if parent != NONE and parent < count else None
+
+    for i, record in enumerate(records):
+        if i in damaged:
+            continue
+        first, n = record[7], record[8]
+        if n and first != NONE:
+            for k in range(first, min(first + n, count)):
+                if k in damaged:
+                    parent_of[k] = i
+                    nodes[k]["cycle"] = nodes[i]["cycle"]
+
+    for k in range(1, count):
+        parent = parent_of[k]
+        if parent is None or parent == k:
+            parent = 0
+        nodes[parent]["children"].append(nodes[k])
+
+    return nodes
+
+
+SECTION_NAMES = {
+    SECTION_HEADER: "HEADER",
+    SECTION_META: "META",
+    SECTION_STRINGS: "STRINGS",
+    SECTION_NODES: "NODES",
+    SECTION_ID_INDEX: "ID_INDEX",
+    SECTION_CYCLE_INDEX: "CYCLE_INDEX",
+    SECTION_SIGIL_INDEX: "SIGIL_INDEX",
+    SECTION_DIGESTS: "DIGESTS",
+    SECTION_CHECKSUMS: "CHECKSUMS",
+}
+
+
+# ============================================================
+#  FILES
+# ============================================================
+
+def save(payload: Dict[str, Any], filename: str, compression: Optional[str] = None):
+    data = encode(payload, compression)
+    with open(filename, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def load(filename: str, verify: bool = True, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Loads an ACMB file. With verify=True (default) segments are
+    hashed while the file streams in, and the returned payload
+    carries a "verification" report (None for pre-checksum files).
+    """
+    if not verify:
+        with open(filename, "rb") as f:
+            payload = decode(f.read())
+        payload["verification"] = None
+        return payload
+
+    from ac_verify import VerificationReport, read_verified
+
+    with open(filename, "rb") as f:
+        head = f.read(HEADER.size)
+        if len(head) < HEADER.size:
+            raise FormatError("File too short for ACMB header")
+        count = HEADER.unpack_from(head)[3]
+        head += f.read(SECTION.size * count)
+        directory = read_directory(head)
+        entry = directory.get(SECTION_CHECKSUMS)
+        if entry is not None:
+            f.seek(entry[1])
+            head = head.ljust(entry[1], b"\0") + f.read(entry[2])
+
+    segment_size, expected = read_checksums(head, directory)
+    if not expected:
+        with open(filename, "rb") as f:
+            payload = decode(f.read())
+        payload["verification"] = None
+        return payload
+
+    data, bad = read_verified(filename, expected, workers)
+    if (SECTION_HEADER, 0) in bad:
+        raise FormatError("ACMB header or directory is corrupt")
+
+    report = VerificationReport(checked=len(expected))
+    payload = decode(data, bad, segment_size, report)
+    payload["verification"] = report
+    return payload
+
+
+def is_binary(filename: str) -> bool:
+    """Format sniffing: True if the file starts with the ACMB magic."""
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
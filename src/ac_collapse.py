@@ -20,6 +20,9 @@ import copy
 import sys
 from enum import IntEnum
 
+from ac_echo import traced
+from ac_seed import ANCHOR_LENGTH, AUTO, AUTO_LENGTH, record, render
+
 
 # ============================================================
 # LOOP 2.2 — COMPRESSION CONTRACT (NORMATIVE)
@@ -73,6 +76,7 @@ class ACCollapseEngine:
             cycle=cycle,
             child_count=len(children),
             depth=depth,
+            node_id=node.get("id"),
         )
 
         return ok, reason
@@ -81,12 +85,16 @@ class ACCollapseEngine:
     #  MAIN COLLAPSE
     # ------------------------------------------------------------
 
+    @traced("collapse")
     def collapse_state(self, node: dict, depth: int = 0) -> dict:
         """
         Recursively collapses a node into a seed-safe structure.
         All Guardian policies are enforced at each step.
         """
+        return self._collapse_state(node, depth)
 
+    def _collapse_state(self, node: dict, depth: int) -> dict:
+        # Loop 1.18 — recursion stays below the traced entry point
         # 1. Structural clone (Preserve original memory safe)
         collapsed = copy.deepcopy(node)
 
@@ -125,13 +133,13 @@ class ACCollapseEngine:
             # Strategy: Generate seed if missing
             if priority >= 3:
                 # High priority: Keep longer snippet
-                snippet = raw[:80]
+                length = ANCHOR_LENGTH
             else:
                 # Low priority: Aggressive truncate
-                snippet = raw[:50]
+                length = AUTO_LENGTH
 
-            # Loop 1.4: Intern the prefix logic if possible, though variable content cannot be interned.
-            collapsed["seed"] = f"[AutoSeed AC-{collapsed.get('cycle', 0)}]: {snippet}..."
+            # Loop 1.28: the content is dropped below, so the seed is kept as text
+            collapsed["seed"] = render(record(AUTO, collapsed.get("cycle", 0), length), raw)
             collapsed["content"] = None
             collapsed["compressed_from"] = collapsed.get("compression_level")
             collapsed["compression_level"] = CompressionLevel.SEED
@@ -141,7 +149,7 @@ class ACCollapseEngine:
         new_children = []
 
         for child in child_list:
-            new_child = self.collapse_state(child, depth + 1)
+            new_child = self._collapse_state(child, depth + 1)
             new_children.append(new_child)
 
         collapsed["children"] = new_children
@@ -0,0 +1,159 @@
+# ============================================================
+# AC CONTENT TABLE — ArcCore-Prime V1.1
+# Loop 1.5: Content-Addressed Deduplication
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Transcripts repeat themselves (boilerplate, repeated
+#   questions, identical acknowledgements). The content table
+#   extends Loop 1.4 interning from roles to node content and
+#   seeds: every distinct string is stored once and shared by
+#   all nodes that reference it, in memory and on disk.
+#
+# ============================================================
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from ac_seed import decode as decode_seed, derived as derived_seed, render as render_seed
+
+
+class ContentTable:
+    """
+    Deduplicating string table shared across a memory tree.
+
+    Responsibilities:
+      - Canonicalise strings (sys.intern-style object sharing)
+      - Assign stable integer ids for persistence
+      - Track references and bytes for dedup reporting
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._refs: List[int] = []
+        self._sizes: List[int] = []
+
+    def __len__(self):
+        return len(self._strings)
+
+    # ------------------------------------------------------------
+    #  INTERNING
+    # ------------------------------------------------------------
+
+    def ref(self, text: str) -> int:
+        """Returns the id of text, adding it to the table if new."""
+        sid = self._ids.get(text)
+        if sid is None:
+            sid = len(self._strings)
+            self._ids[text] = sid
+            self._strings.append(text)
+            self._refs.append(0)
+            self._sizes.append(len(text.encode("utf-8")))
+        self._refs[sid] += 1
+        return sid
+
+    def intern(self, text: Optional[str]) -> Optional[str]:
+        """Returns the canonical shared copy of text (None passes through)."""
+        if text is None:
+            return None
+        return self._strings[self.ref(text)]
+
+    def lookup(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def share(self, node):
+        """Replaces a HarmonicNode's content and seed with shared copies."""
+        node.raw_content = self.intern(node.raw_content)
+        if isinstance(node.seed_record, str):  # Loop 1.28 — records hold no text
+            node.seed_record = self.intern(node.seed_record)
+        return node
+
+    def strings(self) -> List[str]:
+        return list(self._strings)
+
+    # ------------------------------------------------------------
+    #  REPORTING
+    # ------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Dedup ratio and bytes saved across all references."""
+        references = sum(self._refs)
+        unique = len(self._strings)
+        bytes_stored = sum(self._sizes)
+        bytes_referenced = sum(s * r for s, r in zip(self._sizes, self._refs))
+
+        return {
+            "unique_strings": unique,
+            "references": references,
+            "dedup_ratio": round(references / unique, 3) if unique else 1.0,
+            "bytes_referenced": bytes_referenced,
+            "bytes_stored": bytes_stored,
+            "bytes_saved": bytes_referenced - bytes_stored,
+        }
+
+    def describe(self) -> str:
+        s = self.stats()
+        return (
+            f"{s['references']} refs → {s['unique_strings']} unique "
+            f"(dedup {s['dedup_ratio']}x, {s['bytes_saved']} bytes saved)"
+        )
+
+
+# ============================================================
+#  PERSISTED FORM
+# ============================================================
+#
+# Saved trees carry a top-level "strings" list; node "content"
+# and "seed" fields hold integer indexes into it. A fresh table
+# is built per save so strings no longer referenced are dropped.
+# Loop 1.28 — a seed derived from the node's content is saved
+# as "seed_record": an index into a top-level "seeds" list of
+# ac_seed [kind, cycle, length] records, in place of "seed".
+#
+# ============================================================
+
+PACKED_FIELDS = ("content", "seed")
+
+
+def pack_tree(tree: Dict[str, Any]) -> Tuple[List[str], List[list], Dict[str, Any]]:
+    """Returns (strings, seeds, tree) with content/seed replaced by ids."""
+    table = ContentTable()
+    seeds: Dict[Any, int] = {}
+
+    def pack(node):
+        packed = dict(node)
+        record = derived_seed(packed.get("seed"), packed.get("content"))
+        if record is not None:
+            del packed["seed"]
+            packed["seed_record"] = seeds.setdefault(record, len(seeds))
+        for key in PACKED_FIELDS:
+            value = packed.get(key)
+            if isinstance(value, str):
+                packed[key] = table.ref(value)
+        packed["children"] = [pack(c) for c in node.get("children", [])]
+        return packed
+
+    packed_tree = pack(tree)
+    return table.strings(), [list(record) for record in seeds], packed_tree
+
+
+def unpack_tree(strings: Optional[List[str]], tree: Dict[str, Any],
+                seeds: Optional[List[list]] = None) -> Dict[str, Any]:
+    """Resolves string and seed ids in place. Legacy trees (no table) pass through."""
+    if not strings:
+        return tree
+    records = [decode_seed(entry) for entry in seeds or ()]
+
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        for key in PACKED_FIELDS:
+            value = node.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                node[key] = strings[value]
+        if "seed_record" in node:
+            node["seed"] = render_seed(records[node.pop("seed_record")], node.get("content"))
+        stack.extend(node.get("children", []))
+
+    return tree
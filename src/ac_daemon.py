@@ -0,0 +1,337 @@
+# ============================================================
+# AC DAEMON — ArcCore-Prime V1.1
+# Loop 1.12: Persistent Memory Daemon + Local Socket Client
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   One long-running process owns the ArcMemorySystem and
+#   serves ArcInterpreter commands over a Unix domain socket.
+#   Shells and scripts connect as thin clients and share the
+#   same warm tree, content table and caches.
+#
+# Protocol (one request → one response, connection reusable):
+#
+#   frame    := u32 big-endian length | UTF-8 JSON body
+#   request  := {"op": "execute", "command": "<shell line>"}
+#             | {"op": "ping"}
+#             | {"op": "shutdown"}
+#   response := {"ok": true,  "result": "<text>"[, "status": "ok|error|denied"]}
+#             | {"ok": false, "error":  "<text>"}
+#
+# "status" (execute only) is the interpreter's own verdict on the
+# command (ArcInterpreter.execute_status), so clients need not
+# read it from the text.
+#
+# Commands are executed one at a time (the memory kernel is
+# single-writer); connections are served on their own threads.
+#
+# shutdown is accepted from the daemon's own uid (SO_PEERCRED);
+# any other peer, or a platform without peer credentials, is
+# judged by the Sentinel as a GOVERN action.
+#
+# ============================================================
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+FRAME = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+
+SOCKET_ENV = "ARCCORE_SOCKET"
+
+
+class ProtocolError(ConnectionError):
+    pass
+
+
+def default_socket_path() -> str:
+    """$ARCCORE_SOCKET, else a per-user socket in the runtime dir."""
+    explicit = os.environ.get(SOCKET_ENV)
+    if explicit:
+        return explicit
+    runtime = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(runtime, f"arccore-{uid}.sock")
+
+
+# ------------------------------------------------------------
+# Framing
+# ------------------------------------------------------------
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            if chunks:
+                raise ProtocolError("Connection closed mid-frame")
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def send_frame(sock: socket.socket, message: Dict[str, Any]):
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    if len(body) > MAX_FRAME:
+        raise ProtocolError(f"Frame too large ({len(body)} bytes)")
+    sock.sendall(FRAME.pack(len(body)) + body)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """Next message, or None on a clean end of stream."""
+    head = _recv_exact(sock, FRAME.size)
+    if head is None:
+        return None
+    (size,) = FRAME.unpack(head)
+    if size > MAX_FRAME:
+        raise ProtocolError(f"Frame too large ({size} bytes)")
+    body = _recv_exact(sock, size)
+    if body is None:
+        raise ProtocolError("Connection closed mid-frame")
+    return json.loads(body.decode("utf-8"))
+
+
+# ============================================================
+#  SERVER
+# ============================================================
+
+class _Handler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        daemon = self.server.arc_daemon
+        while True:
+            try:
+                request = recv_frame(self.request)
+            except (ProtocolError, ValueError, OSError):
+                return
+            if request is None:
+                return
+            response = daemon.dispatch(request, self.peer_uid)
+            send_frame(self.request, response)
+            if request.get("op") == "shutdown" and response.get("ok"):
+                return
+
+    def setup(self):
+        super().setup()
+        self.peer_uid = _peer_uid(self.request)
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """uid of the process at the other end, None where the OS cannot tell."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    try:
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    except OSError:
+        return None
+    return struct.unpack("3i", creds)[1]
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ArcDaemon:
+    """
+    Owns one ArcInterpreter (and its memory) for the lifetime of
+    the process. memory_file, if given, is restored at start and
+    written back on shutdown.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, interpreter=None,
+                 memory_file: Optional[str] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.memory_file = memory_file
+
+        if interpreter is None:
+            from ac_interpreter import ArcInterpreter
+            interpreter = ArcInterpreter()
+        self.interpreter = interpreter
+        self._lock = threading.Lock()
+        self._server = None
+
+        if memory_file and os.path.exists(memory_file):
+            self.interpreter.memory.restore(memory_file)
+
+    # ------------------------------------------------------------
+    #  DISPATCH
+    # ------------------------------------------------------------
+
+    def dispatch(self, request: Dict[str, Any], peer_uid: Optional[int] = None) -> Dict[str, Any]:
+        """peer_uid is the client's uid (SO_PEERCRED), None if unknown."""
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "result": "pong"}
+        if op == "shutdown":
+            refusal = self._shutdown_refusal(peer_uid)
+            if refusal:
+                return {"ok": False, "error": refusal}
+            threading.Thread(target=self.stop, daemon=True).start()
+            return {"ok": True, "result": "[daemon] Shutting down."}
+        if op != "execute":
+            return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+        command = request.get("command")
+        if not isinstance(command, str):
+            return {"ok": False, "error": "execute requires a command string"}
+        try:
+            with self._lock:
+                result = self.interpreter.execute(command)
+            return {"ok": True, "result": str(result), "status": getattr(result, "status", "ok")}
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    def _shutdown_refusal(self, peer_uid: Optional[int]) -> Optional[str]:
+        """None if the peer may stop the daemon: its owner, or GOVERN authority."""
+        if peer_uid is not None and hasattr(os, "getuid") and peer_uid == os.getuid():
+            return None
+        interpreter = self.interpreter
+        judgment = interpreter.sentinel.judge("shutdown", interpreter.authority)
+        if judgment.allowed:
+            return None
+        return f"[Sentinel] ⛔ shutdown: {judgment.reason}"
+
+    # ------------------------------------------------------------
+    #  LIFECYCLE
+    # ------------------------------------------------------------
+
+    def bind(self):
+        """Creates the listening socket (replacing a stale one)."""
+        if os.path.exists(self.socket_path):
+            if _is_alive(self.socket_path):
+                raise RuntimeError(f"A daemon is already serving {self.socket_path}")
+            os.unlink(self.socket_path)
+        # Created 0600: no window in which another user can connect
+        previous = os.umask(0o177)
+        try:
+            self._server = _Server(self.socket_path, _Handler)
+        finally:
+            os.umask(previous)
+        self._server.arc_daemon = self
+
+    def serve_forever(self):
+        if self._server is None:
+            self.bind()
+        try:
+            self._server.serve_forever(poll_interval=0.2)
+        finally:
+            self._close()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _close(self):
+        server, self._server = self._server, None
+        if server is not None:
+            server.server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        if self.memory_file:
+            with self._lock:
+                self.interpreter.memory.save_memory(self.memory_file)
+        self.interpreter.guardian.audit.close()
+
+
+def _is_alive(path: str) -> bool:
+    try:
+        with ArcClient(path, timeout=1.0) as client:
+            return client.ping()
+    except OSError:
+        return False
+
+
+# ============================================================
+#  CLIENT
+# ============================================================
+
+class ArcClient:
+    """
+    Thin client with the same execute() surface as ArcInterpreter,
+    so ArcConsole can drive either one.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(self.socket_path)
+        except OSError:
+            self.sock.close()
+            raise
+
+    def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        send_frame(self.sock, message)
+        response = recv_frame(self.sock)
+        if response is None:
+            raise ProtocolError("Daemon closed the connection")
+        return response
+
+    def execute(self, command: str) -> str:
+        return self.execute_status(command)[1]
+
+    def execute_status(self, command: str) -> Tuple[str, str]:
+        """(status, text) as ArcInterpreter.execute_status(), from the daemon's verdict."""
+        response = self.request({"op": "execute", "command": command})
+        if not response.get("ok"):
+            return "error", f"[daemon] Error: {response.get('error')}"
+        return response.get("status", "ok"), response.get("result")
+
+    def ping(self) -> bool:
+        return self.request({"op": "ping"}).get("ok", False)
+
+    def shutdown(self) -> str:
+        response = self.request({"op": "shutdown"})
+        if not response.get("ok"):
+            return f"[daemon] Error: {response.get('error')}"
+        return response.get("result", "")
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================
+#  CLI
+# ============================================================
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ArcCore memory daemon")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument("--memory", default=None,
+                        help="memory file restored at start and saved on shutdown")
+    parser.add_argument("--stop", action="store_true", help="stop a running daemon")
+    args = parser.parse_args(argv)
+
+    if args.stop:
+        with ArcClient(args.socket) as client:
+            print(client.shutdown())
+        return
+
+    daemon = ArcDaemon(args.socket, memory_file=args.memory)
+    daemon.bind()
+    print(f"[daemon] Serving ArcCore on {daemon.socket_path}")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
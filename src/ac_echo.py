@@ -1,38 +1,438 @@
-# ac_echo.py
-# ArcEcho: Signal tracing, loop reflection, memory reverb handler
+# ============================================================
+# AC ECHO — ArcCore-Prime V1.1
+# Loop 1.17: Bounded Echo Ring with Segmented Spill
+# Guardian Layer: Arien
+# ============================================================
+#
+# ArcEcho: signal tracing, loop reflection, memory reverb handler.
+#
+# Purpose:
+#   The echo log used to be an unbounded list of dicts, each
+#   pulse hashing its signal. Now:
+#
+#     - records are compact tuples in a fixed-capacity ring
+#       (id, signal, source, intensity, unix time)
+#     - ids are a per-instance 48-bit counter (12 hex chars,
+#       same shape as before) — no hashing per pulse
+#     - when the ring is full, its oldest `segment` records are
+#       written as one NDJSON file to spill_dir; at most
+#       `max_segments` files are kept (oldest deleted first).
+#       Without a spill_dir the oldest records are dropped.
+#     - reflect(count) is O(count) over the ring
+#     - export() streams dicts oldest → newest across the disk
+#       segments and then the ring
+#
+# Loop 1.18 — Tracing:
+#   ArcEcho is also the instrumentation surface for kernel hot
+#   paths (ingest, purify, sigil scoring, gate, hash, collapse,
+#   reconstruct, save, load). The process-wide ECHO instance
+#   keeps counters and streaming latency histograms; spans are
+#   opened with ECHO.span(name) or the @traced(name) decorator.
+#
+#   Tracing is off unless ARCCORE_TRACE=1 or ECHO.enabled is
+#   set. @traced methods cost nothing while it is off: the class
+#   holds the plain function, and enabling swaps in the timing
+#   wrapper. A disabled span() returns a shared no-op context
+#   manager. Spans slower than slow_ms (if set) are also pulsed
+#   into the ring.
+#
+# ============================================================
 
-from datetime import datetime
-import hashlib
+import functools
+import json
+import os
+from collections import deque
+from time import gmtime, perf_counter_ns, strftime, time
+from typing import Any, Dict, Iterator, List, Optional
+
+SEGMENT_PREFIX = "echo-"
+SEGMENT_SUFFIX = ".ndjson"
+TRACE_ENV = "ARCCORE_TRACE"
+
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_second = [None, ""]  # last formatted whole second and its prefix
+
+
+def _iso(ts: float) -> str:
+    """Naive UTC ISO timestamp, as pulse() always returned; the
+    date/time prefix is formatted once per second."""
+    sec = int(ts)
+    if _second[0] != sec:
+        _second[0], _second[1] = sec, strftime("%Y-%m-%dT%H:%M:%S", gmtime(sec))
+    return f"{_second[1]}.{int((ts - sec) * 1e6):06d}"
+
+
+def _entry(record) -> Dict[str, Any]:
+    echo_id, signal, source, intensity, ts = record
+    return {"id": echo_id, "signal": signal, "source": source,
+            "intensity": intensity, "timestamp": _iso(ts)}
+
+
+# ============================================================
+#  LATENCY HISTOGRAM (Loop 1.18)
+# ============================================================
+
+_SUB_BITS = 3  # 8 sub-buckets per power of two: ≤ 12.5% bucket width
+
+
+class Histogram:
+    """
+    Streaming log-linear histogram of nanosecond durations.
+    O(1) record, fixed memory; percentiles are bucket midpoints.
+    """
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
 
-class ArcEcho:
     def __init__(self):
-        self.echo_log = []
+        self.buckets = [0] * (64 << _SUB_BITS)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
 
-    def pulse(self, signal: str, source: str = "manual", intensity: int = 1):
-        timestamp = datetime.utcnow().isoformat()
-        echo_id = hashlib.sha256(f"{signal}{timestamp}".encode()).hexdigest()[:12]
-        echo_entry = {
-            "id": echo_id,
-            "signal": signal,
-            "source": source,
-            "intensity": intensity,
-            "timestamp": timestamp,
+    @staticmethod
+    def _index(ns: int) -> int:
+        if ns < (1 << _SUB_BITS):
+            return ns
+        octave = ns.bit_length() - _SUB_BITS
+        return (octave << _SUB_BITS) + ((ns >> (octave - 1)) & ((1 << _SUB_BITS) - 1))
+
+    @staticmethod
+    def _bounds(index: int):
+        if index < (1 << _SUB_BITS):
+            return index, index + 1
+        octave, sub = index >> _SUB_BITS, index & ((1 << _SUB_BITS) - 1)
+        width = 1 << (octave - 1)
+        low = ((1 << _SUB_BITS) + sub) * width
+        return low, low + width
+
+    def record(self, ns: int):
+        self.buckets[self._index(ns)] += 1
+        self.count += 1
+        self.total += ns
+        if self.min is None or ns < self.min:
+            self.min = ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, p: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, round(p / 100 * self.count))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                low, high = self._bounds(index)
+                return min(max((low + high) // 2, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        ms = 1e-6
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * ms, 3),
+            "p50_ms": round(self.percentile(50) * ms, 4),
+            "p95_ms": round(self.percentile(95) * ms, 4),
+            "p99_ms": round(self.percentile(99) * ms, 4),
+            "max_ms": round(self.max * ms, 4),
         }
-        self.echo_log.append(echo_entry)
-        return echo_entry
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("echo", "name", "start")
+
+    def __init__(self, echo, name: str):
+        self.echo = echo
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.echo.observe(self.name, perf_counter_ns() - self.start)
+        return False
+
+
+# ============================================================
+#  ARC ECHO
+# ============================================================
+
+class ArcEcho:
+    def __init__(self, capacity: int = 4096, spill_dir: Optional[str] = None,
+                 segment: Optional[int] = None, max_segments: int = 8):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.segment = max(1, min(segment or capacity // 4 or 1, capacity))
+        self.spill_dir = spill_dir
+        self.max_segments = max_segments
+
+        self._ring: List[Optional[tuple]] = [None] * capacity
+        self._start = 0
+        self._size = 0
+        self._next_id = int.from_bytes(os.urandom(6), "big")
+
+        self.dropped = 0            # records discarded (no spill_dir or rotated out)
+        self._segments = deque()    # (path, record count), oldest first
+        self._segment_seq = 0
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            self._load_segments()
+
+        # Loop 1.18 — tracing (off by default)
+        self._enabled = False
+        self.slow_ms: Optional[float] = None
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    # ------------------------------------------------------------
+    # Pulse
+    # ------------------------------------------------------------
+
+    def pulse(self, signal: str, source: str = "manual", intensity: int = 1):
+        echo_id = f"{self._next_id & 0xFFFFFFFFFFFF:012x}"
+        self._next_id += 1
+        record = (echo_id, signal, source, intensity, time())
+
+        if self._size == self.capacity:
+            self._spill()
+        ring = self._ring
+        ring[(self._start + self._size) % self.capacity] = record
+        self._size += 1
+        return _entry(record)
+
+    def _spill(self):
+        """Moves the oldest `segment` records out of the ring."""
+        count = self.segment
+        records = [self._ring[(self._start + k) % self.capacity] for k in range(count)]
+        for k in range(count):
+            self._ring[(self._start + k) % self.capacity] = None
+        self._start = (self._start + count) % self.capacity
+        self._size -= count
+
+        if not self.spill_dir:
+            self.dropped += count
+            return
+
+        path = os.path.join(self.spill_dir,
+                            f"{SEGMENT_PREFIX}{self._segment_seq:08d}{SEGMENT_SUFFIX}")
+        self._segment_seq += 1
+        lines = [_encode(_entry(record)) for record in records]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+            f.write("\n")
+        self._segments.append((path, count))
+
+        while len(self._segments) > self.max_segments:
+            old, old_count = self._segments.popleft()
+            self.dropped += old_count
+            try:
+                os.remove(old)
+            except FileNotFoundError:
+                pass
+
+    def _load_segments(self):
+        """Picks up segments left in spill_dir by an earlier run."""
+        names = sorted(n for n in os.listdir(self.spill_dir)
+                       if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX))
+        for name in names:
+            path = os.path.join(self.spill_dir, name)
+            with open(path, "rb") as f:
+                self._segments.append((path, sum(1 for _ in f)))
+            seq = name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+            if seq.isdigit():
+                self._segment_seq = max(self._segment_seq, int(seq) + 1)
+
+    # ------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Echoes retained in memory and on disk."""
+        return self._size + sum(count for _, count in self._segments)
+
+    @property
+    def echo_log(self) -> List[Dict[str, Any]]:
+        """In-memory echoes, oldest first."""
+        return self.reflect(self._size)
 
     def reflect(self, count=5):
-        return self.echo_log[-count:]
+        """The last `count` in-memory echoes, oldest first. O(count)."""
+        count = max(0, min(count, self._size))
+        first = self._start + self._size - count
+        return [_entry(self._ring[(first + k) % self.capacity]) for k in range(count)]
 
     def clear(self):
-        self.echo_log = []
+        """Empties the ring and deletes spilled segments."""
+        self._ring = [None] * self.capacity
+        self._start = self._size = 0
+        while self._segments:
+            path, _ = self._segments.popleft()
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def export(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams every retained echo, oldest first: disk segments,
+        then the ring. The set of echoes is fixed when export() is
+        called; later pulses don't shift the stream.
+        """
+        segments = [path for path, _ in self._segments]
+        ring = [self._ring[(self._start + k) % self.capacity] for k in range(self._size)]
+        return self._stream(segments, ring)
+
+    @staticmethod
+    def _stream(segments: List[str], ring: List[tuple]) -> Iterator[Dict[str, Any]]:
+        for path in segments:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+            except FileNotFoundError:
+                continue  # rotated out before it was reached
+        for record in ring:
+            yield _entry(record)
+
+    # ------------------------------------------------------------
+    # Tracing (Loop 1.18)
+    # ------------------------------------------------------------
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = bool(value)
+        if self is ECHO:
+            _install(self._enabled)
+
+    def span(self, name: str):
+        """Context manager timing one call of a hot path."""
+        if not self._enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def observe(self, name: str, ns: int):
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+        hist.record(ns)
+        if self.slow_ms is not None and ns >= self.slow_ms * 1e6:
+            self.pulse(f"slow {name}: {ns / 1e6:.3f} ms", source="trace", intensity=2)
+
+    def count(self, name: str, n: int = 1):
+        if self._enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
 
-    def export(self):
+    def stats(self) -> Dict[str, Any]:
         return {
-            "echo_count": len(self.echo_log),
-            "echoes": self.echo_log,
+            "enabled": self.enabled,
+            "spans": {name: h.summary() for name, h in sorted(self.histograms.items())},
+            "counters": dict(sorted(self.counters.items())),
         }
 
+    def stats_report(self) -> str:
+        lines = [f"{'span':<22} {'count':>8} {'p50 ms':>9} {'p95 ms':>9} "
+                 f"{'p99 ms':>9} {'max ms':>9} {'total ms':>10}"]
+        for name, m in self.stats()["spans"].items():
+            lines.append(f"{name:<22} {m['count']:>8} {m['p50_ms']:>9.4f} {m['p95_ms']:>9.4f} "
+                         f"{m['p99_ms']:>9.4f} {m['max_ms']:>9.4f} {m['total_ms']:>10.3f}")
+        for name, value in self.stats()["counters"].items():
+            lines.append(f"{name:<22} {value:>8}")
+        return "\n".join(lines)
+
+    def reset_stats(self):
+        self.counters = {}
+        self.histograms = {}
+
+
+# ============================================================
+#  PROCESS-WIDE INSTRUMENTATION
+# ============================================================
+
+ECHO = None
+_sites = []  # (owner, attribute, plain function or descriptor, span name)
+
+
+def _timed(fn, name: str):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            ECHO.observe(name, perf_counter_ns() - start)
+    return wrapper
+
+
+def _wrap(fn, name: str):
+    if isinstance(fn, staticmethod):
+        return staticmethod(_timed(fn.__func__, name))
+    if isinstance(fn, classmethod):
+        return classmethod(_timed(fn.__func__, name))
+    return _timed(fn, name)
+
+
+def _install(enabled: bool):
+    for owner, attr, fn, name in _sites:
+        setattr(owner, attr, _wrap(fn, name) if enabled else fn)
+
+
+class traced:
+    """
+    Decorator: times each call as span `name` while ECHO is
+    enabled. On a class attribute it registers itself and puts
+    the plain function back, so disabled tracing adds no call
+    overhead; elsewhere it wraps the function with a flag check.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.fn = None
+
+    def __call__(self, *args, **kwargs):
+        if self.fn is None:
+            self.fn = args[0]
+            functools.update_wrapper(self, self.fn)
+            return self
+        if not ECHO._enabled:
+            return self.fn(*args, **kwargs)
+        start = perf_counter_ns()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            ECHO.observe(self.name, perf_counter_ns() - start)
+
+    def __set_name__(self, owner, attr):
+        _sites.append((owner, attr, self.fn, self.name))
+        enabled = ECHO is not None and ECHO._enabled
+        setattr(owner, attr, _wrap(self.fn, self.name) if enabled else self.fn)
+
+
+ECHO = ArcEcho()
+ECHO.enabled = os.environ.get(TRACE_ENV, "") not in ("", "0")
+
+
 # Optional: test run
 if __name__ == "__main__":
     echo = ArcEcho()
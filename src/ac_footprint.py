@@ -0,0 +1,315 @@
+# ============================================================
+# AC FOOTPRINT — ArcCore-Prime V1.1
+# Loop 1.19: Memory Footprint Profiler and Budget
+# Guardian Layer: Arien
+# Persistence guarantees are defined in docs/memory_model.md
+# ============================================================
+#
+# Purpose:
+#   docs/memory_model.md promises "a bounded, intentional
+#   memory footprint". This walks the live tree and measures it:
+#
+#     content   — raw_content strings
+#     seed      — structural seeds
+#     structure — node objects, attribute dicts, child lists,
+#                 ids, timestamps and roles
+#
+#   Bytes are sys.getsizeof() of the live objects. A string
+#   shared through the content table (or interned) is charged
+#   once, to the first node that references it, so totals are
+#   resident bytes rather than logical bytes; `shared` counts
+#   what deduplication saved.
+#
+#   Totals are broken down by CompressionLevel, cycle, role
+#   and sigil priority. traced=True adds a tracemalloc figure:
+#   live kernel allocations if tracing was already on,
+#   otherwise the cost of rebuilding the tree under tracing.
+#
+#   A budget (ARCCORE_MEMORY_BUDGET, e.g. "64MB") marks a
+#   report as over budget and echoes a warning.
+#
+# ============================================================
+
+import os
+import re
+import sys
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ac_collapse import CompressionLevel
+
+BUDGET_ENV = "ARCCORE_MEMORY_BUDGET"
+DIMENSIONS = ("level", "cycle", "role", "priority")
+KERNEL_FILES = ("arc_prime.py", "ac_content.py", "ac_storage.py", "ac_persistent.py")
+
+_UNITS = {"": 1, "B": 1, "K": 1 << 10, "KB": 1 << 10, "KIB": 1 << 10,
+          "M": 1 << 20, "MB": 1 << 20, "MIB": 1 << 20,
+          "G": 1 << 30, "GB": 1 << 30, "GIB": 1 << 30}
+
+
+def parse_size(text) -> Optional[int]:
+    """'64MB' / '512k' / '1048576' -> bytes; None, '', 'off' -> None."""
+    if text is None:
+        return None
+    if isinstance(text, int):
+        return text
+    text = str(text).strip()
+    if text.lower() in ("", "off", "none"):
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([A-Za-z]*)", text)
+    if not match or match.group(2).upper() not in _UNITS:
+        raise ValueError(f"Invalid size: {text!r}")
+    return int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GiB"
+
+
+def default_budget() -> Optional[int]:
+    try:
+        return parse_size(os.environ.get(BUDGET_ENV))
+    except ValueError:
+        return None
+
+
+# ============================================================
+#  REPORT
+# ============================================================
+
+class FootprintReport:
+    """
+    Outcome of one analysis.
+      totals   — {"nodes", "content", "seed", "structure", "total", "shared"}
+      groups   — dimension -> key -> same shape as totals (no "shared")
+      traced   — tracemalloc figures, or None
+      budget   — budget in bytes, or None
+    """
+
+    def __init__(self, budget: Optional[int] = None, source: str = "live"):
+        self.totals = _bucket()
+        self.totals["shared"] = 0
+        self.groups: Dict[str, Dict[Any, Dict[str, int]]] = {d: {} for d in DIMENSIONS}
+        self.traced: Optional[Dict[str, Any]] = None
+        self.budget = budget
+        self.source = source
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.totals["total"] > self.budget
+
+    def add(self, keys: Dict[str, Any], content: int, seed: int, structure: int):
+        for bucket in [self.totals] + [_group(self.groups[d], keys[d]) for d in DIMENSIONS]:
+            bucket["nodes"] += 1
+            bucket["content"] += content
+            bucket["seed"] += seed
+            bucket["structure"] += structure
+            bucket["total"] += content + seed + structure
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "totals": dict(self.totals),
+            "groups": {d: {str(k): dict(v) for k, v in g.items()} for d, g in self.groups.items()},
+            "traced": self.traced,
+            "budget": self.budget,
+            "over_budget": self.over_budget,
+        }
+
+    def describe(self) -> str:
+        t = self.totals
+        line = (f"{t['nodes']} nodes, {format_bytes(t['total'])} "
+                f"(content {format_bytes(t['content'])}, seeds {format_bytes(t['seed'])}, "
+                f"structure {format_bytes(t['structure'])}; "
+                f"{format_bytes(t['shared'])} saved by sharing)")
+        if self.budget is not None:
+            used = t["total"] / self.budget * 100 if self.budget else float("inf")
+            line += f" — {used:.0f}% of {format_bytes(self.budget)} budget"
+        return line
+
+    def table(self, dimension: str = "level", top: Optional[int] = None) -> str:
+        rows = self.groups[dimension]
+        keys = list(rows)
+        if dimension == "cycle":
+            keys.sort(key=lambda k: -rows[k]["total"])
+        else:
+            keys.sort(key=lambda k: (str(type(k)), k))
+        shown = keys[:top] if top else keys
+
+        lines = [f"{dimension:<12} {'nodes':>8} {'content':>11} {'seeds':>11} "
+                 f"{'structure':>11} {'total':>11} {'share':>6}"]
+        whole = self.totals["total"] or 1
+        for key in shown:
+            r = rows[key]
+            lines.append(f"{str(key):<12} {r['nodes']:>8} {format_bytes(r['content']):>11} "
+                         f"{format_bytes(r['seed']):>11} {format_bytes(r['structure']):>11} "
+                         f"{format_bytes(r['total']):>11} {r['total'] / whole:>6.1%}")
+        if len(keys) > len(shown):
+            lines.append(f"... {len(keys) - len(shown)} more")
+        return "\n".join(lines)
+
+
+def _bucket() -> Dict[str, int]:
+    return {"nodes": 0, "content": 0, "seed": 0, "structure": 0, "total": 0}
+
+
+def _group(groups: Dict[Any, Dict[str, int]], key) -> Dict[str, int]:
+    bucket = groups.get(key)
+    if bucket is None:
+        bucket = groups[key] = _bucket()
+    return bucket
+
+
+# ============================================================
+#  WALKERS
+# ============================================================
+
+def level_of(compression_level, collapsed: bool) -> str:
+    """CompressionLevel name; live nodes without one are SEED once collapsed."""
+    if compression_level is None:
+        return CompressionLevel.SEED.name if collapsed else CompressionLevel.RAW.name
+    try:
+        return CompressionLevel(compression_level).name
+    except ValueError:
+        return str(compression_level)
+
+
+def _live_nodes(root) -> Iterator[Tuple]:
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        keys = {
+            "level": level_of(getattr(node, "compression_level", None), node.is_collapsed),
+            "cycle": node.cycle_alignment,
+            "role": node.role,
+            "priority": node.priority,
+        }
+        overhead = sys.getsizeof(node) + sys.getsizeof(node.children)
+        state = getattr(node, "__dict__", None)
+        if state is not None:
+            overhead += sys.getsizeof(state)
+        yield (node.raw_content, node.seed_record,  # Loop 1.28 — records are shared
+               (node.id, node.timestamp, node.role), overhead, keys)
+        stack.extend(reversed(node.children))
+
+
+def _dict_nodes(root) -> Iterator[Tuple]:
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        keys = {
+            "level": level_of(node.get("compression_level"), bool(node.get("collapsed"))),
+            "cycle": node.get("cycle"),
+            "role": node.get("role"),
+            "priority": node.get("priority", 0),
+        }
+        children = node.get("children", [])
+        overhead = sys.getsizeof(node) + sys.getsizeof(children)
+        yield (node.get("content"), node.get("seed"),
+               (node.get("id"), node.get("timestamp"), node.get("role")), overhead, keys)
+        stack.extend(reversed(children))
+
+
+# ============================================================
+#  ANALYZER
+# ============================================================
+
+def analyze_tree(root, budget: Optional[int] = None, source: str = "live") -> FootprintReport:
+    """Footprint of a HarmonicNode tree or a to_dict()-shaped tree."""
+    report = FootprintReport(budget, source)
+    nodes = _dict_nodes(root) if isinstance(root, dict) else _live_nodes(root)
+    seen = set()
+
+    def charge(obj) -> int:
+        if obj is None:
+            return 0
+        size = sys.getsizeof(obj)
+        if id(obj) in seen:
+            report.totals["shared"] += size
+            return 0
+        seen.add(id(obj))
+        return size
+
+    # Every object charged is reachable from root, so ids stay unique for the walk
+    for content, seed, small, overhead, keys in nodes:
+        structure = overhead + sum(charge(s) for s in small)
+        report.add(keys, charge(content), charge(seed), structure)
+    return report
+
+
+def tree_bytes(root) -> int:
+    """analyze_tree(root).totals["total"] of a HarmonicNode tree, without
+    the per-dimension breakdowns (Loop 1.29 pool sizing)."""
+    getsizeof = sys.getsizeof
+    seen = set()
+    total = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        total += getsizeof(node) + getsizeof(node.children)
+        state = getattr(node, "__dict__", None)
+        if state is not None:
+            total += getsizeof(state)
+        for obj in (node.raw_content, node.seed_record, node.id, node.timestamp, node.role):
+            if obj is not None and id(obj) not in seen:
+                seen.add(id(obj))
+                total += getsizeof(obj)
+        stack.extend(node.children)
+    return total
+
+
+def analyze(memory, budget: Optional[int] = None, traced: bool = False) -> FootprintReport:
+    """
+    Footprint of an ArcMemorySystem. Resident trees are walked in
+    place under the read lock; other backends are measured on a
+    materialised tree() copy. budget defaults to
+    ARCCORE_MEMORY_BUDGET.
+    """
+    if budget is None:
+        budget = default_budget()
+    with memory.lock.read():
+        if memory.backend.resident:
+            report = analyze_tree(memory.root, budget)
+        else:
+            report = analyze_tree(memory.backend.tree(), budget, source="materialised")
+    if traced:
+        report.traced = traced_footprint(memory)
+    if report.over_budget:
+        from ac_echo import ECHO
+        ECHO.pulse(f"memory over budget: {report.describe()}", source="footprint", intensity=3)
+    return report
+
+
+def traced_footprint(memory, top: int = 5) -> Dict[str, Any]:
+    """
+    tracemalloc view. If tracing is already on, sums the live
+    allocations made from kernel files; otherwise rebuilds a
+    copy of the tree under tracing and reports its size.
+    """
+    import tracemalloc
+
+    if tracemalloc.is_tracing():
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, f"*{name}") for name in KERNEL_FILES])
+        stats = snapshot.statistics("lineno")
+        return {
+            "mode": "live",
+            "bytes": sum(s.size for s in stats),
+            "top": [(f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}", s.size)
+                    for s in stats[:top]],
+        }
+
+    from arc_prime import HarmonicNode
+    tree = memory.tree()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        copy = HarmonicNode.from_dict(tree)
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del copy
+    return {"mode": "rebuild", "bytes": size, "top": []}
@@ -0,0 +1,109 @@
+# ============================================================
+# AC IDS — ArcCore-Prime V1.1
+# Loop 1.26: Node Id Allocation and Id Index
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Node ids used to be 32 random bits, so two nodes of a 100k
+#   node memory were likely to share one — and the walker's
+#   cycle check then hid the second subtree.
+#
+#   IdAllocator hands out 64-bit ids (16 hex digits): a random
+#   32-bit prefix drawn per process (again after fork) and a
+#   32-bit counter. Ids from one process never repeat; the index
+#   re-allocates a new node's id in the unlikely case that it
+#   meets one from another process.
+#
+#   NodeIndex maps id → node and id → parent id for the resident
+#   tree, so a node or its path back to the root is found
+#   without a walk. MemoryBackend keeps it current on append,
+#   extend and replace_tree (restore, sync patches).
+#   Loaded trees keep their ids; duplicates among them are
+#   counted, and the first one in walk order is the one indexed
+#   (children of a later duplicate are indexed beneath the first).
+#
+# ============================================================
+
+import itertools
+import os
+from typing import Any, Dict, List, Optional
+
+_COUNTER_LIMIT = 1 << 32
+
+
+class IdAllocator:
+    """Process-unique 64-bit node ids."""
+
+    def __init__(self):
+        self._reseed()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reseed)
+
+    def _reseed(self):
+        self._prefix = int.from_bytes(os.urandom(4), "big") << 32
+        self._counter = itertools.count(1)
+
+    def next(self) -> str:
+        n = next(self._counter)
+        if n >= _COUNTER_LIMIT:
+            self._reseed()
+            n = next(self._counter)
+        return f"{self._prefix | n:016x}"
+
+
+NODE_IDS = IdAllocator()
+
+
+class NodeIndex:
+    """id → node and id → parent id over a resident HarmonicNode tree."""
+
+    def __init__(self):
+        self.nodes: Dict[str, Any] = {}
+        self.parents: Dict[str, Optional[str]] = {}
+        self.duplicates = 0    # loaded nodes whose id was already indexed
+        self.reallocated = 0   # attached nodes given a fresh id
+
+    def rebuild(self, root):
+        """Re-indexes a whole (loaded) tree; ids are left as they are."""
+        self.nodes, self.parents, self.duplicates = {}, {}, 0
+        self._add(root, None, reallocate=False)
+
+    def add(self, node, parent_id: Optional[str]):
+        """Indexes a newly attached subtree under parent_id."""
+        self._add(node, parent_id, reallocate=True)
+
+    def _add(self, node, parent_id: Optional[str], reallocate: bool):
+        nodes, parents = self.nodes, self.parents
+        stack = [(node, parent_id)]
+        while stack:
+            current, parent = stack.pop()
+            known = nodes.get(current.id)
+            if known is not None and known is not current:
+                if reallocate:
+                    while current.id in nodes:
+                        current.id = NODE_IDS.next()
+                    self.reallocated += 1
+                else:
+                    self.duplicates += 1
+            if current.id not in nodes:
+                nodes[current.id] = current
+                parents[current.id] = parent
+            stack.extend((child, current.id) for child in reversed(current.children))
+
+    def get(self, node_id: str):
+        return self.nodes.get(node_id)
+
+    def path(self, node_id: str) -> List[Any]:
+        """Nodes from the root down to node_id; [] if unknown."""
+        if node_id not in self.nodes:
+            return []
+        chain = []
+        while node_id is not None and len(chain) <= len(self.nodes):
+            chain.append(self.nodes[node_id])
+            node_id = self.parents.get(node_id)
+        chain.reverse()
+        return chain
+
+    def __len__(self) -> int:
+        return len(self.nodes)
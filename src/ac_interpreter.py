@@ -3,9 +3,33 @@
 # Command Execution Layer with Guardian Integration
 # ============================================================
 
+from typing import Callable, Iterator, Tuple
+
 from arc_guardian import ArcGuardian
 from arc_prime import ArcMemorySystem
+from ac_authority_defaults import DEFAULT_ACTOR_AUTHORITY
+from ac_query import format_match
 from ac_reconstruct import ArcReconstruct
+from ac_sentinel import Sentinel
+
+
+class Failure(str):
+    """
+    Reply of a command that failed. execute() returns it as text
+    like any reply; execute_status() reports it as "error".
+    """
+    status = "error"
+
+
+class Denial(Failure):
+    """Reply of a command refused by the Guardian or the Sentinel."""
+    status = "denied"
+
+
+def status_of(reply: str) -> str:
+    """ok / error / denied for a reply of ArcInterpreter.execute()."""
+    return getattr(reply, "status", "ok")
+
 
 class ArcInterpreter:
     """
@@ -13,10 +37,13 @@ class ArcInterpreter:
     Acts as the bridge between the shell/console and the memory kernel.
     """
 
-    def __init__(self, guardian=None):
+    def __init__(self, guardian=None, sentinel=None, authority: int = DEFAULT_ACTOR_AUTHORITY):
         self.guardian = guardian if guardian else ArcGuardian()
-        self.memory = ArcMemorySystem()
+        self.sentinel = sentinel if sentinel else Sentinel.from_env(audit=self.guardian.audit)
+        self.authority = authority  # actor authority judged by the Sentinel
+        self.memory = ArcMemorySystem(guardian=self.guardian)
         self.reconstruct = ArcReconstruct()
+        self.memory_budget = None  # footprint budget in bytes; None → ARCCORE_MEMORY_BUDGET
 
     def execute(self, command: str) -> str:
         """
@@ -26,16 +53,78 @@ class ArcInterpreter:
         # For backward compatibility, delegate to interpret
         return self.interpret(command)
 
+    def execute_status(self, command: str) -> Tuple[str, str]:
+        """(status, text): ok / error / denied as the command reported it, not read from the text."""
+        reply = self.execute(command)
+        return status_of(reply), str(reply)
+
     def interpret(self, command: str) -> str:
         """
         Parse and execute ArcCore commands.
         """
+        capture = self.memory.capture
+        if capture is not None:
+            # Loop 1.27 — recorded with its timing (ac_replay)
+            return capture.command(self._interpret, command, self.authority)
+        return self._interpret(command)
+
+    def _interpret(self, command: str) -> str:
+        cmd, args, refusal = self._admit(command)
+        if refusal is not None:
+            return refusal
+        return self._dispatch(cmd, args)
+
+    def stream(self, command: str) -> Iterator[str]:
+        """
+        Loop 1.24 — output lines pulled lazily, for the pager.
+        walk, reconstruct, summary and thread render straight from
+        a snapshot of the tree; other commands are split from
+        execute().
+        """
+        return self.pages(command)[0]
+
+    def pages(self, command: str) -> Tuple[Iterator[str], Callable[[], Iterator[str]]]:
+        """
+        stream() and a restart() that reads the same lines again.
+        The command is admitted (and captured) once; restarts
+        replay its snapshot or output without running it again.
+        """
+        cmd, args, refusal = self._admit(command)
+        restart = None
+        if refusal is not None:
+            lines = [refusal]
+        elif cmd == "thread" or (cmd in ("walk", "reconstruct", "summary") and not args.strip()):
+            try:
+                root = self.memory.view()
+            except Exception as e:
+                lines = [f"[{cmd}] Error: {e}"]
+            else:
+                if cmd == "thread":
+                    def restart():
+                        return self._stream_thread(args, root)
+                else:
+                    def restart():
+                        return self._stream_tree(cmd, root)
+        else:
+            lines = self._dispatch(cmd, args).splitlines()
+        if restart is None:
+            def restart():
+                return iter(lines)
+
+        capture = self.memory.capture
+        if capture is not None:
+            # Loop 1.27 — recorded once, with its pull time (ac_replay)
+            return capture.stream(restart(), command, self.authority), restart
+        return restart(), restart
+
+    def _admit(self, command: str):
+        """(cmd, args, None) if the command may run, else (None, None, refusal)."""
         if not command or not command.strip():
-            return "[Error] Empty command."
+            return None, None, Failure("[Error] Empty command.")
 
         # Guardian text gate check
         if not self.guardian.gate_text(command):
-            return "[Guardian] ⛔ Command blocked by text gate."
+            return None, None, Denial("[Guardian] ⛔ Command blocked by text gate.")
 
         # Parse command
         parts = command.strip().split(maxsplit=1)
@@ -44,8 +133,47 @@ class ArcInterpreter:
 
         # Validate intent
         if not self.guardian.validate_intent(cmd):
-            return f"[Guardian] ⛔ Command '{cmd}' not permitted."
+            return None, None, Denial(f"[Guardian] ⛔ Command '{cmd}' not permitted.")
+
+        # Sentinel judgment precedes execution
+        action = self.sentinel.action(cmd, args)
+        judgment = self.sentinel.judge(action, self.authority)
+        if not judgment.allowed:
+            if judgment.operation is None:
+                return None, None, Failure(f"[Error] Unknown command: {cmd}")
+            return None, None, Denial(f"[Sentinel] ⛔ {action}: {judgment.reason}")
+        return cmd, args, None
+
+    def _stream_tree(self, cmd: str, root) -> Iterator[str]:
+        try:
+            if cmd == "walk":
+                yield from self.memory.iter_walk(root, "[Integrity: LIVE — in-memory tree]")
+            else:
+                yield from self.reconstruct.iter_node(root)
+        except Exception as e:
+            yield f"[{cmd}] Error: {e}"
 
+    def _stream_thread(self, args: str, root) -> Iterator[str]:
+        if not args.strip():
+            yield "[thread] Usage: thread <cycle>"
+            return
+        try:
+            cycle_id = int(args.strip())
+        except ValueError:
+            yield "[thread] Invalid cycle ID."
+            return
+        found = False
+        try:
+            for node in self.memory.iter_thread(cycle_id, root):
+                found = True
+                yield from self.reconstruct.iter_node(node)
+        except Exception as e:
+            yield f"[thread] Error: {e}"
+            return
+        if not found:
+            yield "[thread] No entries found."
+
+    def _dispatch(self, cmd: str, args: str) -> str:
         # Command routing
         if cmd == "walk":
             return self.cmd_walk(args)
@@ -65,44 +193,88 @@ class ArcInterpreter:
             return self.cmd_summary(args)
         elif cmd == "collapse":
             return self.cmd_collapse(args)
+        elif cmd == "dedup":
+            return self.cmd_dedup(args)
+        elif cmd == "inspect":
+            return self.cmd_inspect(args)
+        elif cmd == "sync":
+            return self.cmd_sync(args)
+        elif cmd == "echo":
+            return self.cmd_echo(args)
+        elif cmd == "footprint":
+            return self.cmd_footprint(args)
+        elif cmd == "audit":
+            return self.cmd_audit(args)
+        elif cmd == "sentinel":
+            return self.cmd_sentinel(args)
+        elif cmd == "query":
+            return self.cmd_query(args)
+        elif cmd == "show":
+            return self.cmd_show(args)
+        elif cmd == "path":
+            return self.cmd_path(args)
         else:
-            return f"[Error] Unknown command: {cmd}"
+            return Failure(f"[Error] Unknown command: {cmd}")
 
     # ------------------------------------------------------------
     # Command Implementations
     # ------------------------------------------------------------
 
     def cmd_walk(self, args: str):
-        """Walk the memory tree."""
+        """
+        Walk the memory tree.
+        Usage: walk            — the live in-memory tree
+               walk <file>     — a saved memory, verified on load
+        """
         try:
-            output = self.memory.load_and_inject()
+            filename = args.strip()
+            if filename:
+                output = self.memory.load_and_inject(filename)
+            else:
+                output = self.memory.walk()
             return output if output else "[walk] Memory tree is empty."
         except Exception as e:
-            return f"[walk] Error: {e}"
+            return Failure(f"[walk] Error: {e}")
 
     def cmd_export(self, args: str):
-        """Export memory to file."""
-        filename = args.strip() or "arc_memory.json"
+        """
+        Export memory to file.
+        Usage: export [--format=json|bin] [--compress=zlib|lzma] [filename]
+        """
+        options = {"format": "json", "compress": None}
+        names = []
+        for token in args.split():
+            if token.startswith("--") and "=" in token:
+                key, value = token[2:].split("=", 1)
+                if key not in options:
+                    return Failure(f"[export] Error: unknown option --{key}")
+                options[key] = value
+            else:
+                names.append(token)
+
+        fmt = options["format"]
+        default = "arc_memory.bin" if fmt == "bin" else "arc_memory.json"
+        filename = names[0] if names else default
         try:
-            self.memory.save_memory(filename)
-            return f"[export] Memory saved to {filename}"
+            self.memory.save_memory(filename, format=fmt, compression=options["compress"])
+            return f"[export] Memory saved to {filename} ({fmt})"
         except Exception as e:
-            return f"[export] Error: {e}"
+            return Failure(f"[export] Error: {e}")
 
     def cmd_inject(self, args: str):
         """Inject a user message into memory."""
         if not args.strip():
-            return "[inject] Usage: inject <message>"
+            return Failure("[inject] Usage: inject <message>")
         try:
             self.memory.ingest_interaction(args, "", cycle_context=1)
             return "[inject] Message injected."
         except Exception as e:
-            return f"[inject] Error: {e}"
+            return Failure(f"[inject] Error: {e}")
 
     def cmd_sigil(self, args: str):
         """Process sigil-tagged content."""
         if not args.strip():
-            return "[sigil] Usage: sigil <content>"
+            return Failure("[sigil] Usage: sigil <content>")
         return f"[sigil] Processed: {args}"
 
     def cmd_guardian(self, args: str):
@@ -114,6 +286,318 @@ class ArcInterpreter:
         """Trigger memory collapse/compression."""
         return "[collapse] Compression not yet implemented."
 
+    def cmd_dedup(self, args: str):
+        """Report content-table dedup ratio and bytes saved."""
+        stats = self.memory.content.stats()
+        lines = [f"[dedup] {self.memory.content.describe()}"]
+        for key, value in stats.items():
+            lines.append(f"  {key}: {value}")
+        return "\n".join(lines)
+
+    def cmd_inspect(self, args: str):
+        """
+        Random-access queries against a saved ACMB file (Loop 1.7).
+        Usage: inspect <file> id <node-id> | thread <cycle> | sigils [limit]
+        """
+        parts = args.split()
+        if len(parts) < 2:
+            return Failure("[inspect] Usage: inspect <file> id <node-id> | thread <cycle> | sigils [limit]")
+
+        filename, query, rest = parts[0], parts[1].lower(), parts[2:]
+        try:
+            mapped = self.memory.open_mapped(filename)
+        except OSError as e:
+            return Failure(f"[inspect] Error: {e}")
+        if mapped is None:
+            return Failure("[inspect] Error: not an uncompressed ACMB file (export --format=bin)")
+
+        try:
+            if query == "id" and rest:
+                node = mapped.find(rest[0])
+                if node is None:
+                    return Failure(f"[inspect] No node with id {rest[0]}.")
+                return "\n".join(self.reconstruct.reconstruct_node(node))
+
+            if query == "thread" and rest:
+                lines = mapped.thread(int(rest[0]))
+                return "\n".join(lines) if lines else "[inspect] No entries found."
+
+            if query == "sigils":
+                limit = int(rest[0]) if rest else 10
+                lines = []
+                for node in mapped.sigil_nodes():
+                    if len(lines) >= limit:
+                        break
+                    lines.append(f"💠 {node.priority} [AC-{node.cycle}] {node.id}: {node.seed}")
+                return "\n".join(lines) if lines else "[inspect] No sigil-weighted nodes."
+
+            return Failure(f"[inspect] Unknown query: {query}")
+        except ValueError:
+            return Failure("[inspect] Invalid number.")
+        except Exception as e:
+            return Failure(f"[inspect] Error: {e}")
+        finally:
+            mapped.close()
+
+    def cmd_sync(self, args: str):
+        """
+        Digest-based diff and patch (Loop 1.9).
+        Usage: sync diff <file> [patch-out] | sync apply <patch-file>
+        """
+        import json
+        import ac_sync
+
+        parts = args.split()
+        if len(parts) < 2 or parts[0] not in ("diff", "apply"):
+            return Failure("[sync] Usage: sync diff <file> [patch-out] | sync apply <patch-file>")
+
+        try:
+            if parts[0] == "diff":
+                other = ac_sync.open_tree(parts[1])
+                patch = self.memory.diff_against(other)
+                if len(parts) > 2:
+                    with open(parts[2], "w") as f:
+                        json.dump(patch, f)
+                return f"[sync] {ac_sync.summarize(patch)}"
+
+            with open(parts[1]) as f:
+                patch = json.load(f)
+            self.memory.apply_patch(patch)
+            return f"[sync] Patch applied: {ac_sync.summarize(patch)}"
+        except Exception as e:
+            return Failure(f"[sync] Error: {e}")
+
+    def cmd_echo(self, args: str):
+        """
+        Hot-path tracing (Loop 1.18).
+        Usage: echo stats | echo on [slow-ms] | echo off | echo reset | echo tail [n]
+        """
+        from ac_echo import ECHO
+
+        parts = args.split()
+        action = parts[0].lower() if parts else "stats"
+        try:
+            if action == "stats":
+                state = "on" if ECHO.enabled else "off"
+                if not ECHO.histograms and not ECHO.counters:
+                    return f"[echo] Tracing {state}; nothing recorded yet."
+                return f"[echo] Tracing {state}\n{ECHO.stats_report()}"
+            if action == "on":
+                ECHO.enabled = True
+                ECHO.slow_ms = float(parts[1]) if len(parts) > 1 else None
+                slow = f" (slow spans ≥ {ECHO.slow_ms} ms echoed)" if ECHO.slow_ms is not None else ""
+                return f"[echo] Tracing on{slow}."
+            if action == "off":
+                ECHO.enabled = False
+                return "[echo] Tracing off."
+            if action == "reset":
+                ECHO.reset_stats()
+                return "[echo] Stats cleared."
+            if action == "tail":
+                count = int(parts[1]) if len(parts) > 1 else 5
+                echoes = ECHO.reflect(count)
+                if not echoes:
+                    return "[echo] No echoes."
+                return "\n".join(f"[{e['timestamp']}] {e['source']}: {e['signal']}" for e in echoes)
+            return Failure("[echo] Usage: echo stats | echo on [slow-ms] | echo off | echo reset | echo tail [n]")
+        except ValueError:
+            return Failure("[echo] Invalid number.")
+        except Exception as e:
+            return Failure(f"[echo] Error: {e}")
+
+    def cmd_footprint(self, args: str):
+        """
+        Memory footprint by compression level, cycle, role or priority (Loop 1.19).
+        Usage: footprint [level|cycle|role|priority] [top <n>] [traced]
+               footprint budget <size|off>
+        """
+        import ac_footprint
+
+        parts = args.split()
+        try:
+            if parts and parts[0].lower() == "budget":
+                if len(parts) < 2:
+                    budget = self.memory_budget or ac_footprint.default_budget()
+                    shown = ac_footprint.format_bytes(budget) if budget else "off"
+                    return f"[footprint] Budget: {shown}"
+                self.memory_budget = ac_footprint.parse_size(parts[1])
+                if self.memory_budget is None:
+                    return "[footprint] Budget off."
+                return f"[footprint] Budget set to {ac_footprint.format_bytes(self.memory_budget)}."
+
+            dimension, top, traced = "level", None, False
+            k = 0
+            while k < len(parts):
+                word = parts[k].lower()
+                if word in ac_footprint.DIMENSIONS:
+                    dimension = word
+                elif word == "top" and k + 1 < len(parts):
+                    top = int(parts[k + 1])
+                    k += 1
+                elif word == "traced":
+                    traced = True
+                else:
+                    return Failure("[footprint] Usage: footprint [level|cycle|role|priority] [top <n>] [traced]"
+                                   " | footprint budget <size|off>")
+                k += 1
+
+            report = ac_footprint.analyze(self.memory, budget=self.memory_budget, traced=traced)
+            if top is None and dimension == "cycle":
+                top = 20
+            lines = [f"[footprint] {report.describe()}"]
+            if report.over_budget:
+                lines.append("[footprint] ⚠ Memory budget exceeded — consider compaction.")
+            lines.append(report.table(dimension, top))
+            if report.traced is not None:
+                t = report.traced
+                lines.append(f"[footprint] tracemalloc ({t['mode']}): {ac_footprint.format_bytes(t['bytes'])}")
+                for where, size in t["top"]:
+                    lines.append(f"  {where}: {ac_footprint.format_bytes(size)}")
+            return "\n".join(lines)
+        except ValueError as e:
+            return Failure(f"[footprint] {e}")
+        except Exception as e:
+            return Failure(f"[footprint] Error: {e}")
+
+    def cmd_audit(self, args: str):
+        """
+        Guardian decision audit (Loop 1.21).
+        Usage: audit why [action] [cycle <n>] [node <id>] [allowed|any] [limit <n>]
+               audit tail [n] | audit level [LEVEL] | audit stats
+        """
+        log = self.guardian.audit
+        parts = args.split()
+        action = parts[0].lower() if parts else "stats"
+        usage = Failure("[audit] Usage: audit why [action] [cycle <n>] [node <id>] [allowed|any] [limit <n>]"
+                        " | audit tail [n] | audit level [LEVEL] | audit stats")
+        try:
+            if action == "stats":
+                return "[audit] " + ", ".join(f"{k}={v}" for k, v in log.stats().items())
+            if action == "level":
+                if len(parts) > 1:
+                    log.set_level(parts[1].upper())
+                return f"[audit] Level: {log.level}"
+            if action in ("tail", "why"):
+                if action == "tail":
+                    records = log.tail(int(parts[1]) if len(parts) > 1 else 10)
+                else:
+                    query = {"allowed": False, "limit": 20}
+                    k = 1
+                    while k < len(parts):
+                        word = parts[k]
+                        if word in ("cycle", "limit") and k + 1 < len(parts):
+                            query[word] = int(parts[k + 1])
+                            k += 1
+                        elif word == "node" and k + 1 < len(parts):
+                            query["node"] = parts[k + 1]
+                            k += 1
+                        elif word in ("allowed", "any"):
+                            query["allowed"] = True if word == "allowed" else None
+                        elif "action" not in query:
+                            query["action"] = word
+                        else:
+                            return usage
+                        k += 1
+                    records = log.why(**query)
+                if not records:
+                    return "[audit] No matching records."
+                return "\n".join(
+                    f"[{r['time']}] {r['operation']} {'allowed' if r['allowed'] else 'DENIED'} "
+                    f"{r['action'] or '-'} cycle={r['cycle_context']} node={r['target_node_id'] or '-'}: "
+                    f"{r['reason']}"
+                    for r in records)
+            return usage
+        except ValueError as e:
+            return Failure(f"[audit] {e}")
+        except Exception as e:
+            return Failure(f"[audit] Error: {e}")
+
+    def cmd_sentinel(self, args: str):
+        """
+        Authority policy and judgments (Loop 1.22).
+        Usage: sentinel | sentinel judge <verb> [sub-action] [authority]
+        """
+        parts = args.split()
+        try:
+            if not parts:
+                return (f"[sentinel] Actor authority {self.authority}; "
+                        f"policy reloads: {self.sentinel.reloads}\n{self.sentinel.describe()}")
+            if parts[0] == "judge" and len(parts) in (2, 3, 4):
+                words = parts[1:]
+                authority = self.authority
+                if len(words) > 1 and words[-1].isdigit():
+                    authority = int(words.pop())
+                if len(words) <= 2:
+                    action = self.sentinel.action(words[0].lower(), " ".join(words[1:]))
+                    result = self.sentinel.explain(action, authority)
+                    return f"[sentinel] {action}: {'allowed' if result.allowed else 'denied'} — {result.reason}"
+            return Failure("[sentinel] Usage: sentinel | sentinel judge <verb> [sub-action] [authority]")
+        except ValueError as e:
+            return Failure(f"[sentinel] {e}")
+        except Exception as e:
+            return Failure(f"[sentinel] Error: {e}")
+
+    def cmd_query(self, args: str):
+        """
+        Filtered walk with predicate push-down (Loop 1.25).
+        Usage: query [where] cycle>=3 and role=user and level<=SEED depth<=5 [limit n]
+        """
+        if not args.strip():
+            return Failure("[query] Usage: query [where] <field><op><value> [and ...] [limit n]\n"
+                           "[query] Fields: cycle, priority, depth, level, role, id, collapsed, content (~ contains)")
+        try:
+            matches, stats = self.memory.query(args)
+        except ValueError as e:
+            return Failure(f"[query] {e}")
+        except Exception as e:
+            return Failure(f"[query] Error: {e}")
+        lines = [format_match(depth, node) for depth, node in matches]
+        lines.append(f"[query] {len(matches)} matches (visited {stats.visited} nodes, "
+                     f"skipped {stats.skipped} in {stats.pruned} blocks)")
+        return "\n".join(lines)
+
+    def cmd_show(self, args: str):
+        """
+        One node by id, through the id index (Loop 1.26).
+        Usage: show <id>
+        """
+        from ac_footprint import level_of
+
+        if len(args.split()) != 1:
+            return Failure("[show] Usage: show <id>")
+        try:
+            node = self.memory.node(args.strip())
+            if node is None:
+                return Failure(f"[show] No node with id {args.strip()}.")
+            level = level_of(node.get("compression_level"), bool(node.get("collapsed")))
+            lines = [f"[show] {node['id']} — {node['role'].upper()}, cycle {node['cycle']}, "
+                     f"priority {node['priority']}, {level}",
+                     f"  parent:   {node['parent'] or '-'}",
+                     f"  children: {node['child_count']}",
+                     f"  time:     {node.get('timestamp') or '-'}"]
+            if node.get("seed") and node.get("seed") != node.get("content"):
+                lines.append(f"  seed:     {node['seed']}")
+            lines.append(f"  content:  {node['content'] if node.get('content') is not None else '-'}")
+            return "\n".join(lines)
+        except Exception as e:
+            return Failure(f"[show] Error: {e}")
+
+    def cmd_path(self, args: str):
+        """
+        The chain of parents from the root down to a node (Loop 1.26).
+        Usage: path <id>
+        """
+        if len(args.split()) != 1:
+            return Failure("[path] Usage: path <id>")
+        try:
+            chain = self.memory.path(args.strip())
+            if not chain:
+                return Failure(f"[path] No node with id {args.strip()}.")
+            return "\n".join(f"{format_match(depth, node)}  ({node['id']})"
+                             for depth, node in enumerate(chain))
+        except Exception as e:
+            return Failure(f"[path] Error: {e}")
+
     # ------------------------------------------------------------
     # RECONSTRUCTION COMMANDS (Loop 6 / Loop 2.2 compliant)
     # ------------------------------------------------------------
@@ -121,24 +605,25 @@ class ArcInterpreter:
     def cmd_reconstruct_full(self, args: str):
         """Full structural reconstruction of the entire tree."""
         try:
-            tree = self.memory.root.to_dict()
+            tree = self.memory.tree()
             return self.reconstruct.reconstruct_full(tree)
         except Exception as e:
-            return f"[reconstruct] Error: {e}"
+            return Failure(f"[reconstruct] Error: {e}")
 
     def cmd_reconstruct_thread(self, args: str):
         """Reconstruct only the nodes belonging to a specific cycle."""
         if not args.strip():
-            return "[thread] Usage: thread <cycle>"
+            return Failure("[thread] Usage: thread <cycle>")
         try:
             cycle_id = int(args.strip())
-            tree = self.memory.root.to_dict()
-            lines = self.reconstruct.reconstruct_thread(tree, cycle_id)
+            lines = []
+            for node in self.memory.thread_nodes(cycle_id):
+                lines.extend(self.reconstruct.reconstruct_node(node))
             return "\n".join(lines) if lines else "[thread] No entries found."
         except ValueError:
-            return "[thread] Invalid cycle ID."
+            return Failure("[thread] Invalid cycle ID.")
         except Exception as e:
-            return f"[thread] Error: {e}"
+            return Failure(f"[thread] Error: {e}")
 
     def cmd_summary(self, args: str):
         """
@@ -146,8 +631,8 @@ class ArcInterpreter:
         Compression-aware (Loop 2.2).
         """
         try:
-            tree = self.memory.root.to_dict()
+            tree = self.memory.tree()
             lines = self.reconstruct.reconstruct_node(tree, depth=0)
             return "\n".join(lines)
         except Exception as e:
-            return f"[summary] Error: {e}"
+            return Failure(f"[summary] Error: {e}")
@@ -0,0 +1,111 @@
+# ============================================================
+# AC LOCKS — ArcCore-Prime V1.1
+# Loop 1.14: Reader/Writer Locking for the Memory Kernel
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Many readers (walk, thread, reconstruct, export) may share
+#   the tree at once; a writer (ingest, patch, restore) gets it
+#   alone. Writers are preferred so a steady stream of reads
+#   cannot starve ingest.
+#
+#   The lock is re-entrant per thread: nested reads never queue
+#   behind a waiting writer, and a writer may read. Upgrading a
+#   read to a write would deadlock and raises instead.
+#
+# ============================================================
+
+import threading
+from contextlib import contextmanager
+
+
+class RWLock:
+    """Writer-preferring, per-thread re-entrant reader/writer lock."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    # ------------------------------------------------------------
+    # Read side
+    # ------------------------------------------------------------
+
+    def acquire_read(self):
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth or self._writer == threading.get_ident():
+            local.depth = depth + 1
+            if not depth:
+                local.counted = False
+            return
+
+        with self._cond:
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        local.depth = 1
+        local.counted = True
+
+    def release_read(self):
+        local = self._local
+        local.depth -= 1
+        if local.depth or not local.counted:
+            return
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------
+    # Write side
+    # ------------------------------------------------------------
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        if getattr(self._local, "depth", 0):
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        with self._cond:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------
+    # Context managers
+    # ------------------------------------------------------------
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,333 @@
+# ============================================================
+# AC MAPPED MEMORY — ArcCore-Prime V1.1
+# Loop 1.7: Random-Access Memory Files (mmap)
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Opens an uncompressed ACMB file (see ac_binary) with mmap
+#   and decodes node records only when they are touched. The
+#   id, cycle and sigil index sections are binary-searched in
+#   place, so reading one node or one cycle's thread touches a
+#   handful of pages regardless of file size.
+#
+# ============================================================
+
+import mmap
+import struct
+from typing import Any, Dict, Iterator, List, Optional
+
+import ac_binary
+from ac_binary import (
+    COUNT, ID_ENTRY, KEYED_ENTRY, NODE_RECORD, NONE, NO_LEVEL,
+    FLAG_COLLAPSED, CODEC_NONE, FormatError,
+)
+
+
+class MappedNode:
+    """
+    Lazily decoded view of one node record.
+    Supports the dict-style .get() used by ArcReconstruct.
+    """
+
+    __slots__ = ("_mem", "index", "_fields")
+
+    def __init__(self, mem: "MappedMemory", index: int):
+        self._mem = mem
+        self.index = index
+        self._fields = mem.record(index)
+
+    # -- record fields ---------------------------------------------
+
+    @property
+    def id(self) -> Optional[str]:
+        return self._mem.string(self._fields[0])
+
+    @property
+    def role(self) -> str:
+        return self._mem.string(self._fields[1])
+
+    @property
+    def cycle(self) -> int:
+        return self._fields[3]
+
+    @property
+    def content(self) -> Optional[str]:
+        return self._mem.string(self._fields[4])
+
+    @property
+    def seed(self) -> Optional[str]:
+        return self._mem.string(self._fields[5])
+
+    @property
+    def priority(self) -> int:
+        return self._fields[6]
+
+    @property
+    def collapsed(self) -> bool:
+        return bool(self._fields[9] & FLAG_COLLAPSED)
+
+    @property
+    def compression_level(self) -> Optional[int]:
+        level = self._fields[10]
+        return None if level == NO_LEVEL else level
+
+    # -- structure -------------------------------------------------
+
+    @property
+    def parent(self) -> Optional["MappedNode"]:
+        parent = self._fields[2]
+        return None if parent == NONE else self._mem.node(parent)
+
+    @property
+    def children(self) -> List["MappedNode"]:
+        first, count = self._fields[7], self._fields[8]
+        return [self._mem.node(first + k) for k in range(count)]
+
+    # -- dict compatibility ----------------------------------------
+
+    _KEYS = ("id", "role", "cycle", "content", "seed", "collapsed",
+             "priority", "compression_level", "children")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._KEYS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decodes this node and its whole subtree."""
+        node = {
+            "id": self.id,
+            "role": self.role,
+            "cycle": self.cycle,
+            "content": self.content,
+            "seed": self.seed,
+            "collapsed": self.collapsed,
+            "priority": self.priority,
+        }
+        if self.compression_level is not None:
+            node["compression_level"] = self.compression_level
+        node["children"] = [c.to_dict() for c in self.children]
+        return node
+
+
+class MappedMemory:
+    """
+    Read-only, memory-mapped view of an ACMB memory file.
+
+    Opening costs one header read; nodes, strings and index
+    entries are decoded on demand and small results are cached.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._file = open(filename, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise FormatError("Cannot map an empty file")
+
+        self._directory = ac_binary.read_directory(self._mm)
+        self._strings_cache: Dict[int, str] = {}
+
+        for kind in (ac_binary.SECTION_STRINGS, ac_binary.SECTION_NODES):
+            if kind not in self._directory:
+                raise FormatError(f"Missing section {kind}")
+            if self._directory[kind][0] != CODEC_NONE:
+                raise FormatError(
+                    "Compressed ACMB files cannot be mapped; use read_memory()"
+                )
+
+        # STRINGS layout: count | offsets | blob
+        offset = self._directory[ac_binary.SECTION_STRINGS][1]
+        (self._string_count,) = COUNT.unpack_from(self._mm, offset)
+        self._string_offsets = offset + COUNT.size
+        self._string_blob = self._string_offsets + 8 * (self._string_count + 1)
+
+        # NODES layout: count | records
+        offset = self._directory[ac_binary.SECTION_NODES][1]
+        (self._node_count,) = COUNT.unpack_from(self._mm, offset)
+        self._records = offset + COUNT.size
+
+    # ------------------------------------------------------------
+    #  LIFECYCLE
+    # ------------------------------------------------------------
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._node_count
+
+    # ------------------------------------------------------------
+    #  RAW ACCESS
+    # ------------------------------------------------------------
+
+    def integrity(self) -> Dict[str, Any]:
+        import json
+        raw = ac_binary.read_section(self._mm, self._directory, ac_binary.SECTION_META)
+        return json.loads(raw or b"{}")
+
+    def string(self, sid: int) -> Optional[str]:
+        if sid == NONE:
+            return None
+        cached = self._strings_cache.get(sid)
+        if cached is None:
+            start, end = struct.unpack_from("<QQ", self._mm, self._string_offsets + 8 * sid)
+            cached = self._mm[self._string_blob + start:self._string_blob + end].decode("utf-8")
+            self._strings_cache[sid] = cached
+        return cached
+
+    def record(self, index: int) -> tuple:
+        if not 0 <= index < self._node_count:
+            raise IndexError(index)
+        return NODE_RECORD.unpack_from(self._mm, self._records + index * NODE_RECORD.size)
+
+    def node(self, index: int) -> MappedNode:
+        return MappedNode(self, index)
+
+    @property
+    def root(self) -> MappedNode:
+        return self.node(0)
+
+    # ------------------------------------------------------------
+    #  SEGMENT VERIFICATION (Loop 1.10)
+    # ------------------------------------------------------------
+
+    def verify(self, workers: Optional[int] = None):
+        """
+        Hashes every checksummed segment straight from the mapping
+        (across a thread pool). Returns a VerificationReport, or
+        None for files written before segment checksums existed.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from ac_verify import VerificationReport, checksum, default_workers
+
+        _, expected = ac_binary.read_checksums(self._mm, self._directory)
+        if not expected:
+            return None
+
+        report = VerificationReport(checked=len(expected))
+        view = memoryview(self._mm)
+        try:
+            with ThreadPoolExecutor(workers or default_workers()) as pool:
+                jobs = [
+                    (key, digest, pool.submit(checksum, view[offset:offset + length]))
+                    for key, (offset, length, digest) in sorted(expected.items())
+                ]
+                for (kind, seg), digest, job in jobs:
+                    if job.result() != digest:
+                        name = ac_binary.SECTION_NAMES.get(kind, f"section {kind}")
+                        report.add(name, f"segment {seg}")
+        finally:
+            view.release()
+        return report
+
+    # ------------------------------------------------------------
+    #  SUBTREE DIGESTS (Loop 1.9)
+    # ------------------------------------------------------------
+
+    def has_digests(self) -> bool:
+        return ac_binary.SECTION_DIGESTS in self._directory
+
+    def digest_range(self, start: int, end: int) -> bytes:
+        from ac_sync import DIGEST_SIZE
+        entry = self._directory.get(ac_binary.SECTION_DIGESTS)
+        if entry is None:
+            raise FormatError("File has no digest section; re-export it")
+        base = entry[1]
+        return self._mm[base + start * DIGEST_SIZE:base + end * DIGEST_SIZE]
+
+    def digest(self, index: int) -> bytes:
+        return self.digest_range(index, index + 1)
+
+    # ------------------------------------------------------------
+    #  INDEX SEARCH
+    # ------------------------------------------------------------
+
+    def _index(self, kind: int):
+        entry = self._directory.get(kind)
+        if entry is None:
+            raise FormatError(f"File has no index section {kind}; re-export it")
+        offset = entry[1]
+        (count,) = COUNT.unpack_from(self._mm, offset)
+        return offset + COUNT.size, count
+
+    def _lower_bound(self, base: int, count: int, entry: struct.Struct, key) -> int:
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if entry.unpack_from(self._mm, base + mid * entry.size)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, node_id: str) -> Optional[MappedNode]:
+        """O(log n) lookup through the id index."""
+        base, count = self._index(ac_binary.SECTION_ID_INDEX)
+        key = ac_binary.id_key(node_id)
+        pos = self._lower_bound(base, count, ID_ENTRY, key)
+
+        while pos < count:
+            entry_key, index = ID_ENTRY.unpack_from(self._mm, base + pos * ID_ENTRY.size)
+            if entry_key != key:
+                break
+            node = self.node(index)
+            if node.id == node_id:
+                return node
+            pos += 1
+        return None
+
+    def cycle_nodes(self, cycle_id: int) -> Iterator[MappedNode]:
+        """Nodes of one cycle, in depth-first order."""
+        base, count = self._index(ac_binary.SECTION_CYCLE_INDEX)
+        pos = self._lower_bound(base, count, KEYED_ENTRY, cycle_id)
+
+        while pos < count:
+            cycle, index = KEYED_ENTRY.unpack_from(self._mm, base + pos * KEYED_ENTRY.size)
+            if cycle != cycle_id:
+                break
+            yield self.node(index)
+            pos += 1
+
+    def sigil_nodes(self, min_priority: int = 1) -> Iterator[MappedNode]:
+        """Sigil-weighted nodes, highest priority first."""
+        base, count = self._index(ac_binary.SECTION_SIGIL_INDEX)
+
+        for pos in range(count):
+            priority, index = KEYED_ENTRY.unpack_from(self._mm, base + pos * KEYED_ENTRY.size)
+            if priority < min_priority:
+                break
+            yield self.node(index)
+
+    # ------------------------------------------------------------
+    #  RECONSTRUCTION HELPERS
+    # ------------------------------------------------------------
+
+    def thread(self, cycle_id: int) -> List[str]:
+        """Same output as ArcReconstruct.reconstruct_thread, via the cycle index."""
+        from ac_reconstruct import ArcReconstruct
+        engine = ArcReconstruct()
+        lines = []
+        for node in self.cycle_nodes(cycle_id):
+            lines.extend(engine.reconstruct_node(node))
+        return lines
+
+    def path(self, node: MappedNode) -> List[MappedNode]:
+        """Root-to-node path following parent links."""
+        chain = [node]
+        while chain[-1].parent is not None:
+            chain.append(chain[-1].parent)
+        return list(reversed(chain))
@@ -0,0 +1,205 @@
+# ============================================================
+# AC PAGER — ArcCore-Prime V1.1
+# Loop 1.24: Lazy Paged Viewer for Large Outputs
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   walk / reconstruct / summary on a large tree produce more
+#   lines than anyone can read at once. The pager pulls lines
+#   from an iterator (ArcInterpreter.pages) only as far as the
+#   screen being shown, so time to first screen and memory use
+#   do not depend on tree size. Lines come from a snapshot of the
+#   tree (the first one in a session freezes it, later ones only
+#   add what was appended), so writes during paging do not shift
+#   them.
+#
+#   Keys (followed by Enter):
+#     Enter / f   next screen        b        previous screen
+#     /text       search forward     n        repeat search
+#     c <cycle>   jump to [AC-cycle] g        top
+#     q           quit
+#
+#   Only the last `history` lines are kept for paging back. If
+#   the source can be restarted, earlier lines, "g" and cycle
+#   jumps that wrap past the start are served by re-reading it;
+#   ArcInterpreter.pages replays the same snapshot or output
+#   without admitting the command again.
+#
+# ============================================================
+
+import os
+import sys
+from collections import deque
+from typing import Callable, Iterable, Iterator, List, Optional
+
+HELP = "Enter:next  b:back  /text:search  n:again  c <cycle>:jump  g:top  q:quit"
+
+
+def screen_height() -> int:
+    try:
+        lines = os.get_terminal_size().lines
+    except OSError:  # not a terminal
+        lines = 24
+    return max(lines - 1, 5)
+
+
+class ArcPager:
+    """
+    Pages an iterable of lines. restart, if given, returns a fresh
+    iterator over the same lines (used to go back further than
+    the history window).
+    """
+
+    def __init__(self, lines: Iterable[str], restart: Optional[Callable[[], Iterable[str]]] = None,
+                 height: Optional[int] = None, history: Optional[int] = None,
+                 out=None, read: Callable[[str], str] = input):
+        self.height = height or screen_height()
+        self.restart = restart
+        self.out = out if out is not None else sys.stdout
+        self.read = read
+        self._history = history or self.height * 20
+        self._open(iter(lines))
+        self.top = 0            # index of the first line on screen
+        self.query = None       # last search
+
+    # ------------------------------------------------------------
+    # Source
+    # ------------------------------------------------------------
+
+    def _open(self, lines: Iterator[str]):
+        self._source = lines
+        self._seen = deque(maxlen=self._history)  # last pulled lines
+        self._pulled = 0                          # lines pulled so far
+        self.eof = False
+
+    def _pull(self) -> bool:
+        """Pulls one more line; False at end of output."""
+        if self.eof:
+            return False
+        try:
+            line = next(self._source)
+        except StopIteration:
+            self.eof = True
+            return False
+        self._seen.append(line)
+        self._pulled += 1
+        return True
+
+    def _oldest(self) -> int:
+        return self._pulled - len(self._seen)
+
+    def _line(self, index: int) -> Optional[str]:
+        """Line at index, pulling forward or restarting as needed."""
+        if index < self._oldest():
+            if self.restart is None:
+                return None
+            self._open(iter(self.restart()))
+        while index >= self._pulled:
+            if not self._pull():
+                return None
+        return self._seen[index - self._oldest()]
+
+    def screen(self) -> List[str]:
+        if self.top < self._oldest() and self.restart is None:
+            self.top = self._oldest()  # scrolled out of the history window
+        lines = []
+        for index in range(self.top, self.top + self.height):
+            line = self._line(index)
+            if line is None:
+                break
+            lines.append(line)
+        return lines
+
+    # ------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------
+
+    def find(self, predicate: Callable[[str], bool], start: int, wrap: bool = False) -> Optional[int]:
+        """First index ≥ start whose line matches; optionally wraps to the top."""
+        index = start
+        while True:
+            line = self._line(index)
+            if line is None:
+                break
+            if predicate(line):
+                return index
+            index += 1
+        if wrap and start > 0 and (self.restart is not None or self._oldest() == 0):
+            for index in range(0, start):
+                line = self._line(index)
+                if line is None:
+                    break
+                if predicate(line):
+                    return index
+        return None
+
+    def handle(self, key: str) -> Optional[str]:
+        """Applies one keystroke; returns a status message, or "quit"."""
+        key = key.strip()
+        if key in ("q", "quit"):
+            return "quit"
+        if key in ("", "f"):
+            if self._line(self.top + self.height) is None:
+                return "(END)"
+            self.top += self.height
+            return None
+        if key == "b":
+            self.top = max(0, self.top - self.height)
+            if self.top < self._oldest() and self.restart is None:
+                self.top = self._oldest()
+                return "(start of history)"
+            return None
+        if key == "g":
+            if self._oldest() > 0 and self.restart is None:
+                self.top = self._oldest()
+                return "(start of history)"
+            self.top = 0
+            return None
+        if key.startswith("/") or key == "n":
+            if key.startswith("/") and len(key) > 1:
+                self.query = key[1:]
+            if not self.query:
+                return "No previous search"
+            query = self.query
+            found = self.find(lambda line: query in line, self.top + 1)
+            if found is None:
+                return f"Pattern not found: {query}"
+            self.top = found
+            return None
+        if key.startswith("c"):
+            try:
+                cycle = int(key[1:].strip())
+            except ValueError:
+                return "Usage: c <cycle>"
+            tag = f"[AC-{cycle}]"
+            found = self.find(lambda line: tag in line, self.top + 1, wrap=True)
+            if found is None:
+                return f"Cycle {cycle} not found"
+            self.top = found
+            return None
+        return HELP
+
+    # ------------------------------------------------------------
+    # Loop
+    # ------------------------------------------------------------
+
+    def run(self):
+        message = None
+        while True:
+            lines = self.screen()
+            if not lines and self.top > 0:
+                self.top = max(0, self.top - self.height)
+                continue
+            end = self.top + len(lines)
+            at_end = self._line(end) is None
+            status = f"-- lines {self.top + 1}-{end}{' (END)' if at_end else ''} -- "
+            self.out.write("\n".join(lines) + "\n")
+            self.out.write(status + (message or HELP) + "\n")
+            self.out.flush()
+            try:
+                message = self.handle(self.read(": "))
+            except (EOFError, KeyboardInterrupt):
+                return
+            if message == "quit":
+                return
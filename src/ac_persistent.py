@@ -0,0 +1,345 @@
+# ============================================================
+# AC PERSISTENT — ArcCore-Prime V1.1
+# Loop 1.15: Structurally Shared Snapshots of the Memory Tree
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Export, hashing, diff and reconstruction need a stable view
+#   of the tree while ingest continues. root.to_dict() gives one
+#   by copying everything. Here the view is immutable and shares
+#   structure with every earlier view:
+#
+#     PVector   — persistent vector (32-way trie + tail); append
+#                 and set copy one root-to-leaf path, O(log32 n)
+#     PNode     — immutable node; child lists are PVectors and
+#                 the subtree digest is cached on the node
+#     TreeSnapshot — a frozen root plus the memory hash it had
+#
+#   Two snapshots of the same memory share every untouched
+#   subtree, so holding many costs little and diffing them only
+#   visits what changed (cached digests, see ac_sync).
+#
+# ============================================================
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from ac_seed import render as render_seed
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+
+# ============================================================
+#  PERSISTENT VECTOR
+# ============================================================
+
+class PVector:
+    """
+    Immutable sequence with O(log32 n) append / set / index.
+    Internal nodes and leaves are tuples of at most 32 items;
+    the last partial leaf is kept as a separate tail.
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    def __init__(self, count: int = 0, shift: int = _BITS, root: tuple = (), tail: tuple = ()):
+        self._count = count
+        self._shift = shift
+        self._root = root
+        self._tail = tail
+
+    @classmethod
+    def of(cls, items: Iterable[Any]) -> "PVector":
+        return EMPTY.extend(items)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _tail_offset(self) -> int:
+        return 0 if self._count < _WIDTH else ((self._count - 1) >> _BITS) << _BITS
+
+    def _leaf(self, i: int) -> tuple:
+        if i >= self._tail_offset():
+            return self._tail
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node[(i >> level) & _MASK]
+            level -= _BITS
+        return node
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._leaf(i)[i & _MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        for start in range(0, self._count, _WIDTH):
+            yield from self._leaf(start)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (PVector, list, tuple)):
+            return NotImplemented
+        return len(other) == self._count and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"PVector({list(self)!r})"
+
+    # ------------------------------------------------------------
+    # Updates (return a new vector)
+    # ------------------------------------------------------------
+
+    def append(self, item: Any) -> "PVector":
+        if len(self._tail) < _WIDTH:
+            return PVector(self._count + 1, self._shift, self._root, self._tail + (item,))
+
+        # Tail is full: push it into the trie
+        shift = self._shift
+        if (self._count >> _BITS) > (1 << shift):
+            root = (self._root, _new_path(shift, self._tail))
+            shift += _BITS
+        else:
+            root = self._push_tail(shift, self._root, self._tail)
+        return PVector(self._count + 1, shift, root, (item,))
+
+    def _push_tail(self, level: int, parent: tuple, tail: tuple) -> tuple:
+        sub = ((self._count - 1) >> level) & _MASK
+        if level == _BITS:
+            insert = tail
+        elif sub < len(parent):
+            insert = self._push_tail(level - _BITS, parent[sub], tail)
+        else:
+            insert = _new_path(level - _BITS, tail)
+        return parent[:sub] + (insert,) + parent[sub + 1:]
+
+    def extend(self, items: Iterable[Any]) -> "PVector":
+        vector = self
+        for item in items:
+            vector = vector.append(item)
+        return vector
+
+    def set(self, i: int, item: Any) -> "PVector":
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        if i >= self._tail_offset():
+            k = i & _MASK
+            return PVector(self._count, self._shift, self._root,
+                           self._tail[:k] + (item,) + self._tail[k + 1:])
+        return PVector(self._count, self._shift,
+                       _assoc(self._shift, self._root, i, item), self._tail)
+
+
+def _new_path(level: int, node: tuple) -> tuple:
+    while level > 0:
+        node = (node,)
+        level -= _BITS
+    return node
+
+
+def _assoc(level: int, node: tuple, i: int, item: Any) -> tuple:
+    k = (i >> level) & _MASK
+    if level == 0:
+        return node[:k] + (item,) + node[k + 1:]
+    return node[:k] + (_assoc(level - _BITS, node[k], i, item),) + node[k + 1:]
+
+
+EMPTY = PVector()
+
+
+# ============================================================
+#  PERSISTENT NODE
+# ============================================================
+
+class PNode:
+    """
+    Immutable memory node. Updates return a new node that shares
+    everything it did not change. Supports the dict-style .get()
+    used by ArcReconstruct, like ac_mmap.MappedNode. seed holds
+    what the live node stores (an ac_seed record or text); get()
+    and to_dict() render it.
+    """
+
+    __slots__ = ("id", "role", "cycle", "content", "seed", "collapsed",
+                 "priority", "compression_level", "children", "_digest")
+
+    _KEYS = ("id", "role", "cycle", "content", "seed", "collapsed",
+             "priority", "compression_level", "children")
+
+    def __init__(self, id, role, cycle, content, seed, collapsed=False, priority=0,
+                 children: PVector = EMPTY, compression_level=None):
+        self.id = id
+        self.role = role
+        self.cycle = cycle
+        self.content = content
+        self.seed = seed
+        self.collapsed = collapsed
+        self.priority = priority
+        self.compression_level = compression_level
+        self.children = children
+        self._digest = None
+
+    # -- construction ---------------------------------------------
+
+    @classmethod
+    def freeze(cls, node) -> "PNode":
+        """Immutable copy of a HarmonicNode subtree."""
+        return cls(node.id, node.role, node.cycle_alignment, node.raw_content,
+                   node.seed_record, node.is_collapsed, node.priority,
+                   PVector.of(cls.freeze(c) for c in node.children))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PNode":
+        """Immutable copy of a to_dict()-shaped subtree."""
+        return cls(data.get("id"), data.get("role"), data.get("cycle"),
+                   data.get("content"), data.get("seed"), data.get("collapsed", False),
+                   data.get("priority", 0),
+                   PVector.of(cls.from_dict(c) for c in data.get("children", [])),
+                   data.get("compression_level"))
+
+    # -- updates --------------------------------------------------
+
+    def replace(self, **changes) -> "PNode":
+        fields = {key: getattr(self, key) for key in self._KEYS}
+        fields.update(changes)
+        return PNode(**fields)
+
+    def append_children(self, nodes: Iterable["PNode"]) -> "PNode":
+        return self.replace(children=self.children.extend(nodes))
+
+    def replace_at(self, path: Sequence[int], node: "PNode") -> "PNode":
+        """New tree with the node at path (child indexes) replaced;
+        copies only the nodes along that path."""
+        if not path:
+            return node
+        k = path[0]
+        return self.replace(children=self.children.set(k, self.children[k].replace_at(path[1:], node)))
+
+    # -- reading --------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "seed":
+            value = render_seed(self.seed, self.content)
+        elif key == "seed_record":
+            value = self.seed
+        elif key in self._KEYS:
+            value = getattr(self, key)
+        else:
+            return default
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as HarmonicNode.to_dict()."""
+        node = {
+            "id": self.id,
+            "role": self.role,
+            "cycle": self.cycle,
+            "content": self.content,
+            "seed": render_seed(self.seed, self.content),
+            "collapsed": self.collapsed,
+            "priority": self.priority,
+        }
+        if self.compression_level is not None:
+            node["compression_level"] = self.compression_level
+        node["children"] = [c.to_dict() for c in self.children]
+        return node
+
+    def digest(self) -> bytes:
+        """ac_sync subtree digest, computed once per node and cached."""
+        if self._digest is None:
+            from ac_sync import combine, node_fields
+            # Post-order over the nodes not yet digested
+            stack = [(self, False)]
+            while stack:
+                node, ready = stack.pop()
+                if ready:
+                    block = b"".join(c._digest for c in node.children)
+                    node._digest = combine(node_fields(node), block)
+                elif node._digest is None:
+                    stack.append((node, True))
+                    stack.extend((c, False) for c in node.children if c._digest is None)
+        return self._digest
+
+
+# ============================================================
+#  SNAPSHOT
+# ============================================================
+
+class TreeSnapshot:
+    """
+    A frozen memory tree. memory_hash is the tree hash at the time
+    the snapshot was taken, or None if it had not been computed;
+    version is the memory's write counter at that time.
+    """
+
+    __slots__ = ("root", "memory_hash", "version")
+
+    def __init__(self, root: PNode, memory_hash: Optional[str] = None, version: int = 0):
+        self.root = root
+        self.memory_hash = memory_hash
+        self.version = version
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.root.to_dict()
+
+    def hash(self) -> str:
+        """Memory tree hash (same value as ArcGuardian's)."""
+        if self.memory_hash is None:
+            from arc_guardian import ArcGuardian
+            self.memory_hash = ArcGuardian.hash_memory_tree(self.to_dict())
+        return self.memory_hash
+
+    def walk(self) -> Iterator[PNode]:
+        """Depth-first, pre-order."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.children)))
+
+    def thread(self, cycle_id: int) -> List[Dict[str, Any]]:
+        return [n.to_dict() for n in self.walk() if n.cycle == cycle_id]
+
+    def sigils(self, min_priority: int = 1) -> List[PNode]:
+        found = [n for n in self.walk() if n.priority >= min_priority]
+        found.sort(key=lambda n: -n.priority)
+        return found
+
+    def sync_view(self):
+        return PersistentView(self.root)
+
+
+class PersistentView:
+    """ac_sync view over PNodes; digests come from the node cache."""
+
+    def __init__(self, root: PNode):
+        self.root = root
+
+    def digest(self, node: PNode) -> bytes:
+        return node.digest()
+
+    def fields(self, node: PNode):
+        from ac_sync import node_fields
+        return node_fields(node)
+
+    def node_id(self, node: PNode):
+        return node.id
+
+    def child_count(self, node: PNode) -> int:
+        return len(node.children)
+
+    def child(self, node: PNode, k: int) -> PNode:
+        return node.children[k]
+
+    def child_block(self, node: PNode, i: int, j: int) -> bytes:
+        return b"".join(c.digest() for c in node.children[i:j])
+
+    def export(self, node: PNode) -> Dict[str, Any]:
+        return node.to_dict()
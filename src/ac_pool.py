@@ -0,0 +1,376 @@
+# ============================================================
+# AC POOL — ArcCore-Prime V1.1
+# Loop 1.29: Multi-Tenant Memory Pool
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   One ArcMemorySystem per tenant, each holding its whole tree
+#   resident, does not scale to thousands of tenants. MemoryPool
+#   keeps tenant memories as files in one directory and only the
+#   recently used ones in RAM:
+#
+#     - a tenant's file is opened (restore) on first access; an
+#       unknown tenant starts with an empty memory
+#     - resident tenants are kept in LRU order; when their bytes
+#       exceed the budget (or their number max_tenants) the
+#       coldest are flushed through save_memory and dropped
+#     - a tenant is written only if it changed since it was
+#       loaded or last saved, to a temporary file then renamed
+#
+#   Bytes are the ac_footprint total for the tree, measured
+#   when a tenant is loaded and scaled by its node count as it
+#   grows (measured again after 50% growth).
+#
+#   get() hands out the memory without holding on to it: another
+#   thread may evict that tenant and later writes would be lost.
+#   Threads that share a pool use lease(), which pins the tenant
+#   until the block ends.
+#
+#   The pool lock only guards bookkeeping. Files are read and
+#   written outside it: a tenant being loaded has a Future that
+#   other callers for the same tenant wait on, and a tenant being
+#   saved for eviction is pinned until the save ends, then
+#   dropped only if nobody leased or changed it meanwhile.
+#
+#   stats() reports hits, misses, hit rate, evictions, and load
+#   and save latency percentiles.
+#
+# ============================================================
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ac_echo import ECHO, Histogram
+from ac_footprint import format_bytes, parse_size, tree_bytes
+
+DEFAULT_BUDGET = "256MB"
+EXTENSIONS = {"json": ".json", "bin": ".acmb"}
+REMEASURE_GROWTH = 1.5
+
+_TENANT = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9_.-]{0,127}")
+
+
+class Tenant:
+    """A resident tenant: its memory and the pool's bookkeeping."""
+
+    __slots__ = ("name", "path", "memory", "bytes", "measured_bytes", "measured_nodes",
+                 "saved_version", "pins", "verification", "save_lock")
+
+    def __init__(self, name: str, path: str, memory, verification=None):
+        self.name = name
+        self.path = path
+        self.memory = memory
+        self.saved_version = memory.version
+        self.pins = 0
+        self.verification = verification
+        self.save_lock = threading.Lock()  # one writer of this tenant's file
+        self.measure()
+
+    @property
+    def dirty(self) -> bool:
+        return self.memory.version != self.saved_version
+
+    def nodes(self) -> int:
+        return len(self.memory.backend.index)
+
+    def measure(self):
+        with self.memory.lock.read():
+            self.measured_bytes = tree_bytes(self.memory.root)
+            self.measured_nodes = self.nodes()
+        self.bytes = self.measured_bytes
+
+    def estimate(self) -> int:
+        """Current bytes: measured, scaled by node count since."""
+        nodes = self.nodes()
+        if nodes == self.measured_nodes:
+            return self.measured_bytes
+        if nodes > self.measured_nodes * REMEASURE_GROWTH:
+            self.measure()
+            return self.bytes
+        return self.measured_bytes * nodes // max(self.measured_nodes, 1)
+
+
+class MemoryPool:
+    """
+    Tenant memories under `directory`, at most `budget` bytes
+    (e.g. "256MB") and `max_tenants` of them resident. factory
+    builds an empty memory on a resident backend: the pool sizes
+    and saves the tree it holds. The default is an ArcMemorySystem
+    on the pool's one guardian, so tenants share its audit log
+    instead of each opening (and never closing) their own.
+    """
+
+    def __init__(self, directory: str, budget=DEFAULT_BUDGET, max_tenants: Optional[int] = None,
+                 format: str = "json", factory: Optional[Callable[[], Any]] = None):
+        if format not in EXTENSIONS:
+            raise ValueError(f"Unknown memory format: {format}")
+        self.directory = directory
+        self.budget = parse_size(budget)
+        self.max_tenants = max_tenants
+        self.format = format
+        self.guardian = None
+        if factory is None:
+            from arc_guardian import ArcGuardian
+            self.guardian = ArcGuardian()
+            factory = self._new_memory
+        self.factory = factory
+        os.makedirs(directory, exist_ok=True)
+
+        self._tenants: "OrderedDict[str, Tenant]" = OrderedDict()  # coldest first
+        self._loading: Dict[str, Future] = {}
+        self._leaving: Dict[str, Tenant] = {}  # being saved for eviction
+        self._lock = threading.RLock()
+        self.resident_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.evictions = 0
+        self.saves = 0
+        self.load_latency = Histogram()
+        self.save_latency = Histogram()
+
+    # ------------------------------------------------------------
+    #  ACCESS
+    # ------------------------------------------------------------
+
+    def path_for(self, tenant: str) -> str:
+        if not isinstance(tenant, str) or not _TENANT.fullmatch(tenant):
+            raise ValueError(f"Invalid tenant name: {tenant!r}")
+        return os.path.join(self.directory, tenant + EXTENSIONS[self.format])
+
+    def get(self, tenant: str):
+        """The tenant's memory, loaded if it is not resident."""
+        entry = self._acquire(tenant)
+        with self._lock:
+            entry.pins -= 1
+        return entry.memory
+
+    @contextmanager
+    def lease(self, tenant: str) -> Iterator[Any]:
+        """The tenant's memory, never evicted while the block runs."""
+        entry = self._acquire(tenant)
+        try:
+            yield entry.memory
+        finally:
+            with self._lock:
+                entry.pins -= 1
+                self._resize(entry)
+            self._evict_over_budget(keep=None)
+
+    def _acquire(self, tenant: str) -> Tenant:
+        """The resident entry, pinned; loads it (once) if needed."""
+        while True:
+            with self._lock:
+                entry = self._tenants.get(tenant)
+                if entry is not None:
+                    self.hits += 1
+                    self._tenants.move_to_end(tenant)
+                    self._resize(entry)
+                    entry.pins += 1
+                    break
+                loading = self._loading.get(tenant)
+                if loading is None:
+                    path = self.path_for(tenant)
+                    self.misses += 1
+                    loading = self._loading[tenant] = Future()
+                    owner = True
+                else:
+                    owner = False
+            if not owner:
+                loading.result()  # loaded by another caller (or raises its error)
+                continue
+            try:
+                entry = self._load(tenant, path)
+            except BaseException as e:
+                with self._lock:
+                    del self._loading[tenant]
+                loading.set_exception(e)
+                raise
+            with self._lock:
+                del self._loading[tenant]
+                self._tenants[tenant] = entry
+                self.resident_bytes += entry.bytes
+                entry.pins += 1
+            loading.set_result(entry)
+            break
+        self._evict_over_budget(keep=entry)
+        return entry
+
+    def _new_memory(self):
+        from arc_prime import ArcMemorySystem
+        return ArcMemorySystem(guardian=self.guardian)
+
+    def _load(self, tenant: str, path: str) -> Tenant:
+        began = perf_counter_ns()
+        memory = self.factory()
+        if not memory.backend.resident:
+            raise ValueError(f"MemoryPool needs a resident backend, factory built "
+                             f"{memory.backend.name!r}")
+        verification = None
+        if os.path.exists(path):
+            verification = memory.restore(path)
+            if verification is not None and not verification.ok:
+                ECHO.pulse(f"tenant {tenant}: {verification.describe()}", source="pool", intensity=3)
+        else:
+            with self._lock:
+                self.created += 1
+        entry = Tenant(tenant, path, memory, verification)
+        with self._lock:
+            self.load_latency.record(perf_counter_ns() - began)
+        return entry
+
+    def _resize(self, entry: Tenant):
+        if self._tenants.get(entry.name) is not entry:
+            return  # dropped; its bytes no longer count
+        previous = entry.bytes
+        entry.bytes = entry.estimate()
+        self.resident_bytes += entry.bytes - previous
+
+    # ------------------------------------------------------------
+    #  EVICTION / FLUSH
+    # ------------------------------------------------------------
+
+    def _over_budget(self) -> bool:
+        leaving = self._leaving.values()
+        if self.budget is not None and self.resident_bytes - sum(e.bytes for e in leaving) > self.budget:
+            return True
+        return self.max_tenants is not None and len(self._tenants) - len(self._leaving) > self.max_tenants
+
+    def _evict_over_budget(self, keep: Optional[Tenant]):
+        """Evicts the coldest unpinned tenants until the pool fits."""
+        while True:
+            with self._lock:
+                if not self._over_budget():
+                    return
+                victim = next((e for e in self._tenants.values()
+                               if e is not keep and not e.pins), None)
+                if victim is None:
+                    return
+                victim.pins += 1
+                self._leaving[victim.name] = victim
+            self._evict(victim)
+
+    def _evict(self, entry: Tenant) -> bool:
+        """Saves a pinned entry, then drops it unless it was leased or changed."""
+        try:
+            self._save(entry)
+        finally:
+            with self._lock:
+                entry.pins -= 1
+                self._leaving.pop(entry.name, None)
+                dropped = not entry.pins and not entry.dirty
+                if dropped:
+                    del self._tenants[entry.name]
+                    self.resident_bytes -= entry.bytes
+                    self.evictions += 1
+        if dropped:
+            ECHO.count("pool.evictions")
+        return dropped
+
+    def _save(self, entry: Tenant):
+        with entry.save_lock:
+            if not entry.dirty:
+                return
+            began = perf_counter_ns()
+            version = entry.memory.version
+            temp = entry.path + ".saving"
+            entry.memory.save_memory(temp, format=self.format, quiet=True)
+            os.replace(temp, entry.path)
+            entry.saved_version = version
+            with self._lock:
+                self.saves += 1
+                self.save_latency.record(perf_counter_ns() - began)
+
+    def evict(self, tenant: str) -> bool:
+        """Flushes and drops a resident, unpinned tenant."""
+        with self._lock:
+            entry = self._tenants.get(tenant)
+            if entry is None or entry.pins:
+                return False
+            entry.pins += 1
+            self._leaving[tenant] = entry
+        return self._evict(entry)
+
+    def flush(self, tenant: Optional[str] = None) -> int:
+        """Saves changed resident tenants (or one); returns how many."""
+        with self._lock:
+            entries = list(self._tenants.values())
+            if tenant is not None:
+                entries = [e for e in entries if e.name == tenant]
+            dirty = [e for e in entries if e.dirty]
+            for entry in dirty:
+                entry.pins += 1
+        try:
+            for entry in dirty:
+                self._save(entry)
+        finally:
+            with self._lock:
+                for entry in dirty:
+                    entry.pins -= 1
+        return len(dirty)
+
+    def close(self):
+        """Flushes every tenant and drops all that are not leased."""
+        self.flush()
+        with self._lock:
+            for entry in list(self._tenants.values()):
+                if not entry.pins:
+                    del self._tenants[entry.name]
+                    self.resident_bytes -= entry.bytes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # ------------------------------------------------------------
+    #  REPORTING
+    # ------------------------------------------------------------
+
+    def __contains__(self, tenant: str) -> bool:
+        return tenant in self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def resident(self) -> List[str]:
+        """Resident tenants, coldest first."""
+        with self._lock:
+            return list(self._tenants)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "tenants": len(self._tenants),
+                "resident_bytes": self.resident_bytes,
+                "budget": self.budget,
+                "pinned": sum(1 for e in self._tenants.values() if e.pins),
+                "dirty": sum(1 for e in self._tenants.values() if e.dirty),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "created": self.created,
+                "evictions": self.evictions,
+                "saves": self.saves,
+                "load": self.load_latency.summary(),
+                "save": self.save_latency.summary(),
+            }
+
+    def describe(self) -> str:
+        s = self.stats()
+        budget = format_bytes(s["budget"]) if s["budget"] is not None else "unbounded"
+        return (f"{s['tenants']} tenants resident ({format_bytes(s['resident_bytes'])} of {budget}), "
+                f"hit rate {s['hit_rate']:.1%} ({s['hits']} hits, {s['misses']} misses), "
+                f"{s['evictions']} evictions, {s['saves']} saves, "
+                f"load p50 {s['load']['p50_ms']:.2f} ms / p99 {s['load']['p99_ms']:.2f} ms")
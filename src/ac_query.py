@@ -0,0 +1,363 @@
+# ============================================================
+# AC QUERY — ArcCore-Prime V1.1
+# Loop 1.25: Query Expressions with Predicate Push-down
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   A small filter language over the memory tree:
+#
+#     where cycle>=3 and role=user and priority>=2 and level<=SEED depth<=5
+#
+#   "where" and "and" are optional; clauses are field, operator,
+#   value. A trailing "limit N" caps the matches.
+#
+#     cycle, priority, depth   <  <=  =  !=  >=  >
+#     level                    same, by CompressionLevel name or number
+#     role, id, collapsed      =  !=
+#     content                  =  !=  ~ (contains, case-insensitive)
+#
+#   select() walks the tree in walk order (pre-order, depth 0 at
+#   the root) and pushes the cycle, priority and depth bounds down:
+#   no descent below the depth bound, and children of wide nodes
+#   are skipped a block at a time when a SubtreeIndex summary
+#   (min/max cycle, max priority over the block's subtrees) shows
+#   nothing in the block can match.
+#
+#   Summaries are cached per node and extended, not rebuilt, as
+#   children are appended — the kernel only ever appends under
+#   the root (MemoryBackend.append/extend); replaced trees get
+#   fresh nodes and so fresh summaries.
+#
+# ============================================================
+
+import operator
+import re
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ac_collapse import CompressionLevel
+
+BLOCK = 64  # children summarised together under a wide node
+
+_OPS = {"<": operator.lt, "<=": operator.le, "=": operator.eq,
+        "!=": operator.ne, ">=": operator.ge, ">": operator.gt}
+_ORDERED = tuple(_OPS)
+_EQUALITY = ("=", "!=")
+
+FIELD_OPS = {
+    "cycle": _ORDERED, "priority": _ORDERED, "depth": _ORDERED, "level": _ORDERED,
+    "role": _EQUALITY, "id": _EQUALITY, "collapsed": _EQUALITY,
+    "content": _EQUALITY + ("~",),
+}
+
+_CLAUSE = re.compile(r'(\w+)\s*(<=|>=|!=|=|<|>|~)\s*("[^"]*"|\S+)')
+_AND = re.compile(r'and\b', re.IGNORECASE)
+_LIMIT = re.compile(r'limit\s+(\d+)\b', re.IGNORECASE)
+_WHERE = re.compile(r'where\b', re.IGNORECASE)
+
+_TRUE = ("true", "yes", "1")
+_FALSE = ("false", "no", "0")
+
+
+# ------------------------------------------------------------
+# Node fields
+# ------------------------------------------------------------
+
+def level_value(node) -> int:
+    """CompressionLevel of a node; live nodes without one are SEED once collapsed."""
+    level = node.get("compression_level")
+    if level is None:
+        return CompressionLevel.SEED if node.get("collapsed") else CompressionLevel.RAW
+    try:
+        return int(level)
+    except (TypeError, ValueError):
+        return -1
+
+
+def fields(node) -> Dict[str, Any]:
+    """The node's own fields (no children), for HarmonicNodes or dicts."""
+    data = {key: node.get(key) for key in
+            ("id", "role", "cycle", "content", "seed", "collapsed", "priority", "timestamp")}
+    level = node.get("compression_level")
+    if level is not None:
+        data["compression_level"] = level
+    return data
+
+
+def format_match(depth: int, node) -> str:
+    """One walk-style line for a matched node."""
+    marker = "💠" if node.get("priority", 0) >= 3 else "•"
+    seed = node.get("seed") or node.get("content")
+    return f"{'  ' * depth}{marker} [AC-{node.get('cycle')}] {node.get('role', '').upper()}: {seed}"
+
+
+# ------------------------------------------------------------
+# Expressions
+# ------------------------------------------------------------
+
+def _check(field: str, op: str):
+    if field not in FIELD_OPS:
+        raise ValueError(f"Unknown field '{field}' (fields: {', '.join(FIELD_OPS)})")
+    if op not in FIELD_OPS[field]:
+        raise ValueError(f"Operator '{op}' not supported for {field}")
+
+
+def _value(field: str, op: str, text: str):
+    _check(field, op)
+    if text.startswith('"') and text.endswith('"') and len(text) >= 2:
+        text = text[1:-1]
+    if field in ("cycle", "priority", "depth"):
+        try:
+            return int(text)
+        except ValueError:
+            raise ValueError(f"{field} needs an integer, got '{text}'")
+    if field == "level":
+        if text.lstrip("-").isdigit():
+            return int(text)
+        try:
+            return int(CompressionLevel[text.upper()])
+        except KeyError:
+            names = ", ".join(level.name for level in CompressionLevel)
+            raise ValueError(f"Unknown level '{text}' (levels: {names})")
+    if field == "collapsed":
+        if text.lower() in _TRUE:
+            return True
+        if text.lower() in _FALSE:
+            return False
+        raise ValueError(f"collapsed needs true or false, got '{text}'")
+    if field == "role":
+        return text.lower()
+    if field == "content" and op == "~":
+        return text.lower()
+    return text
+
+
+def _test(field: str, op: str, value) -> Callable[[Any], bool]:
+    """Compiled node predicate for one clause (depth is tested by select)."""
+    if field == "content" and op == "~":
+        return lambda node: value in (node.get("content") or node.get("seed") or "").lower()
+    compare = _OPS[op]
+    if field == "level":
+        return lambda node: compare(level_value(node), value)
+    if field == "collapsed":
+        return lambda node: compare(bool(node.get("collapsed")), value)
+    if field == "role":
+        return lambda node: compare((node.get("role") or "").lower(), value)
+    if field == "content":
+        return lambda node: compare(node.get("content") or node.get("seed") or "", value)
+    default = 0 if field in ("cycle", "priority") else None
+    return lambda node: compare(node.get(field, default), value)
+
+
+class Query:
+    """
+    A conjunction of (field, op, value) clauses plus an optional
+    limit. The bounds used for push-down are derived once here.
+    """
+
+    def __init__(self, clauses: Iterable[Tuple[str, str, Any]] = (), limit: Optional[int] = None):
+        self.clauses = tuple(clauses)
+        self.limit = limit
+
+        self.cycle_lo, self.cycle_hi = float("-inf"), float("inf")
+        self.min_priority = float("-inf")
+        self.max_depth = float("inf")
+        tests, depth_tests = [], []
+        for field, op, value in self.clauses:
+            _check(field, op)
+            if field == "depth":
+                depth_tests.append((_OPS[op], value))
+                if op in ("=", "<="):
+                    self.max_depth = min(self.max_depth, value)
+                elif op == "<":
+                    self.max_depth = min(self.max_depth, value - 1)
+                continue
+            tests.append(_test(field, op, value))
+            if field == "cycle":
+                if op in ("=", ">=", ">"):
+                    self.cycle_lo = max(self.cycle_lo, value + (op == ">"))
+                if op in ("=", "<=", "<"):
+                    self.cycle_hi = min(self.cycle_hi, value - (op == "<"))
+            elif field == "priority" and op in ("=", ">=", ">"):
+                self.min_priority = max(self.min_priority, value + (op == ">"))
+        self._tests = tuple(tests)
+        self._depth_tests = tuple(depth_tests)
+
+    def matches(self, node, depth: int) -> bool:
+        for compare, value in self._depth_tests:
+            if not compare(depth, value):
+                return False
+        for test in self._tests:
+            if not test(node):
+                return False
+        return True
+
+    def admits(self, summary) -> bool:
+        """False if nothing summarised by (min cycle, max cycle, max priority, …) can match."""
+        lo, hi, top = summary[0], summary[1], summary[2]
+        return lo <= self.cycle_hi and hi >= self.cycle_lo and top >= self.min_priority
+
+    def __str__(self) -> str:
+        text = " and ".join(f"{field}{op}{value}" for field, op, value in self.clauses)
+        text = f"where {text}" if text else "all"
+        return text if self.limit is None else f"{text} limit {self.limit}"
+
+
+def parse(expression: str) -> Query:
+    """Query from 'where cycle>=3 and role=user ... [limit N]'; ValueError if malformed."""
+    text = expression.strip()
+    where = _WHERE.match(text)
+    position = where.end() if where else 0
+    clauses, limit = [], None
+    while True:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        if position >= len(text):
+            break
+        match = _AND.match(text, position)
+        if match:
+            position = match.end()
+            continue
+        match = _LIMIT.match(text, position)
+        if match:
+            limit = int(match.group(1))
+            position = match.end()
+            continue
+        match = _CLAUSE.match(text, position)
+        if match is None:
+            raise ValueError(f"Cannot parse query at: '{text[position:]}'")
+        field, op, raw = match.group(1).lower(), match.group(2), match.group(3)
+        clauses.append((field, op, _value(field, op, raw)))
+        position = match.end()
+    return Query(clauses, limit)
+
+
+# ------------------------------------------------------------
+# Subtree summaries
+# ------------------------------------------------------------
+
+class SubtreeIndex:
+    """
+    Block summaries for the children of wide nodes (≥ block
+    children): one (min cycle, max cycle, max priority, nodes)
+    per run of `block` children, covering their whole subtrees.
+    Cached weakly per node (dict trees, which cannot be weakly
+    referenced, are summarised per call).
+    """
+
+    def __init__(self, block: int = BLOCK):
+        self.block = block
+        self._cache = weakref.WeakKeyDictionary()  # node -> (blocks, children covered)
+        self._lock = threading.RLock()
+
+    def blocks(self, node) -> List[Tuple[int, int, int, int]]:
+        children = node.get("children") or ()
+        count = len(children)
+        with self._lock:
+            try:
+                blocks, covered = self._cache.get(node, ([], 0))
+            except TypeError:  # unhashable (dict node)
+                return self._build(children, [], 0, count)
+            if covered != count:
+                if covered > count:
+                    blocks, covered = [], 0  # shrunk: not append-only, start over
+                blocks = self._build(children, blocks, covered, count)
+                self._cache[node] = (blocks, count)
+            return blocks
+
+    def _build(self, children, blocks, covered: int, count: int):
+        """Recomputes the last partial block onwards."""
+        size = self.block
+        first = covered // size
+        blocks = blocks[:first]
+        for start in range(first * size, count, size):
+            lo, hi, top, nodes = float("inf"), float("-inf"), float("-inf"), 0
+            for child in children[start:start + size]:
+                c_lo, c_hi, c_top, c_nodes = self.summarize(child)
+                lo, hi, top = min(lo, c_lo), max(hi, c_hi), max(top, c_top)
+                nodes += c_nodes
+            blocks.append((lo, hi, top, nodes))
+        return blocks
+
+    def summarize(self, node) -> Tuple[int, int, int, int]:
+        """(min cycle, max cycle, max priority, nodes) over node's whole subtree."""
+        lo, hi, top, nodes = float("inf"), float("-inf"), float("-inf"), 0
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            cycle = current.get("cycle") or 0
+            priority = current.get("priority") or 0
+            lo, hi, top = min(lo, cycle), max(hi, cycle), max(top, priority)
+            nodes += 1
+            children = current.get("children") or ()
+            if len(children) >= self.block:
+                for b_lo, b_hi, b_top, b_nodes in self.blocks(current):
+                    lo, hi, top = min(lo, b_lo), max(hi, b_hi), max(top, b_top)
+                    nodes += b_nodes
+            else:
+                stack.extend(children)
+        return lo, hi, top, nodes
+
+
+# ------------------------------------------------------------
+# Traversal engine
+# ------------------------------------------------------------
+
+class QueryStats:
+    """What a select() run touched: nodes visited, nodes skipped and blocks pruned."""
+
+    __slots__ = ("visited", "skipped", "pruned")
+
+    def __init__(self):
+        self.visited = 0
+        self.skipped = 0
+        self.pruned = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"visited": self.visited, "skipped": self.skipped, "pruned": self.pruned}
+
+
+def _children(node, query: Query, index: Optional[SubtreeIndex], stats: QueryStats) -> Iterator:
+    children = node.get("children") or ()
+    if index is None or len(children) < index.block:
+        return iter(children)
+    return _admitted(children, index.blocks(node), query, index.block, stats)
+
+
+def _admitted(children, blocks, query: Query, size: int, stats: QueryStats) -> Iterator:
+    for number, summary in enumerate(blocks):
+        if not query.admits(summary):
+            stats.skipped += summary[3]
+            stats.pruned += 1
+            continue
+        yield from children[number * size:(number + 1) * size]
+
+
+def select(root, query: Query, index: Optional[SubtreeIndex] = None,
+           stats: Optional[QueryStats] = None) -> Iterator[Tuple[int, Any]]:
+    """
+    (depth, node) for every match, in walk order. Pass index to
+    prune blocks of subtrees; pass stats to learn what was touched.
+    """
+    stats = stats if stats is not None else QueryStats()
+    limit = query.limit
+    found = 0
+    if limit == 0:
+        return
+    stack = [iter((root,))]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            continue
+        depth = len(stack) - 1
+        stats.visited += 1
+        if query.matches(node, depth):
+            yield depth, node
+            found += 1
+            if limit is not None and found >= limit:
+                return
+        if depth < query.max_depth:
+            stack.append(_children(node, query, index, stats))
@@ -5,8 +5,10 @@
 # Guardian: Arien
 # ============================================================
 
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
 from ac_collapse import CompressionLevel
+from ac_echo import traced
+from ac_seed import VERBATIM, SeedRecord, expand
 
 
 class ArcReconstruct:
@@ -25,12 +27,19 @@ class ArcReconstruct:
     # SEED EXPANSION (deterministic)
     # ------------------------------------------------------------
 
-    def expand_seed(self, seed: str) -> str:
+    def expand_seed(self, seed, content: str = None) -> str:
         """
         Deterministic seed expansion:
         Converts a compressed seed into a richer contextual statement.
         Uses structural logic, not generative models.
+        Loop 1.28 — a SeedRecord expands straight from its node's
+        content; only text seeds are parsed.
         """
+        if isinstance(seed, SeedRecord):
+            if seed.kind != VERBATIM:
+                return expand(seed, content)
+            seed = content
+
         if seed is None:
             return "(no seed)"
 
@@ -55,25 +64,28 @@ class ArcReconstruct:
         Reconstructs a node and its children structurally.
         Used for RAW and SUMMARY compression levels.
         """
-        output = []
-        indent = "  " * depth
-
-        seed = node.get("seed") or node.get("content")
-        expanded = self.expand_seed(seed)
-        cycle = node.get("cycle")
-        role = node.get("role", "").upper()
-
-        output.append(f"{indent}[AC-{cycle}] {role}: {expanded}")
+        output = [self._path_line(node, depth)]
 
         for child in node.get("children", []):
-            output.extend(self.reconstruct_node(child, depth + 1))
+            output.extend(self._reconstruct_node(child, depth + 1))
 
         return output
 
+    def _path_line(self, node: Dict[str, Any], depth: int) -> str:
+        seed = node.get("seed_record")
+        if seed:
+            expanded = self.expand_seed(seed, node.get("content"))
+        else:
+            expanded = self.expand_seed(node.get("seed") or node.get("content"))
+        cycle = node.get("cycle")
+        role = node.get("role", "").upper()
+        return f"{'  ' * depth}[AC-{cycle}] {role}: {expanded}"
+
     # ------------------------------------------------------------
     # CYCLE-BASED THREAD RECONSTRUCTION
     # ------------------------------------------------------------
 
+    @traced("reconstruct.thread")
     def reconstruct_thread(self, tree: Dict[str, Any], cycle_id: int) -> List[str]:
         """
         Returns all nodes belonging to a given cycle, expanded.
@@ -95,12 +107,16 @@ class ArcReconstruct:
     # COMPRESSION-AWARE DISPATCH (Loop 2.2)
     # ------------------------------------------------------------
 
+    @traced("reconstruct")
     def reconstruct_node(self, node: Dict[str, Any], depth: int = 0) -> List[str]:
         """
         Dispatch reconstruction based on compression level.
         Reconstruction is meaning-first and fidelity-honest.
         """
+        return self._reconstruct_node(node, depth)
 
+    def _reconstruct_node(self, node: Dict[str, Any], depth: int) -> List[str]:
+        # Loop 1.18 — recursion stays below the traced entry point
         level = node.get("compression_level", CompressionLevel.RAW)
         indent = "  " * depth
         role = node.get("role", "").upper()
@@ -112,7 +128,11 @@ class ArcReconstruct:
 
         # SEED — expand auric seed only
         if level == CompressionLevel.SEED:
-            expanded = self.expand_seed(node.get("seed"))
+            seed = node.get("seed_record")
+            if seed is not None:
+                expanded = self.expand_seed(seed, node.get("content"))
+            else:
+                expanded = self.expand_seed(node.get("seed"))
             return [f"{indent}[AC-{cycle}] {role}: {expanded}"]
 
         # SIGIL_ONLY — honest boundary
@@ -125,10 +145,30 @@ class ArcReconstruct:
         # Defensive fallback
         return [f"{indent}[AC-{cycle}] {role}: [Unknown compression state]"]
 
+    def iter_node(self, node: Dict[str, Any], depth: int = 0) -> Iterator[str]:
+        """
+        reconstruct_node() one line at a time (Loop 1.24), for paging
+        large trees without building the whole list.
+        """
+        stack = [iter((node,))]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                continue
+            level = node.get("compression_level", CompressionLevel.RAW)
+            at = depth + len(stack) - 1
+            if level in (CompressionLevel.RAW, CompressionLevel.SUMMARY):
+                yield self._path_line(node, at)
+                stack.append(iter(node.get("children", [])))
+            else:
+                yield from self._reconstruct_node(node, at)
+
     # ------------------------------------------------------------
     # FULL TREE RECONSTRUCTION (pretty print)
     # ------------------------------------------------------------
 
+    @traced("reconstruct.full")
     def reconstruct_full(self, tree: Dict[str, Any]) -> str:
         """
         Reconstructs the entire tree into a human-readable
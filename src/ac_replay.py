@@ -0,0 +1,343 @@
+# ============================================================
+# AC REPLAY — ArcCore-Prime V1.1
+# Loop 1.27: Workload Capture and Replay
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Records what the kernel was asked to do, with timing, so a
+#   production slowdown can be reproduced and bisected offline.
+#
+#   Capture: with ARCCORE_CAPTURE=<trace file> set (or a
+#   WorkloadCapture assigned to memory.capture) every
+#   ingest_interaction call and every ArcInterpreter command is
+#   appended to the trace. Ingests made by a command ("inject")
+#   are part of that command and are not recorded twice. While
+#   capture is off the only cost is one attribute check.
+#
+#   Trace file: NDJSON (gzip when the name ends in .gz), one
+#   header object then one compact array per call:
+#     {"format": "arccore-trace", "version": 1, "started", "base"}
+#     ["i", t_us, dur_us, user_text, ai_text, cycle]
+#     ["c", t_us, dur_us, command, authority]
+#   t_us is the offset from the start of capture; base is a
+#   saved memory to start from (optional). Traces hold the raw
+#   text of every call — treat them like memory files.
+#
+#   Replay: runs a trace against a fresh memory, or one restored
+#   from a saved file, at the original pace, N× faster, or as
+#   fast as possible, and reports throughput and latency
+#   percentiles per command type next to the captured ones.
+#
+# Usage:
+#   python ac_replay.py TRACE [--speed 1|N|max] [--memory FILE] [--json]
+#
+# ============================================================
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from ac_echo import Histogram
+
+CAPTURE_ENV = "ARCCORE_CAPTURE"
+FORMAT = "arccore-trace"
+VERSION = 1
+INGEST = "ingest"
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        import gzip
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+# ============================================================
+#  CAPTURE
+# ============================================================
+
+class WorkloadCapture:
+    """
+    Appends timed ingest and command records to a trace file.
+    Records are buffered and written `flush_every` at a time.
+    """
+
+    def __init__(self, path: str, base: Optional[str] = None, flush_every: int = 512):
+        self.path = path
+        self.flush_every = flush_every
+        self.records = 0
+        self._file = _open(path, "w")
+        self._file.write(_encode({"format": FORMAT, "version": VERSION,
+                                  "started": datetime.now().isoformat(), "base": base}) + "\n")
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._local = threading.local()  # inside a recorded command on this thread
+        self._start = perf_counter_ns()
+
+    def _append(self, record: list):
+        line = _encode(record)
+        with self._lock:
+            if self._file is None:
+                return
+            self._buffer.append(line)
+            self.records += 1
+            if len(self._buffer) >= self.flush_every:
+                self._write()
+
+    def _write(self):
+        self._file.write("\n".join(self._buffer) + "\n")
+        self._buffer = []
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                if self._buffer:
+                    self._write()
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                if self._buffer:
+                    self._write()
+                self._file.close()
+                self._file = None
+
+    # ------------------------------------------------------------
+    # Hooks (ArcMemorySystem.ingest_interaction, ArcInterpreter)
+    # ------------------------------------------------------------
+
+    def ingest(self, fn: Callable, user_text: str, ai_text: str, cycle_context: int):
+        if getattr(self._local, "command", False):
+            return fn(user_text, ai_text, cycle_context)
+        began = perf_counter_ns()
+        try:
+            return fn(user_text, ai_text, cycle_context)
+        finally:
+            ended = perf_counter_ns()
+            self._append(["i", (began - self._start) // 1000, (ended - began) // 1000,
+                          user_text, ai_text, cycle_context])
+
+    def command(self, fn: Callable, command: str, authority: int):
+        local = self._local
+        outer = getattr(local, "command", False)
+        local.command = True
+        began = perf_counter_ns()
+        try:
+            return fn(command)
+        finally:
+            ended = perf_counter_ns()
+            local.command = outer
+            if not outer:
+                self._append(["c", (began - self._start) // 1000, (ended - began) // 1000,
+                              command, authority])
+
+    def stream(self, lines: Iterator[str], command: str, authority: int) -> Iterator[str]:
+        """A paged command is recorded once fully read (or closed), with its pull time."""
+        began = perf_counter_ns()
+        spent = 0
+        try:
+            while True:
+                pulled = perf_counter_ns()
+                try:
+                    line = next(lines)
+                finally:
+                    spent += perf_counter_ns() - pulled
+                yield line
+        except StopIteration:
+            return
+        finally:
+            self._append(["c", (began - self._start) // 1000, spent // 1000, command, authority])
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_capture() -> Optional[WorkloadCapture]:
+    """The process-wide capture named by ARCCORE_CAPTURE (None if unset)."""
+    global _shared
+    path = os.environ.get(CAPTURE_ENV)
+    if not path:
+        return None
+    with _shared_lock:
+        if _shared is None:
+            import atexit
+            _shared = WorkloadCapture(path)
+            atexit.register(_shared.close)
+        return _shared
+
+
+# ============================================================
+#  TRACE FILES
+# ============================================================
+
+def read_trace(path: str) -> Tuple[Dict[str, Any], Iterator[list]]:
+    """(header, records) of a trace; records are read lazily."""
+    f = _open(path, "r")
+    first = f.readline()
+    try:
+        header = json.loads(first) if first else {}
+    except json.JSONDecodeError:
+        header = {}
+    if header.get("format") != FORMAT:
+        f.close()
+        raise ValueError(f"{path} is not an ArcCore trace")
+
+    def records():
+        with f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    return header, records()
+
+
+def record_type(record: list) -> str:
+    """Report key: "ingest" or the command's verb."""
+    if record[0] == "i":
+        return INGEST
+    parts = record[3].split(maxsplit=1)
+    return parts[0].lower() if parts else "(empty)"
+
+
+# ============================================================
+#  REPLAY
+# ============================================================
+
+class WorkloadReplay:
+    """
+    Runs a trace through one interpreter. speed is a multiple of
+    the original pace (1.0 = as captured); None replays as fast
+    as possible. memory_file overrides the trace's base.
+    """
+
+    def __init__(self, trace: str, speed: Optional[float] = 1.0, memory_file: Optional[str] = None,
+                 interpreter=None):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (or None for maximum)")
+        self.trace = trace
+        self.speed = speed
+        self.header, self._records = read_trace(trace)
+        if interpreter is None:
+            from ac_interpreter import ArcInterpreter
+            interpreter = ArcInterpreter()
+        self.interpreter = interpreter
+        self.memory = interpreter.memory
+        self.memory.capture = None  # never re-capture a replay
+        base = memory_file or self.header.get("base")
+        if base:
+            self.memory.restore(base)
+
+    def run(self) -> Dict[str, Any]:
+        interpreter, memory = self.interpreter, self.memory
+        authority = interpreter.authority
+        replayed: Dict[str, Histogram] = {}
+        captured: Dict[str, Histogram] = {}
+        errors: Dict[str, int] = {}
+        max_lag_us = 0
+        count = 0
+
+        start = perf_counter_ns()
+        try:
+            for record in self._records:
+                kind = record_type(record)
+                if self.speed is not None:
+                    due = record[1] / self.speed
+                    ahead = due - (perf_counter_ns() - start) / 1000
+                    if ahead > 0:
+                        time.sleep(ahead / 1e6)
+                    else:
+                        max_lag_us = max(max_lag_us, -ahead)
+
+                began = perf_counter_ns()
+                failed = False
+                if record[0] == "i":
+                    try:
+                        memory.ingest_interaction(record[3], record[4], record[5])
+                    except Exception:
+                        failed = True
+                else:
+                    interpreter.authority = record[4]
+                    try:
+                        failed = interpreter.execute_status(record[3])[0] != "ok"
+                    except Exception:
+                        failed = True
+                elapsed = perf_counter_ns() - began
+
+                replayed.setdefault(kind, Histogram()).record(elapsed)
+                captured.setdefault(kind, Histogram()).record(record[2] * 1000)
+                if failed:
+                    errors[kind] = errors.get(kind, 0) + 1
+                count += 1
+        finally:
+            interpreter.authority = authority
+        seconds = (perf_counter_ns() - start) / 1e9
+
+        types = {}
+        for kind, hist in sorted(replayed.items(), key=lambda item: -item[1].count):
+            summary = hist.summary()
+            summary["errors"] = errors.get(kind, 0)
+            summary["ops_per_s"] = round(hist.count / (hist.total / 1e9), 1) if hist.total else 0.0
+            was = captured[kind].summary()
+            summary["captured_p50_ms"] = was["p50_ms"]
+            summary["captured_p99_ms"] = was["p99_ms"]
+            types[kind] = summary
+        return {
+            "trace": self.trace,
+            "speed": "max" if self.speed is None else self.speed,
+            "records": count,
+            "seconds": round(seconds, 3),
+            "throughput": round(count / seconds, 1) if seconds else 0.0,
+            "max_lag_ms": round(max_lag_us / 1000, 3),
+            "types": types,
+        }
+
+
+def report_text(report: Dict[str, Any]) -> str:
+    lines = [f"[replay] {report['records']} records in {report['seconds']:.3f}s at speed "
+             f"{report['speed']} — {report['throughput']:.1f} ops/s, max lag {report['max_lag_ms']:.1f} ms",
+             f"{'type':<12} {'count':>7} {'errors':>6} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} "
+             f"{'p99 ms':>9} {'max ms':>9} {'was p50':>9} {'was p99':>9}"]
+    for kind, m in report["types"].items():
+        lines.append(f"{kind:<12} {m['count']:>7} {m['errors']:>6} {m['ops_per_s']:>10.1f} "
+                     f"{m['p50_ms']:>9.4f} {m['p95_ms']:>9.4f} {m['p99_ms']:>9.4f} {m['max_ms']:>9.4f} "
+                     f"{m['captured_p50_ms']:>9.4f} {m['captured_p99_ms']:>9.4f}")
+    return "\n".join(lines)
+
+
+# ============================================================
+#  CLI
+# ============================================================
+
+def main(argv=None) -> int:
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Replay an ArcCore workload trace.")
+    parser.add_argument("trace")
+    parser.add_argument("--speed", default="1",
+                        help="multiple of the captured pace, or 'max' (default 1)")
+    parser.add_argument("--memory", help="saved memory to start from (overrides the trace's base)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        speed = None if args.speed.lower() in ("max", "0") else float(args.speed.rstrip("xX"))
+        report = WorkloadReplay(args.trace, speed, args.memory).run()
+    except (OSError, ValueError) as e:
+        print(f"[replay] Error: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(report, indent=2) if args.json else report_text(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+# ============================================================
+# AC SEED — ArcCore-Prime V1.1
+# Loop 1.28: Structured Seed Records
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Seeds used to be stored as formatted strings ("[AC-7] ...",
+#   "[Seed AC-7]: ...") that repeat the start of the node's own
+#   content, and ArcReconstruct split them apart again on every
+#   render.
+#
+#   A seed is now a SeedRecord (kind, cycle, length): the text
+#   is the first `length` characters of the content, so nothing
+#   is copied. Records are interned, so all nodes with the same
+#   seed shape share one tuple. The legacy string is produced
+#   only at output time (render) and is byte-identical to the
+#   old one — to_dict(), memory hashes, sync digests, ACMB and
+#   SQLite rows do not change. expand() gives ArcReconstruct's
+#   text straight from the record, with cached prefixes.
+#
+#   Seeds that are not derived from their content ("[Blocked]",
+#   collapse output, hand-edited files) stay plain strings.
+#
+#   JSON files keep a table of the distinct [kind, cycle, length]
+#   records; nodes refer to it by index (ac_content.pack_tree).
+#   Older files load unchanged and their seed strings are parsed
+#   back into records. To rewrite a file:
+#     python ac_seed.py migrate IN.json [OUT.json]
+#
+# ============================================================
+
+import re
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+VERBATIM = 0   # the whole content
+ANCHOR = 1     # "[AC-{cycle}] {snippet}..."           — sigil-weighted nodes
+SNIPPET = 2    # "[Seed AC-{cycle}]: {snippet}..."     — long content
+AUTO = 3       # "[AutoSeed AC-{cycle}]: {snippet}..." — collapse engine
+
+KINDS = {VERBATIM: "verbatim", ANCHOR: "anchor", SNIPPET: "snippet", AUTO: "auto"}
+
+# Snippet lengths used by HarmonicNode.prune_to_seed / ACCollapseEngine
+ANCHOR_LENGTH = 80
+SNIPPET_LENGTH = 30
+AUTO_LENGTH = 50
+
+_TAGS = {ANCHOR: ("[AC-", "] "), SNIPPET: ("[Seed AC-", "]: "), AUTO: ("[AutoSeed AC-", "]: ")}
+_DEFAULT_LENGTHS = {ANCHOR: ANCHOR_LENGTH, SNIPPET: SNIPPET_LENGTH, AUTO: ANCHOR_LENGTH}
+_PATTERN = re.compile(r"\[(AC|Seed AC|AutoSeed AC)-(-?\d+)\](:?) ")
+_KIND_OF = {"AC": ANCHOR, "Seed AC": SNIPPET, "AutoSeed AC": AUTO}
+
+
+class SeedRecord(NamedTuple):
+    kind: int
+    cycle: int
+    length: int
+
+
+Seed = Union[None, str, SeedRecord]
+
+_records: Dict[Tuple[int, int, int], SeedRecord] = {}
+_prefixes: Dict[SeedRecord, str] = {}
+_expansions: Dict[SeedRecord, str] = {}
+
+
+def record(kind: int, cycle: int = 0, length: int = 0) -> SeedRecord:
+    """The shared record for (kind, cycle, length)."""
+    key = (kind, cycle, length)
+    found = _records.get(key)
+    if found is None:
+        found = _records.setdefault(key, SeedRecord(kind, cycle, length))
+    return found
+
+
+VERBATIM_SEED = record(VERBATIM)
+
+
+# ------------------------------------------------------------
+#  RENDERING
+# ------------------------------------------------------------
+
+def render(seed: Seed, content: Optional[str]) -> Optional[str]:
+    """The seed as text. Strings and None pass through."""
+    if seed is None or isinstance(seed, str):
+        return seed
+    if seed.kind == VERBATIM:
+        return content
+    prefix = _prefixes.get(seed)
+    if prefix is None:
+        opening, closing = _TAGS[seed.kind]
+        prefix = _prefixes.setdefault(seed, f"{opening}{seed.cycle}{closing}")
+    return f"{prefix}{(content or '')[:seed.length]}..."
+
+
+def expand(seed: SeedRecord, content: Optional[str]) -> str:
+    """ArcReconstruct.expand_seed() of render(seed, content), without the parse."""
+    prefix = _expansions.get(seed)
+    if prefix is None:
+        if seed.kind == ANCHOR:
+            prefix = f"(AC-{seed.cycle}) → "
+        elif seed.kind == SNIPPET:
+            prefix = f"(Seed AC-{seed.cycle}) → "
+        else:
+            prefix = f"(expanded) [AutoSeed AC-{seed.cycle}]: "
+        prefix = _expansions.setdefault(seed, prefix)
+    return f"{prefix}{(content or '')[:seed.length]}..."
+
+
+# ------------------------------------------------------------
+#  PARSING (legacy strings → records)
+# ------------------------------------------------------------
+
+def parse(seed: Seed, content: Optional[str]) -> Seed:
+    """
+    Record for a seed string when it is derived from content,
+    otherwise the string itself. render(parse(s, c), c) == s.
+    """
+    if not isinstance(seed, str) or content is None:
+        return seed
+    if seed is content or seed == content:
+        return VERBATIM_SEED
+    if not seed.endswith("...") or not seed.startswith("["):
+        return seed
+    match = _PATTERN.match(seed)
+    if match is None:
+        return seed
+    tag, cycle_text, colon = match.groups()
+    kind = _KIND_OF[tag]
+    cycle = int(cycle_text)
+    if bool(colon) != (kind != ANCHOR) or str(cycle) != cycle_text:
+        return seed
+    snippet = seed[match.end():-3]
+    if not content.startswith(snippet):
+        return seed
+    length = len(snippet)
+    if length == len(content) and length <= _DEFAULT_LENGTHS[kind]:
+        length = _DEFAULT_LENGTHS[kind]  # share the record prune_to_seed would have made
+    return record(kind, cycle, length)
+
+
+def derived(seed: Seed, content: Optional[str]) -> Optional[SeedRecord]:
+    """The record for a seed built from a snippet of content, else None."""
+    parsed = parse(seed, content)
+    if isinstance(parsed, SeedRecord) and parsed.kind != VERBATIM:
+        return parsed
+    return None
+
+
+def decode(value) -> SeedRecord:
+    """Record for a saved [kind, cycle, length] entry."""
+    kind, cycle, length = value
+    if kind not in _TAGS:
+        raise ValueError(f"Unknown seed kind: {kind}")
+    return record(kind, cycle, length)
+
+
+# ============================================================
+#  MIGRATION
+# ============================================================
+
+def count_seeds(tree) -> Dict[str, int]:
+    """Seeds of a to_dict()-shaped tree by how they would be stored."""
+    counts = {name: 0 for name in KINDS.values()}
+    counts["text"] = counts["none"] = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        parsed = parse(node.get("seed"), node.get("content"))
+        if parsed is None:
+            counts["none"] += 1
+        elif isinstance(parsed, str):
+            counts["text"] += 1
+        else:
+            counts[KINDS[parsed.kind]] += 1
+        stack.extend(node.get("children", []))
+    return counts
+
+
+def migrate(source: str, target: Optional[str] = None) -> Dict[str, object]:
+    """
+    Rewrites a JSON memory file with structured seeds (in place
+    when target is None) and checks that it reads back the same.
+    """
+    import os
+    import ac_binary
+    from ac_storage import read_file, write_file
+
+    if ac_binary.is_binary(source):
+        raise ValueError(f"{source} is an ACMB file; its seeds are stored as text")
+    payload = read_file(source)
+    report = payload["verification"]
+    if report is not None and not report.ok:
+        raise ValueError(f"{source} failed verification: {report.describe()}")
+
+    target = target or source
+    before = os.path.getsize(source)
+    integrity = {k: v for k, v in payload["integrity"].items() if k != "segments"}
+    temp = target + ".migrating"
+    write_file(temp, integrity, payload["tree"])
+    if read_file(temp)["tree"] != payload["tree"]:
+        os.remove(temp)
+        raise ValueError("migrated tree does not read back identically")
+    os.replace(temp, target)
+    return {"source": source, "target": target, "bytes_before": before,
+            "bytes_after": os.path.getsize(target), "seeds": count_seeds(payload["tree"])}
+
+
+def main(argv=None) -> int:
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Structured seed records.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("migrate", help="rewrite a JSON memory file with structured seeds")
+    command.add_argument("source")
+    command.add_argument("target", nargs="?")
+    args = parser.parse_args(argv)
+
+    try:
+        result = migrate(args.source, args.target)
+    except (OSError, ValueError) as e:
+        print(f"[seed] Error: {e}", file=sys.stderr)
+        return 1
+    seeds = result["seeds"]
+    structured = seeds["anchor"] + seeds["snippet"] + seeds["auto"]
+    print(f"[seed] {result['target']}: {structured} structured, {seeds['verbatim']} verbatim, "
+          f"{seeds['text']} text seeds; {result['bytes_before']} → {result['bytes_after']} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,261 @@
+# ============================================================
+# AC SENTINEL — ArcCore-Prime V1.1
+# Loop 1.22: Authority Judgment with a Compiled Decision Table
+# Guardian Layer: Arien
+# Judgment contract is defined in docs/sentinel.md
+# ============================================================
+#
+# Purpose:
+#   The Sentinel judges whether an action may proceed: every
+#   command verb maps to exactly one OperationType, and the
+#   actor's authority is compared with the authority that
+#   operation requires (docs/authority_defaults.md). The answer
+#   is a GateResult that explains itself in isolation.
+#
+#   A policy only has a handful of verbs and ten authority
+#   levels, so every (verb, authority) and (operation,
+#   authority) judgment is compiled up front into a dict of
+#   shared, immutable GateResults; judge() is one lookup.
+#   Authorities outside the scale are judged once and
+#   memoized. Verbs with no OperationType are denied.
+#
+#   Sub-actions that exercise more power than their verb
+#   ("sync apply", "audit level") are classified on their own
+#   as "verb sub"; action() picks the key a command is judged by.
+#
+#   reload() compiles the new policy off to the side and swaps
+#   it in with one attribute assignment: in-flight judgments
+#   finish against the table they started with, nothing waits.
+#
+#   The Sentinel never inspects content and never executes
+#   what it judges.
+#
+# ============================================================
+
+import json
+import os
+from enum import Enum
+from typing import Dict, NamedTuple, Optional
+
+import ac_authority_defaults as defaults
+
+POLICY_ENV = "ARCCORE_SENTINEL_POLICY"
+_MEMO_LIMIT = 4096
+
+
+class OperationType(str, Enum):
+    """The closed set of powers an action may exercise."""
+    READ = "READ"
+    WRITE = "WRITE"
+    MARK = "MARK"
+    GOVERN = "GOVERN"
+
+
+# Every shell verb and the power it exercises; "verb sub" keys
+# classify sub-actions that need more than their verb
+DEFAULT_COMMANDS = {
+    "walk": OperationType.READ, "export": OperationType.READ,
+    "reconstruct": OperationType.READ, "thread": OperationType.READ,
+    "summary": OperationType.READ, "dedup": OperationType.READ,
+    "inspect": OperationType.READ, "guardian": OperationType.READ,
+    "sigil": OperationType.READ, "echo": OperationType.READ,
+    "footprint": OperationType.READ, "audit": OperationType.READ,
+    "sentinel": OperationType.READ, "query": OperationType.READ,
+    "show": OperationType.READ, "path": OperationType.READ,
+    "exit": OperationType.READ,
+    "inject": OperationType.WRITE, "sync": OperationType.WRITE,
+    "collapse": OperationType.GOVERN,
+    "echo on": OperationType.MARK, "echo off": OperationType.MARK,
+    "echo reset": OperationType.MARK, "footprint budget": OperationType.MARK,
+    "sync apply": OperationType.GOVERN, "audit level": OperationType.GOVERN,
+    "shutdown": OperationType.GOVERN,  # ac_daemon op, for peers other than its owner
+}
+
+
+class GateResult(NamedTuple):
+    """The Sentinel's judgment (docs/sentinel.md)."""
+    allowed: bool
+    reason: str
+    operation: Optional[OperationType]
+    required_authority: Optional[int]
+    actor_authority: int
+
+
+# ============================================================
+#  POLICY
+# ============================================================
+
+class SentinelPolicy:
+    """
+    Which verb exercises which OperationType, and the authority
+    each requires. command_authority overrides the operation's
+    requirement for single verbs.
+    """
+
+    def __init__(self, commands: Optional[Dict[str, str]] = None,
+                 required_authority: Optional[Dict[str, int]] = None,
+                 command_authority: Optional[Dict[str, int]] = None):
+        self.commands = {verb: OperationType(op)
+                         for verb, op in (commands if commands is not None else DEFAULT_COMMANDS).items()}
+        self.required_authority = {op: defaults.REQUIRED_AUTHORITY[op.value] for op in OperationType}
+        for op, value in (required_authority or {}).items():
+            self.required_authority[OperationType(op)] = _authority(value)
+        self.command_authority = {verb: _authority(v) for verb, v in (command_authority or {}).items()}
+        unknown = set(self.command_authority) - set(self.commands)
+        if unknown:
+            raise ValueError(f"Authority set for unclassified verbs: {', '.join(sorted(unknown))}")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SentinelPolicy":
+        commands = dict(DEFAULT_COMMANDS)
+        commands.update(data.get("commands", {}))
+        return cls(commands, data.get("required_authority"), data.get("command_authority"))
+
+    @classmethod
+    def load(cls, path: str) -> "SentinelPolicy":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def required_for(self, verb: str) -> Optional[int]:
+        operation = self.commands.get(verb)
+        if operation is None:
+            return None
+        return self.command_authority.get(verb, self.required_authority[operation])
+
+    def to_dict(self) -> dict:
+        return {
+            "commands": {verb: op.value for verb, op in sorted(self.commands.items())},
+            "required_authority": {op.value: v for op, v in self.required_authority.items()},
+            "command_authority": dict(self.command_authority),
+        }
+
+
+def _authority(value) -> int:
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"Authority must be a non-negative integer, got {value!r}")
+    return value
+
+
+# ============================================================
+#  JUDGMENT
+# ============================================================
+
+def decide(operation: OperationType, required: int, actor: int) -> GateResult:
+    """One explicit, numeric authority comparison."""
+    if actor >= required:
+        if operation is OperationType.READ:
+            reason = "READ permitted — non-mutating"
+        else:
+            reason = f"{operation.value} permitted — authority {actor} ≥ required {required}"
+        return GateResult(True, reason, operation, required, actor)
+    return GateResult(False, f"{operation.value} denied — authority {actor} < required {required}",
+                      operation, required, actor)
+
+
+def compile_policy(policy: SentinelPolicy):
+    """(policy, verb table, operation table) for authorities 0..MAX_AUTHORITY."""
+    levels = range(defaults.MAX_AUTHORITY + 1)
+    verbs = {(verb, actor): decide(op, policy.required_for(verb), actor)
+             for verb, op in policy.commands.items() for actor in levels}
+    operations = {(op, actor): decide(op, policy.required_authority[op], actor)
+                  for op in OperationType for actor in levels}
+    return policy, verbs, operations
+
+
+class Sentinel:
+    """
+    Authority judge. judge() for command verbs, judge_operation()
+    for kernel paths that already know their OperationType.
+    Decisions go to `audit` (an AuditLog) when its level asks.
+    """
+
+    def __init__(self, policy: Optional[SentinelPolicy] = None, audit=None):
+        self.audit = audit
+        self.reloads = 0
+        self._state = compile_policy(policy or SentinelPolicy())
+
+    @classmethod
+    def from_env(cls, audit=None) -> "Sentinel":
+        path = os.environ.get(POLICY_ENV)
+        return cls(SentinelPolicy.load(path) if path else None, audit)
+
+    @property
+    def policy(self) -> SentinelPolicy:
+        return self._state[0]
+
+    def action(self, verb: str, args: str = "") -> str:
+        """The key a command is judged by: "verb sub" if classified, else verb."""
+        words = args.split(maxsplit=1)
+        if words:
+            key = f"{verb} {words[0].lower()}"
+            if key in self._state[0].commands:
+                return key
+        return verb
+
+    def judge(self, verb: str, actor_authority: int = defaults.DEFAULT_ACTOR_AUTHORITY) -> GateResult:
+        state = self._state  # one read: a concurrent reload cannot split a judgment
+        result = state[1].get((verb, actor_authority))
+        if result is None:
+            result = self._judge_verb(state, verb, actor_authority)
+        audit = self.audit
+        if audit is not None and (result.operation or "UNCLASSIFIED", result.allowed) in audit.wanted:
+            self._record(result, verb)
+        return result
+
+    def explain(self, verb: str, actor_authority: int = defaults.DEFAULT_ACTOR_AUTHORITY) -> GateResult:
+        """judge() without an audit record, for "what if" questions."""
+        state = self._state
+        result = state[1].get((verb, actor_authority))
+        return result if result is not None else self._judge_verb(state, verb, actor_authority)
+
+    def judge_operation(self, operation: OperationType,
+                        actor_authority: int = defaults.DEFAULT_ACTOR_AUTHORITY) -> GateResult:
+        state = self._state
+        result = state[2].get((operation, actor_authority))
+        if result is None:
+            operation = OperationType(operation)
+            result = decide(operation, state[0].required_authority[operation], _authority(actor_authority))
+        audit = self.audit
+        if audit is not None and (result.operation, result.allowed) in audit.wanted:
+            self._record(result, None)
+        return result
+
+    def _judge_verb(self, state, verb: str, actor: int) -> GateResult:
+        policy, verbs, _ = state
+        actor = _authority(actor)
+        operation = policy.commands.get(verb)
+        if operation is None:
+            return GateResult(False, f"'{verb}' has no OperationType — unclassified actions are invalid",
+                              None, None, actor)
+        result = decide(operation, policy.required_for(verb), actor)
+        if len(verbs) < _MEMO_LIMIT:
+            verbs[(verb, actor)] = result
+        return result
+
+    def _record(self, result: GateResult, verb: Optional[str]):
+        operation = result.operation.value if result.operation is not None else "UNCLASSIFIED"
+        self.audit.record(operation, result.allowed, result.reason, result.actor_authority,
+                          result.required_authority, action=verb)
+
+    # ------------------------------------------------------------
+    # Policy reload
+    # ------------------------------------------------------------
+
+    def reload(self, policy: SentinelPolicy):
+        """Compiles policy, then swaps it in atomically."""
+        state = compile_policy(policy)
+        self._state = state
+        self.reloads += 1
+
+    def load_policy(self, path: str):
+        self.reload(SentinelPolicy.load(path))
+
+    def describe(self) -> str:
+        policy = self.policy
+        lines = []
+        for op in OperationType:
+            verbs = sorted(v for v, o in policy.commands.items() if o is op)
+            lines.append(f"{op.value:<7} ≥{policy.required_authority[op]}  {', '.join(verbs) or '-'}")
+        for verb, value in sorted(policy.command_authority.items()):
+            lines.append(f"override {verb} ≥{value}")
+        return "\n".join(lines)
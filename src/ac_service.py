@@ -0,0 +1,312 @@
+# ============================================================
+# AC SERVICE — ArcCore-Prime V1.1
+# Loop 1.13: asyncio Ingest Queue + Snapshot Queries
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Lets many concurrent chat sessions feed one memory without
+#   serialising on ArcMemorySystem calls.
+#
+#     - ingest() awaits a slot in a bounded queue (backpressure:
+#       producers wait once `capacity` exchanges are pending)
+#     - a single writer task drains the queue in batches; the
+#       O(n) tree hash is not computed on the event loop at all
+#       (hash_on_write is off while the service runs): snapshots
+#       hash themselves when asked, and stop() refreshes the
+#       memory's hash
+#     - after each batch the writer publishes an immutable
+#       Snapshot; queries read the latest one and never see a
+#       half-applied batch
+#     - ingest and query latencies are tracked (p50 / p99)
+#
+#   Snapshots hold references to the root's children, so they
+#   need the resident MemoryBackend.
+#
+# ============================================================
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# ============================================================
+#  LATENCY METRICS
+# ============================================================
+
+class LatencyStats:
+    """Rolling window of latency samples (seconds)."""
+
+    def __init__(self, window: int = 10000):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        k = min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))
+        return ordered[k]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(max(self.samples, default=0.0) * 1000, 3),
+        }
+
+
+# ============================================================
+#  SNAPSHOT
+# ============================================================
+
+class Snapshot:
+    """
+    Consistent read view published after a batch.
+    Holds the root and a frozen tuple of its children.
+    """
+
+    __slots__ = ("version", "_memory_hash", "root", "nodes", "cycles")
+
+    def __init__(self, version: int, memory_hash: Optional[str], root, nodes: Tuple,
+                 cycles: Optional[Dict[int, Tuple]] = None):
+        self.version = version
+        self._memory_hash = memory_hash
+        self.root = root
+        self.nodes = nodes
+        # cycle -> nodes of that cycle below the root, depth-first
+        self.cycles = cycles if cycles is not None else _index_cycles({}, nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def memory_hash(self) -> str:
+        """Memory hash of this version, computed on first use."""
+        if self._memory_hash is None:
+            from arc_guardian import ArcGuardian
+            self._memory_hash = ArcGuardian.hash_memory_tree(self.tree())
+        return self._memory_hash
+
+    def tree(self) -> Dict[str, Any]:
+        root = self.root.to_dict()
+        root["children"] = [n.to_dict() for n in self.nodes]
+        return root
+
+    def walk(self):
+        """Root, then the frozen children depth-first."""
+        yield self.root
+        stack = list(reversed(self.nodes))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def thread(self, cycle_id: int) -> List[Dict[str, Any]]:
+        """Same result as MemoryBackend.thread_nodes, for this version."""
+        found = list(self.cycles.get(cycle_id, ()))
+        if self.root.cycle_alignment == cycle_id:
+            found.insert(0, self.root)
+        return [self.tree() if n is self.root else n.to_dict() for n in found]
+
+    def sigils(self, min_priority: int = 1) -> List[Dict[str, Any]]:
+        """Same result as MemoryBackend.sigil_nodes, for this version."""
+        from ac_storage import _shallow
+        found = [n for n in self.walk() if n.priority >= min_priority]
+        found.sort(key=lambda n: -n.priority)
+        return [_shallow(n) for n in found]
+
+
+def _index_cycles(cycles: Dict[int, Tuple], added) -> Dict[int, Tuple]:
+    """New cycle index: cycles plus the subtrees in added (copy-on-write)."""
+    grouped: Dict[int, list] = {}
+    for top in added:
+        stack = [top]
+        while stack:
+            node = stack.pop()
+            grouped.setdefault(node.cycle_alignment, []).append(node)
+            stack.extend(reversed(node.children))
+    if not grouped:
+        return cycles
+    merged = dict(cycles)
+    for cycle, nodes in grouped.items():
+        merged[cycle] = merged.get(cycle, ()) + tuple(nodes)
+    return merged
+
+
+# ============================================================
+#  SERVICE
+# ============================================================
+
+class ArcService:
+    """
+    asyncio front end for one ArcMemorySystem.
+
+        async with ArcService(memory) as service:
+            await service.ingest("hi", "hello", cycle=3)
+            nodes = await service.thread(3)
+    """
+
+    def __init__(self, memory=None, capacity: int = 1024, batch_size: int = 256):
+        if memory is None:
+            from arc_prime import ArcMemorySystem
+            memory = ArcMemorySystem()
+        self.memory = memory
+        self.capacity = capacity
+        self.batch_size = batch_size
+
+        self.ingest_latency = LatencyStats()
+        self.query_latency = LatencyStats()
+        self.batches = 0
+        self.applied = 0
+        self.rejected = 0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._hash_on_write = memory.hash_on_write
+        self._snapshot = self._publish(0)
+
+    # ------------------------------------------------------------
+    #  LIFECYCLE
+    # ------------------------------------------------------------
+
+    async def start(self):
+        if self._writer is None:
+            self._hash_on_write = self.memory.hash_on_write
+            self.memory.hash_on_write = False
+            self._queue = asyncio.Queue(maxsize=self.capacity)
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self):
+        """Drains pending ingests, then stops the writer."""
+        if self._writer is None:
+            return
+        await self._queue.join()
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+        self.memory.hash_on_write = self._hash_on_write
+        if self._hash_on_write:
+            self.memory.refresh_hash()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    # ------------------------------------------------------------
+    #  INGEST
+    # ------------------------------------------------------------
+
+    async def ingest(self, user_text: str, ai_text: str, cycle: int) -> int:
+        """
+        Queues one exchange and waits until it is applied.
+        Returns the snapshot version that first contains it.
+        Blocks while the queue is full.
+        """
+        if self._writer is None:
+            raise RuntimeError("ArcService is not running; call start()")
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((user_text, ai_text, cycle, done, time.perf_counter()))
+        return await done
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _write_loop(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                self._apply(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+            # Let producers and readers run between batches
+            await asyncio.sleep(0)
+
+    def _apply(self, batch):
+        prepared, waiting = [], []
+        for user_text, ai_text, cycle, done, _ in batch:
+            try:
+                prepared.append(self.memory.prepare_interaction(user_text, ai_text, cycle))
+                waiting.append(done)
+            except Exception as e:
+                self.rejected += 1
+                if not done.done():
+                    done.set_exception(e)
+
+        try:
+            self.memory.ingest_prepared(prepared)
+        except Exception as e:
+            for done in waiting:
+                if not done.done():
+                    done.set_exception(e)
+            return
+
+        self.batches += 1
+        self.applied += len(prepared)
+        self._snapshot = self._publish(self._snapshot.version + 1, prepared)
+
+        now = time.perf_counter()
+        version = self._snapshot.version
+        for user_text, ai_text, cycle, done, queued_at in batch:
+            if not done.done():
+                self.ingest_latency.record(now - queued_at)
+                done.set_result(version)
+
+    def _publish(self, version: int, added=None) -> Snapshot:
+        root = self.memory.root
+        cycles = None if added is None else _index_cycles(self._snapshot.cycles, added)
+        return Snapshot(version, self.memory.memory_hash, root, tuple(root.children), cycles)
+
+    # ------------------------------------------------------------
+    #  QUERIES (latest published snapshot)
+    # ------------------------------------------------------------
+
+    def snapshot(self) -> Snapshot:
+        return self._snapshot
+
+    async def query(self, name: str, *args):
+        """Runs a Snapshot method by name and records its latency."""
+        snap = self._snapshot
+        start = time.perf_counter()
+        result = getattr(snap, name)(*args)
+        self.query_latency.record(time.perf_counter() - start)
+        return result
+
+    async def thread(self, cycle_id: int) -> List[Dict[str, Any]]:
+        return await self.query("thread", cycle_id)
+
+    async def sigils(self, min_priority: int = 1) -> List[Dict[str, Any]]:
+        return await self.query("sigils", min_priority)
+
+    # ------------------------------------------------------------
+    #  METRICS
+    # ------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "version": self._snapshot.version,
+            "applied": self.applied,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "mean_batch": round(self.applied / self.batches, 1) if self.batches else 0.0,
+            "queue_depth": self.queue_depth,
+            "ingest": self.ingest_latency.summary(),
+            "query": self.query_latency.summary(),
+        }
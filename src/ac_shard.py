@@ -0,0 +1,320 @@
+# ============================================================
+# AC SHARD — ArcCore-Prime V1.1
+# Loop 1.16: Sharded Multi-Process Memory
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   One process runs ingest on one core. ShardedMemory spreads
+#   the tree over N worker processes; each owns a partition
+#   (its own ArcMemorySystem, ArcGuardian and ACCollapseEngine)
+#   and the coordinator routes and merges:
+#
+#     - ingest_interaction() is routed by cycle, or by a hash of
+#       the session key, and buffered per shard; full buffers are
+#       sent as one batch (purify / sigil / gate / prune and the
+#       tree hash all run in the worker)
+#     - thread / search / sigils / summary fan out to the shards
+#       (thread goes to one shard when routing by cycle) and the
+#       results are merged in the coordinator
+#
+#   Queries flush pending ingest first, so a caller always reads
+#   its own writes. Guardian rejections are collected per batch
+#   and raised by flush().
+#
+#   The root node exists once per shard; merged views show
+#   shard 0's root (the same one on every call) over the shards'
+#   children in shard order. Search results are ordered by
+#   (cycle, id), so a limit keeps the same nodes however the
+#   tree is sharded.
+#
+# ============================================================
+
+import heapq
+import itertools
+import multiprocessing
+import zlib
+from typing import Any, Dict, List, Optional
+
+ROUTES = ("cycle", "session")
+
+
+def shard_for(key, shards: int) -> int:
+    """Stable shard index for a cycle or session key."""
+    if isinstance(key, int):
+        return key % shards
+    return zlib.crc32(str(key).encode("utf-8")) % shards
+
+
+# ============================================================
+#  WORKER PROCESS
+# ============================================================
+
+def search_key(node: Dict[str, Any]):
+    """Merge order for search results: cycle, then id."""
+    return node.get("cycle") or 0, str(node.get("id"))
+
+
+def _search(root, text: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+    """Matches below root in search_key order, the first `limit` of them."""
+    from ac_storage import _shallow
+    needle = text.lower()
+    found = []
+    stack = list(reversed(root.children))
+    while stack:
+        node = stack.pop()
+        for value in (node.raw_content, node.structural_seed):
+            if value and needle in value.lower():
+                found.append(node)
+                break
+        stack.extend(reversed(node.children))
+    if limit is None:
+        found.sort(key=_node_key)
+    else:
+        found = heapq.nsmallest(limit, found, key=_node_key)
+    return [_shallow(node) for node in found]
+
+
+def _node_key(node):
+    """search_key() of a live node."""
+    return node.cycle_alignment or 0, str(node.id)
+
+
+def _serve(conn, index: int):
+    """Worker loop: one request in, one reply out, until "stop"."""
+    from ac_collapse import ACCollapseEngine
+    from ac_reconstruct import ArcReconstruct
+    from arc_guardian import ArcGuardian
+    from arc_prime import ArcMemorySystem
+
+    memory = ArcMemorySystem(guardian=ArcGuardian())
+    memory.collapse = ACCollapseEngine(guardian=memory.guardian)
+    reconstruct = ArcReconstruct()
+
+    while True:
+        try:
+            op, payload = conn.recv()
+        except EOFError:
+            break
+        try:
+            if op == "stop":
+                conn.send(("ok", None))
+                break
+            elif op == "ingest":
+                prepared, rejected = [], []
+                for user_text, ai_text, cycle in payload:
+                    try:
+                        prepared.append(memory.prepare_interaction(user_text, ai_text, cycle))
+                    except RuntimeError as e:
+                        rejected.append(str(e))
+                memory.ingest_prepared(prepared)
+                result = rejected
+            elif op == "thread":
+                result = [n for n in memory.thread_nodes(payload) if n["id"] != memory.root.id]
+            elif op == "search":
+                result = _search(memory.root, *payload)
+            elif op == "sigils":
+                result = [n for n in memory.sigil_nodes(payload) if n["id"] != memory.root.id]
+            elif op == "summary":
+                result = []
+                for child in memory.root.children:
+                    result.extend(reconstruct.reconstruct_node(child.to_dict(), depth=1))
+            elif op == "children":
+                result = [c.to_dict() for c in memory.root.children]
+            elif op == "root":
+                result = dict(memory.root.to_dict(), children=[])
+            elif op == "stats":
+                result = {"shard": index, "interactions": len(memory.root.children),
+                          "version": memory.version, "memory_hash": memory.refresh_hash()}
+            elif op == "save":
+                memory.save_memory(payload)
+                result = payload
+            else:
+                raise ValueError(f"Unknown op: {op}")
+            conn.send(("ok", result))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+# ============================================================
+#  COORDINATOR
+# ============================================================
+
+class ShardedMemory:
+    """
+    Coordinator for N memory worker processes.
+    Use as a context manager, or call start() / close().
+    """
+
+    def __init__(self, shards: int = 4, route: str = "cycle", batch_size: int = 256,
+                 context: Optional[str] = None):
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        if route not in ROUTES:
+            raise ValueError(f"route must be one of {ROUTES}")
+        self.shards = shards
+        self.route = route
+        self.batch_size = max(1, batch_size)
+        self._ctx = multiprocessing.get_context(context)
+        self._conns = []
+        self._procs = []
+        self._pending = [[] for _ in range(shards)]
+        self._inflight = [0] * shards
+        self._root: Optional[dict] = None
+        self.rejected: List[str] = []
+
+    # ------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------
+
+    def start(self):
+        self._root = None
+        for index in range(self.shards):
+            parent, child = self._ctx.Pipe()
+            proc = self._ctx.Process(target=_serve, args=(child, index),
+                                     name=f"arccore-shard-{index}", daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        return self
+
+    def close(self):
+        """Flushes pending ingest and stops the workers."""
+        if not self._procs:
+            return
+        try:
+            self._drain()
+            for conn in self._conns:
+                conn.send(("stop", None))
+            for index in range(self.shards):
+                self._reply(index)
+        finally:
+            for conn in self._conns:
+                conn.close()
+            for proc in self._procs:
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
+            self._conns, self._procs = [], []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------
+
+    def shard_of(self, cycle: int, session=None) -> int:
+        if self.route == "session" and session is not None:
+            return shard_for(session, self.shards)
+        return shard_for(cycle, self.shards)
+
+    def ingest_interaction(self, user_text: str, ai_text: str, cycle_context: int, session=None):
+        index = self.shard_of(cycle_context, session)
+        pending = self._pending[index]
+        pending.append((user_text, ai_text, cycle_context))
+        if len(pending) >= self.batch_size:
+            self._send_batch(index)
+
+    def flush(self):
+        """Applies all pending ingest; raises if the Guardian rejected any of it."""
+        self._drain()
+        if self.rejected:
+            rejected, self.rejected = self.rejected, []
+            raise RuntimeError(f"{len(rejected)} interaction(s) rejected; first: {rejected[0]}")
+
+    def _send_batch(self, index: int):
+        batch, self._pending[index] = self._pending[index], []
+        conn = self._conns[index]
+        conn.send(("ingest", batch))
+        self._inflight[index] += 1
+        # Collect finished batches so replies never back up the pipe
+        while self._inflight[index] and conn.poll():
+            self._collect(index)
+
+    def _collect(self, index: int):
+        self._inflight[index] -= 1
+        self.rejected.extend(self._reply(index))
+
+    def _drain(self):
+        for index in range(self.shards):
+            if self._pending[index]:
+                self._send_batch(index)
+        for index in range(self.shards):
+            while self._inflight[index]:
+                self._collect(index)
+
+    # ------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------
+
+    def _reply(self, index: int):
+        status, value = self._conns[index].recv()
+        if status != "ok":
+            raise RuntimeError(f"[shard {index}] {value}")
+        return value
+
+    def _fan_out(self, op: str, payload=None, shards=None) -> List[Any]:
+        """Sends one request to each shard, then gathers the replies in shard order."""
+        self._drain()
+        targets = range(self.shards) if shards is None else shards
+        for index in targets:
+            self._conns[index].send((op, payload))
+        return [self._reply(index) for index in targets]
+
+    # ------------------------------------------------------------
+    # Queries (merged)
+    # ------------------------------------------------------------
+
+    def thread_nodes(self, cycle_id: int) -> List[dict]:
+        """Subtrees of cycle_id below the root; one shard when routing by cycle."""
+        shards = [shard_for(cycle_id, self.shards)] if self.route == "cycle" else None
+        return [n for part in self._fan_out("thread", cycle_id, shards) for n in part]
+
+    def search(self, text: str, limit: Optional[int] = None) -> List[dict]:
+        """
+        Nodes whose content or seed contains text (case-insensitive),
+        children omitted, ordered by (cycle, id).
+        """
+        merged = heapq.merge(*self._fan_out("search", (text, limit)), key=search_key)
+        return list(merged if limit is None else itertools.islice(merged, limit))
+
+    def sigil_nodes(self, min_priority: int = 1) -> List[dict]:
+        found = [n for part in self._fan_out("sigils", min_priority) for n in part]
+        found.sort(key=lambda n: -n.get("priority", 0))
+        return found
+
+    def root(self) -> dict:
+        """The merged views' root: shard 0's, without children."""
+        if self._root is None:
+            self._root = self._fan_out("root", shards=[0])[0]
+        return dict(self._root)
+
+    def summary(self) -> str:
+        from ac_reconstruct import ArcReconstruct
+        lines = ArcReconstruct().reconstruct_node(self.root())
+        for part in self._fan_out("summary"):
+            lines.extend(part)
+        return "\n".join(lines)
+
+    def tree(self) -> dict:
+        """Merged tree: one root over every shard's interactions."""
+        root = self.root()
+        root["children"] = [c for part in self._fan_out("children") for c in part]
+        return root
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return self._fan_out("stats")
+
+    def save_memory(self, prefix: str = "arccore_memory") -> List[str]:
+        """Each shard writes <prefix>.shard<i>.json."""
+        self._drain()
+        names = [f"{prefix}.shard{index}.json" for index in range(self.shards)]
+        for index, name in enumerate(names):
+            self._conns[index].send(("save", name))
+        return [self._reply(index) for index in range(self.shards)]
@@ -7,6 +7,11 @@
 #   - Stateful Prompting (Cycle/Context aware)
 #   - Boot Sequence Simulation
 #   - Guardian Integration
+#   - Non-interactive boot for piped / scripted input (Loop 1.11)
+#   - Thin-client mode against a running ac_daemon (Loop 1.12)
+#   - Lazy pager for outputs longer than a screen (Loop 1.24)
+#   - --authority N: actor authority for the Sentinel, as in
+#     ac_batch (MARK / GOVERN commands need more than the default)
 # ============================================================
 
 import sys
@@ -14,6 +19,7 @@ import time
 import os
 from arc_guardian import ArcGuardian
 from ac_interpreter import ArcInterpreter
+from ac_pager import ArcPager, screen_height
 
 # ============================================================
 # ANSI PALETTE (No external dependencies)
@@ -35,13 +41,26 @@ class Colors:
     SIGIL_LOW = '•'
 
 class ArcConsole:
-    def __init__(self):
+    def __init__(self, interactive=None, interpreter=None, authority=None):
         self.guardian = ArcGuardian()
-        self.interpreter = ArcInterpreter(self.guardian)
+        # Any object with execute(command) -> str: a local
+        # ArcInterpreter, or an ac_daemon.ArcClient
+        if interpreter is None:
+            interpreter = ArcInterpreter(self.guardian) if authority is None else \
+                ArcInterpreter(self.guardian, authority=authority)
+        self.interpreter = interpreter
         self.cycle = 1  # Default starting cycle
 
+        # Scripted sessions skip the screen clear, sleeps and typing effect
+        if interactive is None:
+            interactive = sys.stdin.isatty() and sys.stdout.isatty()
+        self.interactive = interactive
+
     def type_effect(self, text, speed=0.01, color=Colors.ENDC):
         """Simulates retro terminal typing effect."""
+        if not self.interactive:
+            print(text)
+            return
         sys.stdout.write(color)
         for char in text:
             sys.stdout.write(char)
@@ -50,6 +69,11 @@ class ArcConsole:
         sys.stdout.write(Colors.ENDC + "\n")
 
     def boot_sequence(self):
+        if not self.interactive:
+            print(f"[KERNEL] ArcCore-Prime ready "
+                  f"(Guardian {self.guardian.identity_key[:12]})")
+            return
+
         os.system('cls' if os.name == 'nt' else 'clear')
         
         banner = f"""
@@ -79,13 +103,43 @@ class ArcConsole:
         """Generates dynamic prompt string."""
         return f"{Colors.BOLD}AC-PRIME [Cycle:{self.cycle}]{Colors.ENDC} ~> "
 
+    def page(self, command):
+        """
+        Pulls the first screen of output lazily. Returns it as a
+        string if it fits, otherwise hands the rest to the pager
+        and returns None.
+        """
+        pages = getattr(self.interpreter, "pages", None)
+        if pages is not None:
+            lines, restart = pages(command)
+        else:
+            lines = iter(self.interpreter.execute(command).splitlines())
+            restart = None
+
+        height = screen_height()
+        first = []
+        for line in lines:
+            first.append(line)
+            if len(first) > height:
+                break
+        else:
+            return "\n".join(first)
+
+        ArcPager(self._chain(first, lines), restart=restart, height=height).run()
+        return None
+
+    @staticmethod
+    def _chain(first, rest):
+        yield from first
+        yield from rest
+
     def run(self):
         self.boot_sequence()
         
         while True:
             try:
                 # 1. Capture Input
-                raw = input(self.get_prompt())
+                raw = input(self.get_prompt() if self.interactive else "")
 
                 if not raw.strip():
                     continue
@@ -115,9 +169,11 @@ class ArcConsole:
                         continue
 
                 # 5. Execution
-                # Note: You might need to update execute() to return (status, text) tuple
-                # For now, we assume it returns string.
-                result = self.interpreter.execute(cleaned)
+                # Interactive sessions page long outputs; scripted ones print them whole
+                if self.interactive:
+                    result = self.page(cleaned)
+                else:
+                    result = self.interpreter.execute(cleaned)
 
                 # 6. Output Formatting
                 if result:
@@ -128,11 +184,32 @@ class ArcConsole:
                     else:
                         print(f"{Colors.GREEN}{Colors.SIGIL_HIGH} {result}{Colors.ENDC}")
 
+            except EOFError:
+                break
             except KeyboardInterrupt:
                 print(f"\n{Colors.WARNING}[SYSTEM] Interrupt signal received.{Colors.ENDC}")
             except Exception as e:
                 print(f"{Colors.FAIL}[CRITICAL] Kernel Panic: {e}{Colors.ENDC}")
 
 if __name__ == "__main__":
-    console = ArcConsole()
+    # --connect [socket]  attach to a running ac_daemon instead of
+    #                     building a private memory system
+    # --authority N       actor authority of the private memory system
+    #                     (a daemon judges with its own)
+    client = None
+    authority = None
+    if "--authority" in sys.argv:
+        i = sys.argv.index("--authority")
+        try:
+            authority = int(sys.argv[i + 1])
+        except (IndexError, ValueError):
+            sys.exit("usage: ac_shell.py [--authority N] [--connect [socket]]")
+        del sys.argv[i:i + 2]
+    if "--connect" in sys.argv:
+        from ac_daemon import ArcClient
+        i = sys.argv.index("--connect")
+        path = sys.argv[i + 1] if len(sys.argv) > i + 1 else None
+        client = ArcClient(path)
+
+    console = ArcConsole(interpreter=client, authority=authority)
     console.run()
@@ -0,0 +1,543 @@
+# ============================================================
+# AC STORAGE BACKENDS — ArcCore-Prime V1.1
+# Loop 1.8: Pluggable Storage Engines
+# Guardian Layer: Arien
+# Persistence guarantees are defined in docs/memory_model.md
+# ============================================================
+#
+# Purpose:
+#   ArcMemorySystem delegates where nodes live and how they are
+#   persisted to a backend:
+#
+#     MemoryBackend  (default) — the HarmonicNode tree stays
+#                    resident; save/load use memory files
+#                    (JSON or ACMB, see docs/memory_formats.md)
+#     SQLiteBackend  — nodes live in a stdlib sqlite3 database,
+#                    written in batched transactions and queried
+#                    through thread / sigil / time indexes
+#
+# ============================================================
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from ac_content import ContentTable, pack_tree, unpack_tree
+from ac_ids import NodeIndex
+from ac_query import Query, fields, select
+
+
+# ============================================================
+#  IN-MEMORY BACKEND (default)
+# ============================================================
+
+class MemoryBackend:
+    """
+    Keeps the full tree resident under memory.root.
+    Persistence is a memory file written by save_memory.
+    """
+
+    name = "memory"
+    default_filename = "arccore_memory.json"
+    # ArcMemorySystem re-hashes after every write (Loop 1.14)
+    hash_on_write = True
+    # Nodes live under memory.root; snapshots mirror them (Loop 1.15)
+    resident = True
+
+    def __init__(self):
+        self.memory = None
+        # Loop 1.26 — id → node / parent id for show and path
+        self.index = NodeIndex()
+
+    def attach(self, memory):
+        self.memory = memory
+        if self.resident:
+            self.index.rebuild(memory.root)
+
+    def resolve(self, filename: Optional[str]) -> Optional[str]:
+        return filename if filename is not None else self.default_filename
+
+    # ------------------------------------------------------------
+    #  WRITE PATH
+    # ------------------------------------------------------------
+
+    def append(self, node):
+        """Attaches an ingested subtree under the root (hash goes stale)."""
+        memory = self.memory
+        memory.root.children.append(node)
+        self.index.add(node, memory.root.id)
+        memory.memory_hash = None
+
+    def extend(self, nodes):
+        """Attaches a batch of subtrees."""
+        memory = self.memory
+        memory.root.children.extend(nodes)
+        for node in nodes:
+            self.index.add(node, memory.root.id)
+        memory.memory_hash = None
+
+    def replace_tree(self, tree: Dict[str, Any]):
+        """Swaps in a whole new tree (e.g. after applying a sync patch)."""
+        from arc_prime import HarmonicNode
+        memory = self.memory
+        memory.root = HarmonicNode.from_dict(tree)
+        memory.content = ContentTable()  # the old tree's references go with it
+        stack = [memory.root]
+        while stack:
+            node = stack.pop()
+            memory.content.share(node)
+            stack.extend(node.children)
+        self.index.rebuild(memory.root)
+        memory.memory_hash = None
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    # ------------------------------------------------------------
+    #  READ PATH
+    # ------------------------------------------------------------
+
+    def tree(self) -> Dict[str, Any]:
+        return self.memory.root.to_dict()
+
+    def thread_nodes(self, cycle_id: int) -> List[Dict[str, Any]]:
+        """Subtrees whose root belongs to cycle_id, depth-first order."""
+        # Loop 1.25 — blocks of exchanges outside the cycle are skipped whole
+        memory = self.memory
+        matches = select(memory.root, Query([("cycle", "=", cycle_id)]), memory.summaries)
+        return [node.to_dict() for _, node in matches]
+
+    def node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """One node's fields plus its parent id and child count; None if unknown."""
+        node = self.index.get(node_id)
+        if node is None:
+            return None
+        return dict(fields(node), parent=self.index.parents.get(node_id),
+                    child_count=len(node.children))
+
+    def path_to(self, node_id: str) -> List[Dict[str, Any]]:
+        """Fields of every node from the root down to node_id; [] if unknown."""
+        return [fields(node) for node in self.index.path(node_id)]
+
+    def sigil_nodes(self, min_priority: int = 1) -> List[Dict[str, Any]]:
+        """Nodes with priority >= min_priority, highest first."""
+        found = []
+        stack = [self.memory.root]
+        while stack:
+            node = stack.pop()
+            if node.priority >= min_priority:
+                found.append(node)
+            stack.extend(reversed(node.children))
+        found.sort(key=lambda n: -n.priority)
+        return [_shallow(n) for n in found]
+
+    def nodes_between(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """Nodes whose ISO timestamp falls in [start, end)."""
+        found = []
+        stack = [self.memory.root]
+        while stack:
+            node = stack.pop()
+            if start <= node.timestamp < end:
+                found.append(node)
+            stack.extend(reversed(node.children))
+        found.sort(key=lambda n: n.timestamp)
+        return [_shallow(n) for n in found]
+
+    # ------------------------------------------------------------
+    #  PERSISTENCE
+    # ------------------------------------------------------------
+
+    def write(self, filename: Optional[str], integrity: Dict[str, Any],
+              format: str = "json", compression: Optional[str] = None,
+              snapshot=None) -> str:
+        """snapshot (ac_persistent.TreeSnapshot) is written instead of the live tree."""
+        filename = self.resolve(filename)
+        tree = snapshot.to_dict() if snapshot is not None else self.tree()
+        write_file(filename, integrity, tree, format, compression)
+        return filename
+
+    def read(self, filename: Optional[str]) -> Dict[str, Any]:
+        return read_file(self.resolve(filename))
+
+
+def _shallow(node) -> Dict[str, Any]:
+    data = node.to_dict()
+    data["children"] = []
+    data["timestamp"] = node.timestamp
+    return data
+
+
+
+# ============================================================
+#  MEMORY FILES (JSON / ACMB)
+# ============================================================
+
+def write_file(filename: str, integrity: Dict[str, Any], tree: Dict[str, Any],
+               format: str = "json", compression: Optional[str] = None):
+    """
+    format="json" writes the string-table JSON payload (Loop 1.5);
+    format="bin" writes the compact ACMB format (Loop 1.6), with
+    optional "zlib" or "lzma" section compression.
+    """
+    if format == "bin":
+        import ac_binary
+        ac_binary.save({"integrity": integrity, "tree": tree}, filename, compression)
+
+    elif format == "json":
+        from ac_verify import encode_lines
+        strings, seeds, packed = pack_tree(tree)
+        # Loop 1.10 — one checksummed segment per line, verified on load
+        with open(filename, 'wb') as f:
+            f.write(encode_lines(integrity, strings, seeds, packed))
+
+    else:
+        raise ValueError(f"Unknown memory format: {format}")
+
+
+def read_file(filename: str, verify: bool = True) -> Dict[str, Any]:
+    """
+    Reads any supported memory file into {"integrity", "tree",
+    "verification"}. verification is an ac_verify report, or None
+    when the file predates segment checksums (or verify=False).
+    """
+    import ac_binary
+
+    if ac_binary.is_binary(filename):
+        return ac_binary.load(filename, verify=verify)
+
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    from ac_verify import is_lines
+    if is_lines(data):
+        from ac_verify import decode_lines
+        payload = decode_lines(data, verify=verify)
+        tree = unpack_tree(payload["strings"], payload["tree"], payload["seeds"])
+        return {
+            "integrity": payload["integrity"],
+            "tree": tree,
+            "verification": payload["verification"],
+        }
+
+    payload = json.loads(data)
+    integrity = payload.get("integrity", {})
+    tree = unpack_tree(payload.get("strings"), payload.get("tree", {}), payload.get("seeds"))
+    report = None
+
+    if verify and integrity.get("segments"):
+        from ac_verify import verify_tree
+        report = verify_tree(tree, integrity["segments"])
+
+    return {
+        "integrity": integrity,
+        "tree": tree,
+        "verification": report,
+    }
+
+
+# ============================================================
+#  SQLITE BACKEND
+# ============================================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    pk                INTEGER PRIMARY KEY,
+    id                TEXT NOT NULL,
+    parent_id         TEXT,
+    role              TEXT NOT NULL,
+    cycle             INTEGER NOT NULL,
+    content           TEXT,
+    seed              TEXT,
+    collapsed         INTEGER NOT NULL DEFAULT 0,
+    priority          INTEGER NOT NULL DEFAULT 0,
+    compression_level INTEGER,
+    timestamp         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_id        ON nodes(id);
+CREATE INDEX IF NOT EXISTS idx_nodes_parent    ON nodes(parent_id, pk);
+CREATE INDEX IF NOT EXISTS idx_nodes_cycle     ON nodes(cycle, pk);
+CREATE INDEX IF NOT EXISTS idx_nodes_priority  ON nodes(priority) WHERE priority > 0;
+CREATE INDEX IF NOT EXISTS idx_nodes_timestamp ON nodes(timestamp);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+COLUMNS = ("id", "parent_id", "role", "cycle", "content", "seed",
+           "collapsed", "priority", "compression_level", "timestamp")
+
+INSERT = (
+    f"INSERT INTO nodes ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(COLUMNS))})"
+)
+
+
+class SQLiteBackend(MemoryBackend):
+    """
+    Durable, queryable node storage in a sqlite3 database.
+
+    - Ingested nodes are buffered and written in batched
+      transactions (batch_size rows per commit).
+    - Only the root node stays resident; reads go to indexes.
+    - The integrity block is stored in the meta table.
+    """
+
+    name = "sqlite"
+    # Tree hash is recomputed lazily at save time
+    hash_on_write = False
+    resident = False
+
+    def __init__(self, path: str = "arccore_memory.db", batch_size: int = 500):
+        super().__init__()
+        self.path = path
+        self.batch_size = batch_size
+        self.pending: List[tuple] = []
+
+        import sqlite3  # deferred: only SQLite users pay for it
+        import threading
+        # One connection shared by concurrent readers (Loop 1.14);
+        # _db serialises use of it and of the pending buffer
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._db = threading.RLock()
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def attach(self, memory):
+        super().attach(memory)
+
+        row = self.conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM nodes WHERE parent_id IS NULL "
+            "ORDER BY pk LIMIT 1"
+        ).fetchone()
+
+        if row is None:
+            self._queue(memory.root, None)
+            self.flush()
+        else:
+            # Re-open: adopt the stored root instead of the fresh one
+            from arc_prime import HarmonicNode
+            memory.root = HarmonicNode.from_dict(self._row_dict(row))
+            memory.content.share(memory.root)
+            memory.memory_hash = None
+
+    def resolve(self, filename: Optional[str]) -> Optional[str]:
+        # None (or the database path itself) means the database
+        return None if filename in (None, self.path) else filename
+
+    # ------------------------------------------------------------
+    #  WRITE PATH (batched)
+    # ------------------------------------------------------------
+
+    def _queue(self, node, parent_id: Optional[str]):
+        self.pending.append((
+            node.id, parent_id, node.role, node.cycle_alignment,
+            node.raw_content, node.structural_seed, int(node.is_collapsed),
+            node.priority, getattr(node, "compression_level", None), node.timestamp,
+        ))
+        for child in node.children:
+            self._queue(child, node.id)
+
+    def append(self, node):
+        self._queue(node, self.memory.root.id)
+        # Tree hash is recomputed lazily at save time
+        self.memory.memory_hash = None
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def extend(self, nodes):
+        for node in nodes:
+            self._queue(node, self.memory.root.id)
+        self.memory.memory_hash = None
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def insert_tree(self, tree: Dict[str, Any], parent_id: Optional[str] = None):
+        """Bulk import of a to_dict()-shaped subtree (e.g. from a memory file)."""
+        self.pending.extend(self._tree_rows(tree, parent_id))
+        self.flush()
+
+    @staticmethod
+    def _tree_rows(tree: Dict[str, Any], parent_id: Optional[str] = None) -> List[tuple]:
+        rows = []
+        stack = [(tree, parent_id)]
+        while stack:
+            node, parent = stack.pop()
+            rows.append((
+                node.get("id"), parent, node.get("role", ""), int(node.get("cycle") or 0),
+                node.get("content"), node.get("seed"), int(bool(node.get("collapsed"))),
+                int(node.get("priority") or 0), node.get("compression_level"),
+                node.get("timestamp", ""),
+            ))
+            for child in reversed(node.get("children", [])):
+                stack.append((child, node.get("id")))
+        return rows
+
+    def replace_tree(self, tree: Dict[str, Any]):
+        """One transaction: readers see the old tree or the new one, never none."""
+        from arc_prime import HarmonicNode
+        rows = self._tree_rows(tree)
+        with self._db:
+            with self.conn:
+                self.conn.execute("DELETE FROM nodes")
+                self.conn.executemany(INSERT, rows)
+            self.pending = []
+        self.memory.root = HarmonicNode.from_dict(dict(tree, children=[]))
+        self.memory.content = ContentTable()
+        self.memory.content.share(self.memory.root)
+        self.memory.memory_hash = None
+
+    def flush(self):
+        with self._db:
+            if not self.pending:
+                return
+            with self.conn:
+                self.conn.executemany(INSERT, self.pending)
+            self.pending = []
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    # ------------------------------------------------------------
+    #  READ PATH (indexed)
+    # ------------------------------------------------------------
+
+    def _row_dict(self, row) -> Dict[str, Any]:
+        (node_id, _parent, role, cycle, content, seed,
+         collapsed, priority, level, timestamp) = row
+        node = {
+            "id": node_id,
+            "role": role,
+            "cycle": cycle,
+            "content": content,
+            "seed": seed,
+            "collapsed": bool(collapsed),
+            "priority": priority,
+        }
+        if level is not None:
+            node["compression_level"] = level
+        node["timestamp"] = timestamp
+        node["children"] = []
+        return node
+
+    def _select(self, where: str = "", params: Iterable = (), order: str = "pk"):
+        sql = f"SELECT {', '.join(COLUMNS)} FROM nodes {where} ORDER BY {order}"
+        with self._db:
+            self.flush()
+            return self.conn.execute(sql, tuple(params)).fetchall()
+
+    def _subtree(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        for row in self._select("WHERE parent_id = ?", (node["id"],)):
+            node["children"].append(self._subtree(self._row_dict(row)))
+        return node
+
+    def _strip_timestamps(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            n.pop("timestamp", None)
+            stack.extend(n["children"])
+        return node
+
+    def tree(self) -> Dict[str, Any]:
+        """Materialises the whole tree (pk order is depth-first order)."""
+        nodes: Dict[str, Dict[str, Any]] = {}
+        root = None
+        for row in self._select():
+            node = self._row_dict(row)
+            node.pop("timestamp")
+            parent = nodes.get(row[1])
+            if parent is not None:
+                parent["children"].append(node)
+            elif root is None:
+                root = node
+            nodes[node["id"]] = node
+        return root or {}
+
+    def thread_nodes(self, cycle_id: int) -> List[Dict[str, Any]]:
+        return [
+            self._strip_timestamps(self._subtree(self._row_dict(row)))
+            for row in self._select("WHERE cycle = ?", (cycle_id,))
+        ]
+
+    def node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._select("WHERE id = ?", (node_id,))
+        if not rows:
+            return None
+        with self._db:
+            (count,) = self.conn.execute("SELECT COUNT(*) FROM nodes WHERE parent_id = ?",
+                                         (node_id,)).fetchone()
+        return dict(self._row_dict(rows[0]), parent=rows[0][1], child_count=count)
+
+    def path_to(self, node_id: str) -> List[Dict[str, Any]]:
+        """Parent links followed through the id index, one lookup per level."""
+        chain, seen = [], set()
+        while node_id is not None and node_id not in seen:
+            rows = self._select("WHERE id = ?", (node_id,))
+            if not rows:
+                break
+            seen.add(node_id)
+            chain.append(self._row_dict(rows[0]))
+            node_id = rows[0][1]
+        chain.reverse()
+        return chain
+
+    def sigil_nodes(self, min_priority: int = 1) -> List[Dict[str, Any]]:
+        return [
+            self._row_dict(row)
+            for row in self._select("WHERE priority >= ?", (max(1, min_priority),),
+                                    order="priority DESC, pk")
+        ]
+
+    def nodes_between(self, start: str, end: str) -> List[Dict[str, Any]]:
+        return [
+            self._row_dict(row)
+            for row in self._select("WHERE timestamp >= ? AND timestamp < ?",
+                                    (start, end), order="timestamp, pk")
+        ]
+
+    def count(self) -> int:
+        with self._db:
+            self.flush()
+            return self.conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    # ------------------------------------------------------------
+    #  PERSISTENCE
+    # ------------------------------------------------------------
+
+    def write(self, filename: Optional[str], integrity: Dict[str, Any],
+              format: str = "json", compression: Optional[str] = None,
+              snapshot=None) -> str:
+        filename = self.resolve(filename)
+        if filename is not None:
+            # Export a memory file from the database
+            tree = snapshot.to_dict() if snapshot is not None else self.tree()
+            write_file(filename, integrity, tree, format, compression)
+            return filename
+
+        with self._db:
+            self.flush()
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('integrity', ?)",
+                    (json.dumps(integrity),),
+                )
+        return self.path
+
+    def read(self, filename: Optional[str]) -> Dict[str, Any]:
+        filename = self.resolve(filename)
+        if filename is not None:
+            return read_file(filename)
+
+        with self._db:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'integrity'").fetchone()
+        return {
+            "integrity": json.loads(row[0]) if row else {},
+            "tree": self.tree(),
+            # SQLite guards its own pages; no segment checksums
+            "verification": None,
+        }
@@ -0,0 +1,433 @@
+# ============================================================
+# AC SYNC — ArcCore-Prime V1.1
+# Loop 1.9: Subtree Digests, Diff + Patch
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   Reconcile two copies of a memory without comparing full
+#   dumps. Every node carries a subtree digest:
+#
+#     digest(node) = blake2b-128(fields(node) || digest(child)...)
+#
+#   Diffing walks both trees from the root and descends only
+#   where digests differ. Children are compared positionally in
+#   blocks of DIGEST_BLOCK digests, so the unchanged prefix of a
+#   wide child list (e.g. an append-only root) is skipped with a
+#   single bytes comparison per block, and short insertions or
+#   deletions are re-aligned instead of forcing an id match of
+#   the whole remaining list.
+#
+#   The patch lists added, removed, changed and collapsed nodes
+#   and can be applied to the other copy.
+#
+# ============================================================
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+DIGEST_SIZE = 16
+DIGEST_BLOCK = 64
+RESYNC_WINDOW = 64
+
+FIELDS = ("id", "role", "cycle", "content", "seed", "collapsed",
+          "priority", "compression_level")
+
+
+class SyncError(ValueError):
+    """Raised when a patch does not apply to the given tree."""
+
+
+# ============================================================
+#  DIGESTS
+# ============================================================
+
+def _field_bytes(values) -> bytes:
+    out = []
+    for v in values:
+        if v is None:
+            out.append("\x00")
+        elif isinstance(v, bool):
+            out.append("1" if v else "0")
+        else:
+            out.append(str(int(v)) if isinstance(v, int) else v)
+    return "\x1f".join(out).encode("utf-8")
+
+
+def node_fields(node) -> Dict[str, Any]:
+    """Comparable node fields from a dict-like node (no children)."""
+    fields = {key: node.get(key) for key in FIELDS}
+    fields["collapsed"] = bool(fields["collapsed"])
+    fields["priority"] = fields["priority"] or 0
+    if fields["compression_level"] is not None:
+        fields["compression_level"] = int(fields["compression_level"])
+    return fields
+
+
+def combine(fields: Dict[str, Any], child_digests: bytes) -> bytes:
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    h.update(_field_bytes(fields[k] for k in FIELDS))
+    h.update(child_digests)
+    return h.digest()
+
+
+# ============================================================
+#  TREE VIEWS
+# ============================================================
+#
+# A view adapts one tree representation to the diff engine:
+#   digest(n), fields(n), node_id(n), child_count(n),
+#   child(n, k), child_block(n, i, j) -> bytes, export(n)
+#
+# ============================================================
+
+class DictView:
+    """to_dict()-shaped trees; digests are memoised per node."""
+
+    def __init__(self, tree: Dict[str, Any]):
+        self.root = tree
+        self._digests: Dict[int, bytes] = {}
+        self._compute(tree)
+
+    def _compute(self, tree):
+        # Post-order without recursion (trees may be deep)
+        stack = [(tree, False)]
+        while stack:
+            node, ready = stack.pop()
+            if ready:
+                block = b"".join(self._digests[id(c)] for c in node.get("children", []))
+                self._digests[id(node)] = combine(node_fields(node), block)
+            else:
+                stack.append((node, True))
+                stack.extend((c, False) for c in node.get("children", []))
+
+    def digest(self, node) -> bytes:
+        return self._digests[id(node)]
+
+    def fields(self, node):
+        return node_fields(node)
+
+    def node_id(self, node):
+        return node.get("id")
+
+    def child_count(self, node) -> int:
+        return len(node.get("children", []))
+
+    def child(self, node, k):
+        return node["children"][k]
+
+    def child_block(self, node, i, j) -> bytes:
+        return b"".join(self._digests[id(c)] for c in node["children"][i:j])
+
+    def export(self, node):
+        return node
+
+
+class MappedView:
+    """
+    ACMB files opened with ac_mmap.MappedMemory. Digests come from
+    the DIGEST section, and the digests of a node's children are a
+    contiguous slice of it, so unchanged regions cost one memcmp.
+    """
+
+    def __init__(self, mapped):
+        self.mapped = mapped
+        self.root = mapped.root
+        if not mapped.has_digests():
+            raise SyncError(f"{mapped.filename} has no digest section; re-export it")
+
+    def digest(self, node) -> bytes:
+        return self.mapped.digest(node.index)
+
+    def fields(self, node):
+        return node_fields(node)
+
+    def node_id(self, node):
+        return node.id
+
+    def child_count(self, node) -> int:
+        return node._fields[8]
+
+    def child(self, node, k):
+        return self.mapped.node(node._fields[7] + k)
+
+    def child_block(self, node, i, j) -> bytes:
+        first = node._fields[7]
+        return self.mapped.digest_range(first + i, first + j)
+
+    def export(self, node):
+        return node.to_dict()
+
+
+def view_of(tree):
+    """Picks the right view for a dict tree, snapshot or MappedMemory."""
+    if isinstance(tree, dict):
+        return DictView(tree)
+    if hasattr(tree, "sync_view"):
+        # ac_persistent.TreeSnapshot: digests cached on the nodes
+        return tree.sync_view()
+    if hasattr(tree, "child_block"):
+        return tree
+    return MappedView(tree)
+
+
+# ============================================================
+#  DIFF
+# ============================================================
+
+def diff(a, b) -> Dict[str, Any]:
+    """
+    Computes the patch that turns tree a into tree b.
+    a and b may be dict trees, MappedMemory files, or views.
+    """
+    va = view_of(a)
+    vb = view_of(b)
+
+    patch = {
+        "base": va.digest(va.root).hex(),
+        "target": vb.digest(vb.root).hex(),
+        "added": [],
+        "removed": [],
+        "changed": [],
+        "collapsed": [],
+        "visited": 0,
+    }
+
+    if va.digest(va.root) == vb.digest(vb.root):
+        return patch
+
+    if va.node_id(va.root) != vb.node_id(vb.root):
+        raise SyncError("Trees have different roots; nothing to reconcile")
+
+    stack = [(va.root, vb.root)]
+    while stack:
+        na, nb = stack.pop()
+        patch["visited"] += 1
+        _diff_fields(va, na, vb, nb, patch)
+        _diff_children(va, na, vb, nb, patch, stack)
+
+    return patch
+
+
+def _diff_children(va, na, vb, nb, patch, stack):
+    """
+    Walks both child lists with independent cursors. Equal blocks are
+    skipped by one digest comparison; a short insertion or deletion is
+    re-aligned within RESYNC_WINDOW; anything else falls back to ids.
+    """
+    count_a, count_b = va.child_count(na), vb.child_count(nb)
+    parent_id = vb.node_id(nb)
+    ia = ib = 0
+
+    while ia < count_a and ib < count_b:
+        n = min(DIGEST_BLOCK, count_a - ia, count_b - ib)
+        if va.child_block(na, ia, ia + n) == vb.child_block(nb, ib, ib + n):
+            ia += n
+            ib += n
+            continue
+
+        for _ in range(n):
+            ca, cb = va.child(na, ia), vb.child(nb, ib)
+            id_a, id_b = va.node_id(ca), vb.node_id(cb)
+
+            if id_a == id_b:
+                if va.digest(ca) != vb.digest(cb):
+                    stack.append((ca, cb))
+                ia += 1
+                ib += 1
+                continue
+
+            skip_a = _find(va, na, ia + 1, count_a, id_b)
+            skip_b = _find(vb, nb, ib + 1, count_b, id_a)
+
+            if skip_a is not None and (skip_b is None or skip_a - ia <= skip_b - ib):
+                for k in range(ia, skip_a):
+                    patch["removed"].append({"parent": parent_id, "id": va.node_id(va.child(na, k))})
+                ia = skip_a
+            elif skip_b is not None:
+                for k in range(ib, skip_b):
+                    patch["added"].append({
+                        "parent": parent_id, "index": k, "node": vb.export(vb.child(nb, k)),
+                    })
+                ib = skip_b
+            else:
+                _diff_by_id(va, na, ia, vb, nb, ib, patch, stack)
+                return
+            break
+
+    for k in range(ib, count_b):
+        patch["added"].append({
+            "parent": parent_id,
+            "index": k,
+            "node": vb.export(vb.child(nb, k)),
+        })
+    for k in range(ia, count_a):
+        patch["removed"].append({"parent": parent_id, "id": va.node_id(va.child(na, k))})
+
+
+def _find(view, node, start, count, node_id):
+    for k in range(start, min(count, start + RESYNC_WINDOW)):
+        if view.node_id(view.child(node, k)) == node_id:
+            return k
+    return None
+
+
+def _diff_fields(va, na, vb, nb, patch):
+    fa, fb = va.fields(na), vb.fields(nb)
+    if fa == fb:
+        return
+
+    changes = {k: fb[k] for k in FIELDS if fa[k] != fb[k]}
+    entry = {"id": fb["id"], "fields": changes}
+
+    if fb["collapsed"] and not fa["collapsed"]:
+        patch["collapsed"].append(entry)
+    else:
+        patch["changed"].append(entry)
+
+
+def _diff_by_id(va, na, start_a, vb, nb, start_b, patch, stack):
+    rest_a = {va.node_id(c): c for c in (va.child(na, k) for k in range(start_a, va.child_count(na)))}
+    parent_id = vb.node_id(nb)
+
+    for k in range(start_b, vb.child_count(nb)):
+        cb = vb.child(nb, k)
+        ca = rest_a.pop(vb.node_id(cb), None)
+        if ca is None:
+            patch["added"].append({"parent": parent_id, "index": k, "node": vb.export(cb)})
+        elif va.digest(ca) != vb.digest(cb):
+            stack.append((ca, cb))
+
+    for node_id in rest_a:
+        patch["removed"].append({"parent": parent_id, "id": node_id})
+
+
+def is_empty(patch: Dict[str, Any]) -> bool:
+    return not any(patch[k] for k in ("added", "removed", "changed", "collapsed"))
+
+
+def summarize(patch: Dict[str, Any]) -> str:
+    return (
+        f"+{len(patch['added'])} added, -{len(patch['removed'])} removed, "
+        f"~{len(patch['changed'])} changed, ▼{len(patch['collapsed'])} collapsed "
+        f"({patch.get('visited', 0)} nodes visited)"
+    )
+
+
+# ============================================================
+#  APPLY
+# ============================================================
+
+def apply_patch(tree: Dict[str, Any], patch: Dict[str, Any], strict: bool = True) -> Dict[str, Any]:
+    """
+    Applies a patch to a dict tree in place and returns it.
+    strict=True checks the base and target digests.
+    """
+    if strict and DictView(tree).digest(tree).hex() != patch["base"]:
+        raise SyncError("Patch base does not match this tree")
+
+    index: Dict[Optional[str], Dict[str, Any]] = {}
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        index[node.get("id")] = node
+        stack.extend(node.get("children", []))
+
+    for entry in patch["removed"]:
+        parent = _require(index, entry["parent"])
+        parent["children"] = [c for c in parent["children"] if c.get("id") != entry["id"]]
+
+    for entry in patch["changed"] + patch["collapsed"]:
+        node = _require(index, entry["id"])
+        for key, value in entry["fields"].items():
+            if key == "compression_level" and value is None:
+                node.pop(key, None)
+            else:
+                node[key] = value
+
+    for entry in sorted(patch["added"], key=lambda e: e["index"]):
+        parent = _require(index, entry["parent"])
+        parent.setdefault("children", []).insert(entry["index"], entry["node"])
+
+    if strict and DictView(tree).digest(tree).hex() != patch["target"]:
+        raise SyncError("Patched tree does not match the target digest")
+
+    return tree
+
+
+def _require(index, node_id):
+    node = index.get(node_id)
+    if node is None:
+        raise SyncError(f"Node {node_id} not found in target tree")
+    return node
+
+
+# ============================================================
+#  CLI
+# ============================================================
+
+def open_tree(filename):
+    """Mapped view for digest-carrying ACMB files, dict tree otherwise."""
+    import ac_binary
+    from ac_mmap import MappedMemory
+    from ac_storage import read_file
+
+    if ac_binary.is_binary(filename):
+        try:
+            mapped = MappedMemory(filename)
+            if mapped.has_digests():
+                return mapped
+            mapped.close()
+        except ac_binary.FormatError:
+            pass
+    return read_file(filename)["tree"]
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Diff and sync ArcCore memory files.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_diff = sub.add_parser("diff", help="write the patch that turns A into B")
+    p_diff.add_argument("a")
+    p_diff.add_argument("b")
+    p_diff.add_argument("-o", "--output")
+
+    p_apply = sub.add_parser("apply", help="apply a patch to a memory file")
+    p_apply.add_argument("memory")
+    p_apply.add_argument("patch")
+    p_apply.add_argument("-o", "--output")
+    p_apply.add_argument("--format", default=None, choices=("json", "bin"))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "diff":
+        patch = diff(open_tree(args.a), open_tree(args.b))
+        print(f"[sync] {summarize(patch)}")
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(patch, f)
+        return 0
+
+    from ac_storage import read_file, write_file
+    from arc_guardian import ArcGuardian
+    import ac_binary
+
+    payload = read_file(args.memory)
+    with open(args.patch) as f:
+        patch = json.load(f)
+    apply_patch(payload["tree"], patch)
+
+    output = args.output or args.memory
+    fmt = args.format or ("bin" if ac_binary.is_binary(args.memory) else "json")
+    memory_hash = ArcGuardian().compute_memory_tree_hash(payload["tree"])
+    integrity = dict(payload["integrity"], memory_hash=memory_hash)
+    write_file(output, integrity, payload["tree"], format=fmt)
+    print(f"[sync] Patch applied → {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
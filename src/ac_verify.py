@@ -0,0 +1,439 @@
+# ============================================================
+# AC VERIFY — ArcCore-Prime V1.1
+# Loop 1.10: Segment Checksums + Verified Streaming Load
+# Guardian Layer: Arien
+# ============================================================
+#
+# Purpose:
+#   A persisted memory is verified against checksums written
+#   with it, not against whatever the current process happens
+#   to hold. Files are split into segments that are hashed
+#   independently, so:
+#
+#     - verification streams (segments are hashed as they are
+#       read, across a thread pool; hashlib releases the GIL)
+#     - corruption is reported per segment, and loaders keep
+#       every intact segment instead of failing the whole file
+#
+#   ACMB files: fixed-size byte segments of every section.
+#   JSON files: one segment per line — the integrity block, the
+#   seed table, each run of STRINGS_PER_LINE strings, the root's
+#   own fields and each top-level subtree — checksummed as raw
+#   bytes, so a damaged line is found before it is parsed and
+#   only that line is lost. The file is still one JSON document.
+#   Older JSON files carry one checksum per parsed subtree.
+#
+# ============================================================
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+SEGMENT_SIZE = 256 * 1024
+ALGORITHM = "sha256"
+
+CORRUPT_SEED = "[Corrupt segment — reconstruction required]"
+CORRUPT_TEXT = "[corrupt]"
+
+
+def default_workers() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+def checksum(data) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+# ============================================================
+#  REPORT
+# ============================================================
+
+class VerificationReport:
+    """
+    Outcome of a verified load.
+      checked  — number of segments hashed
+      bad      — list of (label, detail) for corrupt segments
+      lost     — nodes replaced by corruption placeholders
+    """
+
+    def __init__(self, checked: int = 0):
+        self.checked = checked
+        self.bad: List[Tuple[str, str]] = []
+        self.lost = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.bad
+
+    def add(self, label: str, detail: str):
+        self.bad.append((label, detail))
+
+    def describe(self) -> str:
+        if self.ok:
+            return f"{self.checked} segments verified"
+        where = ", ".join(f"{label} {detail}" for label, detail in self.bad[:5])
+        more = f" (+{len(self.bad) - 5} more)" if len(self.bad) > 5 else ""
+        return (
+            f"{len(self.bad)}/{self.checked} segments corrupt: {where}{more}; "
+            f"{self.lost} nodes quarantined"
+        )
+
+
+# ============================================================
+#  BYTE SEGMENTS (ACMB)
+# ============================================================
+
+def segment_checksums(data: bytes, size: int = SEGMENT_SIZE) -> List[bytes]:
+    view = memoryview(data)
+    return [checksum(view[i:i + size]) for i in range(0, max(len(data), 1), size)]
+
+
+def read_verified(filename: str, expected: Dict[Tuple[int, int], Tuple[int, int, bytes]],
+                  workers: Optional[int] = None) -> Tuple[bytearray, Set[Tuple[int, int]]]:
+    """
+    Streams a file into memory while hashing the listed segments.
+
+    expected maps (section_kind, segment_index) to
+    (file_offset, length, digest). Returns (data, bad) where bad is
+    the set of segment keys whose digest did not match.
+    """
+    size = os.path.getsize(filename)
+    data = bytearray(size)
+    view = memoryview(data)
+
+    # Hash segments in file order so reading and hashing overlap
+    ordered = sorted(expected.items(), key=lambda item: item[1][0])
+    bad: Set[Tuple[int, int]] = set()
+
+    with open(filename, "rb") as f, ThreadPoolExecutor(workers or default_workers()) as pool:
+        pending = []
+        position = 0
+        for key, (offset, length, digest) in ordered:
+            end = offset + length
+            if end > size:
+                bad.add(key)
+                continue
+            if end > position:
+                f.seek(position)
+                f.readinto(view[position:end])
+                position = end
+            pending.append((key, digest, pool.submit(checksum, view[offset:end])))
+
+        if position < size:
+            f.seek(position)
+            f.readinto(view[position:size])
+
+        for key, digest, future in pending:
+            if future.result() != digest:
+                bad.add(key)
+
+    return data, bad
+
+
+# ============================================================
+#  SUBTREE SEGMENTS (JSON)
+# ============================================================
+
+def subtree_checksum(node: Dict[str, Any]) -> str:
+    serialized = json.dumps(node, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _root_fields(tree: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in tree.items() if k != "children"}
+
+
+def tree_segments(tree: Dict[str, Any], workers: Optional[int] = None) -> Dict[str, Any]:
+    """Checksums for the root's own fields and each top-level subtree."""
+    children = tree.get("children", [])
+    with ThreadPoolExecutor(workers or default_workers()) as pool:
+        sums = list(pool.map(subtree_checksum, children, chunksize=64))
+    return {
+        "algorithm": ALGORITHM,
+        "root": subtree_checksum(_root_fields(tree)),
+        "children": sums,
+    }
+
+
+def verify_tree(tree: Dict[str, Any], segments: Dict[str, Any],
+                workers: Optional[int] = None) -> VerificationReport:
+    """
+    Checks a loaded JSON tree against its subtree checksums.
+    Corrupt subtrees are replaced in place by placeholders.
+    """
+    children = tree.get("children", [])
+    expected = segments.get("children", [])
+    report = VerificationReport(checked=len(expected) + 1)
+
+    if subtree_checksum(_root_fields(tree)) != segments.get("root"):
+        report.add("root", "fields")
+
+    with ThreadPoolExecutor(workers or default_workers()) as pool:
+        actual = list(pool.map(subtree_checksum, children, chunksize=64))
+
+    if len(actual) != len(expected):
+        report.add("tree", f"{len(actual)} subtrees, {len(expected)} expected")
+
+    for i, (got, want) in enumerate(zip(actual, expected)):
+        if got != want:
+            report.add("subtree", f"#{i} ({children[i].get('id')})")
+            report.lost += _count(children[i])
+            children[i] = placeholder(children[i].get("cycle", 0))
+
+    return report
+
+
+# ============================================================
+#  LINE SEGMENTS (JSON)
+# ============================================================
+
+LINES_MAGIC = b'{"layout": "lines",\n'
+STRINGS_PER_LINE = 256
+
+_INTEGRITY = b'"integrity": '
+_SEGMENTS = b'"segments": '
+_SEEDS = b'"seeds": '
+_STRINGS_OPEN = b'"strings": ['
+_STRINGS_CLOSE = b'],'
+_TREE = b'"tree": '
+_CHILDREN = b'"children": ['
+_TREE_CLOSE = b']}}'
+
+
+def _compact(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _hex(line) -> str:
+    return hashlib.sha256(line).hexdigest()
+
+
+def encode_lines(integrity: Dict[str, Any], strings: List[str], seeds: List[list],
+                 tree: Dict[str, Any], workers: Optional[int] = None) -> bytes:
+    """
+    A packed payload (ac_content.pack_tree) as a JSON document with
+    one segment per line. Checksums cover each line as written.
+    """
+    integrity = {k: v for k, v in integrity.items() if k != "segments"}
+    root = _compact(_root_fields(tree))
+    children = [_compact(child) for child in tree.get("children", [])]
+    chunks = [b",".join(_compact(s) for s in strings[i:i + STRINGS_PER_LINE])
+              for i in range(0, len(strings), STRINGS_PER_LINE)]
+
+    head = [_INTEGRITY + _compact(integrity) + b",", _SEEDS + _compact(seeds) + b","]
+    chunks = [chunk + b"," for chunk in chunks[:-1]] + chunks[-1:]
+    root = _TREE + root[:-1] + (b"," if len(root) > 2 else b"") + _CHILDREN
+    children = [child + b"," for child in children[:-1]] + children[-1:]
+
+    with ThreadPoolExecutor(workers or default_workers()) as pool:
+        sums = list(pool.map(_hex, head + chunks + [root] + children, chunksize=64))
+    n = len(chunks)
+    segments = {
+        "algorithm": ALGORITHM,
+        "layout": "lines",
+        "strings_per_line": STRINGS_PER_LINE,
+        "string_count": len(strings),
+        "integrity": sums[0],
+        "seeds": sums[1],
+        "strings": sums[2:2 + n],
+        "root": sums[2 + n],
+        "children": sums[3 + n:],
+    }
+    lines = [LINES_MAGIC[:-1], head[0], _SEGMENTS + _compact(segments) + b",", head[1],
+             _STRINGS_OPEN, *chunks, _STRINGS_CLOSE, root, *children, _TREE_CLOSE, b""]
+    return b"\n".join(lines)
+
+
+def is_lines(data: bytes) -> bool:
+    """True for a line-segmented JSON file, also with a damaged first line."""
+    return data.startswith(LINES_MAGIC) or data[len(LINES_MAGIC):].startswith(_INTEGRITY)
+
+
+def _strip(line: bytes, prefix: bytes, suffix: bytes = b"") -> bytes:
+    if not line.startswith(prefix) or not line.endswith(suffix):
+        raise ValueError("segment framing damaged")
+    return line[len(prefix):len(line) - len(suffix)]
+
+
+def _without_comma(line: bytes) -> bytes:
+    return line[:-1] if line.endswith(b",") else line
+
+
+def decode_lines(data: bytes, verify: bool = True,
+                 workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Splits a line-segmented file, hashes every segment across a
+    thread pool, then parses the segments one at a time. Lines
+    that fail their checksum or do not parse become placeholders
+    (subtrees, root fields) or CORRUPT_TEXT (strings). Returns
+    {"integrity", "strings", "seeds", "tree", "verification"} with
+    the tree still packed.
+    """
+    lines = data.split(b"\n")
+    if len(lines) < 8:
+        raise ValueError("memory file truncated")
+    try:
+        segments = json.loads(_strip(lines[2], _SEGMENTS, b","))
+    except ValueError:
+        segments = None
+    if not isinstance(segments, dict):
+        segments = None
+
+    # Section markers; a damaged one is found from the checksum table
+    framing = []
+    if _STRINGS_CLOSE in lines[5:]:
+        close = lines.index(_STRINGS_CLOSE, 5)
+    elif segments is not None:
+        close = 5 + len(segments.get("strings", []))
+        framing.append(close)
+    else:
+        raise ValueError("memory file layout damaged: no strings marker or checksum table")
+    end = len(lines) - 2 if lines[-1] == b"" else len(lines) - 1
+    if lines[end] != _TREE_CLOSE:
+        framing.append(end)
+    if lines[0] != LINES_MAGIC[:-1]:
+        framing.append(0)
+    if lines[4] != _STRINGS_OPEN:
+        framing.append(4)
+    chunks = lines[5:close]
+    root_line = lines[close + 1]
+    children = lines[close + 2:end]
+
+    report = None
+    good = None  # per segment line: checksum matched
+    if verify:
+        report = VerificationReport(checked=3 + len(chunks) + len(children))
+        for line in framing:
+            report.add("layout", f"line {line + 1}")
+        if segments is None:
+            report.add("segments", "checksum table")
+        else:
+            expected = [segments.get("integrity"), segments.get("seeds")]
+            expected += segments.get("strings", [])[:len(chunks)]
+            expected += [None] * (len(chunks) - len(segments.get("strings", [])))
+            expected.append(segments.get("root"))
+            want = segments.get("children", [])
+            expected += want[:len(children)] + [None] * (len(children) - len(want))
+            if len(chunks) != len(segments.get("strings", [])):
+                report.add("strings", f"{len(chunks)} lines, {len(segments.get('strings', []))} expected")
+            if len(children) != len(want):
+                report.add("tree", f"{len(children)} subtrees, {len(want)} expected")
+            ordered = [lines[1], lines[3], *chunks, root_line, *children]
+            with ThreadPoolExecutor(workers or default_workers()) as pool:
+                actual = list(pool.map(_hex, ordered, chunksize=64))
+            good = [got == wanted for got, wanted in zip(actual, expected)]
+
+    def intact(position: int) -> bool:
+        return good is None or good[position]
+
+    def parse(position: int, line: bytes, prefix: bytes = b"", suffix: bytes = b""):
+        if not intact(position):
+            return None
+        try:
+            return json.loads(_strip(line, prefix, suffix))
+        except ValueError:
+            return None
+
+    def bad(label: str, detail: str):
+        if report is not None:
+            report.add(label, detail)
+
+    integrity = parse(0, lines[1], _INTEGRITY, b",")
+    if not isinstance(integrity, dict):
+        bad("integrity", "block")
+        integrity = {}
+    if segments is not None:
+        integrity["segments"] = segments
+
+    seeds = parse(1, lines[3], _SEEDS, b",")
+    if not isinstance(seeds, list):
+        bad("seeds", "table")
+        seeds = None
+
+    per_line = (segments or {}).get("strings_per_line", STRINGS_PER_LINE)
+    total = (segments or {}).get("string_count")
+    strings: List[Any] = []
+    for i, chunk in enumerate(chunks):
+        found = parse(2 + i, b"[" + _without_comma(chunk) + b"]")
+        if not isinstance(found, list):
+            bad("strings", f"#{i}")
+            size = per_line if total is None else max(0, min(per_line, total - i * per_line))
+            found = [CORRUPT_TEXT] * size
+        strings.extend(found)
+
+    base = 2 + len(chunks)
+    kids = []
+    for i, line in enumerate(children):
+        child = parse(base + 1 + i, _without_comma(line))
+        if not isinstance(child, dict):
+            bad("subtree", f"#{i}")
+            if report is not None:
+                report.lost += _count(_decoded_or_empty(line))
+            child = placeholder(_decoded_or_empty(line).get("cycle", 0))
+        elif seeds is None:
+            _drop_seed_records(child)
+        kids.append(child)
+
+    tree = None
+    if root_line.endswith(_CHILDREN):
+        body = root_line[:-len(_CHILDREN)]
+        body = (body[:-1] if body.endswith(b",") else body) + b"}"
+        tree = parse(base, body, _TREE)
+    if not isinstance(tree, dict):
+        bad("root", "fields")
+        if report is not None:
+            report.lost += 1
+        tree = placeholder()
+    elif seeds is None:
+        _drop_seed_records(tree)
+    tree["children"] = kids
+
+    return {"integrity": integrity, "strings": strings, "seeds": seeds,
+            "tree": tree, "verification": report}
+
+
+def _decoded_or_empty(line: bytes) -> Dict[str, Any]:
+    """A damaged subtree line, parsed if it still parses (to size the loss)."""
+    try:
+        value = json.loads(_without_comma(line))
+    except ValueError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _drop_seed_records(node: Dict[str, Any]):
+    """Seed records point into a lost seed table: mark them corrupt."""
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if "seed_record" in n:
+            del n["seed_record"]
+            n["seed"] = CORRUPT_SEED
+        stack.extend(n.get("children", []))
+
+
+def _count(node: Dict[str, Any]) -> int:
+    total, stack = 0, [node]
+    while stack:
+        n = stack.pop()
+        total += 1
+        stack.extend(n.get("children", []) if isinstance(n, dict) else [])
+    return total
+
+
+def placeholder(cycle: Any = 0, children: Optional[list] = None) -> Dict[str, Any]:
+    """Honest stand-in for a node whose bytes failed verification."""
+    from ac_collapse import CompressionLevel
+    return {
+        "id": None,
+        "role": "system",
+        "cycle": cycle if isinstance(cycle, int) else 0,
+        "content": None,
+        "seed": CORRUPT_SEED,
+        "collapsed": True,
+        "priority": 0,
+        "compression_level": CompressionLevel.SIGIL_ONLY,
+        "children": children or [],
+    }
@@ -6,6 +6,75 @@
 import hashlib
 import datetime
 import json
+import os
+
+from ac_audit import AuditLog
+from ac_sentinel import DEFAULT_COMMANDS
+from ac_echo import traced
+
+# ------------------------------------------------------------
+# Kernel hash cache (Loop 1.11)
+#   keyed on (path, mtime_ns, size); the source is only
+#   re-read and re-hashed when the kernel file changes.
+# ------------------------------------------------------------
+
+KERNEL_CACHE_ENV = "ARCCORE_CACHE_DIR"
+_kernel_hash_memo = {}
+
+
+def kernel_cache_file() -> str:
+    base = os.environ.get(KERNEL_CACHE_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "arccore")
+    return os.path.join(base, "kernel_hash.json")
+
+
+def _read_kernel_cache() -> dict:
+    try:
+        with open(kernel_cache_file(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_kernel_cache(entries: dict):
+    path = kernel_cache_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache is an optimization only
+
+
+def cached_kernel_hash(path: str) -> str:
+    """
+    sha256 of a kernel source file, identical to hashing
+    inspect.getsource(module), served from the cache when
+    the file's mtime and size are unchanged.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+
+    digest = _kernel_hash_memo.get(key)
+    if digest is not None:
+        return digest
+
+    entries = _read_kernel_cache()
+    entry = entries.get(path)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        digest = entry[2]
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            digest = hashlib.sha256(f.read().encode()).hexdigest()
+        entries[path] = [st.st_mtime_ns, st.st_size, digest]
+        _write_kernel_cache(entries)
+
+    _kernel_hash_memo[key] = digest
+    return digest
+
 
 class ArcGuardian:
     """
@@ -39,10 +108,14 @@ class ArcGuardian:
         anchor = f"{self.guardian_name}:{self.boot_timestamp}"
         self.identity_key = hashlib.sha256(anchor.encode()).hexdigest()
 
+        # Decision audit (Loop 1.21); ARCCORE_AUDIT_DIR / ARCCORE_AUDIT_LEVEL
+        self.audit = AuditLog.from_env()
+
     # ------------------------------------------------------------
     # Purification Filter
     # ------------------------------------------------------------
 
+    @traced("guardian.purify")
     def purify(self, text: str) -> str:
         """Soft purification to reduce noise."""
         if not isinstance(text, str):
@@ -71,6 +144,11 @@ class ArcGuardian:
         Returns True if text is safe to process, False otherwise.
         """
         if "[redacted]" in text:
+            # Only the verb is audited, never the text itself
+            verb = text.split(maxsplit=1)[0].lower() if text.split() else None
+            operation = DEFAULT_COMMANDS[verb].value if verb in DEFAULT_COMMANDS else "UNCLASSIFIED"
+            if (operation, False) in self.audit.wanted:
+                self.audit.record(operation, False, "Text gate: redacted content", action=verb)
             return False
         # Add other keyword blocks here if needed
         return True
@@ -81,30 +159,32 @@ class ArcGuardian:
 
     def validate_intent(self, cmd: str) -> bool:
         """
-        Validates if a command verb is permitted.
-        Currently permits all known structural commands.
+        Validates if a command verb is permitted. Which verbs exist
+        and who may run them is the Sentinel's policy
+        (ac_sentinel.DEFAULT_COMMANDS), judged after this check.
         """
-        # Whitelist of allowed verbs
-        ALLOWED_INTENTS = {
-            "walk", "export", "inject", "sigil", "guardian",
-            "reconstruct", "thread", "summary", "collapse", "exit"
-        }
-        
-        # If strict checking is desired, uncomment the next line:
-        # return cmd in ALLOWED_INTENTS
-        
         return True
 
     # ------------------------------------------------------------
     # Structural Safety Gate (for Kernel/Collapse)
     # ------------------------------------------------------------
 
-    def gate(self, role: str, cycle: int, child_count: int, depth: int):
+    @traced("guardian.gate")
+    def gate(self, role: str, cycle: int, child_count: int, depth: int,
+             operation: str = "WRITE", node_id=None):
         """
         Ensures that the structural update is safe before memory ingestion.
         Returns (Success: bool, Reason: str)
+        operation / node_id only label the audit record.
         """
-
+        ok, reason = self._check_structure(role, cycle, child_count, depth)
+        if (operation, ok) in self.audit.wanted:
+            self.audit.record(operation, ok, reason, action=f"gate:{role}",
+                              target_node_id=node_id, cycle_context=cycle)
+        return ok, reason
+
+    @staticmethod
+    def _check_structure(role, cycle, child_count, depth):
         # Role validation
         if role not in ("user", "ai", "system"):
             return False, "Invalid role"
@@ -132,14 +212,25 @@ class ArcGuardian:
         self.kernel_hash = hashlib.sha256(kernel_source.encode()).hexdigest()
         return self.kernel_hash
 
+    def load_kernel_hash(self, kernel_path: str) -> str:
+        """Same hash as compute_kernel_hash, via the on-disk cache."""
+        self.kernel_hash = cached_kernel_hash(kernel_path)
+        return self.kernel_hash
+
     # ------------------------------------------------------------
     # Memory Tree Hash (MTH)
     # ------------------------------------------------------------
 
+    @traced("guardian.hash")
+    @staticmethod
+    def hash_memory_tree(tree_dict: dict) -> str:
+        """Deterministic hash of a memory tree (no Guardian state change)."""
+        serialized = json.dumps(tree_dict, sort_keys=True)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
     def compute_memory_tree_hash(self, tree_dict: dict) -> str:
         """Deterministic hash of the memory tree dictionary."""
-        serialized = json.dumps(tree_dict, sort_keys=True)
-        self.memory_tree_hash = hashlib.sha256(serialized.encode()).hexdigest()
+        self.memory_tree_hash = self.hash_memory_tree(tree_dict)
         return self.memory_tree_hash
 
     # ------------------------------------------------------------
@@ -159,6 +250,30 @@ class ArcGuardian:
 
         return True, "Integrity Verified"
 
+    @traced("guardian.verify")
+    def verify_loaded(self, kernel_hash: str, memory_hash: str, tree, report):
+        """
+        Loop 1.10 — verifies a memory read from disk against its own
+        stamps instead of this process's in-memory tree.
+        report is the segment VerificationReport from the loader;
+        files without segment checksums fall back to a full re-hash.
+        """
+
+        if self.kernel_hash != kernel_hash:
+            return False, "Kernel integrity mismatch"
+
+        if report is None:
+            if not isinstance(tree, dict):
+                tree = tree.to_dict()
+            if self.hash_memory_tree(tree) != memory_hash:
+                return False, "Memory tree mismatch"
+            return True, "Integrity Verified (full re-hash)"
+
+        if not report.ok:
+            return False, f"Memory corruption — {report.describe()}"
+
+        return True, f"Integrity Verified ({report.describe()})"
+
     # ------------------------------------------------------------
     # Export: Integrity Report
     # ------------------------------------------------------------
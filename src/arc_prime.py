@@ -9,13 +9,20 @@
 from ac_sigils import SigilEngine
 from ac_collapse import ACCollapseEngine
 from arc_guardian import ArcGuardian
-
-import json
-import uuid
-import inspect
+from ac_content import ContentTable
+from ac_storage import MemoryBackend
+from ac_locks import RWLock
+from ac_echo import ECHO, traced
+from ac_ids import NODE_IDS
+from ac_query import Query, QueryStats, SubtreeIndex, fields, parse, select
+from ac_seed import ANCHOR, ANCHOR_LENGTH, SNIPPET, SNIPPET_LENGTH, VERBATIM_SEED
+from ac_seed import parse as parse_seed, record as make_seed, render as render_seed
+
+import os
 import sys
+import threading
 from datetime import datetime
-from typing import List
+from typing import Iterator, List
 
 
 # ============================================================
@@ -28,13 +35,13 @@ class HarmonicNode:
     """
 
     def __init__(self, role: str, content: str, cycle_id: int = 0):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = NODE_IDS.next()  # Loop 1.26 — 64-bit, unique per process
         self.timestamp = datetime.now().isoformat()
 
         # Loop 1.4 — intern high-frequency structural strings
         self.role = sys.intern(role)
         self.raw_content = content
-        self.structural_seed = None
+        self.seed_record = None  # Loop 1.28 — SeedRecord (or text), rendered on read
         self.cycle_alignment = cycle_id
         self.children: List['HarmonicNode'] = []
 
@@ -45,6 +52,7 @@ class HarmonicNode:
     #  SIGIL PRIORITY (AC-67)
     # ------------------------------------------------------------
 
+    @traced("sigil.score")
     def apply_sigil_priority(self, sigil_engine: SigilEngine):
         self.priority = sigil_engine.evaluate(self.raw_content)
         return self.priority
@@ -55,17 +63,23 @@ class HarmonicNode:
 
     def prune_to_seed(self):
         if self.priority >= 3:
-            snippet = self.raw_content[:80]
-            self.structural_seed = f"[AC-{self.cycle_alignment}] {snippet}..."
+            self.seed_record = make_seed(ANCHOR, self.cycle_alignment, ANCHOR_LENGTH)
             self.is_collapsed = True
             return
 
         if len(self.raw_content) > 50:
-            snippet = self.raw_content[:30]
-            self.structural_seed = f"[Seed AC-{self.cycle_alignment}]: {snippet}..."
+            self.seed_record = make_seed(SNIPPET, self.cycle_alignment, SNIPPET_LENGTH)
             self.is_collapsed = True
         else:
-            self.structural_seed = self.raw_content
+            self.seed_record = VERBATIM_SEED
+
+    @property
+    def structural_seed(self):
+        return render_seed(self.seed_record, self.raw_content)
+
+    @structural_seed.setter
+    def structural_seed(self, seed):
+        self.seed_record = parse_seed(seed, self.raw_content)
 
     # ------------------------------------------------------------
     #  REBUILD
@@ -77,9 +91,35 @@ class HarmonicNode:
         return self.raw_content
 
     # ------------------------------------------------------------
-    #  EXPORT
+    #  EXPORT / IMPORT
     # ------------------------------------------------------------
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'HarmonicNode':
+        """Rebuilds a node (and its children) from to_dict() output."""
+        node = cls(data.get("role", "system"), data.get("content"), data.get("cycle", 0))
+        if data.get("id") is not None:
+            node.id = data["id"]
+        if data.get("timestamp"):
+            node.timestamp = data["timestamp"]
+        node.structural_seed = data.get("seed")
+        node.is_collapsed = bool(data.get("collapsed", False))
+        node.priority = data.get("priority", 0)
+        node.children = [cls.from_dict(c) for c in data.get("children", [])]
+        return node
+
+    # Loop 1.24 — dict-style reads, so renderers walk live nodes without to_dict()
+    _FIELDS = {"id": "id", "role": "role", "cycle": "cycle_alignment", "content": "raw_content",
+               "seed": "structural_seed", "collapsed": "is_collapsed", "priority": "priority",
+               "children": "children", "timestamp": "timestamp", "seed_record": "seed_record"}
+
+    def get(self, key: str, default=None):
+        attr = self._FIELDS.get(key)
+        if attr is None:
+            value = getattr(self, key, None) if key == "compression_level" else None
+            return default if value is None else value
+        return getattr(self, attr)
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -98,26 +138,106 @@ class HarmonicNode:
 # ============================================================
 
 class ArcMemorySystem:
-    def __init__(self):
+    def __init__(self, backend=None, guardian=None):
         self.root = HarmonicNode("system", "ArcCore-Prime Root Node", cycle_id=1)
 
         self.collapse = ACCollapseEngine()
         self.sigil = SigilEngine()
-        self.guardian = ArcGuardian()
+        # Loop 1.11 — callers may share one Guardian across layers
+        self.guardian = guardian if guardian is not None else ArcGuardian()
+
+        # Loop 1.5 — shared content table (dedup of content + seeds)
+        self.content = ContentTable()
+        self.content.share(self.root)
 
-        # Kernel integrity (unchanged — owned by Guardian loops)
-        import arc_prime
-        kernel_source = inspect.getsource(arc_prime)
-        self.kernel_hash = self.guardian.compute_kernel_hash(kernel_source)
+        # Kernel integrity (owned by Guardian loops; cached by mtime/size)
+        self.kernel_hash = self.guardian.load_kernel_hash(__file__)
 
         # Updated whenever memory changes
         self.memory_hash = None
 
+        # Loop 1.14 — shared reads, exclusive writes
+        self.lock = RWLock()
+
+        # Loop 1.15 — frozen mirror of the tree for snapshot();
+        # version counts writes so snapshots can be matched to them
+        self.version = 0
+        self._frozen = (None, None)
+        self._freeze_lock = threading.Lock()
+
+        # Loop 1.8 — storage engine (resident tree by default)
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.backend.attach(self)
+
+        # Loop 1.23 — batch runs defer the O(n) hash to refresh_hash()
+        self.hash_on_write = self.backend.hash_on_write
+
+        # Loop 1.25 — per-subtree summaries for query push-down
+        self.summaries = SubtreeIndex()
+
+        # Loop 1.27 — workload capture (ac_replay), on when
+        # ARCCORE_CAPTURE names a trace file
+        self.capture = None
+        if os.environ.get("ARCCORE_CAPTURE"):
+            from ac_replay import shared_capture
+            self.capture = shared_capture()
+
     # ------------------------------------------------------------
     #  INGEST LOOP
     # ------------------------------------------------------------
 
+    @traced("ingest")
     def ingest_interaction(self, user_text: str, ai_text: str, cycle_context: int):
+        if self.capture is not None:
+            return self.capture.ingest(self._ingest, user_text, ai_text, cycle_context)
+        self._ingest(user_text, ai_text, cycle_context)
+
+    def _ingest(self, user_text: str, ai_text: str, cycle_context: int):
+        user_node = self.prepare_interaction(user_text, ai_text, cycle_context)
+        self._attach([user_node])
+
+    @traced("ingest.batch")
+    def ingest_prepared(self, user_nodes: List[HarmonicNode]):
+        """
+        Loop 1.13 — attaches several prepared interactions at once;
+        the tree is hashed (or flushed) once for the whole batch.
+        """
+        if user_nodes:
+            self._attach(user_nodes)
+
+    def _attach(self, user_nodes: List[HarmonicNode]):
+        """
+        Loop 1.14 — only the structural change holds the write lock;
+        the O(n) tree hash is computed afterwards under a read lock,
+        so concurrent readers are not held up by it.
+        """
+        with self.lock.write():
+            for user_node in user_nodes:
+                stack = [user_node]
+                while stack:
+                    node = stack.pop()
+                    self.content.share(node)
+                    stack.extend(node.children)
+            if len(user_nodes) == 1:
+                self.backend.append(user_nodes[0])
+            else:
+                self.backend.extend(user_nodes)
+            self.version += 1
+        ECHO.count("ingest.interactions", len(user_nodes))
+
+        if self.hash_on_write:
+            self.refresh_hash()
+
+    def refresh_hash(self) -> str:
+        """Memory hash of the current tree (recomputed only if stale)."""
+        with self.lock.read():
+            if self.memory_hash is None:
+                self.memory_hash = self.guardian.compute_memory_tree_hash(self.backend.tree())
+            return self.memory_hash
+
+    @traced("ingest.prepare")
+    def prepare_interaction(self, user_text: str, ai_text: str, cycle_context: int) -> HarmonicNode:
+        """Purifies, scores, gates and prunes one exchange without attaching it."""
         clean_user = self.guardian.purify(user_text)
         clean_ai = self.guardian.purify(ai_text)
 
@@ -127,9 +247,13 @@ class ArcMemorySystem:
         user_node.apply_sigil_priority(self.sigil)
         ai_node.apply_sigil_priority(self.sigil)
 
-        ok_u, msg_u = self.guardian.gate(user_node.role, user_node.cycle_alignment, 1, depth=1)
-        ok_a, msg_a = self.guardian.gate(ai_node.role,   ai_node.cycle_alignment,   0, depth=2)
+        ok_u, msg_u = self.guardian.gate(user_node.role, user_node.cycle_alignment, 1, depth=1,
+                                         node_id=user_node.id)
+        ok_a, msg_a = self.guardian.gate(ai_node.role,   ai_node.cycle_alignment,   0, depth=2,
+                                         node_id=ai_node.id)
 
+        if not (ok_u and ok_a):
+            ECHO.count("guardian.rejected")
         if not ok_u:
             raise RuntimeError(f"[Guardian] User-node rejected: {msg_u}")
         if not ok_a:
@@ -140,71 +264,269 @@ class ArcMemorySystem:
         user_node.prune_to_seed()
         ai_node.prune_to_seed()
 
-        self.root.children.append(user_node)
+        return user_node
 
-        self.memory_hash = self.guardian.compute_memory_tree_hash(self.root.to_dict())
+    # ------------------------------------------------------------
+    #  QUERIES (served by the storage backend)
+    # ------------------------------------------------------------
+
+    def tree(self) -> dict:
+        """The full memory tree as nested dicts."""
+        with self.lock.read():
+            return self.backend.tree()
+
+    def thread_nodes(self, cycle_id: int) -> List[dict]:
+        """Subtrees rooted at nodes of cycle_id, depth-first order."""
+        with self.lock.read():
+            return self.backend.thread_nodes(cycle_id)
+
+    def sigil_nodes(self, min_priority: int = 1) -> List[dict]:
+        """Sigil-weighted nodes, highest priority first."""
+        with self.lock.read():
+            return self.backend.sigil_nodes(min_priority)
+
+    def node(self, node_id: str):
+        """Loop 1.26 — one node's fields, parent id and child count by id (None if unknown)."""
+        with self.lock.read():
+            return self.backend.node(node_id)
+
+    def path(self, node_id: str) -> List[dict]:
+        """Loop 1.26 — fields of the nodes from the root down to node_id ([] if unknown)."""
+        with self.lock.read():
+            return self.backend.path_to(node_id)
+
+    def query(self, expression) -> tuple:
+        """
+        Loop 1.25 — ([(depth, fields)], QueryStats) for a query
+        expression or ac_query.Query, in walk order. Resident trees
+        prune with the cached subtree summaries; other backends
+        filter a materialised tree().
+        """
+        query = parse(expression) if isinstance(expression, str) else expression
+        stats = QueryStats()
+        with self.lock.read():
+            if self.backend.resident:
+                root, index = self.root, self.summaries
+            else:
+                root, index = self.backend.tree(), None
+            matches = [(depth, fields(node)) for depth, node in select(root, query, index, stats)]
+        return matches, stats
+
+    # ------------------------------------------------------------
+    #  SNAPSHOTS (Loop 1.15)
+    # ------------------------------------------------------------
+
+    def snapshot(self):
+        """
+        Immutable, structurally shared view of the tree (ac_persistent).
+        Amortised O(1): only subtrees appended since the previous
+        snapshot are frozen. Non-resident backends build one from
+        tree(), which is O(n).
+        """
+        from ac_persistent import PNode, TreeSnapshot
+
+        with self.lock.read():
+            if not self.backend.resident:
+                return TreeSnapshot(PNode.from_dict(self.backend.tree()),
+                                    self.memory_hash, self.version)
+
+            with self._freeze_lock:
+                frozen, source = self._frozen
+                root = self.root
+                known = len(frozen.children) if frozen is not None else 0
+                if frozen is None or source is not root or known > len(root.children):
+                    frozen = PNode.freeze(root)
+                elif known < len(root.children):
+                    frozen = frozen.append_children(
+                        PNode.freeze(c) for c in root.children[known:])
+                self._frozen = (frozen, root)
+            return TreeSnapshot(frozen, self.memory_hash, self.version)
+
+    # ------------------------------------------------------------
+    #  SYNC (Loop 1.9)
+    # ------------------------------------------------------------
+
+    def diff_against(self, other) -> dict:
+        """Patch turning this memory into other (memory, snapshot, dict tree or mapped file)."""
+        import ac_sync
+        if isinstance(other, ArcMemorySystem):
+            other = other.snapshot()
+        return ac_sync.diff(self.snapshot(), other)
+
+    def apply_patch(self, patch: dict):
+        """Applies an ac_sync patch and recomputes the memory hash."""
+        import ac_sync
+        with self.lock.write():
+            tree = ac_sync.apply_patch(self.tree(), patch)
+            self.backend.replace_tree(tree)
+            self.memory_hash = self.guardian.compute_memory_tree_hash(tree)
+            self.version += 1
 
     # ============================================================
     #  SAVE MEMORY (with integrity stamps)
     # ============================================================
 
-    def save_memory(self, filename="arccore_memory.json"):
-        tree = self.root.to_dict()
+    @traced("save")
+    def save_memory(self, filename=None, format="json", compression=None, quiet=False):
+        """
+        Persists the tree with integrity stamps through the backend.
+        The in-memory backend writes a memory file (default
+        arccore_memory.json); format="bin" selects ACMB, with optional
+        "zlib" or "lzma" section compression. The SQLite backend
+        commits to its database unless a filename is given.
+        quiet skips the summary lines (Loop 1.29 pool evictions).
+        """
+        # Loop 1.15 — written from a snapshot, so ingest is not
+        # blocked for the duration of the export
+        snapshot = self.snapshot()
+        memory_hash = snapshot.hash()
+        with self.lock.read():
+            if self.memory_hash is None and self.version == snapshot.version:
+                self.memory_hash = memory_hash
 
         integrity_block = {
             "kernel_hash": self.kernel_hash,
-            "memory_hash": self.memory_hash,
+            "memory_hash": memory_hash,
             "guardian": self.guardian.guardian_name,
             "identity_key": self.guardian.identity_key,
             "timestamp": datetime.now().isoformat()
         }
 
-        payload = {
-            "integrity": integrity_block,
-            "tree": tree
-        }
+        target = self.backend.write(filename, integrity_block, format, compression,
+                                    snapshot=snapshot)
+        if quiet:
+            return
 
-        with open(filename, 'w') as f:
-            json.dump(payload, f, indent=2)
+        print(f"[ArcCore] Memory + Integrity saved → {target}")
+        print(f"[ArcCore] Content table: {self.content.describe()}")
+
+    # ============================================================
+    #  READ MEMORY (format auto-detection)
+    # ============================================================
 
-        print(f"[ArcCore] Memory + Integrity saved → {filename}")
+    @traced("load.read")
+    def read_memory(self, filename=None):
+        """
+        Reads a saved memory in any supported format and returns
+        {"integrity": ..., "tree": ...} with all string refs resolved.
+        """
+        return self.backend.read(filename)
 
     # ============================================================
-    #  LOAD + INJECT (with verification) — Loop 1.1 Hardened
+    #  OPEN MAPPED (Loop 1.7 random access)
     # ============================================================
 
-    def load_and_inject(self, filename="arccore_memory.json"):
-        with open(filename, 'r') as f:
-            payload = json.load(f)
+    def open_mapped(self, filename):
+        """
+        Opens an uncompressed ACMB file with mmap for lazy, indexed
+        access. Returns None if the file cannot be mapped (JSON or
+        compressed ACMB); use read_memory() for those.
+        """
+        import ac_binary
+        from ac_mmap import MappedMemory
+
+        if not ac_binary.is_binary(filename):
+            return None
+        try:
+            return MappedMemory(filename)
+        except ac_binary.FormatError:
+            return None
+
+    # ============================================================
+    #  LOAD + INJECT (with verification) — Loop 1.1 Hardened
+    # ============================================================
 
-        integrity = payload.get("integrity", {})
-        tree = payload.get("tree", {})
+    @traced("load")
+    def load_and_inject(self, filename=None):
+        filename = self.backend.resolve(filename)
+        mapped = self.open_mapped(filename) if filename is not None else None
+        report = None
+
+        if mapped is not None:
+            # Loop 1.10 — verify segments in place before trusting the map
+            report = mapped.verify()
+            if report is not None and not report.ok:
+                mapped.close()
+                mapped = None
+
+        if mapped is not None:
+            # Loop 1.7 — records decode lazily as the walk reaches them
+            integrity = mapped.integrity()
+            tree = mapped.root
+        else:
+            # Loop 1.10 — damaged segments come back as placeholders
+            payload = self.read_memory(filename)
+            integrity = payload["integrity"]
+            tree = payload["tree"]
+            report = payload.get("verification")
 
         stored_kernel = integrity.get("kernel_hash")
         stored_mem = integrity.get("memory_hash")
 
-        ok, msg = self.guardian.verify_integrity(stored_kernel, stored_mem)
+        ok, msg = self.guardian.verify_loaded(stored_kernel, stored_mem, tree, report)
         status = "OK" if ok else f"WARNING — {msg}"
 
-        buffer = [f"[Integrity: {status}]"]
+        try:
+            return self.render_walk(tree, f"[Integrity: {status}]")
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+    # ============================================================
+    #  WALK (Loop 1.12 — live tree, no disk round trip)
+    # ============================================================
+
+    def walk(self) -> str:
+        """Renders the live memory tree in the load_and_inject format."""
+        return self.render_walk(self.tree(), "[Integrity: LIVE — in-memory tree]")
+
+    @traced("load.restore")
+    def restore(self, filename=None):
+        """
+        Replaces the live tree with a saved memory (any format).
+        Returns the loader's VerificationReport (None if unchecked).
+        """
+        payload = self.read_memory(filename)
+        with self.lock.write():
+            self.backend.replace_tree(payload["tree"])
+            self.version += 1
+        return payload.get("verification")
+
+    def render_walk(self, tree, header: str) -> str:
+        """Indented sigil walk of any .get()-able tree (dicts or mapped nodes)."""
+        return "\n".join(self.iter_walk(tree, header))
+
+    def iter_walk(self, tree, header: str) -> Iterator[str]:
+        """render_walk() one line at a time (Loop 1.24 pager)."""
+        yield header
 
         max_depth = 50
-        visited = set()
+        # Loop 1.26 — ids of the nodes being descended into: a node
+        # that is its own ancestor is a cycle; equal ids in separate
+        # branches (legacy 32-bit ids) are both shown
+        ancestors = []
 
         MARKER_HIGH = sys.intern("💠")
         MARKER_LOW  = sys.intern("•")
 
-        def walk(node, depth=0):
+        # One child iterator per level: memory follows depth, not fan-out
+        stack = [iter((tree,))]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                if ancestors:
+                    ancestors.pop()
+                continue
+            depth = len(stack) - 1
             indent = "  " * depth
             node_id = node.get("id")
             node_key = node_id if node_id is not None else id(node)
 
-            if node_key in visited:
+            if node_key in ancestors:
                 warning = f"Cycle detected at node {node_key}; skipping children"
-                buffer.append(f"{indent}[{warning}]")
-                return
-
-            visited.add(node_key)
+                yield f"{indent}[{warning}]"
+                continue
 
             seed = node.get("seed") or node.get("content")
             cycle = node.get("cycle")
@@ -212,17 +534,32 @@ class ArcMemorySystem:
             priority = node.get("priority", 0)
 
             marker = MARKER_HIGH if priority >= 3 else MARKER_LOW
-            buffer.append(f"{indent}{marker} [AC-{cycle}] {role}: {seed}")
+            yield f"{indent}{marker} [AC-{cycle}] {role}: {seed}"
 
             if depth >= max_depth:
-                buffer.append(f"{indent}[Traversal halted: depth limit {max_depth} reached]")
-                return
+                yield f"{indent}[Traversal halted: depth limit {max_depth} reached]"
+                continue
+
+            ancestors.append(node_key)
+            stack.append(iter(node.get("children", [])))
 
-            for child in node.get("children", []):
-                walk(child, depth + 1)
+    # ------------------------------------------------------------
+    #  LAZY READS (Loop 1.24)
+    # ------------------------------------------------------------
 
-        walk(tree)
-        return "\n".join(buffer)
+    def view(self):
+        """
+        Root for lazy readers: the snapshot() root, which later
+        writes leave untouched, so lines pulled at any pace (and
+        pulled again) come from one version of the tree.
+        """
+        return self.snapshot().root
+
+    def iter_thread(self, cycle_id: int, root=None) -> Iterator:
+        """thread_nodes() as a generator over view() (or root): subtrees rooted at cycle_id."""
+        for _, node in select(root if root is not None else self.view(),
+                              Query([("cycle", "=", cycle_id)])):
+            yield node
 
 
 # ============================================================
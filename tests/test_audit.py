@@ -0,0 +1,157 @@
+# ============================================================
+# ARC CORE — AUDIT LOG TEST
+# Loop 1.21 — Guardian Decisions: Levels, Group Commit, Index
+# ============================================================
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import ac_audit
+import ac_authority_defaults as defaults
+from ac_audit import AuditLog
+from ac_interpreter import ArcInterpreter
+from arc_guardian import ArcGuardian
+from arc_prime import ArcMemorySystem
+
+
+def run_test():
+    print("\n=== ArcCore Audit Test (Loop 1.21) ===\n")
+
+    # Levels are cumulative; allowed READ is never recorded
+    assert ac_audit.wanted_pairs("OFF") == frozenset()
+    assert ("GOVERN", True) in ac_audit.wanted_pairs("GOVERN")
+    assert ("MARK", True) not in ac_audit.wanted_pairs("GOVERN")
+    assert ("WRITE", False) in ac_audit.wanted_pairs("ALL_DENY")
+    assert ("WRITE", True) not in ac_audit.wanted_pairs("ALL_DENY")
+    assert ("WRITE", True) in ac_audit.wanted_pairs("FULL")
+    assert ("READ", True) not in ac_audit.wanted_pairs("FULL")
+    for lower, higher in zip(ac_audit.LEVELS, ac_audit.LEVELS[1:]):
+        assert ac_audit.wanted_pairs(lower) <= ac_audit.wanted_pairs(higher)
+    print("[OK] Audit levels are cumulative")
+
+    # Guardian denials are recorded in memory by default, without content
+    guardian = ArcGuardian()
+    guardian.audit = AuditLog()
+    mem = ArcMemorySystem(guardian=guardian)
+    mem.ingest_interaction("Allowed exchange", "Reply", 2)
+    assert guardian.audit.tail() == []
+    try:
+        mem.ingest_interaction("Secret text", "Reply", 5000)
+        raise AssertionError("cycle 5000 should be rejected")
+    except RuntimeError:
+        pass
+    record, ai_record = guardian.audit.tail(2)
+    assert ai_record["action"] == "gate:ai"
+    assert record["operation"] == "WRITE" and not record["allowed"]
+    assert record["reason"] == "Invalid cycle range" and record["cycle_context"] == 5000
+    assert record["action"] == "gate:user" and record["target_node_id"]
+    assert record["required_authority"] == 1 and record["actor_authority"] == 1
+    assert "Secret" not in str(record)
+    print("[OK] Gate denial recorded without content")
+
+    workdir = tempfile.mkdtemp()
+    try:
+        # Disk sink: batched group commits, rotation, pruning
+        log = AuditLog(workdir, level="FULL", batch_size=64, segment_bytes=8 << 10, max_segments=3)
+        for k in range(2000):
+            log.record("WRITE", k % 10 != 0, "OK" if k % 10 else "Too many children for node",
+                       action="gate:user", target_node_id=f"n{k}", cycle_context=k % 50)
+        log.flush()
+        assert log.written == 2000
+        assert log.groups < 2000
+        segments = sorted(n for n in os.listdir(workdir) if n.endswith(".log"))
+        assert len(segments) == 3, segments
+        print(f"[OK] {log.written} records in {log.groups} group commits, {len(segments)} segments kept")
+
+        # Indexed query: newest first, all filters applied
+        hits = log.why(action="gate:user", cycle=30)
+        assert hits and all(h["cycle_context"] == 30 and not h["allowed"] for h in hits)
+        assert [h["seq"] for h in hits] == sorted((h["seq"] for h in hits), reverse=True)
+        assert log.why(node="n1990", allowed=None)[0]["seq"] == 1991
+        assert log.why(node="n0", allowed=None) == []  # pruned
+        assert log.why(action="sync") == []
+        log.record("GOVERN", False, "Insufficient authority", action="collapse", cycle_context=7)
+        assert log.why(action="collapse")[0]["reason"] == "Insufficient authority"
+        log.close()
+
+        # A fresh log finds the segments again (the CLI path)
+        reopened = AuditLog(workdir)
+        assert reopened.why(action="collapse", cycle=7)[0]["operation"] == "GOVERN"
+        reopened.close()
+        print("[OK] why() answers from the index, also after reopening")
+
+        # Writers sharing a directory: one log per process, correct offsets across processes
+        shared_dir = os.path.join(workdir, "shared")
+        first, second = AuditLog(shared_dir), AuditLog(shared_dir)
+        for k in range(200):
+            (first if k % 2 else second).record("WRITE", False, "Invalid cycle range", cycle_context=k)
+        for log in (first, second):
+            log.close()
+        src = os.path.dirname(ac_audit.__file__)
+        writer = ("import sys; from ac_audit import AuditLog\n"
+                  "log = AuditLog(sys.argv[1], segment_bytes=16 << 10, batch_size=8)\n"
+                  "base = int(sys.argv[2])\n"
+                  "for k in range(400):\n"
+                  "    log.record('WRITE', k % 4 == 0, 'Checked', cycle_context=base + k)\n"
+                  "log.close()\n")
+        env = dict(os.environ, PYTHONPATH=src)
+        workers = [subprocess.Popen([sys.executable, "-c", writer, shared_dir, str(1000 * (w + 1))],
+                                    env=env) for w in range(4)]
+        assert all(worker.wait() == 0 for worker in workers)
+        reader = AuditLog(shared_dir, max_segments=1000)
+        for cycle in list(range(200)) + [1000 * (w + 1) + k for w in range(4) for k in range(400) if k % 4]:
+            hits = reader.why(cycle=cycle)
+            assert [h["cycle_context"] for h in hits] == [cycle], (cycle, hits)
+        assert len(reader.why(limit=10000)) == 200 + 4 * 300
+        reader.close()
+        os.environ[ac_audit.AUDIT_DIR_ENV] = shared_dir
+        try:
+            assert AuditLog.from_env() is AuditLog.from_env() is ArcGuardian().audit
+        finally:
+            del os.environ[ac_audit.AUDIT_DIR_ENV]
+            AuditLog.from_env().close()
+        print("[OK] Two logs and four processes on one directory: every denial found by cycle")
+
+        # A short-lived process keeps its denial (ac_batch, then exit)
+        batch_dir = os.path.join(workdir, "batch")
+        script = os.path.join(workdir, "deny.arc")
+        with open(script, "w") as f:
+            f.write("collapse\n")
+        env = dict(os.environ, ARCCORE_AUDIT_DIR=batch_dir, PYTHONPATH=src)
+        done = subprocess.run([sys.executable, os.path.join(src, "ac_batch.py"), script, "--quiet"],
+                              env=env, cwd=workdir, stdout=subprocess.DEVNULL)
+        assert done.returncode == 1  # one denied command
+        exited = AuditLog(batch_dir)
+        assert exited.why(action="collapse")[0]["operation"] == "GOVERN"
+        exited.close()
+        print("[OK] Denial from a batch process on disk after exit")
+    finally:
+        shutil.rmtree(workdir)
+
+    # Shell: gate_text denials and the audit command
+    shell = ArcInterpreter()
+    shell.guardian.audit = shell.sentinel.audit = AuditLog()
+    out = shell.execute("inject [redacted] payload")
+    out = shell.execute("audit why inject")
+    assert "DENIED inject" in out and "payload" not in out, out
+    assert "[Sentinel]" in shell.execute("audit level OFF")  # GOVERN
+    shell.authority = defaults.STRUCTURAL
+    print(shell.execute("audit level FULL"))
+    shell.authority = defaults.INTERACTION
+    shell.execute("inject Hello")
+    assert "WRITE allowed inject" in shell.execute("audit why inject allowed")
+    assert "[Sentinel]" in shell.execute("collapse")
+    assert "GOVERN DENIED collapse" in shell.execute("audit why collapse")
+    shell.authority = defaults.STRUCTURAL
+    assert "Unknown audit level" in shell.execute("audit level LOUD")
+    print(shell.execute("audit stats"))
+    print("[OK] audit command")
+
+    print("\n=== Audit Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
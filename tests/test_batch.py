@@ -0,0 +1,120 @@
+# ============================================================
+# ARC CORE — BATCH RUNNER TEST
+# Loop 1.23 — Headless Scripts, JSON Lines, Stop on Error
+# ============================================================
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+import ac_authority_defaults as defaults
+import ac_batch
+from ac_batch import BatchRunner
+from ac_interpreter import ArcInterpreter
+
+SCRIPT = """\
+# nightly ingest
+inject First scripted message
+
+cycle 4
+inject Second scripted message
+collapse
+thread 1
+bogus
+summary
+"""
+
+
+def run_test():
+    print("\n=== ArcCore Batch Runner Test (Loop 1.23) ===\n")
+
+    # Text output, comments and blanks skipped, failures counted
+    out = io.StringIO()
+    runner = BatchRunner(out=out)
+    summary = runner.run(SCRIPT.splitlines())
+    assert summary["commands"] == 7, summary
+    assert (summary["ok"], summary["error"], summary["denied"]) == (5, 1, 1), summary
+    assert not summary["stopped"] and runner.cycle == 4
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "[inject] Message injected."
+    assert "[SYSTEM] Context shifted to Cycle 4" in lines
+    print("[OK] Script ran with one warm interpreter")
+
+    # JSON lines with timing; stop at the first failure
+    out = io.StringIO()
+    summary = BatchRunner(json_lines=True, stop_on_error=True, out=out).run(SCRIPT.splitlines())
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert summary["stopped"] and summary["commands"] == 4
+    assert [r["status"] for r in records] == ["ok", "ok", "ok", "denied"]
+    assert records[3]["command"] == "collapse" and records[3]["line"] == 6
+    assert all(r["ms"] >= 0 for r in records)
+    print("[OK] JSON lines with per-command timing; stop on error")
+
+    # Status comes from the interpreter, not from the reply text
+    quoting = BatchRunner(out=io.StringIO())
+    summary = quoting.run(["inject [disk] Error: quota reached", "walk", "summary"])
+    assert (summary["ok"], summary["error"]) == (3, 0), summary
+    failures = ["thread abc", "query (((", "inject", "show", "path a b", "echo loud",
+                "footprint wide", "audit level LOUD", "sentinel judge", "sync apply /nonexistent",
+                "inspect /nonexistent id x", "show no-such-id", "bogus", "cycle x"]
+    out = io.StringIO()
+    summary = BatchRunner(ArcInterpreter(authority=defaults.STRUCTURAL), json_lines=True,
+                          out=out).run(failures)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["status"] for r in records] == ["error"] * len(failures), records
+    assert records[0]["output"] == "[thread] Invalid cycle ID."
+    out = io.StringIO()
+    summary = BatchRunner(stop_on_error=True, out=out).run(["thread abc", "inject never"])
+    assert summary["stopped"] and summary["commands"] == 1
+    shell = ArcInterpreter()
+    assert shell.execute_status("thread 1") == ("ok", shell.execute("thread 1"))
+    assert shell.execute_status("collapse")[0] == "denied"
+    assert ac_batch.classify("[walk] Error: broken tree") == "error"
+    assert ac_batch.classify("[AC-3] USER: [disk] Error: quota reached") == "ok"
+    print(f"[OK] {len(failures)} failing commands reported as errors; quoted text is not one")
+
+    # The tree hash is deferred during the run and correct afterwards
+    shell = ArcInterpreter()
+    runner = BatchRunner(shell, out=io.StringIO())
+    runner.run(["inject one", "inject two", "exit", "inject never"])
+    assert shell.memory.hash_on_write
+    assert len(shell.memory.root.children) == 2
+    assert shell.memory.memory_hash == shell.guardian.hash_memory_tree(shell.memory.tree())
+    print("[OK] exit ends the run; hash computed once at the end")
+
+    # 10k commands take seconds
+    commands = [f"inject Scripted message {k}" for k in range(10000)]
+    start = time.perf_counter()
+    summary = BatchRunner(json_lines=True, out=io.StringIO()).run(commands)
+    elapsed = time.perf_counter() - start
+    assert summary["ok"] == 10000
+    assert elapsed < 30, elapsed
+    print(f"[OK] 10,000 commands in {elapsed:.2f}s")
+
+    # CLI: script file, exit status
+    fd, path = tempfile.mkstemp(suffix=".arc")
+    with os.fdopen(fd, "w") as f:
+        f.write("inject From a file\nsummary\n")
+    try:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = ac_batch.main([path, "--json"])
+        assert code == 0 and "2 commands: 2 ok" in stderr.getvalue(), stderr.getvalue()
+        assert len(stdout.getvalue().splitlines()) == 2
+        with open(path, "a") as f:
+            f.write("collapse\n")
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            assert ac_batch.main([path, "--quiet"]) == 1
+            assert ac_batch.main([path, "--quiet", "--authority", "7"]) == 0
+    finally:
+        os.remove(path)
+    print("[OK] CLI exit status reflects failures")
+
+    print("\n=== Batch Runner Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,96 @@
+# ============================================================
+# ARC CORE — CONCURRENCY STRESS TEST
+# Loop 1.14 — Reader/Writer Locking under Parallel Ingest
+# ============================================================
+
+import threading
+
+from arc_prime import ArcMemorySystem
+from arc_guardian import ArcGuardian
+from ac_reconstruct import ArcReconstruct
+
+WRITERS = 6
+READERS = 6
+PER_WRITER = 120
+
+
+def run_test():
+    print("\n=== ArcCore Concurrency Stress Test (Loop 1.14) ===\n")
+
+    mem = ArcMemorySystem()
+    engine = ArcReconstruct()
+    errors = []
+    checks = {"hash": 0, "reads": 0}
+    done = threading.Event()
+
+    def writer(w):
+        try:
+            for k in range(PER_WRITER):
+                text = f"Writer {w} message {k} 💠" if k % 10 == 0 else f"Writer {w} message {k}"
+                mem.ingest_interaction(text, f"Reply {w}/{k}", cycle_context=w + 2)
+        except Exception as e:
+            errors.append(("writer", repr(e)))
+
+    def reader(r):
+        try:
+            while not done.is_set():
+                # A consistent view: tree and hash taken under one read lock
+                with mem.lock.read():
+                    tree = mem.tree()
+                    stamped = mem.memory_hash
+                if stamped is not None:
+                    assert ArcGuardian.hash_memory_tree(tree) == stamped, "torn hash"
+                    checks["hash"] += 1
+
+                for node in tree["children"]:
+                    assert len(node["children"]) == 1, "half-attached exchange"
+
+                engine.reconstruct_full(mem.tree())
+                for node in mem.thread_nodes(r % WRITERS + 2):
+                    engine.reconstruct_node(node)
+                mem.sigil_nodes(3)
+                checks["reads"] += 1
+        except Exception as e:
+            errors.append(("reader", repr(e)))
+
+    writers = [threading.Thread(target=writer, args=(w,)) for w in range(WRITERS)]
+    readers = [threading.Thread(target=reader, args=(r,)) for r in range(READERS)]
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join()
+    done.set()
+    for t in readers:
+        t.join()
+
+    assert not errors, errors[:3]
+    print(f"[OK] {checks['reads']} concurrent reads, {checks['hash']} hash checks, no errors.")
+
+    tree = mem.tree()
+    assert len(tree["children"]) == WRITERS * PER_WRITER
+    assert mem.refresh_hash() == ArcGuardian.hash_memory_tree(tree)
+    for w in range(WRITERS):
+        assert len(mem.thread_nodes(w + 2)) == 2 * PER_WRITER
+    print(f"[OK] All {WRITERS * PER_WRITER} exchanges attached; hash matches final tree.")
+
+    stats = mem.content.stats()
+    # Root content + (user content, ai content) per exchange; seeds are records (Loop 1.28)
+    assert stats["references"] == 1 + 2 * WRITERS * PER_WRITER, stats
+    print(f"[OK] Content table consistent: {mem.content.describe()}")
+
+    # Nested locking rules
+    with mem.lock.write():
+        mem.tree()                       # a writer may read
+    with mem.lock.read():
+        try:
+            mem.lock.acquire_write()
+            raise AssertionError("upgrade should fail")
+        except RuntimeError:
+            pass
+    print("[OK] Re-entrant reads, no read→write upgrade.")
+
+    print("\n=== Concurrency Stress Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
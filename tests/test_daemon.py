@@ -0,0 +1,104 @@
+# ============================================================
+# ARC CORE — DAEMON TEST
+# Loop 1.12 — Shared Memory Daemon over a Unix Socket
+# ============================================================
+
+import os
+import tempfile
+import threading
+import time
+
+import ac_authority_defaults as defaults
+from ac_daemon import ArcClient, ArcDaemon
+from ac_interpreter import ArcInterpreter
+
+
+def run_test():
+    print("\n=== ArcCore Daemon Test (Loop 1.12) ===\n")
+
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, "arccore.sock")
+
+    daemon = ArcDaemon(path)
+    umask = os.umask(0o022)
+    daemon.bind()
+    assert os.stat(path).st_mode & 0o777 == 0o600 and os.umask(umask) == 0o022
+    server = threading.Thread(target=daemon.serve_forever, daemon=True)
+    server.start()
+
+    # ------------------------------------------------------------
+    # 1. Two clients share one live tree
+    # ------------------------------------------------------------
+
+    with ArcClient(path) as a, ArcClient(path) as b:
+        assert a.execute("inject 💠 Shared decision about the daemon").startswith("[inject]")
+        assert b.execute("inject Second operator note").startswith("[inject]")
+
+        walk = a.execute("walk")
+        assert walk.startswith("[Integrity: LIVE")
+        assert "Shared decision" in walk and "Second operator" in walk
+        print("[OK] Both clients see the same tree.")
+
+        assert "Unknown command" in b.execute("bogus")
+        assert b.execute_status("thread abc") == ("error", "[thread] Invalid cycle ID.")
+        assert b.execute_status("collapse")[0] == "denied"
+        assert b.execute_status("dedup")[0] == "ok"
+        assert b.request({"op": "nope"})["ok"] is False
+        print("[OK] Errors come back as responses.")
+
+        # ------------------------------------------------------------
+        # 2. Dispatch latency on a warm connection
+        # ------------------------------------------------------------
+
+        runs = 500
+        start = time.perf_counter()
+        for _ in range(runs):
+            a.ping()
+        per_call = (time.perf_counter() - start) / runs * 1000
+        print(f"[OK] Round trip: {per_call:.3f} ms")
+        assert per_call < 5.0, per_call
+
+        # ------------------------------------------------------------
+        # 3. Concurrent clients
+        # ------------------------------------------------------------
+
+        def writer(n):
+            with ArcClient(path) as c:
+                for k in range(20):
+                    c.execute(f"inject worker {n} message {k}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        count = len(daemon.interpreter.memory.tree()["children"])
+        assert count == 2 + 4 * 20, count
+        print(f"[OK] {count} interactions after concurrent writes.")
+
+        # ------------------------------------------------------------
+        # 4. Only the owner (or GOVERN authority) stops the daemon
+        # ------------------------------------------------------------
+
+        stranger = daemon.dispatch({"op": "shutdown"}, peer_uid=os.getuid() + 1)
+        assert not stranger["ok"] and "GOVERN denied" in stranger["error"], stranger
+        assert "GOVERN denied" in daemon.dispatch({"op": "shutdown"})["error"]  # no peer credentials
+        assert a.ping()
+        governor = ArcDaemon(os.path.join(workdir, "unused.sock"),
+                             interpreter=ArcInterpreter(authority=defaults.STRUCTURAL))
+        assert governor._shutdown_refusal(os.getuid() + 1) is None
+        print("[OK] Shutdown refused to other uids below GOVERN authority.")
+
+        print(a.shutdown())
+
+    server.join(timeout=5)
+    assert not server.is_alive()
+    assert not os.path.exists(path)
+    os.rmdir(workdir)
+
+    print("\n=== Daemon Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
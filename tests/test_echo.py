@@ -0,0 +1,59 @@
+# ============================================================
+# ARC CORE — ECHO RING TEST
+# Loop 1.17 — Bounded Ring, Segment Spill, Streaming Export
+# ============================================================
+
+import os
+import shutil
+import tempfile
+
+from ac_echo import ArcEcho
+
+
+def run_test():
+    print("\n=== ArcCore Echo Ring Test (Loop 1.17) ===\n")
+
+    # Without a spill directory the ring stays bounded
+    echo = ArcEcho(capacity=8, segment=4)
+    entries = [echo.pulse(f"signal {k}", intensity=k % 3) for k in range(20)]
+    assert len(echo) <= 8 and echo.dropped == 20 - len(echo)
+    assert echo.reflect(3) == entries[-3:]
+    assert echo.reflect(100) == entries[-len(echo):]
+    assert len({e["id"] for e in entries}) == 20 and all(len(e["id"]) == 12 for e in entries)
+    print(f"[OK] Ring bounded at capacity 8 ({echo.dropped} dropped), reflect is tail-exact")
+
+    # With a spill directory full segments rotate through NDJSON files
+    spill = tempfile.mkdtemp(prefix="arc_echo_")
+    try:
+        echo = ArcEcho(capacity=10, segment=5, spill_dir=spill, max_segments=3)
+        entries = [echo.pulse(f"signal {k}", source="test") for k in range(40)]
+        files = sorted(os.listdir(spill))
+        assert len(files) == 3 and all(f.endswith(".ndjson") for f in files), files
+        exported = list(echo.export())
+        assert exported == entries[-len(exported):]
+        assert len(exported) == len(echo) == 40 - echo.dropped
+        print(f"[OK] Spilled to {len(files)} rotating segments; export streams {len(exported)} in order")
+
+        # A new instance on the same directory picks up the segments
+        again = ArcEcho(capacity=10, segment=5, spill_dir=spill, max_segments=3)
+        assert list(again.export()) == exported[:15]
+        print("[OK] Segments survive restart")
+
+        # Pulses during export don't disturb the stream
+        stream = echo.export()
+        first = next(stream)
+        echo.pulse("late")
+        assert [first] + list(stream) == exported
+        print("[OK] export() is stable against concurrent pulses")
+
+        echo.clear()
+        assert not os.listdir(spill) and len(echo) == 0
+        print("[OK] clear() removes spilled segments")
+    finally:
+        shutil.rmtree(spill, ignore_errors=True)
+
+    print("\n=== Echo Ring Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
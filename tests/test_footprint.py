@@ -0,0 +1,96 @@
+# ============================================================
+# ARC CORE — FOOTPRINT PROFILER TEST
+# Loop 1.19 — Bytes by Level / Cycle / Role / Priority, Budget
+# ============================================================
+
+import os
+
+import ac_authority_defaults as defaults
+import ac_footprint
+from ac_echo import ECHO
+from ac_interpreter import ArcInterpreter
+from ac_storage import SQLiteBackend
+from arc_prime import ArcMemorySystem
+
+DB_FILE = "test_footprint.db"
+
+
+def run_test():
+    print("\n=== ArcCore Footprint Test (Loop 1.19) ===\n")
+
+    assert ac_footprint.parse_size("64MB") == 64 << 20
+    assert ac_footprint.parse_size("512k") == 512 << 10
+    assert ac_footprint.parse_size("off") is None
+    try:
+        ac_footprint.parse_size("lots")
+        raise AssertionError("bad size should raise")
+    except ValueError:
+        pass
+    print("[OK] Budget sizes parse")
+
+    shell = ArcInterpreter(authority=defaults.MARKING)  # footprint budget is MARK
+    mem = shell.memory
+    for k in range(60):
+        user = f"Question {k} about the export format" + (" 💠" if k % 10 == 0 else "")
+        mem.ingest_interaction(user, "Acknowledged. Stability is found through structured descent.",
+                               2 + k % 4)
+
+    report = ac_footprint.analyze(mem, budget=None)
+    t = report.totals
+    assert t["nodes"] == 121
+    assert t["total"] == t["content"] + t["seed"] + t["structure"] > 0
+    for dimension in ac_footprint.DIMENSIONS:
+        groups = report.groups[dimension]
+        assert sum(g["nodes"] for g in groups.values()) == t["nodes"], dimension
+        assert sum(g["total"] for g in groups.values()) == t["total"], dimension
+    assert set(report.groups["role"]) == {"system", "user", "ai"}
+    assert set(report.groups["cycle"]) == {1, 2, 3, 4, 5}
+    assert report.groups["priority"][3]["nodes"] == 6
+    assert set(report.groups["level"]) <= {"RAW", "SEED"}
+    assert ac_footprint.tree_bytes(mem.root) == t["total"]
+    print(f"[OK] Breakdowns sum to totals: {report.describe()}")
+
+    # The repeated AI reply is stored once by the content table
+    assert t["shared"] > 0
+    ai = report.groups["role"]["ai"]
+    assert ai["content"] < report.groups["role"]["user"]["content"]
+    print(f"[OK] Shared strings charged once ({ac_footprint.format_bytes(t['shared'])} saved)")
+
+    # Dict trees (loaded files, non-resident backends) are measured the same way
+    as_dict = ac_footprint.analyze_tree(mem.tree())
+    assert as_dict.totals["nodes"] == t["nodes"]
+    assert as_dict.groups["role"].keys() == report.groups["role"].keys()
+    if os.path.exists(DB_FILE):
+        os.remove(DB_FILE)
+    try:
+        sql = ArcMemorySystem(backend=SQLiteBackend(DB_FILE))
+        sql.ingest_interaction("Stored in SQLite", "Reply", 7)
+        sql_report = ac_footprint.analyze(sql)
+        assert sql_report.source == "materialised" and sql_report.totals["nodes"] == 3
+        sql.backend.close()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_FILE + suffix):
+                os.remove(DB_FILE + suffix)
+    print("[OK] Dict trees and the SQLite backend are measured too")
+
+    traced = ac_footprint.analyze(mem, traced=True).traced
+    assert traced["mode"] == "rebuild" and traced["bytes"] > 0
+    print(f"[OK] tracemalloc rebuild: {ac_footprint.format_bytes(traced['bytes'])}")
+
+    # Budget: warning in the command output and an echo in the ring
+    print(shell.execute("footprint budget 4KB"))
+    out = shell.execute("footprint role")
+    assert "Memory budget exceeded" in out and "% of 4.0 KiB budget" in out, out
+    assert any(e["source"] == "footprint" for e in ECHO.reflect(3))
+    print(shell.execute("footprint budget off"))
+    out = shell.execute("footprint cycle top 2")
+    assert "exceeded" not in out and "... 3 more" in out, out
+    print(out)
+    print("[OK] footprint command and budget warning")
+
+    print("\n=== Footprint Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
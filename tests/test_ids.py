@@ -0,0 +1,135 @@
+# ============================================================
+# ARC CORE — NODE ID TEST
+# Loop 1.26 — 64-bit Ids, Id Index, show / path
+# ============================================================
+
+import os
+import tempfile
+import time
+
+from ac_ids import NODE_IDS, IdAllocator
+from ac_interpreter import ArcInterpreter
+from ac_storage import SQLiteBackend
+from arc_prime import ArcMemorySystem, HarmonicNode
+
+
+def build(exchanges: int) -> ArcMemorySystem:
+    mem = ArcMemorySystem()
+    mem.hash_on_write = False
+    for k in range(exchanges):
+        mem.ingest_interaction(f"Question {k}", f"Answer {k}", 2 + k % 100)
+    return mem
+
+
+def timed_lookups(mem: ArcMemorySystem, node_id: str, rounds: int = 2000) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        mem.node(node_id)
+        mem.path(node_id)
+    return (time.perf_counter() - start) / rounds
+
+
+def run_test():
+    print("\n=== ArcCore Node Id Test (Loop 1.26) ===\n")
+
+    # Allocation: 64-bit, never repeated within a process
+    ids = [NODE_IDS.next() for _ in range(200000)]
+    assert len(set(ids)) == len(ids) and all(len(i) == 16 for i in ids)
+    assert int(ids[0], 16) >> 32 == int(ids[-1], 16) >> 32
+    other = IdAllocator()
+    assert other.next() != NODE_IDS.next()
+    assert len(HarmonicNode("user", "x").id) == 16
+    print("[OK] 200,000 ids, all distinct, 16 hex digits")
+
+    # The index follows ingest and batch attach
+    mem = build(500)
+    index = mem.backend.index
+    assert len(index) == 1001
+    batch = [mem.prepare_interaction(f"Batch {k}", "Reply", 7) for k in range(3)]
+    mem.ingest_prepared(batch)
+    assert len(index) == 1007 and index.parents[batch[2].children[0].id] == batch[2].id
+    print("[OK] Index maintained on ingest")
+
+    # show / path by id
+    target = mem.root.children[250].children[0]
+    node = mem.node(target.id)
+    assert node["content"] == "Answer 250" and node["parent"] == mem.root.children[250].id
+    assert node["child_count"] == 0 and mem.node("0000000000000000") is None
+    chain = mem.path(target.id)
+    assert [n["id"] for n in chain] == [mem.root.id, mem.root.children[250].id, target.id]
+    assert mem.path("missing") == []
+    shell = ArcInterpreter()
+    shell.memory = mem
+    assert shell.execute(f"show {target.id}").startswith(f"[show] {target.id} — AI, cycle 52")
+    lines = shell.execute(f"path {target.id}").splitlines()
+    assert len(lines) == 3 and lines[2].endswith(f"({target.id})") and "USER: Question 250" in lines[1]
+    assert shell.execute("show nope") == "[show] No node with id nope."
+    print("[OK] show and path by id")
+
+    # Lookups do not grow with the tree
+    small_s = timed_lookups(mem, target.id)
+    large = build(50000)
+    deep = large.root.children[40000].children[0]
+    large_s = timed_lookups(large, deep.id)
+    assert large_s < small_s * 3 + 5e-6, (small_s, large_s)
+    print(f"[OK] show+path: {small_s * 1e6:.1f} µs on 1k nodes, {large_s * 1e6:.1f} µs on 100k nodes")
+
+    # A fresh node meeting an indexed id is given a new one
+    clash = HarmonicNode("user", "Clash", 3)
+    clash.id = target.id
+    mem.ingest_prepared([clash])
+    assert clash.id != target.id and mem.node(clash.id)["content"] == "Clash"
+    assert mem.node(target.id)["content"] == "Answer 250" and index.reallocated == 1
+    print("[OK] Colliding ids re-allocated on attach")
+
+    # Loaded legacy ids: duplicates no longer hide subtrees
+    legacy = {"id": "root0001", "role": "system", "cycle": 1, "content": "Root", "children": [
+        {"id": "dup00001", "role": "user", "cycle": 2, "content": "First", "children": []},
+        {"id": "dup00001", "role": "user", "cycle": 3, "content": "Second", "children": [
+            {"id": "kid00001", "role": "ai", "cycle": 3, "content": "Hidden before", "children": []}]},
+    ]}
+    restored = ArcMemorySystem()
+    restored.backend.replace_tree(legacy)
+    walk = restored.walk()
+    assert "Second" in walk and "Hidden before" in walk and "Cycle detected" not in walk
+    assert restored.backend.index.duplicates == 1
+    assert restored.node("dup00001")["content"] == "First"
+    assert [n["id"] for n in restored.path("kid00001")] == ["root0001", "dup00001", "kid00001"]
+    looped = {"id": "self", "role": "user", "cycle": 1, "content": "Loop"}
+    looped["children"] = [looped]
+    assert "Cycle detected at node self" in restored.render_walk(looped, "")
+    print("[OK] Loaded duplicates indexed once and still walked; real cycles still cut")
+
+    # Patches swap in a new tree: the index is rebuilt
+    source = build(5)
+    copy = ArcMemorySystem()
+    copy.backend.replace_tree(dict(source.tree(), children=[]))  # same root, no exchanges
+    copy.apply_patch(copy.diff_against(source))
+    leaf = source.root.children[4].children[0]
+    assert copy.node(leaf.id)["content"] == leaf.raw_content
+    assert len(copy.backend.index) == 11
+    print("[OK] Index rebuilt after sync")
+
+    # SQLite: the same commands through its id / parent indexes
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.remove(db_path)
+    try:
+        sq = ArcMemorySystem(backend=SQLiteBackend(db_path))
+        sq.ingest_interaction("Stored question", "Stored answer", 4)
+        user = sq.thread_nodes(4)[0]
+        answer = user["children"][0]
+        assert sq.node(user["id"])["child_count"] == 1
+        assert [n["id"] for n in sq.path(answer["id"])] == [sq.root.id, user["id"], answer["id"]]
+        sq.backend.close()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+    print("[OK] SQLite backend serves show and path")
+
+    print("\n=== Node Id Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
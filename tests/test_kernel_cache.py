@@ -0,0 +1,86 @@
+# ============================================================
+# ARC CORE — KERNEL HASH CACHE TEST
+# Loop 1.11 — Cache Hit, Invalidation on Edit, Same Digest
+# ============================================================
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+
+import arc_guardian
+import arc_prime
+from arc_guardian import ArcGuardian, cached_kernel_hash, kernel_cache_file
+
+
+def sha256_of(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return hashlib.sha256(f.read().encode()).hexdigest()
+
+
+def run_test():
+    print("\n=== ArcCore Kernel Hash Cache Test (Loop 1.11) ===\n")
+    workdir = tempfile.mkdtemp()
+    previous = os.environ.get(arc_guardian.KERNEL_CACHE_ENV)
+    os.environ[arc_guardian.KERNEL_CACHE_ENV] = os.path.join(workdir, "cache")
+    arc_guardian._kernel_hash_memo.clear()
+    try:
+        # Same value as hashing the source directly
+        kernel = arc_prime.__file__
+        digest = cached_kernel_hash(kernel)
+        assert digest == sha256_of(kernel)
+        assert digest == ArcGuardian().compute_kernel_hash(inspect.getsource(arc_prime))
+        assert kernel_cache_file().startswith(workdir) and os.path.exists(kernel_cache_file())
+        print("[OK] Cached digest equals sha256 of the kernel source")
+
+        # Hit: served from the cache file while mtime and size are unchanged
+        copy = os.path.join(workdir, "kernel.py")
+        shutil.copy2(kernel, copy)
+        copy = os.path.abspath(copy)
+        assert cached_kernel_hash(copy) == digest
+        with open(kernel_cache_file()) as f:
+            entries = json.load(f)
+        entries[copy][2] = "from-cache"
+        with open(kernel_cache_file(), "w") as f:
+            json.dump(entries, f)
+        arc_guardian._kernel_hash_memo.clear()
+        assert cached_kernel_hash(copy) == "from-cache"
+        os.remove(kernel_cache_file())
+        assert cached_kernel_hash(copy) == "from-cache"  # in-process memo, no file read
+        assert not os.path.exists(kernel_cache_file())
+        print("[OK] Cache hit (file, then in-process memo) skips re-hashing")
+
+        # Miss: an edit of the same size with a new mtime, then a size change
+        with open(copy, "r+", encoding="utf-8") as f:
+            text = f.read()
+            f.seek(0)
+            f.write(text.replace("Guardian", "GUARDIAN", 1))
+        stat = os.stat(copy)
+        os.utime(copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert os.path.getsize(copy) == os.path.getsize(kernel)
+        edited = cached_kernel_hash(copy)
+        assert edited == sha256_of(copy) != digest
+        with open(copy, "a", encoding="utf-8") as f:
+            f.write("\n# appended\n")
+        grown = cached_kernel_hash(copy)
+        assert grown == sha256_of(copy) not in (digest, edited)
+        with open(kernel_cache_file()) as f:
+            entry = json.load(f)[copy]
+        stat = os.stat(copy)
+        assert entry == [stat.st_mtime_ns, stat.st_size, grown]
+        print("[OK] Edits that change mtime or size miss the cache and re-hash")
+    finally:
+        if previous is None:
+            del os.environ[arc_guardian.KERNEL_CACHE_ENV]
+        else:
+            os.environ[arc_guardian.KERNEL_CACHE_ENV] = previous
+        arc_guardian._kernel_hash_memo.clear()
+        shutil.rmtree(workdir)
+
+    print("\n=== Kernel Hash Cache Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,98 @@
+# ============================================================
+# ARC CORE — MAPPED MEMORY TEST
+# Loop 1.7 — Id / Cycle / Sigil Indexes, Lazy Decoding, Paths
+# ============================================================
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+
+from ac_mmap import MappedMemory
+from ac_reconstruct import ArcReconstruct
+from arc_prime import ArcMemorySystem
+
+
+def deep_tree(branches: int, depth: int, seed: int = 11) -> dict:
+    """Root with `branches` chains of `depth` nodes, some with side children."""
+    rng = random.Random(seed)
+
+    def node(name: str, level: int) -> dict:
+        content = f"Node {name} " + "with detail " * rng.randrange(6)
+        return {"id": name, "role": "user" if level % 2 else "ai", "cycle": rng.randrange(1, 40),
+                "content": content, "seed": f"[AC-{level}] {content[:80]}..." if level % 5 == 0 else None,
+                "collapsed": level % 7 == 0, "priority": rng.choice((0, 0, 0, 1, 2, 3)), "children": []}
+
+    root = {"id": "root", "role": "system", "cycle": 0, "content": "ArcCore-Prime Root Node",
+            "seed": None, "collapsed": False, "priority": 0, "children": []}
+    for b in range(branches):
+        parent = root
+        for level in range(1, depth + 1):
+            child = node(f"b{b}-d{level}", level)
+            parent["children"].append(child)
+            if level % 4 == 0:
+                child["children"].append(node(f"b{b}-d{level}-side", level + 1))
+            parent = child
+    return root
+
+
+def run_test():
+    print("\n=== ArcCore Mapped Memory Test (Loop 1.7) ===\n")
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, "deep.acmb")
+
+    mem = ArcMemorySystem()
+    mem.backend.replace_tree(deep_tree(branches=40, depth=60))
+    with contextlib.redirect_stdout(io.StringIO()):
+        mem.save_memory(path, format="bin")
+    ids = list(mem.backend.index.parents)
+    engine = ArcReconstruct()
+
+    with MappedMemory(path) as mapped:
+        # Lazy decoding: opening reads no strings; one lookup decodes a few
+        assert len(mapped) == len(ids) == 40 * 75 + 1
+        assert mapped._strings_cache == {}
+        node = mapped.find("b7-d33")
+        assert node.content.startswith("Node b7-d33") and len(mapped._strings_cache) <= 3
+        print(f"[OK] {len(mapped)} nodes mapped; one find() decoded "
+              f"{len(mapped._strings_cache)} strings")
+
+        # Id index: every node, and nothing else
+        for node_id in ids:
+            found = mapped.find(node_id)
+            assert found is not None and found.to_dict() == mem.backend.index.get(node_id).to_dict(), node_id
+        assert mapped.find("b7-d61") is None and mapped.find("") is None
+        print(f"[OK] find() matches the in-memory tree for all {len(ids)} ids")
+
+        # Cycle index: thread output equals the in-memory thread
+        for cycle in range(0, 41):
+            expected = [line for node in mem.thread_nodes(cycle) for line in engine.reconstruct_node(node)]
+            assert mapped.thread(cycle) == expected, cycle
+            assert [n.id for n in mapped.cycle_nodes(cycle)] == [n["id"] for n in mem.thread_nodes(cycle)]
+        print("[OK] thread() / cycle_nodes() match thread_nodes() for cycles 0-40")
+
+        # Sigil index: highest priority first, same nodes
+        for minimum in (1, 2, 3):
+            mapped_sigils = [(n.priority, n.id) for n in mapped.sigil_nodes(minimum)]
+            priorities = [p for p, _ in mapped_sigils]
+            assert priorities == sorted(priorities, reverse=True)
+            assert sorted(mapped_sigils) == sorted((n["priority"], n["id"]) for n in mem.sigil_nodes(minimum))
+        print(f"[OK] sigil_nodes() matches for priority ≥ 1/2/3 "
+              f"({len(list(mapped.sigil_nodes()))} nodes)")
+
+        # Parent links: root-to-node paths, including the deepest nodes
+        for node_id in ("b0-d1", "b13-d60", "b39-d44-side", "b21-d8-side"):
+            chain = [n.id for n in mapped.path(mapped.find(node_id))]
+            assert chain == [n["id"] for n in mem.path(node_id)], node_id
+            assert chain[0] == "root" and chain[-1] == node_id
+        assert len(mapped.path(mapped.find("b13-d60"))) == 61
+        print("[OK] path() matches the in-memory path, 61 levels deep")
+
+    os.remove(path)
+    os.rmdir(workdir)
+    print("\n=== Mapped Memory Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,141 @@
+# ============================================================
+# ARC CORE — PAGER TEST
+# Loop 1.24 — Lazy Streams, Paging, Search, Jump to Cycle
+# ============================================================
+
+import builtins
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from ac_interpreter import ArcInterpreter
+from ac_pager import ArcPager
+from ac_replay import WorkloadCapture, read_trace
+from ac_shell import ArcConsole
+
+
+def build(exchanges: int) -> ArcInterpreter:
+    shell = ArcInterpreter()
+    shell.memory.hash_on_write = False
+    for k in range(exchanges):
+        shell.memory.ingest_interaction(f"Question {k}" + (" 💠" if k % 50 == 0 else ""),
+                                        f"Answer {k}", 2 + k % 200)
+    return shell
+
+
+def first_screen(shell: ArcInterpreter, command: str, height: int = 24):
+    tracemalloc.start()
+    start = time.perf_counter()
+    stream = shell.stream(command)
+    lines = [next(stream) for _ in range(height)]
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return lines, elapsed, peak
+
+
+def run_test():
+    print("\n=== ArcCore Pager Test (Loop 1.24) ===\n")
+
+    # Streams match execute() exactly
+    small = build(40)
+    for command in ("walk", "reconstruct", "summary", "thread 5", "thread 999", "thread x",
+                    "dedup", "collapse", "bogus"):
+        assert "\n".join(small.stream(command)) == small.execute(command), command
+    print("[OK] stream() lines equal execute() output")
+
+    # First screen costs the same on a small and a large tree once it
+    # has been snapshotted (later snapshots only freeze what was appended)
+    big = build(20000)
+    start = time.perf_counter()
+    small.memory.snapshot(), big.memory.snapshot()
+    print(f"[OK] Snapshot of 40,001 nodes frozen once in {time.perf_counter() - start:.2f} s")
+    for command in ("walk", "summary"):
+        _, small_s, small_peak = first_screen(small, command)
+        lines, big_s, big_peak = first_screen(big, command)
+        assert any(line.endswith("ArcCore-Prime Root Node") for line in lines[:2])
+        assert big_peak < 64 * 1024, (command, big_peak)
+        assert big_s < 0.05, (command, big_s)
+        print(f"[OK] {command}: first screen of 40,001 nodes in {big_s * 1000:.2f} ms, "
+              f"peak {big_peak / 1024:.1f} KiB (40 exchanges: {small_peak / 1024:.1f} KiB)")
+
+    # Paging: forward, back, search, repeat, jump to cycle, top
+    keys = iter(["", "b", "/Question 7", "n", "c 150", "c 3", "g", "x", "q"])
+    out = io.StringIO()
+    lines, restart = big.pages("walk")
+    pager = ArcPager(lines, restart=restart, height=10, out=out, read=lambda prompt: next(keys))
+    tops = []
+    original = pager.handle
+
+    def handle(key):
+        message = original(key)
+        tops.append((key, pager.top, message))
+        return message
+
+    pager.handle = handle
+    pager.run()
+    by_key = {key: (top, message) for key, top, message in tops}
+    assert by_key[""][0] == 10 and by_key["b"][0] == 0
+    assert pager._line(by_key["/Question 7"][0]).endswith("USER: Question 7")
+    assert pager._line(by_key["n"][0]).endswith("USER: Question 70")
+    assert "[AC-150]" in pager._line(by_key["c 150"][0])
+    assert "[AC-3]" in pager._line(by_key["c 3"][0])  # wrapped past the start
+    assert by_key["g"][0] == 0 and "Enter:next" in by_key["x"][1]
+    assert out.getvalue().count("-- lines ") == 9
+    print("[OK] Forward/back, search, repeat, jump to cycle and top")
+
+    # Restarts replay one admission and one snapshot
+    workdir = tempfile.mkdtemp()
+    trace = os.path.join(workdir, "paged.trace")
+    small.memory.capture = WorkloadCapture(trace)
+    judged = []
+    judge = small.sentinel.judge
+    small.sentinel.judge = lambda *args: judged.append(args) or judge(*args)
+    for command in ("walk", "thread 5", "dedup"):
+        lines, restart = small.pages(command)
+        first = list(lines)
+        small.memory.ingest_interaction("Written while paging", "Not shown", 5)
+        assert list(restart()) == first and list(restart()) == first, command
+    assert len(judged) == 3
+    small.sentinel.judge = judge
+    small.memory.capture.close()
+    small.memory.capture = None
+    _, records = read_trace(trace)
+    assert [r[3] for r in records if r[0] == "c"] == ["walk", "thread 5", "dedup"]
+    os.remove(trace)
+    os.rmdir(workdir)
+    print("[OK] Restarts re-read the same snapshot without admitting the command again")
+
+    # Without restart only the history window can be paged back into
+    pager = ArcPager(iter(str(k) for k in range(1000)), height=10, history=50,
+                     out=io.StringIO(), read=lambda prompt: "q")
+    assert pager.handle("/900") is None and pager.top == 900
+    assert pager.handle("g") == "(start of history)" and pager.top == pager._oldest() > 0
+    assert pager.handle("/95") is None and pager.top == 895
+    assert pager.handle("/nothing") == "Pattern not found: nothing"
+    assert pager.screen()[0] == "950"  # clamped into the history window, not an empty screen
+    print("[OK] Bounded history without a restartable source")
+
+    # Console: short output printed, long output paged
+    console = ArcConsole(interactive=False, interpreter=small)
+    assert console.page("thread 5") == small.execute("thread 5")
+    console = ArcConsole(interactive=False, interpreter=big)
+    answers = iter(["/Question 3", "q"])
+    real_input = builtins.input
+    builtins.input = lambda prompt="": next(answers)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) as screen:
+            assert console.page("walk") is None
+    finally:
+        builtins.input = real_input
+    assert "USER: Question 3" in screen.getvalue() and "-- lines 1-" in screen.getvalue()
+    print("[OK] Console pages outputs longer than a screen")
+
+    print("\n=== Pager Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,234 @@
+# ============================================================
+# ARC CORE — MEMORY POOL TEST
+# Loop 1.29 — Lazy Tenant Loading, LRU Byte Budget, Eviction
+# ============================================================
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+
+from ac_pool import MemoryPool
+from ac_storage import SQLiteBackend
+from arc_prime import ArcMemorySystem
+
+
+class GatedMemory(ArcMemorySystem):
+    """restore / save_memory wait on `gate` once `held` is set."""
+    held = threading.Event()
+    entered = threading.Event()
+    gate = threading.Event()
+
+    def _wait(self):
+        if GatedMemory.held.is_set():
+            GatedMemory.entered.set()
+            assert GatedMemory.gate.wait(10)
+
+    def restore(self, *args, **kwargs):
+        self._wait()
+        return super().restore(*args, **kwargs)
+
+    def save_memory(self, *args, **kwargs):
+        self._wait()
+        return super().save_memory(*args, **kwargs)
+
+
+def fill(memory, tenant: str, exchanges: int = 40):
+    for k in range(exchanges):
+        memory.ingest_interaction(f"{tenant} asks question {k}",
+                                  f"Answer {k} for {tenant}, " + "with detail " * (k % 5), 2 + k % 9)
+
+
+def interactions(memory) -> int:
+    return len(memory.root.children)
+
+
+def run_test():
+    print("\n=== ArcCore Memory Pool Test (Loop 1.29) ===\n")
+    workdir = tempfile.mkdtemp()
+
+    # Size of one tenant decides the budget: room for about four
+    with MemoryPool(os.path.join(workdir, "probe"), budget=None) as probe:
+        with probe.lease("probe") as memory:
+            fill(memory, "probe")
+        one = probe.stats()["resident_bytes"]
+    assert one > 0
+
+    # Twenty tenants through a pool that holds four
+    directory = os.path.join(workdir, "tenants")
+    pool = MemoryPool(directory, budget=one * 4 + one // 2)
+    trees = {}
+    for n in range(20):
+        tenant = f"tenant-{n:02d}"
+        with pool.lease(tenant) as memory:
+            fill(memory, tenant)
+            trees[tenant] = memory.tree()
+        assert pool.resident_bytes <= pool.budget, pool.stats()
+    stats = pool.stats()
+    assert stats["tenants"] == 4 and stats["evictions"] == 16 and stats["created"] == 20
+    assert pool.resident() == [f"tenant-{n}" for n in range(16, 20)]
+    assert sorted(os.listdir(directory)) == [f"tenant-{n:02d}.json" for n in range(16)]
+    print(f"[OK] 20 tenants, 4 resident: {pool.describe()}")
+
+    # Evicted tenants come back from their files, unchanged
+    memory = pool.get("tenant-03")
+    assert memory.tree() == trees["tenant-03"] and interactions(memory) == 40
+    assert pool.misses == 21 and "tenant-16" not in pool
+    print("[OK] Evicted tenant reloaded from its file")
+
+    # Clean tenants are dropped without a write
+    assert pool.flush() == 3  # tenant-17..19 were never saved (16 was evicted)
+    saves = pool.saves
+    for n in range(5):
+        pool.get(f"tenant-{n:02d}")
+    assert pool.saves == saves
+    for _ in range(10):
+        pool.get("tenant-04")
+    assert pool.stats()["hits"] >= 10 and 0 < pool.stats()["hit_rate"] < 1
+    print(f"[OK] Clean evictions skip save_memory; hit rate {pool.stats()['hit_rate']:.0%}")
+
+    # Byte budget, not count: one large tenant displaces several small ones
+    with pool.lease("large") as memory:
+        fill(memory, "large", 120)
+    assert pool.resident_bytes <= pool.budget and len(pool) < 4
+    assert pool.resident()[-1] == "large"
+    print(f"[OK] Large tenant: {len(pool)} resident within {pool.budget} bytes")
+
+    # Pinned tenants stay; max_tenants bounds the count
+    small = MemoryPool(directory, budget=None, max_tenants=2)
+    with small.lease("tenant-00") as pinned:
+        for n in range(1, 6):
+            small.get(f"tenant-{n:02d}")
+        assert "tenant-00" in small and len(small) == 2
+        assert not small.evict("tenant-00")
+        pinned.ingest_interaction("Written while pinned", "Kept", 3)
+    assert small.flush() == 1 and small.flush() == 0
+    with small.lease("tenant-00") as pinned:
+        small.close()
+        assert small.resident() == ["tenant-00"]
+        pinned.ingest_interaction("Written across close", "Kept", 3)
+    assert len(small) == 1 and small.resident_bytes > 0
+    small.close()
+    assert len(small) == 0 and small.resident_bytes == 0
+    reopened = MemoryPool(directory, budget=None)
+    assert interactions(reopened.get("tenant-00")) == 42
+    print("[OK] Leased tenant never evicted or closed; max_tenants respected; flush saves once")
+
+    # Threads leasing tenants at random lose no writes
+    shared = MemoryPool(os.path.join(workdir, "shared"), budget=one * 3)
+    expected = {f"t{n}": 0 for n in range(12)}
+    counts_lock = threading.Lock()
+    errors = []
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        try:
+            for k in range(60):
+                tenant = f"t{rng.randrange(12)}"
+                with shared.lease(tenant) as memory:
+                    memory.ingest_interaction(f"Q {seed}-{k}", "A", 2)
+                with counts_lock:
+                    expected[tenant] += 1
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(s,)) for s in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+    shared.close()
+    check = MemoryPool(os.path.join(workdir, "shared"), budget=None)
+    for tenant, count in expected.items():
+        assert interactions(check.get(tenant)) == count, tenant
+    print(f"[OK] 360 leased writes from 6 threads all persisted ({shared.evictions} evictions)")
+
+    # File I/O runs outside the pool lock
+    gated = MemoryPool(os.path.join(workdir, "shared"), budget=None, factory=GatedMemory)
+    gated.get("t0")
+    GatedMemory.held.set()
+    loaded = []
+    loaders = [threading.Thread(target=lambda: loaded.append(gated.get("t1"))) for _ in range(3)]
+    for t in loaders:
+        t.start()
+    assert GatedMemory.entered.wait(10)
+    assert interactions(gated.get("t0")) == expected["t0"]  # not blocked by the load
+    GatedMemory.gate.set()
+    for t in loaders:
+        t.join()
+    assert len(loaded) == 3 and loaded[0] is loaded[1] is loaded[2] and gated.misses == 2
+    print("[OK] Slow restore blocks nobody; concurrent callers share one load")
+
+    # A tenant leased while its eviction save runs stays resident
+    GatedMemory.entered.clear()
+    GatedMemory.gate.clear()
+    gated.get("t0").ingest_interaction("Changed", "Saved on eviction", 2)
+    evicting = threading.Thread(target=lambda: loaded.append(gated.evict("t0")))
+    evicting.start()
+    assert GatedMemory.entered.wait(10)
+    with gated.lease("t0") as memory:
+        GatedMemory.gate.set()
+        evicting.join()
+        memory.ingest_interaction("Written during the save", "Kept", 2)
+    assert loaded[-1] is False and "t0" in gated and gated.flush("t0") == 1
+    GatedMemory.held.clear()
+    gated.close()
+    assert interactions(MemoryPool(os.path.join(workdir, "shared"), budget=None).get("t0")) == \
+        expected["t0"] + 2
+    print("[OK] Tenant saved for eviction but leased meanwhile is kept, not dropped")
+
+    # Tenants share the pool's guardian: no audit fds or threads per tenant
+    os.environ["ARCCORE_AUDIT_DIR"] = os.path.join(workdir, "audit")
+    try:
+        churn = MemoryPool(os.path.join(workdir, "churn"), budget=None, max_tenants=2)
+        counts = []
+        for n in range(200):
+            with churn.lease(f"c{n}") as memory:
+                fill(memory, f"c{n}", 2)
+                try:
+                    memory.ingest_interaction("Out of range", "Denied", 5000)
+                except RuntimeError:
+                    pass
+            if n in (10, 199):
+                counts.append((len(os.listdir("/proc/self/fd")), threading.active_count()))
+        assert counts[0] == counts[1], counts
+        assert churn.evictions == 198 and memory.guardian is churn.guardian
+        assert len(churn.guardian.audit.why(limit=1000)) == 400  # user and ai gate per tenant
+        churn.close()
+    finally:
+        del os.environ["ARCCORE_AUDIT_DIR"]
+        churn.guardian.audit.close()
+    print(f"[OK] 200 tenants leased and evicted: fds and threads flat at {counts[1]}")
+
+    # Binary files, bad names, latency report
+    with MemoryPool(os.path.join(workdir, "bin"), budget=None, format="bin") as binary:
+        fill(binary.get("acme"), "acme", 5)
+    assert os.listdir(os.path.join(workdir, "bin")) == ["acme.acmb"]
+    for bad in ("../escape", "a/b", ".hidden", "", None):
+        try:
+            pool.get(bad)
+            raise AssertionError(f"{bad!r} should be rejected")
+        except ValueError:
+            pass
+    database = os.path.join(workdir, "tenant.db")
+    durable = MemoryPool(os.path.join(workdir, "sqlite"), budget=None,
+                         factory=lambda: ArcMemorySystem(backend=SQLiteBackend(database)))
+    try:
+        durable.get("acme")
+        raise AssertionError("a non-resident backend should be rejected")
+    except ValueError as e:
+        assert "resident" in str(e) and "acme" not in durable
+    assert durable.stats()["tenants"] == 0
+    load = pool.stats()["load"]
+    assert load["count"] == pool.misses and load["p99_ms"] >= load["p50_ms"] > 0
+    print(f"[OK] ACMB tenants, names and backends validated, load p50 {load['p50_ms']:.2f} ms")
+
+    pool.close()
+    shutil.rmtree(workdir)
+    print("\n=== Memory Pool Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,124 @@
+# ============================================================
+# ARC CORE — QUERY TEST
+# Loop 1.25 — Query Expressions, Subtree Summaries, Push-down
+# ============================================================
+
+import time
+
+from ac_interpreter import ArcInterpreter
+from ac_query import Query, QueryStats, SubtreeIndex, level_value, parse, select
+
+
+def build(exchanges: int) -> ArcInterpreter:
+    shell = ArcInterpreter()
+    shell.memory.hash_on_write = False
+    for k in range(exchanges):
+        shell.memory.ingest_interaction(f"Question {k}" + (" 💠" if k % 50 == 0 else ""),
+                                        "Answer " + ("detail " * 10 if k % 3 else "short"),
+                                        2 + k // 100)
+    return shell
+
+
+def brute_force(root, query: Query):
+    """Every node tested, no pruning: the reference result."""
+    found = []
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if query.matches(node, depth):
+            found.append((depth, node.get("id")))
+        stack.extend((child, depth + 1) for child in reversed(node.get("children") or []))
+    return found[:query.limit] if query.limit is not None else found
+
+
+def ids(matches):
+    return [(depth, node.get("id")) for depth, node in matches]
+
+
+QUERIES = [
+    "where cycle>=3 and role=user and priority>=2 and level<=SEED depth<=5",
+    "cycle=150",
+    "cycle>40 cycle<=42 role=ai",
+    "priority>=3 limit 7",
+    "level=SEED and collapsed=true and cycle!=2",
+    'content~"question 199"',
+    "depth=0",
+    "cycle=999",
+]
+
+
+def run_test():
+    print("\n=== ArcCore Query Test (Loop 1.25) ===\n")
+
+    # Parsing
+    query = parse("where cycle>=3 and role=USER and priority>2 level<=seed depth<5 limit 10")
+    assert query.clauses == (("cycle", ">=", 3), ("role", "=", "user"), ("priority", ">", 2),
+                             ("level", "<=", 2), ("depth", "<", 5))
+    assert (query.cycle_lo, query.min_priority, query.max_depth, query.limit) == (3, 3, 4, 10)
+    assert str(parse("cycle = 4 and role=ai")) == "where cycle=4 and role=ai"
+    for bad in ("colour=red", "role>user", "cycle=x", "level=HUGE", "cycle", "collapsed=maybe"):
+        try:
+            parse(bad)
+            raise AssertionError(f"{bad!r} should not parse")
+        except ValueError:
+            pass
+    print("[OK] Expressions parsed; bounds derived for push-down")
+
+    # Pruned results equal an unpruned scan, in walk order
+    shell = build(20000)
+    root = shell.memory.root
+    for text in QUERIES:
+        query = parse(text)
+        expected = brute_force(root, query)
+        assert ids(select(root, query, shell.memory.summaries)) == expected, text
+        assert ids(select(shell.memory.tree(), query)) == expected, text  # dict tree, no cache
+        assert ids(select(shell.memory.tree(), query, SubtreeIndex())) == expected, text
+    assert level_value({"compression_level": 3}) == 3 and level_value({"collapsed": True}) == 2
+    print(f"[OK] {len(QUERIES)} queries match a full scan on 40,001 nodes")
+
+    # Whole blocks of subtrees are skipped
+    stats = QueryStats()
+    matches = list(select(root, parse("cycle=150"), shell.memory.summaries, stats))
+    assert len(matches) == 200 and stats.visited < 400 and stats.pruned > 300
+    assert stats.visited + stats.skipped == 40001
+    print(f"[OK] cycle=150: visited {stats.visited}, skipped {stats.skipped} nodes "
+          f"in {stats.pruned} blocks")
+
+    # Summaries follow appends and replaced trees
+    shell.memory.ingest_interaction("Late arrival", "Reply", 150)
+    late, _ = shell.memory.query("cycle=150 and content~late")
+    assert [node["content"] for _, node in late] == ["Late arrival"]
+    assert len(shell.memory.thread_nodes(150)) == 202
+    shell.memory.backend.replace_tree(shell.memory.tree())
+    assert len(shell.memory.query("cycle=150")[0]) == 202
+    assert len(list(shell.memory.iter_thread(150))) == 202
+    print("[OK] Appends extend cached summaries; replaced trees get fresh ones")
+
+    # Push-down against a full scan
+    query = parse("cycle=150")
+    start = time.perf_counter()
+    for _ in range(20):
+        brute_force(root, query)
+    scan = (time.perf_counter() - start) / 20
+    start = time.perf_counter()
+    for _ in range(20):
+        shell.memory.query(query)
+    pushed = (time.perf_counter() - start) / 20
+    assert pushed * 10 < scan, (pushed, scan)
+    print(f"[OK] Push-down {pushed * 1000:.2f} ms vs full scan {scan * 1000:.2f} ms")
+
+    # Interpreter command
+    small = build(40)
+    output = small.execute("query where cycle=2 and role=user and priority>=3")
+    assert output.splitlines()[0] == "  💠 [AC-2] USER: [AC-2] Question 0 💠..."
+    assert output.endswith("[query] 1 matches (visited 81 nodes, skipped 0 in 0 blocks)")
+    assert small.execute("query colour=red").startswith("[query] Unknown field 'colour'")
+    assert "Usage" in small.execute("query")
+    assert ArcInterpreter(authority=0).execute("query depth=0").startswith("• [AC-1] SYSTEM")
+    print("[OK] query command in the shell")
+
+    print("\n=== Query Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,127 @@
+# ============================================================
+# ARC CORE — WORKLOAD REPLAY TEST
+# Loop 1.27 — Capture, Trace Files, Replay at 1× / N× / Max
+# ============================================================
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import ac_replay
+from ac_interpreter import ArcInterpreter
+from ac_replay import WorkloadCapture, WorkloadReplay, read_trace
+
+
+def contents(memory):
+    """What was stored, without ids or timestamps."""
+    found, stack = [], [memory.root]
+    while stack:
+        node = stack.pop()
+        found.append((node.role, node.raw_content, node.cycle_alignment))
+        stack.extend(reversed(node.children))
+    return found
+
+
+def run_test():
+    print("\n=== ArcCore Workload Replay Test (Loop 1.27) ===\n")
+    workdir = tempfile.mkdtemp()
+    trace = os.path.join(workdir, "work.trace.gz")
+
+    # Capture: ingests and commands, each with its timing
+    shell = ArcInterpreter()
+    shell.memory.capture = WorkloadCapture(trace, flush_every=16)
+    for k in range(100):
+        shell.memory.ingest_interaction(f"Question {k}", f"Answer {k}", 2 + k % 5)
+    shell.execute("inject Injected once")
+    shell.execute("thread 3")
+    shell.execute("bogus")
+    assert len(list(shell.stream("walk"))) > 200
+    shell.memory.capture.close()
+
+    header, records = read_trace(trace)
+    records = list(records)
+    assert header["format"] == "arccore-trace" and header["base"] is None
+    assert len(records) == 104  # the inject's own ingest is part of the command
+    assert records[0][:1] + records[0][3:] == ["i", "Question 0", "Answer 0", 2]
+    assert [r[3] for r in records[100:]] == ["inject Injected once", "thread 3", "bogus", "walk"]
+    assert all(r[1] <= s[1] for r, s in zip(records, records[1:])) and records[103][2] > 0
+    print(f"[OK] Captured {len(records)} records to a gzip trace")
+
+    # Replay at maximum speed rebuilds the same memory
+    replay = WorkloadReplay(trace, speed=None)
+    report = replay.run()
+    assert contents(replay.memory) == contents(shell.memory)
+    types = report["types"]
+    assert list(types)[0] == "ingest" and types["ingest"]["count"] == 100
+    assert types["bogus"]["errors"] == 1 and types["thread"]["errors"] == 0
+    assert all(types[t]["p99_ms"] >= types[t]["p50_ms"] > 0 for t in types)
+    assert report["records"] == 104 and report["throughput"] > 0
+    print(ac_replay.report_text(report))
+    print("[OK] Replay reproduces the memory and reports per-type percentiles")
+
+    # Original pace, then 4× faster
+    paced = os.path.join(workdir, "paced.trace")
+    shell = ArcInterpreter()
+    shell.memory.capture = WorkloadCapture(paced)
+    for k in range(4):
+        shell.execute(f"inject Paced {k}")
+        time.sleep(0.1)
+    shell.memory.capture.close()
+    timings = {}
+    for speed in (1.0, 4.0, None):
+        timings[speed] = WorkloadReplay(paced, speed=speed).run()["seconds"]
+    assert 0.28 < timings[1.0] < 0.6, timings
+    assert 0.06 < timings[4.0] < 0.2, timings
+    assert timings[None] < 0.06, timings
+    print(f"[OK] 1×: {timings[1.0]:.2f}s, 4×: {timings[4.0]:.2f}s, max: {timings[None]:.3f}s")
+
+    # Start from a saved memory: the trace's base, or --memory
+    base = os.path.join(workdir, "base.json")
+    seeded = ArcInterpreter()
+    seeded.memory.ingest_interaction("Already stored", "Before capture", 9)
+    with contextlib.redirect_stdout(io.StringIO()):
+        seeded.memory.save_memory(base)
+    based = os.path.join(workdir, "based.trace")
+    seeded.memory.capture = WorkloadCapture(based, base=base)
+    seeded.execute("inject After capture")
+    seeded.memory.capture.close()
+    replay = WorkloadReplay(based, speed=None)
+    replay.run()
+    assert contents(replay.memory) == contents(seeded.memory)
+    print("[OK] Replay starts from the captured base memory")
+
+    # CLI
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        assert ac_replay.main([paced, "--speed", "max", "--json"]) == 0
+    assert json.loads(out.getvalue())["types"]["inject"]["count"] == 4
+    with contextlib.redirect_stderr(io.StringIO()):
+        assert ac_replay.main([base]) == 1  # not a trace
+    print("[OK] CLI replays and rejects non-trace files")
+
+    # ARCCORE_CAPTURE captures a whole process, written at exit
+    script = os.path.join(workdir, "script.arc")
+    with open(script, "w") as f:
+        f.write("inject From the environment\nthread 1\n")
+    env_trace = os.path.join(workdir, "env.trace")
+    env = dict(os.environ, ARCCORE_CAPTURE=env_trace, PYTHONPATH=os.pathsep.join(sys.path))
+    src = os.path.dirname(ac_replay.__file__)
+    subprocess.run([sys.executable, os.path.join(src, "ac_batch.py"), script, "--quiet"],
+                   env=env, cwd=workdir, check=True, stdout=subprocess.DEVNULL)
+    _, records = read_trace(env_trace)
+    assert [r[3] for r in records] == ["inject From the environment", "thread 1"]
+    print("[OK] ARCCORE_CAPTURE records a batch run")
+
+    for name in os.listdir(workdir):
+        os.remove(os.path.join(workdir, name))
+    os.rmdir(workdir)
+    print("\n=== Workload Replay Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,174 @@
+# ============================================================
+# ARC CORE — SEED RECORD TEST
+# Loop 1.28 — Structured Seeds, Output-Time Rendering, Migration
+# ============================================================
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+import ac_seed
+from ac_collapse import ACCollapseEngine
+from ac_footprint import analyze_tree
+from ac_persistent import PNode
+from ac_reconstruct import ArcReconstruct
+from ac_seed import ANCHOR, SNIPPET, VERBATIM_SEED, SeedRecord, decode, parse, record, render
+from ac_storage import read_file
+from arc_guardian import ArcGuardian
+from arc_prime import ArcMemorySystem, HarmonicNode
+
+
+def legacy_seed(node: HarmonicNode) -> str:
+    """The string prune_to_seed stored before Loop 1.28."""
+    if node.priority >= 3:
+        return f"[AC-{node.cycle_alignment}] {node.raw_content[:80]}..."
+    if len(node.raw_content) > 50:
+        return f"[Seed AC-{node.cycle_alignment}]: {node.raw_content[:30]}..."
+    return node.raw_content
+
+
+def legacy_tree(node: HarmonicNode) -> dict:
+    """to_dict() as it was when seeds were stored as strings."""
+    return {"id": node.id, "role": node.role, "cycle": node.cycle_alignment,
+            "content": node.raw_content, "seed": legacy_seed(node), "collapsed": node.is_collapsed,
+            "priority": node.priority, "children": [legacy_tree(c) for c in node.children]}
+
+
+def seeds_as_text(payload: dict) -> dict:
+    """A saved payload rewritten the way files were written before Loop 1.28."""
+    strings = list(payload["strings"])
+    records = [decode(entry) for entry in payload["seeds"]]
+    legacy = {key: value for key, value in payload.items() if key != "seeds"}
+    legacy["tree"] = json.loads(json.dumps(payload["tree"]))
+    stack = [legacy["tree"]]
+    while stack:
+        node = stack.pop()
+        if "seed_record" in node:
+            strings.append(render(records[node.pop("seed_record")], strings[node["content"]]))
+            node["seed"] = len(strings) - 1
+        stack.extend(node["children"])
+    legacy["strings"] = strings
+    return legacy
+
+
+def build(exchanges: int) -> ArcMemorySystem:
+    mem = ArcMemorySystem()
+    mem.hash_on_write = False
+    for k in range(exchanges):
+        mem.ingest_interaction(f"Question {k}" + (" 💠" if k % 7 == 0 else ""),
+                               f"Answer {k} " + "with a longer explanation " * (k % 4), 2 + k % 30)
+    return mem
+
+
+def nodes(root):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children)
+
+
+def run_test():
+    print("\n=== ArcCore Seed Record Test (Loop 1.28) ===\n")
+
+    # Live nodes hold shared records; the text is unchanged
+    mem = build(2000)
+    for node in nodes(mem.root):
+        if node is not mem.root:
+            assert node.structural_seed == legacy_seed(node)
+            assert isinstance(node.seed_record, SeedRecord)
+    kinds = {node.seed_record for node in nodes(mem.root) if node is not mem.root}
+    assert record(ANCHOR, 2, 80) in kinds and VERBATIM_SEED in kinds and len(kinds) < 100
+    print(f"[OK] 4,000 seeds render as before from {len(kinds)} shared records")
+
+    # Hashes are computed from the same text
+    tree = mem.tree()
+    legacy = dict(tree, children=[legacy_tree(child) for child in mem.root.children])
+    assert mem.refresh_hash() == ArcGuardian.hash_memory_tree(legacy)
+    print("[OK] Memory hash unchanged")
+
+    # Legacy strings parse back to records; anything else stays text
+    content = "The quick brown fox jumps over the lazy dog, twice over, and then rests."
+    for seed in (f"[AC-4] {content[:80]}...", f"[Seed AC-9]: {content[:30]}...",
+                 f"[AutoSeed AC-3]: {content[:50]}...", content):
+        parsed = parse(seed, content)
+        assert isinstance(parsed, SeedRecord) and render(parsed, content) == seed
+    assert parse("[Seed AC-9]: Short...", "Short") is record(SNIPPET, 9, 30)
+    for seed in ("[Blocked]", "[AC-4] Something else...", "[AC-04] The quick...",
+                 "[Seed AC-9] The quick...", "[AC-4] The quick", None):
+        assert parse(seed, content) == seed
+    restored = HarmonicNode.from_dict({"role": "user", "content": content, "cycle": 9,
+                                       "seed": f"[Seed AC-9]: {content[:30]}..."})
+    assert restored.seed_record == record(SNIPPET, 9, 30)
+    print("[OK] Legacy seed strings parse into records; others kept as text")
+
+    # Reconstruction: same lines from records, strings and snapshots
+    engine = ArcReconstruct()
+    expected = engine.reconstruct_path(tree)
+    assert engine.reconstruct_path(mem.root) == expected
+    assert engine.reconstruct_path(PNode.freeze(mem.root)) == expected
+    assert PNode.freeze(mem.root).to_dict() == tree
+    seed_level = dict(tree["children"][0], compression_level=2)
+    live = mem.root.children[0]
+    live.compression_level = 2
+    assert engine.reconstruct_node(live) == engine.reconstruct_node(seed_level)
+    collapsed = ACCollapseEngine().collapse_state({"role": "user", "cycle": 5, "priority": 4,
+                                                  "content": content, "seed": None})
+    assert collapsed["seed"] == f"[AutoSeed AC-5]: {content[:80]}..."
+    print(f"[OK] {len(expected)} reconstructed lines identical")
+
+    # Seeds no longer take memory per node
+    live_seeds = analyze_tree(mem.root).totals["seed"]
+    text_seeds = analyze_tree(tree).totals["seed"]
+    assert live_seeds * 20 < text_seeds, (live_seeds, text_seeds)
+    print(f"[OK] Seed bytes: {live_seeds} as records vs {text_seeds} as strings")
+
+    # JSON files: derived seeds saved as references to a table of records
+    workdir = tempfile.mkdtemp()
+    saved = os.path.join(workdir, "memory.json")
+    with contextlib.redirect_stdout(io.StringIO()):
+        mem.save_memory(saved)
+    with open(saved) as f:
+        payload = json.load(f)
+    first = payload["tree"]["children"][0]
+    assert "seed" not in first and payload["seeds"][first["seed_record"]] == [ANCHOR, 2, 80]
+    assert len(payload["seeds"]) < 100
+    loaded = read_file(saved)
+    assert loaded["verification"].ok and loaded["tree"] == tree
+    print("[OK] JSON saves structured seeds and reads back the same tree")
+
+    # Migration: files with seeds as text (pre-1.5 inline, pre-1.28 string table)
+    inline = os.path.join(workdir, "inline.json")
+    with open(inline, "w") as f:
+        json.dump({"integrity": {"memory_hash": mem.refresh_hash()}, "tree": tree}, f, indent=2)
+    result = ac_seed.migrate(inline, os.path.join(workdir, "from_inline.json"))
+    assert read_file(result["target"])["tree"] == tree
+    assert result["seeds"]["anchor"] > 0 and result["seeds"]["text"] == 0
+
+    old = os.path.join(workdir, "old.json")
+    with open(old, "w") as f:
+        json.dump(seeds_as_text(payload), f, indent=2)
+    before = os.path.getsize(old)
+    assert read_file(old)["tree"] == tree
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        assert ac_seed.main(["migrate", old]) == 0
+    after = os.path.getsize(old)
+    assert "structured" in out.getvalue() and read_file(old)["tree"] == tree and after < before
+    binary = os.path.join(workdir, "memory.acmb")
+    with contextlib.redirect_stdout(io.StringIO()):
+        mem.save_memory(binary, format="bin")
+    with contextlib.redirect_stderr(io.StringIO()):
+        assert ac_seed.main(["migrate", binary]) == 1
+    print(f"[OK] Migrated legacy files; string-table file {before} → {after} bytes")
+
+    for name in os.listdir(workdir):
+        os.remove(os.path.join(workdir, name))
+    os.rmdir(workdir)
+    print("\n=== Seed Record Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,153 @@
+# ============================================================
+# ARC CORE — SENTINEL TEST
+# Loop 1.22 — OperationType, GateResult, Compiled Table, Reload
+# ============================================================
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+
+import ac_authority_defaults as defaults
+import ac_shell
+from ac_audit import AuditLog
+from ac_interpreter import ArcInterpreter
+from ac_sentinel import GateResult, OperationType, Sentinel, SentinelPolicy
+from ac_shell import ArcConsole
+
+
+def run_test():
+    print("\n=== ArcCore Sentinel Test (Loop 1.22) ===\n")
+
+    sentinel = Sentinel()
+
+    # GateResult contract: explainable in isolation
+    result = sentinel.judge("collapse", 3)
+    assert isinstance(result, GateResult)
+    assert result == (False, "GOVERN denied — authority 3 < required 7", OperationType.GOVERN, 7, 3)
+    assert sentinel.judge("walk", 0).reason == "READ permitted — non-mutating"
+    assert sentinel.judge("inject").allowed
+    assert not sentinel.judge("inject", 0).allowed
+    assert sentinel.judge("collapse", defaults.RECOVERY).allowed
+    print("[OK] Authority comparisons follow the default scale")
+
+    # Every judgment inside the scale is precompiled and shared
+    assert sentinel.judge("walk", 1) is sentinel.judge("walk", 1)
+    assert sentinel.judge_operation(OperationType.MARK, 3).allowed
+    assert not sentinel.judge_operation(OperationType.MARK, 2).allowed
+    # Off-scale authority is judged once, then memoized
+    assert sentinel.judge("inject", 42) is sentinel.judge("inject", 42)
+    print("[OK] Judgments served from the compiled table")
+
+    # Unclassified actions are invalid, and never memoized
+    bogus = sentinel.judge("bogus", defaults.RECOVERY)
+    assert not bogus.allowed and bogus.operation is None
+    assert ("bogus", defaults.RECOVERY) not in sentinel._state[1]
+    try:
+        sentinel.judge("walk", -1)
+        raise AssertionError("negative authority should raise")
+    except ValueError:
+        pass
+    try:
+        SentinelPolicy(command_authority={"bogus": 3})
+        raise AssertionError("override for an unclassified verb should raise")
+    except ValueError:
+        pass
+    print("[OK] Unclassified verbs and invalid authority rejected")
+
+    # Policy file: MARK sigils, let normal actors collapse
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"commands": {"sigil": "MARK"}, "command_authority": {"collapse": 1}}, f)
+    try:
+        sentinel.load_policy(path)
+    finally:
+        os.remove(path)
+    assert sentinel.reloads == 1
+    assert sentinel.judge("sigil", 1).reason == "MARK denied — authority 1 < required 3"
+    assert sentinel.judge("collapse", 1).allowed
+    assert sentinel.policy.to_dict()["commands"]["sigil"] == "MARK"
+    print("[OK] Policy loaded from file")
+
+    # Reload under load: every judgment comes from one compiled policy
+    strict = SentinelPolicy(command_authority={"inject": 5, "sync": 5})
+    loose = SentinelPolicy()
+    sentinel.reload(loose)
+    torn, stop = [], threading.Event()
+
+    def judge_loop():
+        while not stop.is_set():
+            inject = sentinel.judge("inject", 1)
+            sync = sentinel.judge("sync", 1)
+            if inject.required_authority not in (1, 5) or sync.required_authority not in (1, 5):
+                torn.append((inject, sync))
+
+    workers = [threading.Thread(target=judge_loop) for _ in range(4)]
+    for w in workers:
+        w.start()
+    for k in range(200):
+        sentinel.reload(strict if k % 2 == 0 else loose)
+    stop.set()
+    for w in workers:
+        w.join()
+    assert not torn
+    assert sentinel.judge("inject", 1).allowed  # loose policy was last
+    print(f"[OK] {sentinel.reloads} reloads swapped without pausing judges")
+
+    # Interpreter: judgment precedes execution; denials are audited
+    shell = ArcInterpreter()
+    shell.sentinel.audit = AuditLog()
+    assert "[Sentinel] ⛔ collapse: GOVERN denied" in shell.execute("collapse")
+    assert "Unknown command" in shell.execute("bogus")
+    assert shell.execute("inject Hello") == "[inject] Message injected."
+    denied = shell.sentinel.audit.why(action="collapse")
+    assert denied and denied[0]["required_authority"] == 7 and denied[0]["actor_authority"] == 1
+    print(shell.execute("sentinel"))
+    assert "allowed" in shell.execute("sentinel judge collapse 9")
+    assert len(shell.sentinel.audit.why(action="collapse")) == 1  # explain() is not audited
+    governor = ArcInterpreter(authority=defaults.STRUCTURAL)
+    assert "[Sentinel]" not in governor.execute("collapse")
+    print("[OK] Interpreter gated by the Sentinel")
+
+    # Sub-actions are judged by what they do, not by their verb
+    for command, operation in (("sync apply patch.json", "GOVERN"), ("audit level OFF", "GOVERN"),
+                               ("echo on", "MARK"), ("echo OFF", "MARK"), ("echo reset", "MARK"),
+                               ("footprint budget 1MB", "MARK")):
+        out = shell.execute(command)
+        assert out.startswith("[Sentinel] ⛔") and f"{operation} denied — authority 1" in out, out
+    assert shell.sentinel.audit.level != "OFF"
+    for command in ("sync diff missing.json", "audit stats", "echo stats", "echo tail 3", "footprint"):
+        assert "[Sentinel]" not in shell.execute(command), command
+    assert shell.sentinel.action("sync", "APPLY x") == "sync apply"
+    assert shell.sentinel.action("sync", "") == "sync"
+    assert "sync apply: denied" in shell.execute("sentinel judge sync apply")
+    assert "sync apply: allowed" in shell.execute("sentinel judge sync apply 7")
+    marker = ArcInterpreter(authority=defaults.MARKING)
+    assert "[Sentinel]" not in marker.execute("echo reset")
+    assert "[Sentinel]" in marker.execute("audit level FULL")
+    print("[OK] sync apply / audit level need GOVERN, echo and footprint budget MARK")
+
+    # The console raises its actor authority with --authority
+    assert ArcConsole(interactive=False).interpreter.authority == defaults.DEFAULT_ACTOR_AUTHORITY
+    assert ArcConsole(interactive=False, authority=defaults.STRUCTURAL).interpreter.authority == 7
+    src = os.path.dirname(ac_shell.__file__)
+    script = "echo reset\nfootprint budget 64MB\nsync apply /nonexistent.patch\nexit\n"
+
+    def console(*flags):
+        return subprocess.run([sys.executable, os.path.join(src, "ac_shell.py"), *flags],
+                              input=script, capture_output=True, text=True, timeout=60,
+                              env=dict(os.environ, PYTHONPATH=src)).stdout
+
+    assert console().count("[Sentinel] ⛔") == 3
+    raised = console("--authority", str(defaults.STRUCTURAL))
+    assert "[Sentinel]" not in raised and "[echo] Stats cleared." in raised, raised
+    assert "Budget set to 64.0 MiB" in raised and "[sync] Error:" in raised
+    print("[OK] ac_shell.py --authority runs MARK and GOVERN commands")
+
+    print("\n=== Sentinel Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
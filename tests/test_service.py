@@ -0,0 +1,78 @@
+# ============================================================
+# ARC CORE — ASYNC SERVICE TEST
+# Loop 1.13 — Bounded Ingest Queue, Batched Writer, Snapshots
+# ============================================================
+
+import asyncio
+
+from ac_service import ArcService
+from arc_prime import ArcMemorySystem
+
+
+async def scenario():
+    memory = ArcMemorySystem()
+    service = ArcService(memory, capacity=16, batch_size=8)
+
+    async with service:
+        before = service.snapshot()
+
+        # ------------------------------------------------------------
+        # 1. Many concurrent sessions, bounded queue
+        # ------------------------------------------------------------
+
+        depth = []
+
+        async def session(n):
+            for k in range(5):
+                await service.ingest(f"Session {n} 💠" if k == 0 else f"Session {n} turn {k}",
+                                     f"Reply {k}", cycle=n % 7)
+                depth.append(service.queue_depth)
+
+        await asyncio.gather(*(session(n) for n in range(60)))
+
+        assert max(depth) <= 16
+        assert len(memory.root.children) == 300
+        assert service.batches < 300
+        print(f"[OK] 300 exchanges in {service.batches} batches, max queue depth {max(depth)}")
+
+        # ------------------------------------------------------------
+        # 2. Snapshots are stable and match the backend
+        # ------------------------------------------------------------
+
+        assert len(before) == 0 and before.version == 0
+        latest = service.snapshot()
+        assert len(latest) == 300
+        assert memory.memory_hash is None  # nothing hashed on the event loop
+        assert latest.memory_hash == memory.refresh_hash()
+        assert await service.thread(3) == memory.thread_nodes(3)
+        assert await service.sigils(3) == memory.sigil_nodes(3)
+        print(f"[OK] Snapshot v{latest.version} matches live queries.")
+
+        # ------------------------------------------------------------
+        # 3. A rejected exchange fails alone
+        # ------------------------------------------------------------
+
+        results = await asyncio.gather(
+            service.ingest("fine", "ok", cycle=1),
+            service.ingest("bad cycle", "no", cycle=5000),
+            return_exceptions=True,
+        )
+        assert isinstance(results[0], int)
+        assert isinstance(results[1], RuntimeError)
+        print("[OK] Guardian rejection is reported to its caller only.")
+
+    assert memory.hash_on_write and memory.memory_hash is not None
+    metrics = service.metrics()
+    assert metrics["applied"] == 301 and metrics["rejected"] == 1
+    assert metrics["ingest"]["p99_ms"] >= metrics["ingest"]["p50_ms"] > 0
+    print(f"[OK] Metrics: {metrics}")
+
+
+def run_test():
+    print("\n=== ArcCore Async Service Test (Loop 1.13) ===\n")
+    asyncio.run(scenario())
+    print("\n=== Async Service Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,93 @@
+# ============================================================
+# ARC CORE — SHARDED MEMORY TEST
+# Loop 1.16 — Multi-Process Shards: Routing, Fan-Out, Merge
+# ============================================================
+
+from arc_prime import ArcMemorySystem
+from ac_reconstruct import ArcReconstruct
+from ac_shard import ShardedMemory, search_key, shard_for
+
+EXCHANGES = 300
+
+
+def strip(nodes):
+    """Compares content only: ids differ between processes."""
+    return [(n["role"], n["cycle"], n["content"], n["seed"], n["priority"],
+             strip(n["children"])) for n in nodes]
+
+
+def feed(target):
+    for k in range(EXCHANGES):
+        user = f"Session {k % 7} asks question {k}" + (" 💠" if k % 25 == 0 else "")
+        target.ingest_interaction(user, f"Answer {k}: stability is found through structure.",
+                                  2 + k % 40)
+
+
+def run_test():
+    print("\n=== ArcCore Sharded Memory Test (Loop 1.16) ===\n")
+
+    single = ArcMemorySystem()
+    feed(single)
+
+    with ShardedMemory(shards=3, batch_size=16) as sharded:
+        feed(sharded)
+        sharded.flush()
+
+        counts = [s["interactions"] for s in sharded.stats()]
+        assert sum(counts) == EXCHANGES and all(counts), counts
+        assert all(s["memory_hash"] for s in sharded.stats())
+        print(f"[OK] {EXCHANGES} exchanges routed by cycle → {counts}")
+
+        for cycle in (2, 17, 41):
+            assert strip(sharded.thread_nodes(cycle)) == strip(single.thread_nodes(cycle)), cycle
+        print("[OK] thread(cycle) served by the owning shard matches one process")
+
+        found = sharded.search("QUESTION 1")
+        expected = [k for k in range(EXCHANGES) if f"question {k}".startswith("question 1")]
+        assert len(found) == len(expected), (len(found), len(expected))
+        everything = sharded.search("question")
+        assert [search_key(n) for n in everything] == sorted(search_key(n) for n in everything)
+        assert sharded.search("question", limit=5) == everything[:5]
+        print(f"[OK] search fans out and merges ({len(found)} hits)")
+
+        sigils = sharded.sigil_nodes(3)
+        assert len(sigils) == len([n for n in single.sigil_nodes(3) if n["role"] != "system"])
+        assert [n["priority"] for n in sigils] == sorted((n["priority"] for n in sigils), reverse=True)
+        print(f"[OK] sigil sweep merged by priority ({len(sigils)} nodes)")
+
+        merged = sharded.tree()
+        assert len(merged["children"]) == EXCHANGES
+        again = sharded.tree()
+        assert again["id"] == merged["id"] and again == merged
+        assert sharded.summary() == sharded.summary()
+        expected_summary = ArcReconstruct().reconstruct_node(single.tree())
+        assert len(sharded.summary().splitlines()) == len(expected_summary)
+        print("[OK] merged tree and summary cover every shard")
+
+        # Guardian rejections are isolated to the offending exchange
+        sharded.ingest_interaction("bad cycle", "reply", 5000)
+        sharded.ingest_interaction("good cycle", "reply", 3)
+        try:
+            sharded.flush()
+            raise AssertionError("rejection should be raised by flush()")
+        except RuntimeError as e:
+            assert "Invalid cycle range" in str(e), e
+        assert sharded.search("good cycle") and not sharded.search("bad cycle")
+        print("[OK] Guardian rejection raised by flush(); rest of the batch applied")
+
+    # Session routing: one cycle may span shards, thread() fans out
+    with ShardedMemory(shards=2, route="session", batch_size=4) as by_session:
+        sessions = ["alpha", "beta", "gamma", "delta"]
+        assert len({shard_for(s, 2) for s in sessions}) == 2
+        for k, session in enumerate(sessions * 5):
+            by_session.ingest_interaction(f"{session} turn {k}", "ok", 9, session=session)
+        assert len(by_session.thread_nodes(9)) == 40  # user + nested ai subtree per exchange
+        spread = [s["interactions"] for s in by_session.stats()]
+        assert all(spread), spread
+        print(f"[OK] session routing spreads one cycle over shards → {spread}")
+
+    print("\n=== Sharded Memory Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,104 @@
+# ============================================================
+# ARC CORE — PERSISTENT SNAPSHOT TEST
+# Loop 1.15 — Structural Sharing, Isolation, Snapshot Diff
+# ============================================================
+
+import os
+import random
+
+from arc_prime import ArcMemorySystem
+from ac_persistent import EMPTY, PNode
+from arc_guardian import ArcGuardian
+import ac_sync
+
+
+def run_test():
+    print("\n=== ArcCore Persistent Snapshot Test (Loop 1.15) ===\n")
+
+    # ------------------------------------------------------------
+    # 1. PVector behaves like an immutable list
+    # ------------------------------------------------------------
+
+    rng = random.Random(7)
+    vec, mirror, history = EMPTY, [], []
+    for n in range(5000):
+        if mirror and rng.random() < 0.2:
+            k = rng.randrange(len(mirror))
+            vec = vec.set(k, -n)
+            mirror[k] = -n
+        else:
+            vec = vec.append(n)
+            mirror.append(n)
+        if n % 997 == 0:
+            history.append((vec, list(mirror)))
+
+    assert list(vec) == mirror and len(vec) == len(mirror)
+    assert all(vec[k] == mirror[k] for k in range(0, len(mirror), 37))
+    assert vec[-1] == mirror[-1] and vec[10:20] == mirror[10:20]
+    for old, expected in history:
+        assert list(old) == expected
+    print(f"[OK] PVector: {len(vec)} items, {len(history)} old versions intact.")
+
+    # ------------------------------------------------------------
+    # 2. Snapshots are isolated from later ingest
+    # ------------------------------------------------------------
+
+    mem = ArcMemorySystem()
+    for n in range(300):
+        mem.ingest_interaction(f"Question {n} 💠" if n % 9 == 0 else f"Question {n}",
+                               f"Answer {n}", cycle_context=2 + n % 5)
+
+    first = mem.snapshot()
+    frozen_tree = mem.tree()
+    assert first.to_dict() == frozen_tree
+    assert first.hash() == ArcGuardian.hash_memory_tree(frozen_tree) == mem.memory_hash
+    assert mem.snapshot().root is first.root
+    print("[OK] Snapshot matches the live tree; repeat snapshot is free.")
+
+    for n in range(50):
+        mem.ingest_interaction(f"Later {n}", "Reply", cycle_context=3)
+
+    second = mem.snapshot()
+    assert first.to_dict() == frozen_tree
+    assert len(second.root.children) == 350
+    assert second.to_dict() == mem.tree()
+    shared = sum(a is b for a, b in zip(first.root.children, second.root.children))
+    assert shared == 300
+    print(f"[OK] Old snapshot unchanged; {shared} subtrees shared with the new one.")
+
+    # ------------------------------------------------------------
+    # 3. Path copy, reconstruction and diff work on snapshots
+    # ------------------------------------------------------------
+
+    edited = second.root.replace_at([5, 0], second.root.children[5].children[0].replace(content="Edited."))
+    assert edited.children[4] is second.root.children[4]
+    assert second.root.children[5].children[0].content == "Answer 5"
+
+    thread = second.thread(3)
+    assert thread == mem.thread_nodes(3)
+
+    patch = ac_sync.diff(first, second)
+    assert len(patch["added"]) == 50 and not patch["changed"] and not patch["removed"]
+    assert ac_sync.apply_patch(first.to_dict(), patch) == second.to_dict()
+    assert ac_sync.is_empty(ac_sync.diff(first, first.to_dict()))
+    print(f"[OK] Snapshot diff: {ac_sync.summarize(patch)}")
+
+    node = PNode.from_dict(second.to_dict())
+    assert node.digest() == second.root.digest()
+
+    # ------------------------------------------------------------
+    # 4. Export writes the snapshot it took
+    # ------------------------------------------------------------
+
+    mem.save_memory("test_snapshots.json")
+    payload = mem.read_memory("test_snapshots.json")
+    assert payload["tree"] == mem.tree()
+    assert payload["integrity"]["memory_hash"] == mem.memory_hash
+    os.remove("test_snapshots.json")
+    print("[OK] Export from snapshot round-trips.")
+
+    print("\n=== Persistent Snapshot Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,118 @@
+# ============================================================
+# ARC CORE — STORAGE FORMAT TEST
+# Loop 1.5 / 1.6 — Content Table + ACMB Round Trip
+# ============================================================
+
+import os
+import sqlite3
+
+from arc_prime import ArcMemorySystem
+from ac_storage import SQLiteBackend
+
+
+def run_test():
+    print("\n=== ArcCore Storage Format Test ===\n")
+
+    mem = ArcMemorySystem()
+
+    # ------------------------------------------------------------
+    # 1. Inject repetitive memory
+    # ------------------------------------------------------------
+
+    for cycle in (3, 3, 7):
+        mem.ingest_interaction(
+            "💠 Same question as before: how do I stabilize?",
+            "Acknowledged. Stability is found through structured descent.",
+            cycle_context=cycle
+        )
+
+    stats = mem.content.stats()
+    assert stats["dedup_ratio"] > 1, stats
+    assert stats["bytes_saved"] > 0, stats
+    print(f"[OK] Content table: {mem.content.describe()}")
+
+    # Replacing the tree releases the old tree's references
+    before = mem.content.stats()
+    mem.backend.replace_tree(mem.tree())
+    assert mem.content.stats() == before, (mem.content.stats(), before)
+    mem.backend.replace_tree(mem.tree())
+    assert mem.content.stats() == before
+    print("[OK] replace_tree() leaves the content table counting the live tree only\n")
+
+    # ------------------------------------------------------------
+    # 2. Save in every format, reload with auto-detection
+    # ------------------------------------------------------------
+
+    expected = mem.root.to_dict()
+    files = [
+        ("test_memory.json", "json", None),
+        ("test_memory.bin", "bin", None),
+        ("test_memory_zlib.bin", "bin", "zlib"),
+        ("test_memory_lzma.bin", "bin", "lzma"),
+    ]
+
+    for filename, fmt, compression in files:
+        mem.save_memory(filename, format=fmt, compression=compression)
+        payload = mem.read_memory(filename)
+        assert payload["tree"] == expected, filename
+        assert payload["integrity"]["memory_hash"] == mem.memory_hash
+        print(f"[OK] {filename} round trip ({os.path.getsize(filename)} bytes)")
+
+    print()
+    print(mem.load_and_inject("test_memory.bin"))
+
+    # ------------------------------------------------------------
+    # 3. SQLite backend (Loop 1.8)
+    # ------------------------------------------------------------
+
+    db_path = "test_memory.db"
+    sq = ArcMemorySystem(backend=SQLiteBackend(db_path, batch_size=2))
+
+    for cycle in (3, 3, 7):
+        sq.ingest_interaction(
+            "💠 Same question as before: how do I stabilize?",
+            "Acknowledged. Stability is found through structured descent.",
+            cycle_context=cycle
+        )
+
+    assert len(sq.tree()["children"]) == 3
+    assert len(sq.thread_nodes(3)) == 4   # two user subtrees + their ai nodes
+    assert sq.sigil_nodes(3)[0]["priority"] >= 3
+    sq.save_memory()
+    sq.backend.close()
+
+    reopened = ArcMemorySystem(backend=SQLiteBackend(db_path))
+    assert reopened.backend.count() == 7
+    assert reopened.read_memory()["integrity"]["memory_hash"] == sq.memory_hash
+
+    # replace_tree is one transaction: a failed insert keeps the old rows
+    tree = reopened.tree()
+    broken = dict(tree, children=tree["children"] + [dict(tree["children"][0], role=None)])
+    try:
+        reopened.backend.replace_tree(broken)
+        raise AssertionError("a NULL role should fail the insert")
+    except sqlite3.IntegrityError:
+        pass
+    assert reopened.backend.count() == 7
+    reopened.backend.replace_tree(dict(tree, children=tree["children"][:1]))
+    assert reopened.backend.count() == 3
+    reopened.backend.close()
+    print("\n[OK] SQLite backend round trip")
+
+    # ------------------------------------------------------------
+    # 4. Cleanup
+    # ------------------------------------------------------------
+
+    for filename, _, _ in files:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    print("\n=== Storage Format Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
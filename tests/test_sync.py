@@ -0,0 +1,80 @@
+# ============================================================
+# ARC CORE — SYNC ENGINE TEST
+# Loop 1.9 — Subtree Digests, Diff + Patch
+# ============================================================
+
+import copy
+import json
+import os
+
+from arc_prime import ArcMemorySystem, HarmonicNode
+from ac_mmap import MappedMemory
+from ac_storage import write_file
+import ac_sync
+
+
+def run_test():
+    print("\n=== ArcCore Sync Test (Loop 1.9) ===\n")
+
+    mem = ArcMemorySystem()
+    for n in range(200):
+        mem.ingest_interaction(f"Question {n} 💠" if n % 7 == 0 else f"Question {n}",
+                               f"Answer {n} " * 8, cycle_context=n % 9)
+
+    # ------------------------------------------------------------
+    # 1. Build a diverged copy
+    # ------------------------------------------------------------
+
+    a = mem.tree()
+    b = copy.deepcopy(a)
+    b["children"][3]["children"][0]["content"] = "Edited on another machine."
+    b["children"][10]["collapsed"] = True
+    b["children"][10]["content"] = None
+    del b["children"][42]
+    b["children"].append(HarmonicNode("user", "Appended elsewhere.", 4).to_dict())
+
+    # ------------------------------------------------------------
+    # 2. Dict diff + apply
+    # ------------------------------------------------------------
+
+    patch = ac_sync.diff(a, b)
+    print(f"[diff] {ac_sync.summarize(patch)}")
+    assert len(patch["added"]) == 1
+    assert len(patch["removed"]) == 1
+    assert len(patch["changed"]) == 1
+    assert len(patch["collapsed"]) == 1
+    assert patch["visited"] < 10, patch["visited"]
+
+    patched = ac_sync.apply_patch(copy.deepcopy(a), json.loads(json.dumps(patch)))
+    assert patched == b
+    assert ac_sync.is_empty(ac_sync.diff(patched, b))
+    print("[OK] Dict patch applied and verified.")
+
+    # ------------------------------------------------------------
+    # 3. Mapped diff (digests read from ACMB files)
+    # ------------------------------------------------------------
+
+    write_file("test_sync_a.bin", {}, a, format="bin")
+    write_file("test_sync_b.bin", {}, b, format="bin")
+
+    with MappedMemory("test_sync_a.bin") as ma, MappedMemory("test_sync_b.bin") as mb:
+        mapped_patch = ac_sync.diff(ma, mb)
+        assert ac_sync.summarize(mapped_patch) == ac_sync.summarize(patch)
+    print("[OK] Mapped diff matches dict diff.")
+
+    # ------------------------------------------------------------
+    # 4. Apply to a live memory
+    # ------------------------------------------------------------
+
+    mem.apply_patch(patch)
+    assert mem.tree() == b
+    print("[OK] Live memory patched.")
+
+    for name in ("test_sync_a.bin", "test_sync_b.bin"):
+        os.remove(name)
+
+    print("\n=== Sync Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,83 @@
+# ============================================================
+# ARC CORE — HOT-PATH TRACING TEST
+# Loop 1.18 — ArcEcho Spans, Counters, Latency Histograms
+# ============================================================
+
+import os
+
+import ac_authority_defaults as defaults
+from ac_echo import ECHO, Histogram, NULL_SPAN
+from ac_interpreter import ArcInterpreter
+
+MEMORY_FILE = "test_tracing_memory.json"
+
+
+def run_test():
+    print("\n=== ArcCore Tracing Test (Loop 1.18) ===\n")
+
+    # Histogram accuracy: bucket midpoints within 12.5%
+    hist = Histogram()
+    for ns in range(1, 100001):
+        hist.record(ns * 1000)
+    for p, exact in ((50, 50_000_000), (95, 95_000_000), (99, 99_000_000)):
+        got = hist.percentile(p)
+        assert abs(got - exact) / exact <= 0.125, (p, got, exact)
+    assert hist.max == 100_000_000 and hist.min == 1000 and hist.count == 100000
+    print(f"[OK] Histogram p50/p95/p99 within bucket error: {hist.summary()}")
+
+    # Disabled: nothing recorded, spans are the shared no-op
+    ECHO.enabled = False
+    ECHO.reset_stats()
+    shell = ArcInterpreter(authority=defaults.MARKING)  # echo on/off are MARK
+    shell.memory.ingest_interaction("Untraced question", "Untraced answer", 4)
+    assert ECHO.span("ingest") is NULL_SPAN
+    assert not ECHO.histograms and not ECHO.counters
+    print("[OK] Disabled mode records nothing")
+
+    # Enabled: every instrumented hot path reports
+    print(shell.execute("echo on"))
+    try:
+        for k in range(20):
+            shell.memory.ingest_interaction(f"Question {k} 💠", f"Answer {k} about stability", 5 + k % 3)
+        shell.memory.save_memory(MEMORY_FILE)
+        shell.memory.load_and_inject(MEMORY_FILE)
+        shell.execute("thread 5")
+        shell.execute("summary")
+        shell.memory.collapse.collapse_state(shell.memory.tree())
+
+        spans = ECHO.stats()["spans"]
+        for name in ("ingest", "ingest.prepare", "guardian.purify", "guardian.gate",
+                     "sigil.score", "guardian.hash", "save", "load", "load.read",
+                     "guardian.verify", "reconstruct", "collapse"):
+            assert name in spans, (name, sorted(spans))
+        assert spans["ingest"]["count"] == 20
+        assert spans["guardian.purify"]["count"] == 40  # user + ai per exchange
+        assert spans["reconstruct"]["count"] == 1 + 2 * 7  # summary + 7 cycle-5 exchanges × (user, ai)
+        assert spans["collapse"]["count"] == 1  # recursion is not re-counted
+        assert ECHO.counters["ingest.interactions"] == 20
+        m = spans["ingest"]
+        assert 0 < m["p50_ms"] <= m["p95_ms"] <= m["p99_ms"] <= m["max_ms"] * 1.125
+        print(f"[OK] {len(spans)} spans recorded; ingest p50={m['p50_ms']} ms p99={m['p99_ms']} ms")
+
+        report = shell.execute("echo stats")
+        assert report.startswith("[echo] Tracing on") and "guardian.gate" in report
+        print("[OK] echo stats renders the table")
+
+        # Slow spans are pulsed into the ring
+        ECHO.slow_ms = 0.0
+        shell.memory.ingest_interaction("slow one", "reply", 6)
+        tail = shell.execute("echo tail 3")
+        assert "trace: slow" in tail, tail
+        print("[OK] Slow spans echoed to the ring")
+    finally:
+        print(shell.execute("echo off"))
+        ECHO.slow_ms = None
+        ECHO.reset_stats()
+        if os.path.exists(MEMORY_FILE):
+            os.remove(MEMORY_FILE)
+
+    print("\n=== Tracing Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()
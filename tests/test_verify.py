@@ -0,0 +1,167 @@
+# ============================================================
+# ARC CORE — VERIFIED LOAD TEST
+# Loop 1.10 — Segment Checksums + Localized Corruption
+# ============================================================
+
+import json
+import os
+
+from arc_prime import ArcMemorySystem
+from ac_content import pack_tree
+from ac_storage import read_file
+import ac_binary
+from ac_verify import CORRUPT_SEED, tree_segments
+
+
+def count(node):
+    return 1 + sum(count(c) for c in node["children"])
+
+
+def flip(filename, offset):
+    with open(filename, "r+b") as f:
+        f.seek(offset)
+        byte = f.read(1)
+        f.seek(offset)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+
+def run_test():
+    print("\n=== ArcCore Verified Load Test (Loop 1.10) ===\n")
+
+    mem = ArcMemorySystem()
+    for n in range(800):
+        mem.ingest_interaction(f"Question {n}", f"Answer {n} " * 6, cycle_context=n % 11)
+    tree = mem.tree()
+
+    # ------------------------------------------------------------
+    # 1. Clean files verify and load in a fresh process state
+    # ------------------------------------------------------------
+
+    mem.save_memory("test_verify.bin", format="bin")
+    integrity = read_file("test_verify.bin")["integrity"]
+    with open("test_verify_small.bin", "wb") as f:
+        f.write(ac_binary.encode({"integrity": integrity, "tree": tree}, segment_size=16 * 1024))
+    mem.save_memory("test_verify.json")
+
+    for name in ("test_verify.bin", "test_verify.json"):
+        payload = read_file(name)
+        assert payload["verification"].ok, payload["verification"].describe()
+        assert payload["tree"] == tree
+        print(f"[OK] {name}: {payload['verification'].describe()}")
+
+    fresh = ArcMemorySystem()
+    output = fresh.load_and_inject("test_verify.bin")
+    assert output.startswith("[Integrity: OK"), output.split("\n")[0]
+    print("[OK] Fresh load reports intact memory.")
+
+    # ------------------------------------------------------------
+    # 2. A flipped byte in NODES quarantines only nearby records
+    # ------------------------------------------------------------
+
+    with open("test_verify_small.bin", "rb") as f:
+        directory = ac_binary.read_directory(f.read())
+    flip("test_verify_small.bin", directory[ac_binary.SECTION_NODES][1] + 200)
+
+    payload = read_file("test_verify_small.bin")
+    report = payload["verification"]
+    assert not report.ok
+    assert 0 < report.lost <= 16 * 1024 // ac_binary.NODE_RECORD.size + 1, report.lost
+    assert count(payload["tree"]) == count(tree)
+    print(f"[OK] {report.describe()}")
+
+    output = fresh.load_and_inject("test_verify_small.bin")
+    assert "Memory corruption" in output.split("\n")[0]
+    assert CORRUPT_SEED in output
+    print("[OK] Loader keeps intact records and marks the rest.")
+
+    # ------------------------------------------------------------
+    # 3. A tampered JSON subtree line is replaced, the rest survives
+    # ------------------------------------------------------------
+
+    with open("test_verify.json", "rb") as f:
+        lines = f.read().split(b"\n")
+    start = lines.index(b"],") + 2  # first subtree line
+    assert b'"priority":0' in lines[start + 7]
+    lines[start + 7] = lines[start + 7].replace(b'"priority":0', b'"priority":9', 1)
+    with open("test_verify.json", "wb") as f:
+        f.write(b"\n".join(lines))
+
+    payload = read_file("test_verify.json")
+    report = payload["verification"]
+    assert [label for label, _ in report.bad] == ["subtree"]
+    assert payload["tree"]["children"][7]["seed"] == CORRUPT_SEED
+    assert payload["tree"]["children"][8] == tree["children"][8]
+    print(f"[OK] {report.describe()}")
+
+    # Files with per-subtree checksums (before line segments) still verify
+    strings, seeds, packed = pack_tree(tree)
+    legacy = {"integrity": dict(integrity, segments=tree_segments(tree)),
+              "strings": strings, "seeds": seeds, "tree": packed}
+    legacy["tree"]["children"][7]["priority"] = 99
+    with open("test_verify.json", "w", encoding="utf-8") as f:
+        json.dump(legacy, f, indent=2)
+    report = read_file("test_verify.json")["verification"]
+    assert [label for label, _ in report.bad] == ["subtree"] and "#7" in report.bad[0][1]
+    print("[OK] Legacy per-subtree checksums still checked")
+
+    # ------------------------------------------------------------
+    # 4. Byte damage: one bad line, never a JSONDecodeError
+    # ------------------------------------------------------------
+
+    small = ArcMemorySystem()
+    for n in range(200):
+        small.ingest_interaction(f"Question {n}", f"Answer {n} " * 3, cycle_context=n % 9)
+    small_tree = small.tree()
+    small.save_memory("test_verify.json")
+    with open("test_verify.json", "rb") as f:
+        clean = f.read()
+    start = clean.index(b"\n", clean.index(b'\n"tree": ') + 1) + 1
+    quotes = [i for i in range(start, len(clean)) if clean[i:i + 1] == b'"']
+    picked = quotes[::len(quotes) // 25]
+    for offset in picked:
+        with open("test_verify.json", "wb") as f:
+            f.write(clean)
+        flip("test_verify.json", offset)
+        payload = read_file("test_verify.json")
+        report = payload["verification"]
+        assert len(report.bad) == 1 and report.bad[0][0] == "subtree", report.describe()
+        index = int(report.bad[0][1][1:])
+        assert payload["tree"]["children"][index]["seed"] == CORRUPT_SEED
+        rest = [c for i, c in enumerate(payload["tree"]["children"]) if i != index]
+        assert rest == [c for i, c in enumerate(small_tree["children"]) if i != index]
+    print(f"[OK] {len(picked)} flipped quotes in subtree lines: one bad segment each")
+
+    # Damage to the tables is confined to what they hold
+    for marker, label in ((b'"seeds": ', "seeds"), (b'"strings": [', "strings"),
+                          (b'"integrity": ', "integrity"), (b'"tree": ', "root")):
+        line = clean.index(marker)
+        if label == "strings":
+            line = clean.index(b"\n", line) + 1  # first run of strings
+        with open("test_verify.json", "wb") as f:
+            f.write(clean)
+        flip("test_verify.json", line + len(marker) + 2)
+        payload = read_file("test_verify.json")
+        assert [bad[0] for bad in payload["verification"].bad] == [label], payload["verification"].describe()
+        assert len(payload["tree"]["children"]) == 200
+    corrupt = read_file("test_verify.json", verify=False)["tree"]
+    assert corrupt["seed"] == CORRUPT_SEED and corrupt["children"] == small_tree["children"]
+
+    # Any quote in the file: at most one bad segment, the tree still loads
+    everywhere = [i for i in range(len(clean)) if clean[i:i + 1] == b'"']
+    for offset in everywhere[::len(everywhere) // 60] + everywhere[:40]:
+        with open("test_verify.json", "wb") as f:
+            f.write(clean)
+        flip("test_verify.json", offset)
+        payload = read_file("test_verify.json")
+        assert len(payload["verification"].bad) == 1, (offset, payload["verification"].describe())
+        assert len(payload["tree"]["children"]) == 200
+    print("[OK] Seed, string, integrity, root and framing lines fail alone")
+
+    for name in ("test_verify.bin", "test_verify_small.bin", "test_verify.json"):
+        os.remove(name)
+
+    print("\n=== Verified Load Test COMPLETE ===\n")
+
+
+if __name__ == "__main__":
+    run_test()